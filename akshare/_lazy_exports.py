@@ -0,0 +1,1423 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Desc: akshare 顶层接口和所在模块的对照表, 用于 akshare/__init__.py 的延迟导入
+由 scripts/gen_lazy_exports.py 根据 akshare/__init__.py 中 TYPE_CHECKING 块生成, 请勿手动修改
+"""
+
+LAZY_EXPORTS = {
+    # openctp-合约信息接口
+    "option_contract_info_ctp": "akshare.option.option_contract_info_ctp",
+    # 中国外汇交易中心暨全国银行间同业拆借中心-基准-外汇市场-外汇掉期曲线-外汇掉漆 C-Swap 定盘曲线
+    "fx_c_swap_cm": "akshare.fx.fx_c_swap_cm",
+    # 上海证券交易所-产品-股票期权-信息披露-当日合约
+    "option_current_day_sse": "akshare.option.option_current_sse",
+    # 深圳证券交易所-期权子网-行情数据-当日合约
+    "option_current_day_szse": "akshare.option.option_current_szse",
+    # 东方财富-A股-财务分析-主要指标
+    "stock_financial_analysis_indicator_em": "akshare.stock_fundamental.stock_finance_sina",
+    # 期权保证金
+    "option_margin": "akshare.option.option_margin",
+    "option_margin_symbol": "akshare.option.option_margin",
+    # 东方财富-港股-证券资料
+    "stock_hk_company_profile_em": "akshare.stock.stock_profile_em",
+    "stock_hk_security_profile_em": "akshare.stock.stock_profile_em",
+    # 东方财富-港股-核心必读
+    "stock_hk_dividend_payout_em": "akshare.stock.stock_profile_em",
+    "stock_hk_financial_indicator_em": "akshare.stock.stock_profile_em",
+    # 东方财富-港股-行业对比
+    "stock_hk_growth_comparison_em": "akshare.stock.stock_hk_comparison_em",
+    "stock_hk_valuation_comparison_em": "akshare.stock.stock_hk_comparison_em",
+    "stock_hk_scale_comparison_em": "akshare.stock.stock_hk_comparison_em",
+    # 东方财富-行情中心-同行比较
+    "stock_zh_growth_comparison_em": "akshare.stock.stock_zh_comparison_em",
+    "stock_zh_valuation_comparison_em": "akshare.stock.stock_zh_comparison_em",
+    "stock_zh_dupont_comparison_em": "akshare.stock.stock_zh_comparison_em",
+    "stock_zh_scale_comparison_em": "akshare.stock.stock_zh_comparison_em",
+    # 东方财富网-行情中心-债券市场-质押式回购
+    "bond_sh_buy_back_em": "akshare.bond.bond_buy_back_em",
+    "bond_sz_buy_back_em": "akshare.bond.bond_buy_back_em",
+    "bond_buy_back_hist_em": "akshare.bond.bond_buy_back_em",
+    # 东方财富-A股数据-股本结构
+    "stock_zh_a_gbjg_em": "akshare.stock_fundamental.stock_gbjg_em",
+    # 雪球-个股-公司概况-公司简介
+    "stock_individual_basic_info_xq": "akshare.stock_fundamental.stock_basic_info_xq",
+    "stock_individual_basic_info_hk_xq": "akshare.stock_fundamental.stock_basic_info_xq",
+    "stock_individual_basic_info_us_xq": "akshare.stock_fundamental.stock_basic_info_xq",
+    # 新浪财经-行情中心-环球市场
+    "index_global_hist_sina": "akshare.index.index_global_sina",
+    "index_global_name_table": "akshare.index.index_global_sina",
+    # 东方财富网-行情中心-全球指数
+    "index_global_hist_em": "akshare.index.index_global_em",
+    "index_global_spot_em": "akshare.index.index_global_em",
+    # 东方财富网-行情中心-外汇市场-所有汇率
+    "forex_hist_em": "akshare.forex.forex_em",
+    "forex_spot_em": "akshare.forex.forex_em",
+    # 东方财富网-行情中心-沪深港通
+    "stock_zh_ah_spot_em": "akshare.stock.stock_hsgt_em",
+    "stock_hsgt_sh_hk_spot_em": "akshare.stock.stock_hsgt_em",
+    # 东方财富-美股-财务分析-三大报表
+    "stock_financial_us_report_em": "akshare.stock_fundamental.stock_finance_us_em",
+    "stock_financial_us_analysis_indicator_em": "akshare.stock_fundamental.stock_finance_us_em",
+    # 期货行情-内盘-历史行情数据-东财
+    "futures_hist_table_em": "akshare.futures.futures_hist_em",
+    "futures_hist_em": "akshare.futures.futures_hist_em",
+    # 巨潮资讯-数据中心-专题统计-股东股本-股本变动
+    "stock_hold_change_cninfo": "akshare.stock.stock_hold_control_cninfo",
+    # 天天基金-基金档案-基金基本概况
+    "fund_overview_em": "akshare.fund.fund_overview_em",
+    # 基金费率
+    "fund_fee_em": "akshare.fund.fund_fee_em",
+    # 东方财富网-数据中心-估值分析-每日互动-每日互动-估值分析
+    "stock_value_em": "akshare.stock_feature.stock_value_em",
+    # 已实现波动率
+    "volatility_yz_rv": "akshare.cal.rv",
+    "rv_from_futures_zh_minute_sina": "akshare.cal.rv",
+    "rv_from_stock_zh_a_hist_min_em": "akshare.cal.rv",
+    # QDII
+    "qdii_a_index_jsl": "akshare.qdii.qdii_jsl",
+    "qdii_e_index_jsl": "akshare.qdii.qdii_jsl",
+    "qdii_e_comm_jsl": "akshare.qdii.qdii_jsl",
+    # 财新网-财新数据通
+    "stock_news_main_cx": "akshare.stock.stock_news_cx",
+    # 搜猪-生猪大数据-各省均价实时排行榜
+    "spot_hog_soozhu": "akshare.spot.spot_hog_soozhu",
+    "spot_hog_year_trend_soozhu": "akshare.spot.spot_hog_soozhu",
+    "spot_hog_lean_price_soozhu": "akshare.spot.spot_hog_soozhu",
+    "spot_hog_three_way_soozhu": "akshare.spot.spot_hog_soozhu",
+    "spot_hog_crossbred_soozhu": "akshare.spot.spot_hog_soozhu",
+    "spot_corn_price_soozhu": "akshare.spot.spot_hog_soozhu",
+    "spot_soybean_price_soozhu": "akshare.spot.spot_hog_soozhu",
+    "spot_mixed_feed_soozhu": "akshare.spot.spot_hog_soozhu",
+    # 知名港股
+    "stock_hk_famous_spot_em": "akshare.stock.stock_hk_famous",
+    # 同花顺-数据中心-宏观数据-股票筹资
+    "macro_stock_finance": "akshare.economic.macro_finance_ths",
+    "macro_rmb_loan": "akshare.economic.macro_finance_ths",
+    "macro_rmb_deposit": "akshare.economic.macro_finance_ths",
+    # 富途牛牛-主题投资-概念板块-成分股
+    "stock_concept_cons_futu": "akshare.stock_feature.stock_concept_futu",
+    # 商品期权手续费
+    "option_comm_info": "akshare.option.option_comm_qihuo",
+    "option_comm_symbol": "akshare.option.option_comm_qihuo",
+    # 上海证券交易所-产品-股票期权-每日统计
+    "option_daily_stats_sse": "akshare.option.option_daily_stats_sse_szse",
+    "option_daily_stats_szse": "akshare.option.option_daily_stats_sse_szse",
+    # 同花顺理财-基金数据-每日净值-ETF
+    "fund_etf_spot_ths": "akshare.fund.fund_etf_ths",
+    # 东方财富网-数据中心-融资融券-融资融券账户统计-两融账户信息
+    "stock_margin_account_info": "akshare.stock_feature.stock_margin_em",
+    # 现货走势
+    "spot_price_qh": "akshare.spot.spot_price_qh",
+    "spot_price_table_qh": "akshare.spot.spot_price_qh",
+    # 华尔街见闻-日历-宏观
+    "macro_info_ws": "akshare.economic.macro_info_ws",
+    # 数库-A股新闻情绪指数
+    "index_news_sentiment_scope": "akshare.index.index_zh_a_scope",
+    # 申万宏源研究-申万指数-指数发布-基金指数-实时行情
+    "index_hist_fund_sw": "akshare.index.index_research_fund_sw",
+    "index_realtime_fund_sw": "akshare.index.index_research_fund_sw",
+    # 东方财富-财经早餐
+    "stock_info_cjzc_em": "akshare.stock_feature.stock_info",
+    "stock_info_global_em": "akshare.stock_feature.stock_info",
+    "stock_info_global_ths": "akshare.stock_feature.stock_info",
+    "stock_info_global_futu": "akshare.stock_feature.stock_info",
+    "stock_info_global_sina": "akshare.stock_feature.stock_info",
+    "stock_info_global_cls": "akshare.stock_feature.stock_info",
+    # 期货交易-参数汇总查询
+    "futures_contract_info_shfe": "akshare.futures_derivative.futures_contract_info_shfe",
+    "futures_contract_info_dce": "akshare.futures_derivative.futures_contract_info_dce",
+    "futures_contract_info_czce": "akshare.futures_derivative.futures_contract_info_czce",
+    "futures_contract_info_gfex": "akshare.futures_derivative.futures_contract_info_gfex",
+    "futures_contract_info_cffex": "akshare.futures_derivative.futures_contract_info_cffex",
+    "futures_contract_info_ine": "akshare.futures_derivative.futures_contract_info_ine",
+    # 上海期货交易所-指定交割仓库-库存周报
+    "futures_stock_shfe_js": "akshare.futures.futures_stock_js",
+    # 东方财富-数据中心-沪深港通-市场概括-分时数据
+    "stock_hsgt_fund_min_em": "akshare.stock_feature.stock_hsgt_min_em",
+    # 东方财富网-行情中心-期货市场-国际期货
+    "futures_global_spot_em": "akshare.futures.futures_hf_em",
+    "futures_global_hist_em": "akshare.futures.futures_hf_em",
+    # 雪球行情数据
+    "stock_individual_spot_xq": "akshare.stock.stock_xq",
+    # 港股盈利预测
+    "stock_hk_profit_forecast_et": "akshare.stock_fundamental.stock_profit_forecast_hk_etnet",
+    # 巨潮资讯-首页-公告查询-信息披露
+    "stock_zh_a_disclosure_relation_cninfo": "akshare.stock_feature.stock_disclosure_cninfo",
+    "stock_zh_a_disclosure_report_cninfo": "akshare.stock_feature.stock_disclosure_cninfo",
+    # 东财财富-分时数据
+    "stock_intraday_sina": "akshare.stock.stock_intraday_sina",
+    "stock_intraday_sina_iter": "akshare.stock.stock_intraday_sina",
+    # 股票日行情
+    "stock_zh_a_hist_tx": "akshare.stock_feature.stock_hist_tx",
+    # 筹码分布
+    "stock_cyq_em": "akshare.stock_feature.stock_cyq_em",
+    # 东财财富-分时数据
+    "stock_intraday_em": "akshare.stock.stock_intraday_em",
+    "stock_intraday_em_stream": "akshare.stock.stock_intraday_em",
+    "stock_intraday_em_subscribe": "akshare.stock.stock_intraday_em",
+    # 美股指数行情
+    "index_us_stock_sina": "akshare.index.index_stock_us_sina",
+    # 董监高及相关人员持股变动
+    "stock_share_hold_change_bse": "akshare.stock.stock_share_hold",
+    "stock_share_hold_change_sse": "akshare.stock.stock_share_hold",
+    "stock_share_hold_change_szse": "akshare.stock.stock_share_hold",
+    # 东方财富网-数据中心-研究报告-个股研报
+    "stock_research_report_em": "akshare.stock_feature.stock_research_report_em",
+    # 东方财富网-数据中心-重大合同-重大合同明细
+    "stock_zdhtmx_em": "akshare.stock_feature.stock_zdhtmx_em",
+    # 东方财富网-数据中心-股东大会
+    "stock_gddh_em": "akshare.stock_feature.stock_gddh_em",
+    # 东方财富网-数据中心-股市日历
+    "stock_gsrl_gsdt_em": "akshare.stock.stock_gsrl_em",
+    # 东方财富网-数据中心-特色数据-高管持股
+    "stock_hold_management_detail_em": "akshare.stock.stock_hold_control_em",
+    "stock_hold_management_person_em": "akshare.stock.stock_hold_control_em",
+    # 新浪财经-债券-可转债
+    "bond_cb_profile_sina": "akshare.bond.bond_cb_sina",
+    "bond_cb_summary_sina": "akshare.bond.bond_cb_sina",
+    # 上证e互动
+    "stock_sns_sseinfo": "akshare.stock_feature.stock_sns_sseinfo",
+    # 互动易-提问与回答
+    "stock_irm_cninfo": "akshare.stock_feature.stock_irm_cninfo",
+    "stock_irm_ans_cninfo": "akshare.stock_feature.stock_irm_cninfo",
+    # 基金公告-分红配送
+    "fund_announcement_dividend_em": "akshare.fund.fund_announcement_em",
+    # 基金公告-定期报告
+    "fund_announcement_report_em": "akshare.fund.fund_announcement_em",
+    # 基金公告-人事公告
+    "fund_announcement_personnel_em": "akshare.fund.fund_announcement_em",
+    # 新浪财经-ESG评级中心
+    "stock_esg_msci_sina": "akshare.stock_feature.stock_esg_sina",
+    "stock_esg_rft_sina": "akshare.stock_feature.stock_esg_sina",
+    "stock_esg_rate_sina": "akshare.stock_feature.stock_esg_sina",
+    "stock_esg_zd_sina": "akshare.stock_feature.stock_esg_sina",
+    "stock_esg_hz_sina": "akshare.stock_feature.stock_esg_sina",
+    # LOF 行情数据
+    "fund_lof_hist_em": "akshare.fund.fund_lof_em",
+    "fund_lof_spot_em": "akshare.fund.fund_lof_em",
+    "fund_lof_hist_min_em": "akshare.fund.fund_lof_em",
+    # 同花顺-财务指标-主要指标
+    "stock_financial_abstract_ths": "akshare.stock_fundamental.stock_finance_ths",
+    "stock_financial_debt_ths": "akshare.stock_fundamental.stock_finance_ths",
+    "stock_financial_benefit_ths": "akshare.stock_fundamental.stock_finance_ths",
+    "stock_financial_cash_ths": "akshare.stock_fundamental.stock_finance_ths",
+    "stock_financial_abstract_new_ths": "akshare.stock_fundamental.stock_finance_ths",
+    "stock_financial_debt_new_ths": "akshare.stock_fundamental.stock_finance_ths",
+    "stock_financial_benefit_new_ths": "akshare.stock_fundamental.stock_finance_ths",
+    "stock_financial_cash_new_ths": "akshare.stock_fundamental.stock_finance_ths",
+    "stock_management_change_ths": "akshare.stock_fundamental.stock_finance_ths",
+    "stock_shareholder_change_ths": "akshare.stock_fundamental.stock_finance_ths",
+    # 港股股票指数数据-新浪-东财
+    "stock_hk_index_spot_sina": "akshare.index.index_stock_hk",
+    "stock_hk_index_daily_em": "akshare.index.index_stock_hk",
+    "stock_hk_index_spot_em": "akshare.index.index_stock_hk",
+    "stock_hk_index_daily_sina": "akshare.index.index_stock_hk",
+    # 同花顺-数据中心-可转债
+    "bond_zh_cov_info_ths": "akshare.bond.bond_cb_ths",
+    # 同花顺-港股-分红派息
+    "stock_hk_fhpx_detail_ths": "akshare.stock.stock_hk_fhpx_ths",
+    # 同花顺-分红融资
+    "stock_fhps_detail_ths": "akshare.stock_feature.stock_fhps_ths",
+    # 东方财富-行情报价
+    "stock_bid_ask_em": "akshare.stock.stock_ask_bid_em",
+    # 同花顺-盈利预测
+    "stock_profit_forecast_ths": "akshare.stock_fundamental.stock_profit_forecast_ths",
+    # 期货资讯
+    "futures_news_shmet": "akshare.futures.futures_news_shmet",
+    # 主营介绍
+    "stock_zyjs_ths": "akshare.stock_fundamental.stock_zyjs_ths",
+    # 东方财富-ETF 行情
+    "fund_etf_hist_em": "akshare.fund.fund_etf_em",
+    "fund_etf_hist_min_em": "akshare.fund.fund_etf_em",
+    "fund_etf_spot_em": "akshare.fund.fund_etf_em",
+    # 上海证券交易所-ETF基金份额数据
+    "fund_etf_scale_sse": "akshare.fund.fund_etf_sse",
+    # 深圳证券交易所-ETF基金份额数据
+    "fund_etf_scale_szse": "akshare.fund.fund_etf_szse",
+    # 乐咕乐股-股债利差
+    "stock_ebs_lg": "akshare.stock_feature.stock_ebs_lg",
+    # 乐咕乐股-基金仓位
+    "fund_stock_position_lg": "akshare.fund.fund_position_lg",
+    "fund_balance_position_lg": "akshare.fund.fund_position_lg",
+    "fund_linghuo_position_lg": "akshare.fund.fund_position_lg",
+    # 乐咕乐股-大盘拥挤度
+    "stock_a_congestion_lg": "akshare.stock_feature.stock_congestion_lg",
+    # 乐咕乐股-股息率-A 股股息率
+    "stock_a_gxl_lg": "akshare.stock_feature.stock_gxl_lg",
+    "stock_hk_gxl_lg": "akshare.stock_feature.stock_gxl_lg",
+    # 东方财富-限售解禁股
+    "stock_restricted_release_stockholder_em": "akshare.stock_fundamental.stock_restricted_em",
+    "stock_restricted_release_summary_em": "akshare.stock_fundamental.stock_restricted_em",
+    "stock_restricted_release_detail_em": "akshare.stock_fundamental.stock_restricted_em",
+    "stock_restricted_release_queue_em": "akshare.stock_fundamental.stock_restricted_em",
+    # 同花顺行业一览表
+    "stock_board_industry_summary_ths": "akshare.stock_feature.stock_board_industry_ths",
+    # 生猪市场价格指数
+    "index_hog_spot_price": "akshare.index.index_hog",
+    # 债券信息查询
+    "bond_info_detail_cm": "akshare.bond.bond_info_cm",
+    "bond_info_cm": "akshare.bond.bond_info_cm",
+    "bond_info_cm_query": "akshare.bond.bond_info_cm",
+    # 申万宏源研究-指数系列
+    "index_realtime_sw": "akshare.index.index_research_sw",
+    "index_hist_sw": "akshare.index.index_research_sw",
+    "index_component_sw": "akshare.index.index_research_sw",
+    "index_min_sw": "akshare.index.index_research_sw",
+    "index_analysis_daily_sw": "akshare.index.index_research_sw",
+    "index_analysis_weekly_sw": "akshare.index.index_research_sw",
+    "index_analysis_monthly_sw": "akshare.index.index_research_sw",
+    "index_analysis_week_month_sw": "akshare.index.index_research_sw",
+    # 50ETF 期权波动率指数
+    "index_option_50etf_qvix": "akshare.index.index_option_qvix",
+    "index_option_300etf_min_qvix": "akshare.index.index_option_qvix",
+    "index_option_300etf_qvix": "akshare.index.index_option_qvix",
+    "index_option_50etf_min_qvix": "akshare.index.index_option_qvix",
+    "index_option_1000index_min_qvix": "akshare.index.index_option_qvix",
+    "index_option_1000index_qvix": "akshare.index.index_option_qvix",
+    "index_option_100etf_min_qvix": "akshare.index.index_option_qvix",
+    "index_option_100etf_qvix": "akshare.index.index_option_qvix",
+    "index_option_300index_min_qvix": "akshare.index.index_option_qvix",
+    "index_option_300index_qvix": "akshare.index.index_option_qvix",
+    "index_option_500etf_min_qvix": "akshare.index.index_option_qvix",
+    "index_option_500etf_qvix": "akshare.index.index_option_qvix",
+    "index_option_50index_min_qvix": "akshare.index.index_option_qvix",
+    "index_option_50index_qvix": "akshare.index.index_option_qvix",
+    "index_option_cyb_min_qvix": "akshare.index.index_option_qvix",
+    "index_option_cyb_qvix": "akshare.index.index_option_qvix",
+    "index_option_kcb_min_qvix": "akshare.index.index_option_qvix",
+    "index_option_kcb_qvix": "akshare.index.index_option_qvix",
+    # 百度股市通-外汇-行情榜单
+    "fx_quote_baidu": "akshare.fx.fx_quote_baidu",
+    # 乐估乐股-底部研究-巴菲特指标
+    "stock_buffett_index_lg": "akshare.stock_feature.stock_buffett_index_lg",
+    # 百度股市通-热搜股票
+    "stock_hot_search_baidu": "akshare.stock.stock_hot_search_baidu",
+    # 百度股市通- A 股或指数-股评-投票
+    "stock_zh_vote_baidu": "akshare.stock_feature.stock_zh_vote_baidu",
+    # 百度股市通-A 股-财务报表-估值数据
+    "stock_zh_valuation_baidu": "akshare.stock_feature.stock_zh_valuation_baidu",
+    # 百度股市通-港股-财务报表-估值数据
+    "stock_hk_valuation_baidu": "akshare.stock_feature.stock_hk_valuation_baidu",
+    # 百度股市通-美股-财务报表-估值数据
+    "stock_us_valuation_baidu": "akshare.stock_feature.stock_us_valuation_baidu",
+    # 巨潮资讯-个股-公司概况
+    "stock_profile_cninfo": "akshare.stock.stock_profile_cninfo",
+    # 巨潮资讯-个股-上市相关
+    "stock_ipo_summary_cninfo": "akshare.stock.stock_ipo_summary_cninfo",
+    # 巨潮资讯-数据浏览器-筹资指标-公司配股实施方案
+    "stock_allotment_cninfo": "akshare.stock.stock_allotment_cninfo",
+    # 沪深港股通-参考汇率和结算汇率
+    "stock_sgt_reference_exchange_rate_sse": "akshare.stock_feature.stock_hsgt_exchange_rate",
+    "stock_sgt_settlement_exchange_rate_sse": "akshare.stock_feature.stock_hsgt_exchange_rate",
+    "stock_sgt_reference_exchange_rate_szse": "akshare.stock_feature.stock_hsgt_exchange_rate",
+    "stock_sgt_settlement_exchange_rate_szse": "akshare.stock_feature.stock_hsgt_exchange_rate",
+    # 中国债券信息网-中债指数-中债指数族系-总指数-综合类指数
+    "bond_new_composite_index_cbond": "akshare.bond.bond_cbond",
+    "bond_composite_index_cbond": "akshare.bond.bond_cbond",
+    # 行业板块
+    "stock_classify_sina": "akshare.stock_feature.stock_classify_sina",
+    # 主营构成
+    "stock_zygc_em": "akshare.stock_fundamental.stock_zygc",
+    # 人民币汇率中间价
+    "currency_boc_safe": "akshare.currency.currency_safe",
+    # 期权-上海证券交易所-风险指标
+    "option_risk_indicator_sse": "akshare.option.option_risk_indicator_sse",
+    # 期权-上海证券交易所-当日合约
+    # 全球宏观事件
+    "news_economic_baidu": "akshare.news.news_baidu",
+    "news_trade_notify_suspend_baidu": "akshare.news.news_baidu",
+    "news_report_time_baidu": "akshare.news.news_baidu",
+    "news_trade_notify_dividend_baidu": "akshare.news.news_baidu",
+    # 东方财富-股票-财务分析
+    "stock_balance_sheet_by_report_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_balance_sheet_by_yearly_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_profit_sheet_by_report_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_profit_sheet_by_quarterly_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_profit_sheet_by_yearly_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_cash_flow_sheet_by_report_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_cash_flow_sheet_by_quarterly_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_cash_flow_sheet_by_yearly_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_balance_sheet_by_report_delisted_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_profit_sheet_by_report_delisted_em": "akshare.stock_feature.stock_three_report_em",
+    "stock_cash_flow_sheet_by_report_delisted_em": "akshare.stock_feature.stock_three_report_em",
+    # 内部交易
+    "stock_inner_trade_xq": "akshare.stock_feature.stock_inner_trade_xq",
+    # 股票热度-雪球
+    "stock_hot_deal_xq": "akshare.stock_feature.stock_hot_xq",
+    "stock_hot_follow_xq": "akshare.stock_feature.stock_hot_xq",
+    "stock_hot_tweet_xq": "akshare.stock_feature.stock_hot_xq",
+    # 东方财富-股票数据-龙虎榜
+    "stock_lhb_hyyyb_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_detail_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_detail_em_iter": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_stock_detail_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_jgmmtj_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_stock_statistic_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_stock_detail_date_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_yybph_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_jgstatistic_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_traderstatistic_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_yyb_detail_em": "akshare.stock_feature.stock_lhb_em",
+    "stock_lhb_yyb_detail_em_iter": "akshare.stock_feature.stock_lhb_em",
+    # 指数行情数据
+    "index_zh_a_hist": "akshare.index.index_zh_em",
+    "index_zh_a_hist_min_em": "akshare.index.index_zh_em",
+    "index_code_id_map_em": "akshare.index.index_zh_em",
+    # 东方财富个股人气榜-A股
+    "stock_hot_rank_detail_em": "akshare.stock.stock_hot_rank_em",
+    "stock_hot_rank_em": "akshare.stock.stock_hot_rank_em",
+    "stock_hot_rank_detail_realtime_em": "akshare.stock.stock_hot_rank_em",
+    "stock_hot_rank_relate_em": "akshare.stock.stock_hot_rank_em",
+    "stock_hot_keyword_em": "akshare.stock.stock_hot_rank_em",
+    "stock_hot_rank_latest_em": "akshare.stock.stock_hot_rank_em",
+    "stock_hot_up_em": "akshare.stock.stock_hot_up_em",
+    # 东方财富个股人气榜-港股
+    "stock_hk_hot_rank_detail_em": "akshare.stock.stock_hk_hot_rank_em",
+    "stock_hk_hot_rank_latest_em": "akshare.stock.stock_hk_hot_rank_em",
+    "stock_hk_hot_rank_detail_realtime_em": "akshare.stock.stock_hk_hot_rank_em",
+    "stock_hk_hot_rank_em": "akshare.stock.stock_hk_hot_rank_em",
+    # 财新指数
+    "index_pmi_com_cx": "akshare.index.index_cx",
+    "index_pmi_man_cx": "akshare.index.index_cx",
+    "index_pmi_ser_cx": "akshare.index.index_cx",
+    "index_dei_cx": "akshare.index.index_cx",
+    "index_ii_cx": "akshare.index.index_cx",
+    "index_si_cx": "akshare.index.index_cx",
+    "index_fi_cx": "akshare.index.index_cx",
+    "index_bi_cx": "akshare.index.index_cx",
+    "index_ci_cx": "akshare.index.index_cx",
+    "index_awpr_cx": "akshare.index.index_cx",
+    "index_cci_cx": "akshare.index.index_cx",
+    "index_li_cx": "akshare.index.index_cx",
+    "index_neaw_cx": "akshare.index.index_cx",
+    "index_nei_cx": "akshare.index.index_cx",
+    "index_ti_cx": "akshare.index.index_cx",
+    "index_ai_cx": "akshare.index.index_cx",
+    "index_neei_cx": "akshare.index.index_cx",
+    "index_bei_cx": "akshare.index.index_cx",
+    "index_qli_cx": "akshare.index.index_cx",
+    # 期权折溢价分析
+    "option_premium_analysis_em": "akshare.option.option_premium_analysis_em",
+    # 期权风险分析
+    "option_risk_analysis_em": "akshare.option.option_risk_analysis_em",
+    # 期权价值分析
+    "option_value_analysis_em": "akshare.option.option_value_analysis_em",
+    # 期权龙虎榜
+    "option_lhb_em": "akshare.option.option_lhb_em",
+    # 东方财富网-数据中心-股东分析
+    "stock_gdfx_holding_analyse_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_analyse_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_top_10_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_top_10_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_detail_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_holding_detail_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_change_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_holding_change_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_statistics_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_holding_statistics_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_free_holding_teamwork_em": "akshare.stock_feature.stock_gdfx_em",
+    "stock_gdfx_holding_teamwork_em": "akshare.stock_feature.stock_gdfx_em",
+    # 中国食糖指数
+    "index_sugar_msweet": "akshare.index.index_sugar",
+    "index_inner_quote_sugar_msweet": "akshare.index.index_sugar",
+    "index_outer_quote_sugar_msweet": "akshare.index.index_sugar",
+    # 东方财富-个股信息
+    "stock_individual_info_em": "akshare.stock.stock_info_em",
+    # 上海黄金交易所-数据资讯-行情走势
+    "spot_hist_sge": "akshare.spot.spot_sge",
+    "spot_symbol_table_sge": "akshare.spot.spot_sge",
+    "spot_silver_benchmark_sge": "akshare.spot.spot_sge",
+    "spot_golden_benchmark_sge": "akshare.spot.spot_sge",
+    "spot_quotations_sge": "akshare.spot.spot_sge",
+    # 股票回购
+    "stock_repurchase_em": "akshare.stock.stock_repurchase_em",
+    # 东方财富-行业板块
+    "stock_board_industry_cons_em": "akshare.stock.stock_board_industry_em",
+    "stock_board_industry_hist_em": "akshare.stock.stock_board_industry_em",
+    "stock_board_industry_hist_min_em": "akshare.stock.stock_board_industry_em",
+    "stock_board_industry_name_em": "akshare.stock.stock_board_industry_em",
+    "stock_board_industry_spot_em": "akshare.stock.stock_board_industry_em",
+    # 天天基金网-基金数据-规模变动
+    "fund_scale_change_em": "akshare.fund.fund_scale_em",
+    "fund_hold_structure_em": "akshare.fund.fund_scale_em",
+    # 天天基金网-基金数据-分红送配
+    "fund_cf_em": "akshare.fund.fund_fhsp_em",
+    "fund_fh_rank_em": "akshare.fund.fund_fhsp_em",
+    "fund_fh_em": "akshare.fund.fund_fhsp_em",
+    # 艺恩-艺人
+    "online_value_artist": "akshare.movie.artist_yien",
+    "business_value_artist": "akshare.movie.artist_yien",
+    # 艺恩-视频放映
+    "video_variety_show": "akshare.movie.video_yien",
+    "video_tv": "akshare.movie.video_yien",
+    # 同花顺-数据中心-技术选股
+    "stock_rank_cxg_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_cxd_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_lxsz_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_lxxd_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_cxfl_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_cxsl_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_xstp_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_xxtp_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_ljqd_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_ljqs_ths": "akshare.stock_feature.stock_technology_ths",
+    "stock_rank_xzjp_ths": "akshare.stock_feature.stock_technology_ths",
+    # 沪深港通持股
+    "stock_hsgt_individual_em": "akshare.stock_feature.stock_hsgt_em",
+    "stock_hsgt_individual_detail_em": "akshare.stock_feature.stock_hsgt_em",
+    "stock_hsgt_fund_flow_summary_em": "akshare.stock_feature.stock_hsgt_em",
+    # 基金规模
+    "fund_scale_open_sina": "akshare.fund.fund_scale_sina",
+    "fund_scale_close_sina": "akshare.fund.fund_scale_sina",
+    "fund_scale_structured_sina": "akshare.fund.fund_scale_sina",
+    # 巨潮资讯-数据中心-专题统计-基金报表
+    "fund_report_stock_cninfo": "akshare.fund.fund_report_cninfo",
+    "fund_report_industry_allocation_cninfo": "akshare.fund.fund_report_cninfo",
+    "fund_report_asset_allocation_cninfo": "akshare.fund.fund_report_cninfo",
+    # 巨潮资讯-数据中心-专题统计-债券报表-债券发行
+    "bond_treasure_issue_cninfo": "akshare.bond.bond_issue_cninfo",
+    "bond_local_government_issue_cninfo": "akshare.bond.bond_issue_cninfo",
+    "bond_corporate_issue_cninfo": "akshare.bond.bond_issue_cninfo",
+    "bond_cov_issue_cninfo": "akshare.bond.bond_issue_cninfo",
+    "bond_cov_stock_issue_cninfo": "akshare.bond.bond_issue_cninfo",
+    # 巨潮资讯-数据中心-专题统计-公司治理-股权质押
+    "stock_cg_equity_mortgage_cninfo": "akshare.stock.stock_cg_equity_mortgage",
+    # 巨潮资讯-数据中心-专题统计-公司治理-公司诉讼
+    "stock_cg_lawsuit_cninfo": "akshare.stock.stock_cg_lawsuit",
+    # 巨潮资讯-数据中心-专题统计-公司治理-对外担保
+    "stock_cg_guarantee_cninfo": "akshare.stock.stock_cg_guarantee",
+    # B 股
+    "stock_zh_b_spot": "akshare.stock.stock_zh_b_sina",
+    "stock_zh_b_daily": "akshare.stock.stock_zh_b_sina",
+    "stock_zh_b_minute": "akshare.stock.stock_zh_b_sina",
+    # 期货手续费
+    "futures_comm_info": "akshare.futures.futures_comm_qihuo",
+    "futures_fees_info": "akshare.futures.futures_comm_ctp",
+    # 实际控制人持股变动
+    "stock_hold_control_cninfo": "akshare.stock.stock_hold_control_cninfo",
+    "stock_hold_management_detail_cninfo": "akshare.stock.stock_hold_control_cninfo",
+    # 股东人数及持股集中度
+    "stock_hold_num_cninfo": "akshare.stock.stock_hold_num_cninfo",
+    # 新股过会
+    "stock_new_gh_cninfo": "akshare.stock.stock_new_cninfo",
+    "stock_new_ipo_cninfo": "akshare.stock.stock_new_cninfo",
+    # 个股分红
+    "stock_dividend_cninfo": "akshare.stock.stock_dividend_cninfo",
+    # 公司股本变动
+    "stock_share_change_cninfo": "akshare.stock.stock_share_changes_cninfo",
+    # 行业分类数据
+    "stock_industry_category_cninfo": "akshare.stock.stock_industry_cninfo",
+    "stock_industry_change_cninfo": "akshare.stock.stock_industry_cninfo",
+    # 行业市盈率
+    "stock_industry_pe_ratio_cninfo": "akshare.stock.stock_industry_pe_cninfo",
+    # 申万宏源行业分类数据
+    "stock_industry_clf_hist_sw": "akshare.stock.stock_industry_sw",
+    # 投资评级
+    "stock_rank_forecast_cninfo": "akshare.stock.stock_rank_forecast",
+    # 美股-知名美股
+    "stock_us_famous_spot_em": "akshare.stock.stock_us_famous",
+    # 美股-粉单市场
+    "stock_us_pink_spot_em": "akshare.stock.stock_us_pink",
+    # REITs
+    "reits_realtime_em": "akshare.reits.reits_basic",
+    "reits_hist_em": "akshare.reits.reits_basic",
+    "reits_hist_min_em": "akshare.reits.reits_basic",
+    # 全部 A 股-等权重市盈率、中位数市盈率 全部 A 股-等权重、中位数市净率
+    "stock_a_ttm_lyr": "akshare.stock_feature.stock_ttm_lyr",
+    "stock_a_all_pb": "akshare.stock_feature.stock_all_pb",
+    # 宏观-加拿大
+    "macro_canada_cpi_monthly": "akshare.economic.macro_canada",
+    "macro_canada_core_cpi_monthly": "akshare.economic.macro_canada",
+    "macro_canada_bank_rate": "akshare.economic.macro_canada",
+    "macro_canada_core_cpi_yearly": "akshare.economic.macro_canada",
+    "macro_canada_cpi_yearly": "akshare.economic.macro_canada",
+    "macro_canada_gdp_monthly": "akshare.economic.macro_canada",
+    "macro_canada_new_house_rate": "akshare.economic.macro_canada",
+    "macro_canada_retail_rate_monthly": "akshare.economic.macro_canada",
+    "macro_canada_trade": "akshare.economic.macro_canada",
+    "macro_canada_unemployment_rate": "akshare.economic.macro_canada",
+    # 猪肉价格信息
+    "futures_hog_core": "akshare.futures_derivative.futures_hog",
+    "futures_hog_cost": "akshare.futures_derivative.futures_hog",
+    "futures_hog_supply": "akshare.futures_derivative.futures_hog",
+    # 宏观-澳大利亚
+    "macro_australia_bank_rate": "akshare.economic.macro_australia",
+    "macro_australia_unemployment_rate": "akshare.economic.macro_australia",
+    "macro_australia_trade": "akshare.economic.macro_australia",
+    "macro_australia_cpi_quarterly": "akshare.economic.macro_australia",
+    "macro_australia_cpi_yearly": "akshare.economic.macro_australia",
+    "macro_australia_ppi_quarterly": "akshare.economic.macro_australia",
+    "macro_australia_retail_rate_monthly": "akshare.economic.macro_australia",
+    # 融资融券-深圳
+    "stock_margin_underlying_info_szse": "akshare.stock_feature.stock_margin_szse",
+    "stock_margin_detail_szse": "akshare.stock_feature.stock_margin_szse",
+    "stock_margin_szse": "akshare.stock_feature.stock_margin_szse",
+    # 英国-宏观
+    "macro_uk_gdp_yearly": "akshare.economic.macro_uk",
+    "macro_uk_gdp_quarterly": "akshare.economic.macro_uk",
+    "macro_uk_retail_yearly": "akshare.economic.macro_uk",
+    "macro_uk_rightmove_monthly": "akshare.economic.macro_uk",
+    "macro_uk_rightmove_yearly": "akshare.economic.macro_uk",
+    "macro_uk_unemployment_rate": "akshare.economic.macro_uk",
+    "macro_uk_halifax_monthly": "akshare.economic.macro_uk",
+    "macro_uk_bank_rate": "akshare.economic.macro_uk",
+    "macro_uk_core_cpi_monthly": "akshare.economic.macro_uk",
+    "macro_uk_core_cpi_yearly": "akshare.economic.macro_uk",
+    "macro_uk_cpi_monthly": "akshare.economic.macro_uk",
+    "macro_uk_cpi_yearly": "akshare.economic.macro_uk",
+    "macro_uk_halifax_yearly": "akshare.economic.macro_uk",
+    "macro_uk_retail_monthly": "akshare.economic.macro_uk",
+    "macro_uk_trade": "akshare.economic.macro_uk",
+    # 日本-宏观
+    "macro_japan_bank_rate": "akshare.economic.macro_japan",
+    "macro_japan_core_cpi_yearly": "akshare.economic.macro_japan",
+    "macro_japan_cpi_yearly": "akshare.economic.macro_japan",
+    "macro_japan_head_indicator": "akshare.economic.macro_japan",
+    "macro_japan_unemployment_rate": "akshare.economic.macro_japan",
+    # 瑞士-宏观
+    "macro_swiss_trade": "akshare.economic.macro_swiss",
+    "macro_swiss_svme": "akshare.economic.macro_swiss",
+    "macro_swiss_cpi_yearly": "akshare.economic.macro_swiss",
+    "macro_swiss_gbd_yearly": "akshare.economic.macro_swiss",
+    "macro_swiss_gbd_bank_rate": "akshare.economic.macro_swiss",
+    "macro_swiss_gdp_quarterly": "akshare.economic.macro_swiss",
+    # 东方财富-概念板块
+    "stock_board_concept_cons_em": "akshare.stock.stock_board_concept_em",
+    "stock_board_concept_hist_em": "akshare.stock.stock_board_concept_em",
+    "stock_board_concept_hist_min_em": "akshare.stock.stock_board_concept_em",
+    "stock_board_concept_name_em": "akshare.stock.stock_board_concept_em",
+    "stock_board_concept_spot_em": "akshare.stock.stock_board_concept_em",
+    # 东方财富-股票所属板块
+    "stock_board_membership_em": "akshare.stock.stock_board_membership_em",
+    # 德国-经济指标
+    "macro_germany_gdp": "akshare.economic.macro_germany",
+    "macro_germany_ifo": "akshare.economic.macro_germany",
+    "macro_germany_cpi_monthly": "akshare.economic.macro_germany",
+    "macro_germany_retail_sale_monthly": "akshare.economic.macro_germany",
+    "macro_germany_trade_adjusted": "akshare.economic.macro_germany",
+    "macro_germany_retail_sale_yearly": "akshare.economic.macro_germany",
+    "macro_germany_cpi_yearly": "akshare.economic.macro_germany",
+    "macro_germany_zew": "akshare.economic.macro_germany",
+    # 基金规模和规模趋势
+    "fund_aum_em": "akshare.fund.fund_aum_em",
+    "fund_aum_trend_em": "akshare.fund.fund_aum_em",
+    "fund_aum_hist_em": "akshare.fund.fund_aum_em",
+    # CME 比特币成交量
+    "crypto_bitcoin_cme": "akshare.crypto.crypto_bitcoin_cme",
+    # 盘口异动
+    "stock_changes_em": "akshare.stock_feature.stock_pankou_em",
+    "stock_board_change_em": "akshare.stock_feature.stock_pankou_em",
+    # A 股东方财富
+    "stock_zh_a_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_bj_a_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_new_a_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_kc_a_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_cy_a_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_sh_a_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_sz_a_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_zh_b_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_zh_ab_comparison_em": "akshare.stock_feature.stock_hist_em",
+    "stock_zh_a_hist": "akshare.stock_feature.stock_hist_em",
+    "stock_zh_a_hist_batch": "akshare.stock_feature.stock_hist_em",
+    "stock_zh_a_hist_batch_iter": "akshare.stock_feature.stock_hist_em",
+    "stock_hk_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_hk_main_board_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_hk_hist": "akshare.stock_feature.stock_hist_em",
+    "stock_us_spot_em": "akshare.stock_feature.stock_hist_em",
+    "stock_us_hist": "akshare.stock_feature.stock_hist_em",
+    "stock_zh_a_hist_min_em": "akshare.stock_feature.stock_hist_em",
+    "stock_zh_a_hist_pre_min_em": "akshare.stock_feature.stock_hist_em",
+    "stock_hk_hist_min_em": "akshare.stock_feature.stock_hist_em",
+    "stock_us_hist_min_em": "akshare.stock_feature.stock_hist_em",
+    # A 股历史行情-本地增量存储
+    "stock_zh_a_hist_store": "akshare.stock_feature.stock_hist_store",
+    # 中行人民币牌价历史数据查询
+    "currency_boc_sina": "akshare.currency.currency_china_bank_sina",
+    # 期货持仓
+    "futures_hold_pos_sina": "akshare.futures_derivative.futures_cot_sina",
+    # 股东户数
+    "stock_zh_a_gdhs": "akshare.stock_feature.stock_gdhs",
+    "stock_zh_a_gdhs_detail_em": "akshare.stock_feature.stock_gdhs",
+    # 两网及退市
+    "stock_staq_net_stop": "akshare.stock.stock_stop",
+    # 涨停板行情
+    "stock_zt_pool_em": "akshare.stock_feature.stock_ztb_em",
+    "stock_zt_pool_previous_em": "akshare.stock_feature.stock_ztb_em",
+    "stock_zt_pool_dtgc_em": "akshare.stock_feature.stock_ztb_em",
+    "stock_zt_pool_zbgc_em": "akshare.stock_feature.stock_ztb_em",
+    "stock_zt_pool_strong_em": "akshare.stock_feature.stock_ztb_em",
+    "stock_zt_pool_sub_new_em": "akshare.stock_feature.stock_ztb_em",
+    # 中国-香港-宏观
+    "macro_china_hk_cpi": "akshare.economic.macro_china_hk",
+    "macro_china_hk_cpi_ratio": "akshare.economic.macro_china_hk",
+    "macro_china_hk_trade_diff_ratio": "akshare.economic.macro_china_hk",
+    "macro_china_hk_gbp_ratio": "akshare.economic.macro_china_hk",
+    "macro_china_hk_building_amount": "akshare.economic.macro_china_hk",
+    "macro_china_hk_building_volume": "akshare.economic.macro_china_hk",
+    "macro_china_hk_gbp": "akshare.economic.macro_china_hk",
+    "macro_china_hk_ppi": "akshare.economic.macro_china_hk",
+    "macro_china_hk_rate_of_unemployment": "akshare.economic.macro_china_hk",
+    # 增发和配股
+    "stock_qbzf_em": "akshare.stock_feature.stock_zf_pg",
+    "stock_pg_em": "akshare.stock_feature.stock_zf_pg",
+    # 汽车销量
+    "car_sale_rank_gasgoo": "akshare.other.other_car_gasgoo",
+    "car_market_cate_cpca": "akshare.other.other_car_cpca",
+    "car_market_fuel_cpca": "akshare.other.other_car_cpca",
+    "car_market_segment_cpca": "akshare.other.other_car_cpca",
+    "car_market_country_cpca": "akshare.other.other_car_cpca",
+    "car_market_man_rank_cpca": "akshare.other.other_car_cpca",
+    "car_market_total_cpca": "akshare.other.other_car_cpca",
+    # 中国公路物流运价、运量指数
+    "index_price_cflp": "akshare.index.index_cflp",
+    "index_volume_cflp": "akshare.index.index_cflp",
+    # 赚钱效应分析
+    "stock_market_activity_legu": "akshare.stock_feature.stock_market_legu",
+    # 浙江省排污权交易指数
+    "index_eri": "akshare.index.index_eri",
+    # Drewry 集装箱指数
+    "drewry_wci_index": "akshare.index.index_drewry",
+    # 柯桥指数
+    "index_kq_fz": "akshare.index.index_kq_fz",
+    "index_kq_fashion": "akshare.index.index_kq_ss",
+    # 新发基金
+    "fund_new_found_em": "akshare.fund.fund_init_em",
+    # 高管持股
+    "stock_ggcg_em": "akshare.stock_feature.stock_gdzjc_em",
+    # 同花顺-数据中心-资金流向-概念资金流
+    "stock_fund_flow_concept": "akshare.stock_feature.stock_fund_flow",
+    "stock_fund_flow_industry": "akshare.stock_feature.stock_fund_flow",
+    "stock_fund_flow_big_deal": "akshare.stock_feature.stock_fund_flow",
+    "stock_fund_flow_individual": "akshare.stock_feature.stock_fund_flow",
+    # 比特币持仓
+    "crypto_bitcoin_hold_report": "akshare.crypto.crypto_hold",
+    # 证券交易营业部排行
+    "stock_lh_yyb_capital": "akshare.stock_feature.stock_lh_yybpm",
+    "stock_lh_yyb_most": "akshare.stock_feature.stock_lh_yybpm",
+    "stock_lh_yyb_control": "akshare.stock_feature.stock_lh_yybpm",
+    # 沪深 A 股公告
+    "stock_notice_report": "akshare.stock_fundamental.stock_notice",
+    # 首发企业申报
+    "stock_ipo_declare_em": "akshare.stock_fundamental.stock_ipo_declare",
+    # 辅导备案信息
+    "stock_ipo_tutor_em": "akshare.stock_fundamental.stock_ipo_tutor",
+    # 三大报表
+    "stock_zcfz_em": "akshare.stock_feature.stock_report_em",
+    "stock_zcfz_bj_em": "akshare.stock_feature.stock_report_em",
+    "stock_lrb_em": "akshare.stock_feature.stock_report_em",
+    "stock_xjll_em": "akshare.stock_feature.stock_report_em",
+    # 业绩报告
+    "stock_yjbb_em": "akshare.stock_feature.stock_yjbb_em",
+    # 同花顺-概念板块
+    "stock_board_concept_info_ths": "akshare.stock_feature.stock_board_concept_ths",
+    "stock_board_concept_summary_ths": "akshare.stock_feature.stock_board_concept_ths",
+    "stock_board_concept_index_ths": "akshare.stock_feature.stock_board_concept_ths",
+    "stock_board_concept_name_ths": "akshare.stock_feature.stock_board_concept_ths",
+    # 同花顺-行业板块
+    "stock_board_industry_name_ths": "akshare.stock_feature.stock_board_industry_ths",
+    "stock_board_industry_info_ths": "akshare.stock_feature.stock_board_industry_ths",
+    "stock_board_industry_index_ths": "akshare.stock_feature.stock_board_industry_ths",
+    "stock_ipo_benefit_ths": "akshare.stock_feature.stock_board_industry_ths",
+    "stock_xgsr_ths": "akshare.stock_feature.stock_board_industry_ths",
+    # 分红配送
+    "stock_fhps_em": "akshare.stock_feature.stock_fhps_em",
+    "stock_fhps_detail_em": "akshare.stock_feature.stock_fhps_em",
+    # 中美国债收益率
+    "bond_zh_us_rate": "akshare.bond.bond_em",
+    # 盈利预测
+    "stock_profit_forecast_em": "akshare.stock_fundamental.stock_profit_forecast_em",
+    # 基金经理
+    "fund_manager_em": "akshare.fund.fund_manager",
+    # 基金评级
+    "fund_rating_sh": "akshare.fund.fund_rating",
+    "fund_rating_zs": "akshare.fund.fund_rating",
+    "fund_rating_ja": "akshare.fund.fund_rating",
+    "fund_rating_all": "akshare.fund.fund_rating",
+    # 融资融券数据
+    "stock_margin_detail_sse": "akshare.stock_feature.stock_margin_sse",
+    "stock_margin_sse": "akshare.stock_feature.stock_margin_sse",
+    "stock_margin_ratio_pa": "akshare.stock_feature.stock_margin_sse",
+    # 期货交割和期转现
+    "futures_to_spot_czce": "akshare.futures.futures_to_spot",
+    "futures_to_spot_shfe": "akshare.futures.futures_to_spot",
+    "futures_to_spot_dce": "akshare.futures.futures_to_spot",
+    "futures_delivery_dce": "akshare.futures.futures_to_spot",
+    "futures_delivery_shfe": "akshare.futures.futures_to_spot",
+    "futures_delivery_czce": "akshare.futures.futures_to_spot",
+    "futures_delivery_match_dce": "akshare.futures.futures_to_spot",
+    "futures_delivery_match_czce": "akshare.futures.futures_to_spot",
+    # 基金持仓
+    "fund_portfolio_hold_em": "akshare.fund.fund_portfolio_em",
+    "fund_portfolio_change_em": "akshare.fund.fund_portfolio_em",
+    "fund_portfolio_bond_hold_em": "akshare.fund.fund_portfolio_em",
+    "fund_portfolio_industry_allocation_em": "akshare.fund.fund_portfolio_em",
+    # 债券概览
+    "bond_deal_summary_sse": "akshare.bond.bond_summary",
+    "bond_cash_summary_sse": "akshare.bond.bond_summary",
+    # 新闻-个股新闻
+    "stock_news_em": "akshare.news.news_stock",
+    # 股票数据-一致行动人
+    "stock_yzxdr_em": "akshare.stock_feature.stock_yzxdr_em",
+    # 大宗交易
+    "stock_dzjy_sctj": "akshare.stock.stock_dzjy_em",
+    "stock_dzjy_mrmx": "akshare.stock.stock_dzjy_em",
+    "stock_dzjy_mrtj": "akshare.stock.stock_dzjy_em",
+    "stock_dzjy_hygtj": "akshare.stock.stock_dzjy_em",
+    "stock_dzjy_yybph": "akshare.stock.stock_dzjy_em",
+    "stock_dzjy_hyyybtj": "akshare.stock.stock_dzjy_em",
+    # 国证指数
+    "index_hist_cni": "akshare.index.index_cni",
+    "index_all_cni": "akshare.index.index_cni",
+    "index_detail_cni": "akshare.index.index_cni",
+    "index_detail_hist_cni": "akshare.index.index_cni",
+    "index_detail_hist_adjust_cni": "akshare.index.index_cni",
+    # 东方财富-期权
+    "option_current_em": "akshare.option.option_em",
+    # 科创板报告
+    "stock_zh_kcb_report_em": "akshare.stock.stock_zh_kcb_report",
+    # 期货合约详情
+    "futures_contract_detail": "akshare.futures.futures_contract_detail",
+    "futures_contract_detail_em": "akshare.futures.futures_contract_detail",
+    # 胡润排行榜
+    "hurun_rank": "akshare.fortune.fortune_hurun",
+    # 新财富富豪榜
+    "xincaifu_rank": "akshare.fortune.fortune_xincaifu_500",
+    # 福布斯中国榜单
+    "forbes_rank": "akshare.fortune.fortune_forbes_500",
+    # 回购定盘利率
+    "repo_rate_hist": "akshare.rate.repo_rate",
+    "repo_rate_query": "akshare.rate.repo_rate",
+    # 公募基金排行
+    "fund_exchange_rank_em": "akshare.fund.fund_rank_em",
+    "fund_money_rank_em": "akshare.fund.fund_rank_em",
+    "fund_open_fund_rank_em": "akshare.fund.fund_rank_em",
+    "fund_hk_rank_em": "akshare.fund.fund_rank_em",
+    "fund_lcx_rank_em": "akshare.fund.fund_rank_em",
+    # 电影票房
+    "movie_boxoffice_cinema_daily": "akshare.movie.movie_yien",
+    "movie_boxoffice_cinema_weekly": "akshare.movie.movie_yien",
+    "movie_boxoffice_weekly": "akshare.movie.movie_yien",
+    "movie_boxoffice_daily": "akshare.movie.movie_yien",
+    "movie_boxoffice_monthly": "akshare.movie.movie_yien",
+    "movie_boxoffice_realtime": "akshare.movie.movie_yien",
+    "movie_boxoffice_yearly": "akshare.movie.movie_yien",
+    "movie_boxoffice_yearly_first_week": "akshare.movie.movie_yien",
+    # 新闻联播文字稿
+    "news_cctv": "akshare.news.news_cctv",
+    # 债券收盘收益率曲线历史数据
+    "bond_china_close_return": "akshare.bond.bond_china_money",
+    "macro_china_bond_public": "akshare.bond.bond_china_money",
+    "macro_china_swap_rate": "akshare.bond.bond_china_money",
+    "bond_china_close_return_map": "akshare.bond.bond_china_money",
+    # COMEX黄金-白银库存
+    "futures_comex_inventory": "akshare.futures.futures_comex_em",
+    # A 股-特别标的
+    "stock_zh_a_new": "akshare.stock.stock_zh_a_special",
+    "stock_zh_a_st_em": "akshare.stock.stock_zh_a_special",
+    "stock_zh_a_new_em": "akshare.stock.stock_zh_a_special",
+    "stock_zh_a_stop_em": "akshare.stock.stock_zh_a_special",
+    # 东方财富-注册制审核
+    "stock_register_all_em": "akshare.stock_fundamental.stock_register_em",
+    "stock_register_kcb": "akshare.stock_fundamental.stock_register_em",
+    "stock_register_cyb": "akshare.stock_fundamental.stock_register_em",
+    "stock_register_bj": "akshare.stock_fundamental.stock_register_em",
+    "stock_register_db": "akshare.stock_fundamental.stock_register_em",
+    "stock_register_sh": "akshare.stock_fundamental.stock_register_em",
+    "stock_register_sz": "akshare.stock_fundamental.stock_register_em",
+    # 东方财富-过会企业信息
+    "stock_ipo_review_em": "akshare.stock_fundamental.stock_ipo_review",
+    # 新浪财经-龙虎榜
+    "stock_lhb_detail_daily_sina": "akshare.stock_feature.stock_lhb_sina",
+    "stock_lhb_ggtj_sina": "akshare.stock_feature.stock_lhb_sina",
+    "stock_lhb_jgmx_sina": "akshare.stock_feature.stock_lhb_sina",
+    "stock_lhb_jgzz_sina": "akshare.stock_feature.stock_lhb_sina",
+    "stock_lhb_yytj_sina": "akshare.stock_feature.stock_lhb_sina",
+    # 中证指数
+    "stock_zh_index_hist_csindex": "akshare.index.index_stock_zh_csindex",
+    "stock_zh_index_value_csindex": "akshare.index.index_stock_zh_csindex",
+    # 股票基金持仓数据
+    "stock_report_fund_hold": "akshare.stock.stock_fund_hold",
+    "stock_report_fund_hold_detail": "akshare.stock.stock_fund_hold",
+    # 期货分钟数据
+    "futures_zh_minute_sina": "akshare.futures.futures_zh_sina",
+    "futures_zh_daily_sina": "akshare.futures.futures_zh_sina",
+    "futures_zh_realtime": "akshare.futures.futures_zh_sina",
+    "futures_symbol_mark": "akshare.futures.futures_zh_sina",
+    "match_main_contract": "akshare.futures.futures_zh_sina",
+    "futures_zh_spot": "akshare.futures.futures_zh_sina",
+    # 股票财务报告预约披露
+    "stock_report_disclosure": "akshare.stock_feature.stock_yjyg_cninfo",
+    # 基金行情
+    "fund_etf_hist_sina": "akshare.fund.fund_etf_sina",
+    "fund_etf_category_sina": "akshare.fund.fund_etf_sina",
+    "fund_etf_dividend_sina": "akshare.fund.fund_etf_sina",
+    # 交易日历
+    "tool_trade_date_hist_sina": "akshare.tool.trade_date_hist",
+    # commodity option
+    "option_commodity_contract_table_sina": "akshare.option.option_commodity_sina",
+    "option_commodity_contract_sina": "akshare.option.option_commodity_sina",
+    "option_commodity_hist_sina": "akshare.option.option_commodity_sina",
+    # A 股PE和PB
+    "stock_market_pb_lg": "akshare.stock_feature.stock_a_pe_and_pb",
+    "stock_index_pb_lg": "akshare.stock_feature.stock_a_pe_and_pb",
+    "stock_market_pe_lg": "akshare.stock_feature.stock_a_pe_and_pb",
+    "stock_index_pe_lg": "akshare.stock_feature.stock_a_pe_and_pb",
+    "stock_hk_indicator_eniu": "akshare.stock_feature.stock_a_indicator",
+    "stock_a_high_low_statistics": "akshare.stock_feature.stock_a_high_low",
+    "stock_a_below_net_asset_statistics": "akshare.stock_feature.stock_a_below_net_asset_statistics",
+    # 彭博亿万富豪指数
+    "index_bloomberg_billionaires": "akshare.fortune.fortune_bloomberg",
+    "index_bloomberg_billionaires_hist": "akshare.fortune.fortune_bloomberg",
+    # stock-券商业绩月报
+    "stock_qsjy_em": "akshare.stock_feature.stock_qsjy_em",
+    # futures-warehouse-receipt
+    "futures_warehouse_receipt_czce": "akshare.futures.futures_warehouse_receipt",
+    "futures_warehouse_receipt_dce": "akshare.futures.futures_warehouse_receipt",
+    "futures_shfe_warehouse_receipt": "akshare.futures.futures_warehouse_receipt",
+    "futures_gfex_warehouse_receipt": "akshare.futures.futures_warehouse_receipt",
+    # stock-js
+    "stock_price_js": "akshare.stock.stock_us_js",
+    # stock-summary
+    "stock_sse_summary": "akshare.stock.stock_summary",
+    "stock_szse_summary": "akshare.stock.stock_summary",
+    "stock_sse_deal_daily": "akshare.stock.stock_summary",
+    "stock_szse_area_summary": "akshare.stock.stock_summary",
+    "stock_szse_sector_summary": "akshare.stock.stock_summary",
+    # 股票-机构推荐池
+    "stock_institute_recommend": "akshare.stock_fundamental.stock_recommend",
+    "stock_institute_recommend_detail": "akshare.stock_fundamental.stock_recommend",
+    # 股票-机构持股
+    "stock_institute_hold_detail": "akshare.stock_fundamental.stock_hold",
+    "stock_institute_hold": "akshare.stock_fundamental.stock_hold",
+    # stock-info
+    "stock_info_sh_delist": "akshare.stock.stock_info",
+    "stock_info_sz_delist": "akshare.stock.stock_info",
+    "stock_info_a_code_name": "akshare.stock.stock_info",
+    "stock_info_sh_name_code": "akshare.stock.stock_info",
+    "stock_info_bj_name_code": "akshare.stock.stock_info",
+    "stock_info_sz_name_code": "akshare.stock.stock_info",
+    "stock_info_sz_change_name": "akshare.stock.stock_info",
+    "stock_info_change_name": "akshare.stock.stock_info",
+    # stock-sector
+    "stock_sector_spot": "akshare.stock.stock_industry",
+    "stock_sector_detail": "akshare.stock.stock_industry",
+    # stock-fundamental
+    "stock_financial_abstract": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_financial_report_sina": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_financial_analysis_indicator": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_add_stock": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_ipo_info": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_history_dividend_detail": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_history_dividend": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_circulate_stock_holder": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_restricted_release_queue_sina": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_fund_stock_holder": "akshare.stock_fundamental.stock_finance_sina",
+    "stock_main_stock_holder": "akshare.stock_fundamental.stock_finance_sina",
+    # stock-HK-fundamental
+    "stock_financial_hk_analysis_indicator_em": "akshare.stock_fundamental.stock_finance_hk_em",
+    "stock_financial_hk_report_em": "akshare.stock_fundamental.stock_finance_hk_em",
+    # stock_fund
+    "stock_individual_fund_flow": "akshare.stock.stock_fund_em",
+    "stock_market_fund_flow": "akshare.stock.stock_fund_em",
+    "stock_sector_fund_flow_rank": "akshare.stock.stock_fund_em",
+    "stock_individual_fund_flow_rank": "akshare.stock.stock_fund_em",
+    "stock_sector_fund_flow_summary": "akshare.stock.stock_fund_em",
+    "stock_sector_fund_flow_hist": "akshare.stock.stock_fund_em",
+    "stock_concept_fund_flow_hist": "akshare.stock.stock_fund_em",
+    "stock_main_fund_flow": "akshare.stock.stock_fund_em",
+    # air-quality
+    "air_quality_hist": "akshare.air.air_zhenqi",
+    "air_quality_rank": "akshare.air.air_zhenqi",
+    "air_quality_watch_point": "akshare.air.air_zhenqi",
+    "air_city_table": "akshare.air.air_zhenqi",
+    # hf
+    "hf_sp_500": "akshare.hf.hf_sp500",
+    # stock_yjyg_em
+    "stock_yjyg_em": "akshare.stock_feature.stock_yjyg_em",
+    "stock_yysj_em": "akshare.stock_feature.stock_yjyg_em",
+    "stock_yjkb_em": "akshare.stock_feature.stock_yjyg_em",
+    # stock
+    "stock_dxsyl_em": "akshare.stock_feature.stock_dxsyl_em",
+    "stock_xgsglb_em": "akshare.stock_feature.stock_dxsyl_em",
+    # article
+    "fred_md": "akshare.article.fred_md",
+    "fred_qd": "akshare.article.fred_md",
+    # 中证商品指数
+    "futures_index_ccidx": "akshare.futures.futures_index_ccidx",
+    # futures_em_spot_stock
+    "futures_spot_stock": "akshare.futures.futures_spot_stock_em",
+    # energy_oil
+    "energy_oil_detail": "akshare.energy.energy_oil_em",
+    "energy_oil_hist": "akshare.energy.energy_oil_em",
+    # futures-foreign
+    "futures_foreign_detail": "akshare.futures.futures_foreign",
+    "futures_foreign_hist": "akshare.futures.futures_foreign",
+    # stock-em-tfp
+    "stock_tfp_em": "akshare.stock_feature.stock_tfp_em",
+    # stock-em-hsgt
+    "stock_hk_ggt_components_em": "akshare.stock_feature.stock_hsgt_em",
+    "stock_hsgt_hold_stock_em": "akshare.stock_feature.stock_hsgt_em",
+    "stock_hsgt_hist_em": "akshare.stock_feature.stock_hsgt_em",
+    "stock_hsgt_institution_statistics_em": "akshare.stock_feature.stock_hsgt_em",
+    "stock_hsgt_stock_statistics_em": "akshare.stock_feature.stock_hsgt_em",
+    "stock_hsgt_board_rank_em": "akshare.stock_feature.stock_hsgt_em",
+    # stock-em-comment
+    "stock_comment_em": "akshare.stock_feature.stock_comment_em",
+    "stock_comment_detail_zlkp_jgcyd_em": "akshare.stock_feature.stock_comment_em",
+    "stock_comment_detail_scrd_focus_em": "akshare.stock_feature.stock_comment_em",
+    "stock_comment_detail_zhpj_lspf_em": "akshare.stock_feature.stock_comment_em",
+    "stock_comment_detail_scrd_desire_em": "akshare.stock_feature.stock_comment_em",
+    # stock-em-analyst
+    "stock_analyst_detail_em": "akshare.stock_feature.stock_analyst_em",
+    "stock_analyst_rank_em": "akshare.stock_feature.stock_analyst_em",
+    # 新加坡期货交易所
+    "futures_settlement_price_sgx": "akshare.futures.futures_settlement_price_sgx",
+    # currency interface
+    "currency_convert": "akshare.currency.currency",
+    "currency_currencies": "akshare.currency.currency",
+    "currency_history": "akshare.currency.currency",
+    "currency_latest": "akshare.currency.currency",
+    "currency_time_series": "akshare.currency.currency",
+    # 知识图谱
+    "nlp_ownthink": "akshare.nlp.nlp_interface",
+    "nlp_answer": "akshare.nlp.nlp_interface",
+    # 微博舆情报告
+    "stock_js_weibo_nlp_time": "akshare.stock.stock_weibo_nlp",
+    "stock_js_weibo_report": "akshare.stock.stock_weibo_nlp",
+    # 金融期权-新浪
+    "option_cffex_sz50_list_sina": "akshare.option.option_finance_sina",
+    "option_cffex_sz50_spot_sina": "akshare.option.option_finance_sina",
+    "option_cffex_sz50_daily_sina": "akshare.option.option_finance_sina",
+    "option_cffex_hs300_list_sina": "akshare.option.option_finance_sina",
+    "option_cffex_hs300_spot_sina": "akshare.option.option_finance_sina",
+    "option_cffex_hs300_daily_sina": "akshare.option.option_finance_sina",
+    "option_cffex_zz1000_list_sina": "akshare.option.option_finance_sina",
+    "option_cffex_zz1000_spot_sina": "akshare.option.option_finance_sina",
+    "option_cffex_zz1000_daily_sina": "akshare.option.option_finance_sina",
+    "option_sse_list_sina": "akshare.option.option_finance_sina",
+    "option_sse_expire_day_sina": "akshare.option.option_finance_sina",
+    "option_sse_codes_sina": "akshare.option.option_finance_sina",
+    "option_sse_spot_price_sina": "akshare.option.option_finance_sina",
+    "option_sse_underlying_spot_price_sina": "akshare.option.option_finance_sina",
+    "option_sse_greeks_sina": "akshare.option.option_finance_sina",
+    "option_sse_chain_snapshot_sina": "akshare.option.option_finance_sina",
+    "option_sse_chain_snapshot_sina_poll": "akshare.option.option_finance_sina",
+    "option_sse_minute_sina": "akshare.option.option_finance_sina",
+    "option_sse_daily_sina": "akshare.option.option_finance_sina",
+    "option_finance_minute_sina": "akshare.option.option_finance_sina",
+    "option_minute_em": "akshare.option.option_finance_sina",
+    # 债券-沪深债券
+    "bond_zh_hs_daily": "akshare.bond.bond_zh_sina",
+    "bond_zh_hs_spot": "akshare.bond.bond_zh_sina",
+    "bond_zh_hs_cov_daily": "akshare.bond.bond_zh_cov",
+    "bond_zh_hs_cov_spot": "akshare.bond.bond_zh_cov",
+    "bond_cov_comparison": "akshare.bond.bond_zh_cov",
+    "bond_zh_cov": "akshare.bond.bond_zh_cov",
+    "bond_zh_cov_info": "akshare.bond.bond_zh_cov",
+    "bond_zh_hs_cov_min": "akshare.bond.bond_zh_cov",
+    "bond_zh_hs_cov_pre_min": "akshare.bond.bond_zh_cov",
+    "bond_zh_cov_value_analysis": "akshare.bond.bond_zh_cov",
+    "bond_cb_jsl": "akshare.bond.bond_convert",
+    "bond_cb_adj_logs_jsl": "akshare.bond.bond_convert",
+    "bond_cb_index_jsl": "akshare.bond.bond_convert",
+    "bond_cb_redeem_jsl": "akshare.bond.bond_convert",
+    # 基金数据接口
+    "fund_open_fund_daily_em": "akshare.fund.fund_em",
+    "fund_open_fund_info_em": "akshare.fund.fund_em",
+    "fund_open_fund_info_all_em": "akshare.fund.fund_em",
+    "fund_open_fund_info_all_batch_em": "akshare.fund.fund_em",
+    "fund_etf_fund_daily_em": "akshare.fund.fund_em",
+    "fund_etf_fund_info_em": "akshare.fund.fund_em",
+    "fund_financial_fund_daily_em": "akshare.fund.fund_em",
+    "fund_financial_fund_info_em": "akshare.fund.fund_em",
+    "fund_name_em": "akshare.fund.fund_em",
+    "fund_info_index_em": "akshare.fund.fund_em",
+    "fund_graded_fund_daily_em": "akshare.fund.fund_em",
+    "fund_graded_fund_info_em": "akshare.fund.fund_em",
+    "fund_money_fund_daily_em": "akshare.fund.fund_em",
+    "fund_money_fund_info_em": "akshare.fund.fund_em",
+    "fund_value_estimation_em": "akshare.fund.fund_em",
+    "fund_hk_fund_hist_em": "akshare.fund.fund_em",
+    "fund_purchase_em": "akshare.fund.fund_em",
+    # 百度迁徙地图接口
+    "migration_area_baidu": "akshare.event.migration",
+    "migration_scale_baidu": "akshare.event.migration",
+    # 英为财情-外汇-货币对历史数据
+    "currency_pair_map": "akshare.fx.currency_investing",
+    # 商品期权-郑州商品交易所-期权-历史数据
+    "option_hist_yearly_czce": "akshare.option.option_czce",
+    # 宏观-经济数据-银行间拆借利率
+    "rate_interbank": "akshare.interest_rate.interbank_rate_em",
+    # 金十数据中心-外汇情绪
+    "macro_fx_sentiment": "akshare.economic.macro_other",
+    # 金十数据中心-经济指标-欧元区
+    "macro_euro_gdp_yoy": "akshare.economic.macro_euro",
+    "macro_euro_cpi_mom": "akshare.economic.macro_euro",
+    "macro_euro_cpi_yoy": "akshare.economic.macro_euro",
+    "macro_euro_current_account_mom": "akshare.economic.macro_euro",
+    "macro_euro_employment_change_qoq": "akshare.economic.macro_euro",
+    "macro_euro_industrial_production_mom": "akshare.economic.macro_euro",
+    "macro_euro_manufacturing_pmi": "akshare.economic.macro_euro",
+    "macro_euro_ppi_mom": "akshare.economic.macro_euro",
+    "macro_euro_retail_sales_mom": "akshare.economic.macro_euro",
+    "macro_euro_sentix_investor_confidence": "akshare.economic.macro_euro",
+    "macro_euro_services_pmi": "akshare.economic.macro_euro",
+    "macro_euro_trade_balance": "akshare.economic.macro_euro",
+    "macro_euro_unemployment_rate_mom": "akshare.economic.macro_euro",
+    "macro_euro_zew_economic_sentiment": "akshare.economic.macro_euro",
+    "macro_euro_lme_holding": "akshare.economic.macro_euro",
+    "macro_euro_lme_stock": "akshare.economic.macro_euro",
+    # 金十数据中心-经济指标-央行利率-主要央行利率
+    "macro_bank_australia_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_brazil_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_china_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_english_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_euro_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_india_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_japan_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_newzealand_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_russia_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_switzerland_interest_rate": "akshare.economic.macro_bank",
+    "macro_bank_usa_interest_rate": "akshare.economic.macro_bank",
+    # 义乌小商品指数
+    "index_yw": "akshare.index.index_yw",
+    # 股票指数-股票指数-中证指数列表
+    "index_csindex_all": "akshare.index.index_csindex",
+    # 股票指数-股票指数-成份股
+    "index_stock_info": "akshare.index.index_cons",
+    "index_stock_cons": "akshare.index.index_cons",
+    "index_stock_cons_sina": "akshare.index.index_cons",
+    "index_stock_cons_csindex": "akshare.index.index_cons",
+    "index_stock_cons_weight_csindex": "akshare.index.index_cons",
+    "stock_a_code_to_symbol": "akshare.index.index_cons",
+    # 东方财富-股票账户
+    "stock_account_statistics_em": "akshare.stock_feature.stock_account_em",
+    # 期货规则
+    "futures_rule": "akshare.futures.futures_rule",
+    # 东方财富-商誉专题
+    "stock_sy_profile_em": "akshare.stock_feature.stock_sy_em",
+    "stock_sy_yq_em": "akshare.stock_feature.stock_sy_em",
+    "stock_sy_jz_em": "akshare.stock_feature.stock_sy_em",
+    "stock_sy_em": "akshare.stock_feature.stock_sy_em",
+    "stock_sy_hy_em": "akshare.stock_feature.stock_sy_em",
+    # 东方财富-股票质押
+    "stock_gpzy_pledge_ratio_em": "akshare.stock_feature.stock_gpzy_em",
+    "stock_gpzy_profile_em": "akshare.stock_feature.stock_gpzy_em",
+    "stock_gpzy_distribute_statistics_bank_em": "akshare.stock_feature.stock_gpzy_em",
+    "stock_gpzy_distribute_statistics_company_em": "akshare.stock_feature.stock_gpzy_em",
+    "stock_gpzy_industry_data_em": "akshare.stock_feature.stock_gpzy_em",
+    "stock_gpzy_pledge_ratio_detail_em": "akshare.stock_feature.stock_gpzy_em",
+    # 东方财富-机构调研
+    "stock_jgdy_tj_em": "akshare.stock_feature.stock_jgdy_em",
+    "stock_jgdy_detail_em": "akshare.stock_feature.stock_jgdy_em",
+    # 新浪主力连续接口
+    "futures_main_sina": "akshare.futures_derivative.futures_index_sina",
+    "futures_display_main_sina": "akshare.futures_derivative.futures_index_sina",
+    # 中国宏观杠杆率数据
+    "macro_cnbs": "akshare.economic.marco_cnbs",
+    # 大宗商品-现货价格指数
+    "spot_goods": "akshare.index.index_spot",
+    # 能源-碳排放权
+    "energy_carbon_domestic": "akshare.energy.energy_carbon",
+    "energy_carbon_bj": "akshare.energy.energy_carbon",
+    "energy_carbon_eu": "akshare.energy.energy_carbon",
+    "energy_carbon_gz": "akshare.energy.energy_carbon",
+    "energy_carbon_hb": "akshare.energy.energy_carbon",
+    "energy_carbon_sz": "akshare.energy.energy_carbon",
+    # 中国证券投资基金业协会-信息公示
+    "amac_manager_info": "akshare.fund.fund_amac",
+    "amac_member_info": "akshare.fund.fund_amac",
+    "amac_member_sub_info": "akshare.fund.fund_amac",
+    "amac_aoin_info": "akshare.fund.fund_amac",
+    "amac_fund_account_info": "akshare.fund.fund_amac",
+    "amac_fund_info": "akshare.fund.fund_amac",
+    "amac_fund_sub_info": "akshare.fund.fund_amac",
+    "amac_futures_info": "akshare.fund.fund_amac",
+    "amac_manager_cancelled_info": "akshare.fund.fund_amac",
+    "amac_securities_info": "akshare.fund.fund_amac",
+    "amac_fund_abs": "akshare.fund.fund_amac",
+    "amac_manager_classify_info": "akshare.fund.fund_amac",
+    "amac_person_fund_org_list": "akshare.fund.fund_amac",
+    "amac_person_bond_org_list": "akshare.fund.fund_amac",
+    # 申万行业一级
+    "sw_index_third_cons": "akshare.index.index_sw",
+    "sw_index_first_info": "akshare.index.index_sw",
+    "sw_index_second_info": "akshare.index.index_sw",
+    "sw_index_third_info": "akshare.index.index_sw",
+    # 经济政策不确定性指数
+    "article_epu_index": "akshare.article.epu_index",
+    # 空气-河北
+    "air_quality_hebei": "akshare.air.air_hebei",
+    # 日出和日落
+    "sunrise_daily": "akshare.air.sunrise_tad",
+    "sunrise_monthly": "akshare.air.sunrise_tad",
+    # 新浪-指数实时行情和历史行情
+    "stock_zh_a_tick_tx_js": "akshare.stock.stock_zh_a_tick_tx",
+    "stock_zh_a_tick_tx_js_iter": "akshare.stock.stock_zh_a_tick_tx",
+    "stock_zh_index_daily": "akshare.index.index_stock_zh",
+    "stock_zh_index_spot_sina": "akshare.index.index_stock_zh",
+    "stock_zh_index_spot_em": "akshare.index.index_stock_zh",
+    "stock_zh_index_daily_tx": "akshare.index.index_stock_zh",
+    "stock_zh_index_daily_em": "akshare.index.index_stock_zh",
+    # 外盘期货实时行情
+    "futures_foreign_commodity_realtime": "akshare.futures.futures_hq_sina",
+    "futures_foreign_commodity_subscribe_exchange_symbol": "akshare.futures.futures_hq_sina",
+    "futures_hq_subscribe_exchange_symbol": "akshare.futures.futures_hq_sina",
+    # FF多因子数据接口
+    "article_ff_crr": "akshare.article.ff_factor",
+    # Realized Library 接口
+    "article_oman_rv": "akshare.article.risk_rv",
+    "article_oman_rv_short": "akshare.article.risk_rv",
+    "article_rlab_rv": "akshare.article.risk_rv",
+    # 银保监分局本级行政处罚数据
+    "bank_fjcf_table_detail": "akshare.bank.bank_cbirc_2020",
+    # 科创板股票
+    "stock_zh_kcb_spot": "akshare.stock.stock_zh_kcb_sina",
+    "stock_zh_kcb_daily": "akshare.stock.stock_zh_kcb_sina",
+    # A股
+    "stock_zh_a_spot": "akshare.stock.stock_zh_a_sina",
+    "stock_zh_a_spot_iter": "akshare.stock.stock_zh_a_sina",
+    "stock_zh_a_daily": "akshare.stock.stock_zh_a_sina",
+    "stock_zh_a_minute": "akshare.stock.stock_zh_a_sina",
+    "stock_zh_a_cdr_daily": "akshare.stock.stock_zh_a_sina",
+    # A+H股
+    "stock_zh_ah_spot": "akshare.stock.stock_zh_ah_tx",
+    "stock_zh_ah_daily": "akshare.stock.stock_zh_ah_tx",
+    "stock_zh_ah_name": "akshare.stock.stock_zh_ah_tx",
+    # 加密货币
+    "crypto_js_spot": "akshare.economic.macro_other",
+    # 金融期权
+    "option_finance_board": "akshare.option.option_finance",
+    "option_finance_sse_underlying": "akshare.option.option_finance",
+    # 新浪-美股实时行情数据和历史行情数据(前复权)
+    "stock_us_daily": "akshare.stock.stock_us_sina",
+    "stock_us_spot": "akshare.stock.stock_us_sina",
+    "get_us_stock_name": "akshare.stock.stock_us_sina",
+    # 新浪-港股实时行情数据和历史数据(前复权和后复权因子)
+    "stock_hk_daily": "akshare.stock.stock_hk_sina",
+    "stock_hk_spot": "akshare.stock.stock_hk_sina",
+    # 生意社-商品与期货-现期图数据
+    "futures_spot_sys": "akshare.futures_derivative.futures_spot_sys",
+    # 全球宏观-机构宏观
+    "macro_cons_gold": "akshare.economic.macro_constitute",
+    "macro_cons_silver": "akshare.economic.macro_constitute",
+    "macro_cons_opec_month": "akshare.economic.macro_constitute",
+    # 全球宏观-美国宏观
+    "macro_usa_eia_crude_rate": "akshare.economic.macro_usa",
+    "macro_usa_non_farm": "akshare.economic.macro_usa",
+    "macro_usa_unemployment_rate": "akshare.economic.macro_usa",
+    "macro_usa_adp_employment": "akshare.economic.macro_usa",
+    "macro_usa_core_pce_price": "akshare.economic.macro_usa",
+    "macro_usa_cpi_monthly": "akshare.economic.macro_usa",
+    "macro_usa_cpi_yoy": "akshare.economic.macro_usa",
+    "macro_usa_crude_inner": "akshare.economic.macro_usa",
+    "macro_usa_gdp_monthly": "akshare.economic.macro_usa",
+    "macro_usa_initial_jobless": "akshare.economic.macro_usa",
+    "macro_usa_lmci": "akshare.economic.macro_usa",
+    "macro_usa_api_crude_stock": "akshare.economic.macro_usa",
+    "macro_usa_building_permits": "akshare.economic.macro_usa",
+    "macro_usa_business_inventories": "akshare.economic.macro_usa",
+    "macro_usa_cb_consumer_confidence": "akshare.economic.macro_usa",
+    "macro_usa_core_cpi_monthly": "akshare.economic.macro_usa",
+    "macro_usa_core_ppi": "akshare.economic.macro_usa",
+    "macro_usa_current_account": "akshare.economic.macro_usa",
+    "macro_usa_durable_goods_orders": "akshare.economic.macro_usa",
+    "macro_usa_trade_balance": "akshare.economic.macro_usa",
+    "macro_usa_spcs20": "akshare.economic.macro_usa",
+    "macro_usa_services_pmi": "akshare.economic.macro_usa",
+    "macro_usa_rig_count": "akshare.economic.macro_usa",
+    "macro_usa_retail_sales": "akshare.economic.macro_usa",
+    "macro_usa_real_consumer_spending": "akshare.economic.macro_usa",
+    "macro_usa_ppi": "akshare.economic.macro_usa",
+    "macro_usa_pmi": "akshare.economic.macro_usa",
+    "macro_usa_personal_spending": "akshare.economic.macro_usa",
+    "macro_usa_pending_home_sales": "akshare.economic.macro_usa",
+    "macro_usa_nfib_small_business": "akshare.economic.macro_usa",
+    "macro_usa_new_home_sales": "akshare.economic.macro_usa",
+    "macro_usa_nahb_house_market_index": "akshare.economic.macro_usa",
+    "macro_usa_michigan_consumer_sentiment": "akshare.economic.macro_usa",
+    "macro_usa_exist_home_sales": "akshare.economic.macro_usa",
+    "macro_usa_export_price": "akshare.economic.macro_usa",
+    "macro_usa_factory_orders": "akshare.economic.macro_usa",
+    "macro_usa_house_price_index": "akshare.economic.macro_usa",
+    "macro_usa_house_starts": "akshare.economic.macro_usa",
+    "macro_usa_import_price": "akshare.economic.macro_usa",
+    "macro_usa_industrial_production": "akshare.economic.macro_usa",
+    "macro_usa_ism_non_pmi": "akshare.economic.macro_usa",
+    "macro_usa_ism_pmi": "akshare.economic.macro_usa",
+    "macro_usa_job_cuts": "akshare.economic.macro_usa",
+    "macro_usa_cftc_nc_holding": "akshare.economic.macro_usa",
+    "macro_usa_cftc_c_holding": "akshare.economic.macro_usa",
+    "macro_usa_cftc_merchant_currency_holding": "akshare.economic.macro_usa",
+    "macro_usa_cftc_merchant_goods_holding": "akshare.economic.macro_usa",
+    "macro_usa_cme_merchant_goods_holding": "akshare.economic.macro_usa",
+    "macro_usa_phs": "akshare.economic.macro_usa",
+    # 全球宏观-中国宏观
+    "macro_china_bank_financing": "akshare.economic.macro_china",
+    "macro_china_insurance_income": "akshare.economic.macro_china",
+    "macro_china_mobile_number": "akshare.economic.macro_china",
+    "macro_china_vegetable_basket": "akshare.economic.macro_china",
+    "macro_china_agricultural_product": "akshare.economic.macro_china",
+    "macro_china_agricultural_index": "akshare.economic.macro_china",
+    "macro_china_energy_index": "akshare.economic.macro_china",
+    "macro_china_commodity_price_index": "akshare.economic.macro_china",
+    "macro_global_sox_index": "akshare.economic.macro_china",
+    "macro_china_yw_electronic_index": "akshare.economic.macro_china",
+    "macro_china_construction_index": "akshare.economic.macro_china",
+    "macro_china_construction_price_index": "akshare.economic.macro_china",
+    "macro_china_lpi_index": "akshare.economic.macro_china",
+    "macro_china_bdti_index": "akshare.economic.macro_china",
+    "macro_china_bsi_index": "akshare.economic.macro_china",
+    "macro_china_cpi_monthly": "akshare.economic.macro_china",
+    "macro_china_cpi_yearly": "akshare.economic.macro_china",
+    "macro_china_m2_yearly": "akshare.economic.macro_china",
+    "macro_china_fx_reserves_yearly": "akshare.economic.macro_china",
+    "macro_china_cx_pmi_yearly": "akshare.economic.macro_china",
+    "macro_china_pmi_yearly": "akshare.economic.macro_china",
+    "macro_china_daily_energy": "akshare.economic.macro_china",
+    "macro_china_non_man_pmi": "akshare.economic.macro_china",
+    "macro_china_rmb": "akshare.economic.macro_china",
+    "macro_china_gdp_yearly": "akshare.economic.macro_china",
+    "macro_china_shrzgm": "akshare.economic.macro_china",
+    "macro_china_ppi_yearly": "akshare.economic.macro_china",
+    "macro_china_cx_services_pmi_yearly": "akshare.economic.macro_china",
+    "macro_china_market_margin_sh": "akshare.economic.macro_china",
+    "macro_china_market_margin_sz": "akshare.economic.macro_china",
+    "macro_china_au_report": "akshare.economic.macro_china",
+    "macro_china_exports_yoy": "akshare.economic.macro_china",
+    "macro_china_hk_market_info": "akshare.economic.macro_china",
+    "macro_china_imports_yoy": "akshare.economic.macro_china",
+    "macro_china_trade_balance": "akshare.economic.macro_china",
+    "macro_china_shibor_all": "akshare.economic.macro_china",
+    "macro_china_industrial_production_yoy": "akshare.economic.macro_china",
+    "macro_china_gyzjz": "akshare.economic.macro_china",
+    "macro_china_lpr": "akshare.economic.macro_china",
+    "macro_china_new_house_price": "akshare.economic.macro_china",
+    "macro_china_enterprise_boom_index": "akshare.economic.macro_china",
+    "macro_china_national_tax_receipts": "akshare.economic.macro_china",
+    "macro_china_new_financial_credit": "akshare.economic.macro_china",
+    "macro_china_fx_gold": "akshare.economic.macro_china",
+    "macro_china_money_supply": "akshare.economic.macro_china",
+    "macro_china_stock_market_cap": "akshare.economic.macro_china",
+    "macro_china_cpi": "akshare.economic.macro_china",
+    "macro_china_gdp": "akshare.economic.macro_china",
+    "macro_china_ppi": "akshare.economic.macro_china",
+    "macro_china_pmi": "akshare.economic.macro_china",
+    "macro_china_gdzctz": "akshare.economic.macro_china",
+    "macro_china_hgjck": "akshare.economic.macro_china",
+    "macro_china_czsr": "akshare.economic.macro_china",
+    "macro_china_whxd": "akshare.economic.macro_china",
+    "macro_china_wbck": "akshare.economic.macro_china",
+    "macro_china_xfzxx": "akshare.economic.macro_china",
+    "macro_china_reserve_requirement_ratio": "akshare.economic.macro_china",
+    "macro_china_consumer_goods_retail": "akshare.economic.macro_china",
+    "macro_china_society_electricity": "akshare.economic.macro_china",
+    "macro_china_society_traffic_volume": "akshare.economic.macro_china",
+    "macro_china_postal_telecommunicational": "akshare.economic.macro_china",
+    "macro_china_international_tourism_fx": "akshare.economic.macro_china",
+    "macro_china_passenger_load_factor": "akshare.economic.macro_china",
+    "macro_china_freight_index": "akshare.economic.macro_china",
+    "macro_china_central_bank_balance": "akshare.economic.macro_china",
+    "macro_china_insurance": "akshare.economic.macro_china",
+    "macro_china_supply_of_money": "akshare.economic.macro_china",
+    "macro_china_foreign_exchange_gold": "akshare.economic.macro_china",
+    "macro_china_retail_price_index": "akshare.economic.macro_china",
+    "macro_china_real_estate": "akshare.economic.macro_china",
+    "macro_china_qyspjg": "akshare.economic.macro_china",
+    "macro_china_fdi": "akshare.economic.macro_china",
+    "macro_shipping_bci": "akshare.economic.macro_china",
+    "macro_shipping_bcti": "akshare.economic.macro_china",
+    "macro_shipping_bdi": "akshare.economic.macro_china",
+    "macro_shipping_bpi": "akshare.economic.macro_china",
+    "macro_china_urban_unemployment": "akshare.economic.macro_china",
+    # 全球宏观-中国宏观-国家统计局
+    "macro_china_nbs_nation": "akshare.economic.macro_china_nbs",
+    "macro_china_nbs_region": "akshare.economic.macro_china_nbs",
+    # 外汇
+    "fx_pair_quote": "akshare.fx.fx_quote",
+    "fx_spot_quote": "akshare.fx.fx_quote",
+    "fx_swap_quote": "akshare.fx.fx_quote",
+    # 债券行情
+    "bond_spot_quote": "akshare.bond.bond_china",
+    "bond_spot_deal": "akshare.bond.bond_china",
+    "bond_china_yield": "akshare.bond.bond_china",
+    # 商品期权
+    "option_hist_dce": "akshare.option.option_commodity",
+    "option_hist_czce": "akshare.option.option_commodity",
+    "option_hist_shfe": "akshare.option.option_commodity",
+    "option_vol_gfex": "akshare.option.option_commodity",
+    "option_hist_gfex": "akshare.option.option_commodity",
+    "option_vol_shfe": "akshare.option.option_commodity",
+    # 99期货-期货库存数据
+    "futures_inventory_99": "akshare.futures.futures_inventory_99",
+    # 东方财富-期货库存数据
+    "futures_inventory_em": "akshare.futures.futures_inventory_em",
+    # 中国银行间市场交易商协会
+    "bond_debt_nafmii": "akshare.bond.bond_nafmii",
+    # 奇货可查-工具模块
+    "qhkc_tool_foreign": "akshare.qhkc_web.qhkc_tool",
+    "qhkc_tool_gdp": "akshare.qhkc_web.qhkc_tool",
+    # 奇货可查-指数模块
+    "get_qhkc_index": "akshare.qhkc_web.qhkc_index",
+    "get_qhkc_index_trend": "akshare.qhkc_web.qhkc_index",
+    "get_qhkc_index_profit_loss": "akshare.qhkc_web.qhkc_index",
+    # 奇货可查-资金模块
+    "get_qhkc_fund_money_change": "akshare.qhkc_web.qhkc_fund",
+    "get_qhkc_fund_bs": "akshare.qhkc_web.qhkc_fund",
+    "get_qhkc_fund_position": "akshare.qhkc_web.qhkc_fund",
+    # 大宗商品现货价格及基差
+    "futures_spot_price_daily": "akshare.futures.futures_basis",
+    "futures_spot_price": "akshare.futures.futures_basis",
+    "futures_spot_price_previous": "akshare.futures.futures_basis",
+    # 期货持仓成交排名数据
+    "get_rank_sum_daily": "akshare.futures.cot",
+    "get_rank_sum": "akshare.futures.cot",
+    "get_rank_table": "akshare.futures.cot",
+    "get_shfe_rank_table": "akshare.futures.cot",
+    "get_rank_table_czce": "akshare.futures.cot",
+    "get_dce_rank_table": "akshare.futures.cot",
+    "get_cffex_rank_table": "akshare.futures.cot",
+    "futures_dce_position_rank": "akshare.futures.cot",
+    "futures_dce_position_rank_other": "akshare.futures.cot",
+    "futures_gfex_position_rank": "akshare.futures.cot",
+    # 大宗商品期货仓单数据
+    "get_receipt": "akshare.futures.receipt",
+    # 大宗商品期货展期收益率数据
+    "get_roll_yield_bar": "akshare.futures.futures_roll_yield",
+    "get_roll_yield": "akshare.futures.futures_roll_yield",
+    # 交易所日线行情数据
+    "get_cffex_daily": "akshare.futures.futures_daily_bar",
+    "get_czce_daily": "akshare.futures.futures_daily_bar",
+    "get_shfe_daily": "akshare.futures.futures_daily_bar",
+    "get_dce_daily": "akshare.futures.futures_daily_bar",
+    "get_futures_daily": "akshare.futures.futures_daily_bar",
+    "get_futures_daily_batch": "akshare.futures.futures_daily_bar",
+    "get_ine_daily": "akshare.futures.futures_daily_bar",
+    "get_gfex_daily": "akshare.futures.futures_daily_bar",
+    # 雪球基金数据
+    "fund_individual_basic_info_xq": "akshare.fund.fund_xq",
+    "fund_individual_achievement_xq": "akshare.fund.fund_xq",
+    "fund_individual_analysis_xq": "akshare.fund.fund_xq",
+    "fund_individual_profit_probability_xq": "akshare.fund.fund_xq",
+    "fund_individual_detail_info_xq": "akshare.fund.fund_xq",
+    "fund_individual_detail_hold_xq": "akshare.fund.fund_xq",
+    # 异常处理模块
+    "AkshareException": "akshare.exceptions",
+    "APIError": "akshare.exceptions",
+    "DataParsingError": "akshare.exceptions",
+    "InvalidParameterError": "akshare.exceptions",
+    "NetworkError": "akshare.exceptions",
+    "RateLimitError": "akshare.exceptions",
+    # Pro API 设置
+    "pro_api": "akshare.pro.data_pro",
+    "set_token": "akshare.utils.token_process",
+    "get_token": "akshare.utils.token_process",
+    # AKQMT 设置
+    "xt_api": "akqmt",
+}
+
+# 依赖可选的第三方库, 未安装时视为不存在该接口
+OPTIONAL_EXPORTS = {
+    "xt_api",
+}
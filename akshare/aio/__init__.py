@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: akshare 异步接口
+接口名称, 参数和返回值与同名的同步接口一致, 需要 await 调用; 同一事件循环中可以同时发起大量请求,
+各 host 的请求速率和并发数由 akshare.utils.context.set_rate_limit 控制
+import asyncio
+import akshare.aio as ak_aio
+
+async def main():
+    return await asyncio.gather(*[ak_aio.stock_zh_a_hist(symbol=item) for item in ["000001", "600000"]])
+"""
+
+from akshare.aio.client import async_request, close_async_session, get_async_session
+from akshare.aio.fund import fund_open_fund_info_em
+from akshare.aio.futures import futures_zh_spot
+from akshare.aio.stock import (
+    stock_individual_info_em,
+    stock_zh_a_hist,
+    stock_zh_a_hist_min_em,
+    stock_zh_a_spot_em,
+)
+
+__all__ = [
+    "async_request",
+    "close_async_session",
+    "get_async_session",
+    "fund_open_fund_info_em",
+    "futures_zh_spot",
+    "stock_individual_info_em",
+    "stock_zh_a_hist",
+    "stock_zh_a_hist_min_em",
+    "stock_zh_a_spot_em",
+]
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 异步 HTTP 请求工具
+基于 curl_cffi 的 AsyncSession, 每个事件循环共享一个 Session; 与同步接口共用 akshare.utils.context 中的代理, 重试策略和按 host 限速设置
+"""
+
+import asyncio
+import math
+import random
+import weakref
+from functools import partial
+from typing import Dict, List
+
+import pandas as pd
+from curl_cffi.requests import AsyncSession
+from curl_cffi.requests.exceptions import RequestException
+
+from akshare.utils.context import config, get_rate_limiter, get_retry_policy
+from akshare.utils.func import merge_paginated_rows
+
+# 单个 Session 最多同时进行的请求数, 各 host 的并发数另由限速器控制
+DEFAULT_MAX_CLIENTS = 256
+
+_sessions = weakref.WeakKeyDictionary()
+
+
+def get_async_session(max_clients: int = DEFAULT_MAX_CLIENTS) -> AsyncSession:
+    """
+    获取当前事件循环共享的 AsyncSession, 同一事件循环中的请求复用连接
+    :param max_clients: 新建 Session 时最多同时进行的请求数
+    :type max_clients: int
+    :return: 共享的 AsyncSession
+    :rtype: curl_cffi.requests.AsyncSession
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None:
+        session = AsyncSession(loop=loop, max_clients=max_clients)
+        _sessions[loop] = session
+    return session
+
+
+async def close_async_session():
+    """
+    关闭当前事件循环共享的 AsyncSession, 一般在服务退出前调用
+    """
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+async def async_request(
+    url: str,
+    params: Dict = None,
+    headers: Dict = None,
+    timeout: float = 15,
+    max_retries: int = None,
+    base_delay: float = None,
+):
+    """
+    带重试和按 host 限速的异步 GET 请求, 与 akshare.utils.request.request_with_retry 的行为一致
+    :param url: 请求 URL
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :param headers: 请求头
+    :type headers: dict
+    :param timeout: 超时时间（秒）
+    :type timeout: float
+    :param max_retries: 最大重试次数，默认使用该 host 的重试策略
+    :type max_retries: int
+    :param base_delay: 基础延迟时间（秒），用于指数退避，默认使用该 host 的重试策略
+    :type base_delay: float
+    :return: Response 对象
+    :rtype: curl_cffi.requests.Response
+    :raises: 最后一次请求的异常
+    """
+    policy = get_retry_policy(url)
+    if max_retries is None:
+        max_retries = policy["max_retries"]
+    if base_delay is None:
+        base_delay = policy["base_delay"]
+    session = get_async_session()
+    last_exception = None
+
+    for attempt in range(max_retries):
+        limiter = get_rate_limiter(url)
+        get = partial(
+            session.get,
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            proxies=config.proxies,
+        )
+        try:
+            if limiter is None:
+                response = await get()
+            else:
+                # 等待名额或请求过程中被取消时, limit_async 负责归还名额
+                async with limiter.limit_async():
+                    response = await get()
+            response.raise_for_status()
+            return response
+
+        except (RequestException, ValueError) as e:
+            last_exception = e
+
+            if attempt < max_retries - 1:
+                # 指数退避 + 随机抖动
+                delay = base_delay * (2**attempt) + random.uniform(0.5, 1.5)
+                await asyncio.sleep(delay)
+
+    raise last_exception
+
+
+async def fetch_paginated_data_async(
+    url: str, base_params: Dict, timeout: float = 15
+) -> pd.DataFrame:
+    """
+    东方财富-分页获取数据并合并结果, akshare.utils.func.fetch_paginated_data 的异步版本
+    第一页确定总页数后, 其余页面同时请求
+    :param url: 请求地址
+    :type url: str
+    :param base_params: 基础请求参数
+    :type base_params: dict
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: 合并后的数据
+    :rtype: pandas.DataFrame
+    """
+    params = base_params.copy()
+    r = await async_request(url, params=params, timeout=timeout)
+    data_json = r.json()
+    per_page_num = len(data_json["data"]["diff"])
+    total_page = math.ceil(data_json["data"]["total"] / per_page_num)
+
+    async def _fetch_page(page: int) -> List:
+        page_params = params.copy()
+        page_params.update({"pn": page})
+        inner_r = await async_request(url, params=page_params, timeout=timeout)
+        return inner_r.json()["data"]["diff"]
+
+    other_rows = await asyncio.gather(
+        *[_fetch_page(page) for page in range(2, total_page + 1)]
+    )
+    return merge_paginated_rows([data_json["data"]["diff"], *other_rows])
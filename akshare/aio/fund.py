@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 东方财富网-天天基金网-基金数据-异步接口
+请求参数和解析代码与同步接口共用, 参数和返回值与同步接口一致
+"""
+
+import pandas as pd
+
+from akshare.aio.client import async_request
+from akshare.fund.fund_em import (
+    _fund_open_fund_info_em_parse,
+    _fund_open_fund_info_em_request,
+)
+
+
+async def fund_open_fund_info_em(
+    symbol: str = "710001", indicator: str = "单位净值走势", period: str = "成立来"
+) -> pd.DataFrame:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值
+    https://fund.eastmoney.com/fund.html
+    :param symbol: 基金代码; 可以通过调用 ak.fund_open_fund_daily_em() 获取所有开放式基金代码
+    :type symbol: str
+    :param indicator: 需要获取的指标
+    :type indicator: str
+    :param period: "成立来"; choice of {"1月", "3月", "6月", "1年", "3年", "5年", "今年来", "成立来"}
+    :type period: str
+    :return: 指定基金指定指标的数据
+    :rtype: pandas.DataFrame
+    """
+    request = _fund_open_fund_info_em_request(
+        symbol=symbol, indicator=indicator, period=period
+    )
+    if request is None:
+        return pd.DataFrame()
+    url, params, headers = request
+    r = await async_request(url, params=params, headers=headers)
+    return _fund_open_fund_info_em_parse(r.text, indicator=indicator)
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    fund_open_fund_info_em_df = asyncio.run(
+        fund_open_fund_info_em(symbol="710001", indicator="单位净值走势")
+    )
+    print(fund_open_fund_info_em_df)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 新浪财经-国内期货-实时数据-异步接口
+请求参数和解析代码与同步接口共用, 参数和返回值与同步接口一致
+"""
+
+import asyncio
+
+import pandas as pd
+
+from akshare.aio.client import async_request
+from akshare.futures.futures_zh_sina import (
+    _futures_zh_spot_contract_info,
+    _futures_zh_spot_parse,
+    _futures_zh_spot_request,
+)
+
+
+async def futures_zh_spot(
+    symbol: str = "V2309",
+    market: str = "CF",
+    adjust: str = "0",
+) -> pd.DataFrame:
+    """
+    期货的实时行情数据
+    https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_1
+    :param symbol: 合约名称的字符串组合
+    :type symbol: str
+    :param market: CF 为商品期货
+    :type market: str
+    :param adjust: '1' or '0'；字符串的 0 或 1；返回合约、交易所和最小变动单位的实时数据, 返回数据会变慢
+    :type adjust: str
+    :return: 期货的实时行情数据
+    :rtype: pandas.DataFrame
+    """
+    url, headers, subscribe_list = _futures_zh_spot_request(symbol=symbol)
+    r = await async_request(url, headers=headers)
+    contract_info = None
+    if adjust == "1":
+        # 合约详情来自新浪的网页表格, 数据量小且不常用, 放到线程池中执行
+        loop = asyncio.get_running_loop()
+        contract_info = await loop.run_in_executor(
+            None, _futures_zh_spot_contract_info, subscribe_list
+        )
+    return _futures_zh_spot_parse(r.text, market=market, contract_info=contract_info)
+
+
+if __name__ == "__main__":
+    futures_zh_spot_df = asyncio.run(
+        futures_zh_spot(symbol="V2405,V2409", market="CF", adjust="0")
+    )
+    print(futures_zh_spot_df)
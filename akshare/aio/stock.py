@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 东方财富网-沪深京 A 股-异步接口
+请求参数和解析代码与同步接口共用, 参数和返回值与同步接口一致
+"""
+
+import pandas as pd
+
+from akshare.aio.client import async_request, fetch_paginated_data_async
+from akshare.stock.stock_info_em import (
+    _stock_individual_info_em_params,
+    _stock_individual_info_em_parse,
+)
+from akshare.stock_feature.stock_hist_em import (
+    _stock_zh_a_hist_min_em_params,
+    _stock_zh_a_hist_min_em_parse,
+    _stock_zh_a_hist_params,
+    _stock_zh_a_hist_parse,
+    _stock_zh_a_spot_em_params,
+    _stock_zh_a_spot_em_parse,
+)
+
+
+async def stock_zh_a_spot_em() -> pd.DataFrame:
+    """
+    东方财富网-沪深京 A 股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#hs_a_board
+    :return: 实时行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_spot_em_params()
+    temp_df = await fetch_paginated_data_async(url, params)
+    return _stock_zh_a_spot_em_parse(temp_df)
+
+
+async def stock_zh_a_hist(
+    symbol: str = "000001",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+    timeout: float = 15,
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_hist_params(
+        symbol=symbol,
+        period=period,
+        start_date=start_date,
+        end_date=end_date,
+        adjust=adjust,
+    )
+    r = await async_request(url, params=params, timeout=timeout)
+    return _stock_zh_a_hist_parse(r.json(), symbol=symbol)
+
+
+async def stock_zh_a_hist_min_em(
+    symbol: str = "000001",
+    start_date: str = "1979-09-01 09:32:00",
+    end_date: str = "2222-01-01 09:32:00",
+    period: str = "5",
+    adjust: str = "",
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日分时行情
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param period: choice of {'1', '5', '15', '30', '60'}
+    :type period: str
+    :param adjust: choice of {'', 'qfq', 'hfq'}
+    :type adjust: str
+    :return: 每日分时行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_hist_min_em_params(
+        symbol=symbol, period=period, adjust=adjust
+    )
+    r = await async_request(url, params=params, timeout=15)
+    return _stock_zh_a_hist_min_em_parse(
+        r.json(), period=period, start_date=start_date, end_date=end_date
+    )
+
+
+async def stock_individual_info_em(
+    symbol: str = "603777", timeout: float = 15
+) -> pd.DataFrame:
+    """
+    东方财富-个股-股票信息
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: 股票信息
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_individual_info_em_params(symbol=symbol)
+    r = await async_request(url, params=params, timeout=timeout)
+    return _stock_individual_info_em_parse(r.json())
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    async def main():
+        stock_zh_a_hist_df = await stock_zh_a_hist(
+            symbol="000001", start_date="20240101", end_date="20240301", adjust="qfq"
+        )
+        print(stock_zh_a_hist_df)
+
+    asyncio.run(main())
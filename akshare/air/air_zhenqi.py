@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/4/2 22:40
+Date: 2026/10/15 18:00
 Desc: 真气网-空气质量
 https://www.zq12369.com/environment.php
 空气质量在线监测分析平台的空气质量数据
@@ -15,9 +15,9 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from py_mini_racer import MiniRacer
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_js_path(name: str = None, module_file: str = None) -> str:
@@ -116,8 +116,7 @@ def air_quality_watch_point(
     end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
     url = "https://www.zq12369.com/api/zhenqiapi.php"
     file_data = _get_file_content(file_name="crypto.js")
-    ctx = MiniRacer()
-    ctx.eval(file_data)
+    ctx = get_js_context(file_data)
     method = "GETCITYPOINTAVG"
     city_param = ctx.call("encode_param", city)
     payload = {
@@ -134,7 +133,7 @@ def air_quality_watch_point(
     }
     r = requests.post(url, data=payload, headers=headers)
     data_text = r.text
-    data_json = demjson.decode(ctx.call("decode_result", data_text))
+    data_json = js_literal.loads(ctx.call("decode_result", data_text))
     temp_df = pd.DataFrame(data_json["rows"])
     return temp_df
 
@@ -163,8 +162,7 @@ def air_quality_hist(
     end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
     url = "https://www.zq12369.com/api/newzhenqiapi.php"
     file_data = _get_file_content(file_name="outcrypto.js")
-    ctx = MiniRacer()
-    ctx.eval(file_data)
+    ctx = get_js_context(file_data)
     app_id = "4f0e3a273d547ce6b7147bfa7ceb4b6e"
     method = "CETCITYPERIOD"
     timestamp = ctx.eval("timestamp = new Date().getTime()")
@@ -208,7 +206,7 @@ def air_quality_hist(
     params = {"param": ctx.call("encode_param", need)}
     r = requests.post(url, data=params, headers=headers)
     temp_text = ctx.call("decryptData", r.text)
-    data_json = demjson.decode(ctx.call("b.decode", temp_text))
+    data_json = js_literal.loads(ctx.call("b.decode", temp_text))
     temp_df = pd.DataFrame(data_json["result"]["data"]["rows"])
     temp_df.index = temp_df["time"]
     del temp_df["time"]
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/5/16 19:00
+Date: 2026/10/15 18:00
 Desc: 债券-集思录-可转债
 集思录：https://www.jisilu.cn/data/cbnew/#cb
 """
@@ -11,7 +11,7 @@ import pandas as pd
 import requests
 import time
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 
 
 def bond_cb_index_jsl() -> pd.DataFrame:
@@ -23,7 +23,7 @@ def bond_cb_index_jsl() -> pd.DataFrame:
     """
     url = "https://www.jisilu.cn/webapi/cb/index_history/"
     r = requests.get(url)
-    data_dict = demjson.decode(r.text)["data"]
+    data_dict = js_literal.loads(r.text)["data"]
     temp_df = pd.DataFrame(data_dict)
     return temp_df
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/6/18 18:30
+Date: 2026/10/15 18:00
 Desc: 新浪财经-债券-沪深债券-实时行情数据和历史行情数据
 https://vip.stock.finance.sina.com.cn/mkt/#hs_z
 """
@@ -11,7 +11,6 @@ import re
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.bond.cons import (
     zh_sina_bond_hs_count_url,
@@ -19,9 +18,9 @@ from akshare.bond.cons import (
     zh_sina_bond_hs_url,
     zh_sina_bond_hs_hist_url,
 )
-from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
+from akshare.utils import js_literal
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.sina_decode import sina_kline_decode
 
 
 def get_zh_bond_hs_page_count() -> int:
@@ -63,7 +62,7 @@ def bond_zh_hs_spot(start_page: str = "1", end_page: str = "10") -> pd.DataFrame
     for page in tqdm(range(start_page, end_page), leave=False):
         zh_sina_bond_hs_payload_copy.update({"page": page})
         r = requests.get(zh_sina_bond_hs_url, params=zh_sina_bond_hs_payload_copy)
-        data_json = demjson.decode(r.text)
+        data_json = js_literal.loads(r.text)
         temp_df = pd.DataFrame(data_json)
         big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
     big_df.columns = [
@@ -129,11 +128,9 @@ def bond_zh_hs_daily(symbol: str = "sh010107") -> pd.DataFrame:
             symbol, datetime.datetime.now().strftime("%Y_%m_%d")
         )
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行 js 解密代码
+    dict_list = sina_kline_decode(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
+    )  # 解密数据
     data_df = pd.DataFrame(dict_list)
     data_df["date"] = pd.to_datetime(data_df["date"], errors="coerce").dt.date
     data_df["open"] = pd.to_numeric(data_df["open"], errors="coerce")
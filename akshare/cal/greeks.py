@@ -0,0 +1,439 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 期权隐含波动率和希腊字母计算
+Black-Scholes (股票、ETF 和股指期权, 标的为现货) 和 Black-76 (商品期货期权, 标的为期货) 模型
+整个期权链一次向量化计算, 隐含波动率用牛顿法求解, 步长超出有根区间时改用二分法
+Vega 和 Rho 为波动率和利率变动 1 个百分点时的价格变动, Theta 为每个自然日的价格变动
+"""
+
+import datetime
+import re
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[np.ndarray, pd.Series, list, float]
+
+# 计算剩余期限时每年的天数
+DAYS_PER_YEAR = 365
+
+# 求解隐含波动率时的波动率上下限
+IV_LOWER = 1e-6
+IV_UPPER = 10.0
+
+# 累积正态分布的有理函数逼近系数, Hart (1968), 双精度
+_CDF_P = [
+    3.52624965998911e-02,
+    0.700383064443688,
+    6.37396220353165,
+    33.912866078383,
+    112.079291497871,
+    221.213596169931,
+    220.206867912376,
+]
+_CDF_Q = [
+    8.83883476483184e-02,
+    1.75566716318264,
+    16.064177579207,
+    86.7807322029461,
+    296.564248779674,
+    637.333633378831,
+    793.826512519948,
+    440.413735824752,
+]
+_SQRT_2PI = np.sqrt(2 * np.pi)
+
+# 看涨和看跌期权的写法
+_CALL_NAMES = {"C", "CALL", "认购", "看涨", "看涨期权", "购"}
+_PUT_NAMES = {"P", "PUT", "认沽", "看跌", "看跌期权", "沽"}
+
+# 上交所合约交易代码, 例如 510050C2412M02500, 行权价单位为 0.001 元
+_SSE_CODE = re.compile(r"^(\d{6})([CP])(\d{4})([A-Z])(\d{5})$")
+# 期货期权合约代码, 例如 m2501-C-3000, SR501C5000, IO2412-P-4000
+_FUTURES_CODE = re.compile(r"^([A-Za-z]+\d{3,4})-?([CP])-?(\d+(?:\.\d+)?)$")
+
+# 未指定列名时依次查找的列
+_PRICE_COLUMNS = ("最新价", "当前价", "收盘价", "今收盘", "结算价", "今结算")
+_CONTRACT_COLUMNS = ("交易代码", "合约交易代码", "合约代码", "合约")
+_EXPIRY_COLUMNS = ("到期日", "期权行权日")
+
+
+def _horner(coefficients, x: np.ndarray) -> np.ndarray:
+    result = coefficients[0]
+    for c in coefficients[1:]:
+        result = result * x + c
+    return result
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    a = np.abs(x)
+    e = np.exp(-a * a / 2)
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        small = e * _horner(_CDF_P, a) / _horner(_CDF_Q, a)
+        b = a + 0.65
+        for i in (4, 3, 2, 1):
+            b = a + i / b
+        large = e / b / _SQRT_2PI
+    tail = np.where(a < 7.07106781186547, small, large)
+    return np.where(x > 0, 1 - tail, tail)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-x * x / 2) / _SQRT_2PI
+
+
+def _is_call(option_type) -> np.ndarray:
+    """
+    把 "C", "认购", "看涨期权" 等写法转换为是否为看涨期权
+    """
+    codes, uniques = pd.factorize(np.atleast_1d(np.asarray(option_type, dtype=object)))
+    names = [str(item).strip().upper() for item in uniques]
+    unknown = [
+        item
+        for item, name in zip(uniques, names)
+        if name not in _CALL_NAMES and name not in _PUT_NAMES
+    ]
+    if unknown or (codes < 0).any():
+        raise ValueError(f"无法识别的期权类型: {unknown or [None]}")
+    return np.array([name in _CALL_NAMES for name in names], dtype=bool)[codes]
+
+
+def _carry(r: np.ndarray, q: np.ndarray, model: str) -> np.ndarray:
+    if model == "bs":
+        return r - q
+    if model == "black76":
+        return np.zeros_like(r)
+    raise ValueError("model 需要为 bs 或 black76")
+
+
+def _prepare(s, k, t, r, q, option_type, model: str) -> Tuple:
+    is_call = _is_call(option_type)
+    s, k, t, r, q, is_call = np.broadcast_arrays(
+        np.asarray(s, dtype=float),
+        np.asarray(k, dtype=float),
+        np.asarray(t, dtype=float),
+        np.asarray(r, dtype=float),
+        np.asarray(q, dtype=float),
+        is_call if is_call.size > 1 else is_call[0],
+    )
+    return s, k, t, r, _carry(r, q, model), is_call
+
+
+def _price_vega(s, k, t, r, b, sigma, is_call) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    广义 Black-Scholes 价格和 Vega, b 为持有成本: Black-Scholes 为 r - q, Black-76 为 0
+    """
+    sqrt_t = np.sqrt(t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(s / k) + (b + sigma * sigma / 2) * t) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    forward = s * np.exp((b - r) * t)
+    discount = k * np.exp(-r * t)
+    sign = np.where(is_call, 1.0, -1.0)
+    price = sign * (forward * _norm_cdf(sign * d1) - discount * _norm_cdf(sign * d2))
+    return price, forward * _norm_pdf(d1) * sqrt_t
+
+
+def option_price(
+    s: ArrayLike,
+    k: ArrayLike,
+    t: ArrayLike,
+    sigma: ArrayLike,
+    r: ArrayLike = 0.02,
+    option_type="C",
+    q: ArrayLike = 0.0,
+    model: str = "bs",
+) -> np.ndarray:
+    """
+    期权理论价格, 所有参数可以是数组, 按 numpy 规则广播
+    :param s: 标的价格, Black-76 模型为期货价格
+    :type s: numpy.ndarray
+    :param k: 行权价
+    :type k: numpy.ndarray
+    :param t: 剩余期限（年）
+    :type t: numpy.ndarray
+    :param sigma: 波动率, 0.2 表示 20%
+    :type sigma: numpy.ndarray
+    :param r: 无风险利率, 0.02 表示 2%
+    :type r: numpy.ndarray
+    :param option_type: 期权类型, "C" 或 "P", 也可以是 "认购", "看跌期权" 等写法
+    :type option_type: str or numpy.ndarray
+    :param q: 标的的连续股息率, 只用于 Black-Scholes 模型
+    :type q: numpy.ndarray
+    :param model: choice of {"bs", "black76"}
+    :type model: str
+    :return: 期权理论价格
+    :rtype: numpy.ndarray
+    """
+    s, k, t, r, b, is_call = _prepare(s, k, t, r, q, option_type, model)
+    sigma = np.broadcast_to(np.asarray(sigma, dtype=float), s.shape)
+    return _price_vega(s, k, t, r, b, sigma, is_call)[0]
+
+
+def option_greeks(
+    s: ArrayLike,
+    k: ArrayLike,
+    t: ArrayLike,
+    sigma: ArrayLike,
+    r: ArrayLike = 0.02,
+    option_type="C",
+    q: ArrayLike = 0.0,
+    model: str = "bs",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    期权希腊字母, 参数与 option_price 相同
+    :return: (Delta, Gamma, Vega, Theta, Rho); Vega 和 Rho 为变动 1 个百分点, Theta 为每个自然日
+    :rtype: tuple
+    """
+    s, k, t, r, b, is_call = _prepare(s, k, t, r, q, option_type, model)
+    sigma = np.broadcast_to(np.asarray(sigma, dtype=float), s.shape)
+    sqrt_t = np.sqrt(t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(s / k) + (b + sigma * sigma / 2) * t) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    carry = np.exp((b - r) * t)
+    discount = k * np.exp(-r * t)
+    pdf = _norm_pdf(d1)
+    sign = np.where(is_call, 1.0, -1.0)
+    cdf_d1 = _norm_cdf(sign * d1)
+    cdf_d2 = _norm_cdf(sign * d2)
+    delta = sign * carry * cdf_d1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = carry * pdf / (s * sigma * sqrt_t)
+        decay = -s * carry * pdf * sigma / (2 * sqrt_t)
+    vega = s * carry * pdf * sqrt_t
+    theta = decay - sign * ((b - r) * s * carry * cdf_d1 + r * discount * cdf_d2)
+    if model == "black76":
+        price = sign * (s * carry * cdf_d1 - discount * cdf_d2)
+        rho = -t * price
+    else:
+        rho = sign * t * discount * cdf_d2
+    return delta, gamma, vega / 100, theta / DAYS_PER_YEAR, rho / 100
+
+
+def implied_volatility(
+    price: ArrayLike,
+    s: ArrayLike,
+    k: ArrayLike,
+    t: ArrayLike,
+    r: ArrayLike = 0.02,
+    option_type="C",
+    q: ArrayLike = 0.0,
+    model: str = "bs",
+    tol: float = 1e-8,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    期权隐含波动率, 整个期权链同时用牛顿法迭代, 步长超出有根区间或 Vega 过小时改用二分法
+    价格不在无套利区间内, 或者剩余期限不大于 0 的合约返回缺失值
+    :param price: 期权价格
+    :type price: numpy.ndarray
+    :param s: 标的价格, Black-76 模型为期货价格
+    :type s: numpy.ndarray
+    :param k: 行权价
+    :type k: numpy.ndarray
+    :param t: 剩余期限（年）
+    :type t: numpy.ndarray
+    :param r: 无风险利率, 0.02 表示 2%
+    :type r: numpy.ndarray
+    :param option_type: 期权类型, "C" 或 "P", 也可以是 "认购", "看跌期权" 等写法
+    :type option_type: str or numpy.ndarray
+    :param q: 标的的连续股息率, 只用于 Black-Scholes 模型
+    :type q: numpy.ndarray
+    :param model: choice of {"bs", "black76"}
+    :type model: str
+    :param tol: 隐含波动率的容差
+    :type tol: float
+    :param max_iter: 最大迭代次数
+    :type max_iter: int
+    :return: 隐含波动率, 0.2 表示 20%
+    :rtype: numpy.ndarray
+    """
+    s, k, t, r, b, is_call = _prepare(s, k, t, r, q, option_type, model)
+    shape = s.shape
+    price = np.broadcast_to(np.asarray(price, dtype=float), shape).ravel()
+    s, k, t, r, b, is_call = (x.ravel() for x in (s, k, t, r, b, is_call))
+    with np.errstate(invalid="ignore", over="ignore"):
+        forward = s * np.exp((b - r) * t)
+        discount = k * np.exp(-r * t)
+        lower = np.maximum(np.where(is_call, forward - discount, discount - forward), 0)
+        upper = np.where(is_call, forward, discount)
+        valid = (t > 0) & (s > 0) & (k > 0) & (price > lower) & (price < upper)
+    result = np.full(price.shape, np.nan)
+    idx = np.flatnonzero(valid)
+    # Brenner-Subrahmanyam 近似作为初始值
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma = np.sqrt(2 * np.pi / t[idx]) * price[idx] / forward[idx]
+    sigma = np.clip(np.nan_to_num(sigma, nan=0.2), 0.01, 3.0)
+    lo = np.full(idx.size, IV_LOWER)
+    hi = np.full(idx.size, IV_UPPER)
+    last_step = np.full(idx.size, IV_UPPER)
+    for _ in range(max_iter):
+        if idx.size == 0:
+            break
+        model_price, vega = _price_vega(
+            s[idx], k[idx], t[idx], r[idx], b[idx], sigma, is_call[idx]
+        )
+        diff = model_price - price[idx]
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            correction = diff / vega
+        done = (np.abs(correction) < tol) | (hi - lo < tol) | (diff == 0)
+        result[idx[done]] = sigma[done]
+        # 理论价格随波动率单调递增, 据此缩小有根区间
+        hi = np.where(diff > 0, sigma, hi)
+        lo = np.where(diff < 0, sigma, lo)
+        step = sigma - correction
+        # 牛顿步超出有根区间, 或者步长没有减半 (远离平值时收敛很慢) 时改用二分法
+        bisect = ~((step > lo) & (step < hi) & (np.abs(correction) < last_step / 2))
+        new_sigma = np.where(bisect, (lo + hi) / 2, step)
+        last_step = np.abs(new_sigma - sigma)
+        sigma = new_sigma
+        keep = ~done
+        idx, sigma, lo, hi = idx[keep], sigma[keep], lo[keep], hi[keep]
+        last_step = last_step[keep]
+    return result.reshape(shape)
+
+
+def parse_option_contract(codes: ArrayLike) -> pd.DataFrame:
+    """
+    从合约代码中解析标的、期权类型和行权价
+    上交所合约交易代码, 例如 510050C2412M02500; 期货和股指期权合约代码, 例如 m2501-C-3000, SR501C5000, IO2412-P-4000
+    :param codes: 合约代码
+    :type codes: list or pandas.Series
+    :return: 标的, 类型, 行权价; 无法解析的合约为缺失值
+    :rtype: pandas.DataFrame
+    """
+    codes = pd.Series(codes, dtype=object).astype(str).str.strip()
+    sse_df = codes.str.extract(_SSE_CODE)
+    futures_df = codes.str.extract(_FUTURES_CODE)
+    is_sse = sse_df[0].notna()
+    temp_df = pd.DataFrame(index=codes.index)
+    temp_df["标的"] = sse_df[0].where(is_sse, futures_df[0])
+    temp_df["类型"] = sse_df[1].where(is_sse, futures_df[1])
+    temp_df["行权价"] = (pd.to_numeric(sse_df[4], errors="coerce") / 1000).where(
+        is_sse, pd.to_numeric(futures_df[2], errors="coerce")
+    )
+    return temp_df
+
+
+def _pick_column(df: pd.DataFrame, name: Optional[str], candidates: Tuple) -> str:
+    if name is not None:
+        return name
+    for column in candidates:
+        if column in df.columns:
+            return column
+    return ""
+
+
+def _column_or_value(df: pd.DataFrame, value):
+    if isinstance(value, str) and value in df.columns:
+        return df[value]
+    return value
+
+
+def option_chain_greeks(
+    df: pd.DataFrame,
+    underlying_price: Union[str, float, ArrayLike],
+    expiry=None,
+    trade_date=None,
+    rate: float = 0.02,
+    dividend: float = 0.0,
+    model: str = "bs",
+    price: Optional[str] = None,
+    strike: str = "行权价",
+    option_type: str = "类型",
+    contract: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    根据期权链的价格计算隐含波动率和希腊字母, 不需要再逐个合约请求网页
+    可以直接传入 option_sse_chain_snapshot_sina, option_finance_board 和 option_hist_dce 等接口返回的数据
+    :param df: 期权链, 每个合约一行
+    :type df: pandas.DataFrame
+    :param underlying_price: 标的价格, 可以是数值或者列名; Black-76 模型为对应的期货价格
+    :type underlying_price: str or float
+    :param expiry: 到期日, 可以是日期或者列名; 为 None 时使用 "到期日" 或 "期权行权日" 列
+    :type expiry: str or datetime.date
+    :param trade_date: 计算日期, 可以是日期或者列名; 为 None 时为今天
+    :type trade_date: str or datetime.date
+    :param rate: 无风险利率, 0.02 表示 2%
+    :type rate: float
+    :param dividend: 标的的连续股息率, 只用于 Black-Scholes 模型
+    :type dividend: float
+    :param model: choice of {"bs", "black76"}; 股票、ETF 和股指期权使用 bs, 商品期货期权使用 black76
+    :type model: str
+    :param price: 期权价格列名; 为 None 时依次查找 "最新价", "当前价", "收盘价", "今收盘", "结算价", "今结算"
+    :type price: str
+    :param strike: 行权价列名, 不存在时从合约代码中解析
+    :type strike: str
+    :param option_type: 期权类型列名, 不存在时从合约代码中解析
+    :type option_type: str
+    :param contract: 合约代码列名; 为 None 时依次查找 "交易代码", "合约交易代码", "合约代码", "合约"
+    :type contract: str
+    :return: 增加 剩余期限, 隐含波动率, Delta, Gamma, Vega, Theta, Rho 列, 同名列会被替换; 从合约代码中解析的行权价和期权类型也会加入
+    :rtype: pandas.DataFrame
+    """
+    temp_df = df.copy()
+    price = _pick_column(temp_df, price, _PRICE_COLUMNS)
+    if price not in temp_df.columns:
+        raise ValueError("没有找到期权价格列, 请通过 price 参数指定")
+    if strike not in temp_df.columns or option_type not in temp_df.columns:
+        contract = _pick_column(temp_df, contract, _CONTRACT_COLUMNS)
+        if contract not in temp_df.columns:
+            raise ValueError(
+                "没有找到行权价和期权类型, 请通过 contract 参数指定合约代码列"
+            )
+        parsed_df = parse_option_contract(temp_df[contract])
+        if strike not in temp_df.columns:
+            temp_df[strike] = parsed_df["行权价"].to_numpy()
+        if option_type not in temp_df.columns:
+            temp_df[option_type] = parsed_df["类型"].to_numpy()
+    if expiry is None:
+        expiry = _pick_column(temp_df, None, _EXPIRY_COLUMNS)
+        if not expiry:
+            raise ValueError("没有找到到期日, 请通过 expiry 参数指定")
+    if trade_date is None:
+        trade_date = datetime.date.today()
+    expiry_date = pd.to_datetime(_column_or_value(temp_df, expiry), format="mixed")
+    trade_date = pd.to_datetime(_column_or_value(temp_df, trade_date), format="mixed")
+    days = pd.Series(expiry_date - trade_date, index=temp_df.index).dt.days
+    temp_df["剩余期限"] = days.to_numpy(dtype=float) / DAYS_PER_YEAR
+    s = pd.to_numeric(_column_or_value(temp_df, underlying_price), errors="coerce")
+    s = np.asarray(s, dtype=float)
+    k = pd.to_numeric(temp_df[strike], errors="coerce").to_numpy(dtype=float)
+    option_price_arr = np.array(
+        pd.to_numeric(temp_df[price], errors="coerce"), dtype=float
+    )
+    names = temp_df[option_type].astype(str).str.strip().str.upper()
+    # 合计行等无法识别期权类型的行不计算
+    option_price_arr[~names.isin(_CALL_NAMES | _PUT_NAMES).to_numpy()] = np.nan
+    option_types = np.where(names.isin(_CALL_NAMES), "C", "P")
+    t = temp_df["剩余期限"].to_numpy()
+    sigma = implied_volatility(
+        option_price_arr, s, k, t, rate, option_types, dividend, model
+    )
+    temp_df["隐含波动率"] = sigma
+    greeks = option_greeks(s, k, t, sigma, rate, option_types, dividend, model)
+    for name, values in zip(["Delta", "Gamma", "Vega", "Theta", "Rho"], greeks):
+        temp_df[name] = values
+    return temp_df
+
+
+if __name__ == "__main__":
+    chain_df = pd.DataFrame(
+        {
+            "合约": ["m2505-C-2800", "m2505-C-3000", "m2505-P-2800", "m2505-P-3000"],
+            "收盘价": [175.5, 68.0, 52.5, 145.0],
+        }
+    )
+    option_chain_greeks_df = option_chain_greeks(
+        chain_df,
+        underlying_price=2920,
+        expiry="2025-04-08",
+        trade_date="2025-01-15",
+        model="black76",
+    )
+    print(option_chain_greeks_df)
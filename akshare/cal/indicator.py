@@ -0,0 +1,564 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 技术指标计算
+输入为 (时间, 股票) 的二维面板数据, 一次计算所有股票的指标, 也可以传入一维数组或单列 Series
+每个指标都有对应的增量计算类, 用历史数据初始化后, 每根新 K 线只需要 O(1) 的计算量即可更新指标
+缺失值的处理: 股票上市前的缺失值保持为缺失; 移动平均等窗口指标在窗口内存在缺失值时结果为缺失值;
+指数移动平均在缺失值处保持上一期的值不变, 缺失值后的第一个值按权重 alpha 直接与缺失前的值加权;
+RSI 和 ATR 中 REF(close, 1) 为缺失值时当期的差分和真实波幅为缺失值
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[np.ndarray, pd.DataFrame, pd.Series, list]
+
+
+def _as_2d(x: ArrayLike) -> np.ndarray:
+    """
+    转换为 (时间, 股票) 的二维浮点数组
+    """
+    arr = np.asarray(x, dtype=float)
+    if arr.ndim == 1:
+        return arr[:, None]
+    return arr
+
+
+def _wrap(arr: np.ndarray, like: ArrayLike):
+    """
+    按输入的类型和形状返回结果, DataFrame 和 Series 保留原有的索引和列名
+    """
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(arr, index=like.index, columns=like.columns)
+    if isinstance(like, pd.Series):
+        return pd.Series(arr[:, 0], index=like.index, name=like.name)
+    if np.ndim(like) == 1:
+        return arr[:, 0]
+    return arr
+
+
+def _ema_step(prev: np.ndarray, row: np.ndarray, alpha: float, seed) -> np.ndarray:
+    """
+    指数移动平均的单步更新, prev 为缺失值时从当前值(或 seed)开始
+    """
+    valid = ~np.isnan(row)
+    start = row if seed is None else (1 - alpha) * seed + alpha * row
+    updated = np.where(np.isnan(prev), start, (1 - alpha) * prev + alpha * row)
+    return np.where(valid, updated, prev)
+
+
+def _ema_2d(arr: np.ndarray, alpha: float, seed=None) -> np.ndarray:
+    out = np.empty_like(arr)
+    prev = np.full(arr.shape[1], np.nan)
+    for t in range(arr.shape[0]):
+        prev = _ema_step(prev, arr[t], alpha, seed)
+        out[t] = prev
+    return out
+
+
+def _rolling_2d(arr: np.ndarray, window: int, func: str) -> np.ndarray:
+    """
+    滚动窗口统计, 窗口内存在缺失值时结果为缺失值, 与 pandas rolling(window) 一致
+    """
+    out = np.full_like(arr, np.nan)
+    if arr.shape[0] < window:
+        return out
+    view = np.lib.stride_tricks.sliding_window_view(arr, window, axis=0)
+    if func == "std":
+        out[window - 1 :] = view.std(axis=-1, ddof=1)
+    else:
+        out[window - 1 :] = getattr(view, func)(axis=-1)
+    return out
+
+
+def _shift_2d(arr: np.ndarray) -> np.ndarray:
+    out = np.empty_like(arr)
+    out[0] = np.nan
+    out[1:] = arr[:-1]
+    return out
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, prev_close: np.ndarray):
+    return np.fmax(
+        high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+
+
+def _rsv(close: np.ndarray, hhv: np.ndarray, llv: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rsv = (close - llv) / (hhv - llv) * 100
+    # 最高价等于最低价时 RSV 取 50
+    return np.where(np.isnan(rsv) & ~np.isnan(hhv) & ~np.isnan(close), 50, rsv)
+
+
+def ema(x: ArrayLike, span: int = 12):
+    """
+    指数移动平均, 与 pandas ewm(span=span, adjust=False, ignore_na=True).mean() 一致;
+    没有缺失值时与 ewm(span=span, adjust=False).mean() 一致, 有缺失值时两者不同
+    :param x: 面板数据, 形状为 (时间, 股票)
+    :type x: numpy.ndarray or pandas.DataFrame
+    :param span: 周期
+    :type span: int
+    :return: 指数移动平均
+    :rtype: numpy.ndarray or pandas.DataFrame
+    """
+    return _wrap(_ema_2d(_as_2d(x), 2 / (span + 1)), x)
+
+
+def ma(x: ArrayLike, window: int = 5):
+    """
+    简单移动平均, 与 pandas rolling(window).mean() 一致
+    :param x: 面板数据, 形状为 (时间, 股票)
+    :type x: numpy.ndarray or pandas.DataFrame
+    :param window: 周期
+    :type window: int
+    :return: 简单移动平均
+    :rtype: numpy.ndarray or pandas.DataFrame
+    """
+    return _wrap(_rolling_2d(_as_2d(x), window, "mean"), x)
+
+
+def rolling_max(x: ArrayLike, window: int = 20):
+    """
+    滚动最大值, 与 pandas rolling(window).max() 一致
+    :param x: 面板数据, 形状为 (时间, 股票)
+    :type x: numpy.ndarray or pandas.DataFrame
+    :param window: 周期
+    :type window: int
+    :return: 滚动最大值
+    :rtype: numpy.ndarray or pandas.DataFrame
+    """
+    return _wrap(_rolling_2d(_as_2d(x), window, "max"), x)
+
+
+def rolling_min(x: ArrayLike, window: int = 20):
+    """
+    滚动最小值, 与 pandas rolling(window).min() 一致
+    :param x: 面板数据, 形状为 (时间, 股票)
+    :type x: numpy.ndarray or pandas.DataFrame
+    :param window: 周期
+    :type window: int
+    :return: 滚动最小值
+    :rtype: numpy.ndarray or pandas.DataFrame
+    """
+    return _wrap(_rolling_2d(_as_2d(x), window, "min"), x)
+
+
+def macd(close: ArrayLike, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple:
+    """
+    MACD 指标
+    DIF = EMA(close, fast) - EMA(close, slow), DEA = EMA(DIF, signal), MACD 柱 = 2 * (DIF - DEA)
+    :param close: 收盘价面板, 形状为 (时间, 股票)
+    :type close: numpy.ndarray or pandas.DataFrame
+    :param fast: 快线周期
+    :type fast: int
+    :param slow: 慢线周期
+    :type slow: int
+    :param signal: DEA 周期
+    :type signal: int
+    :return: (DIF, DEA, MACD 柱)
+    :rtype: tuple
+    """
+    arr = _as_2d(close)
+    dif = _ema_2d(arr, 2 / (fast + 1)) - _ema_2d(arr, 2 / (slow + 1))
+    dea = _ema_2d(dif, 2 / (signal + 1))
+    return _wrap(dif, close), _wrap(dea, close), _wrap(2 * (dif - dea), close)
+
+
+def kdj(
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    n: int = 9,
+    m1: int = 3,
+    m2: int = 3,
+) -> Tuple:
+    """
+    KDJ 指标, K 和 D 的初始值为 50
+    RSV = (close - LLV(low, n)) / (HHV(high, n) - LLV(low, n)) * 100
+    K = SMA(RSV, m1, 1), D = SMA(K, m2, 1), J = 3K - 2D
+    :param high: 最高价面板
+    :type high: numpy.ndarray or pandas.DataFrame
+    :param low: 最低价面板
+    :type low: numpy.ndarray or pandas.DataFrame
+    :param close: 收盘价面板
+    :type close: numpy.ndarray or pandas.DataFrame
+    :param n: RSV 周期
+    :type n: int
+    :param m1: K 值平滑周期
+    :type m1: int
+    :param m2: D 值平滑周期
+    :type m2: int
+    :return: (K, D, J)
+    :rtype: tuple
+    """
+    high_arr, low_arr, close_arr = _as_2d(high), _as_2d(low), _as_2d(close)
+    rsv = _rsv(
+        close_arr, _rolling_2d(high_arr, n, "max"), _rolling_2d(low_arr, n, "min")
+    )
+    k = _ema_2d(rsv, 1 / m1, seed=50.0)
+    d = _ema_2d(k, 1 / m2, seed=50.0)
+    return _wrap(k, close), _wrap(d, close), _wrap(3 * k - 2 * d, close)
+
+
+def rsi(close: ArrayLike, n: int = 14):
+    """
+    RSI 指标
+    RSI = SMA(MAX(close - REF(close, 1), 0), n, 1) / SMA(ABS(close - REF(close, 1)), n, 1) * 100
+    :param close: 收盘价面板
+    :type close: numpy.ndarray or pandas.DataFrame
+    :param n: 周期
+    :type n: int
+    :return: RSI
+    :rtype: numpy.ndarray or pandas.DataFrame
+    """
+    arr = _as_2d(close)
+    diff = arr - _shift_2d(arr)
+    up = _ema_2d(np.where(np.isnan(diff), np.nan, np.fmax(diff, 0)), 1 / n)
+    total = _ema_2d(np.abs(diff), 1 / n)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = up / total * 100
+    return _wrap(result, close)
+
+
+def boll(close: ArrayLike, n: int = 20, k: float = 2) -> Tuple:
+    """
+    布林线
+    MID = MA(close, n), UPPER = MID + k * STD(close, n), LOWER = MID - k * STD(close, n)
+    :param close: 收盘价面板
+    :type close: numpy.ndarray or pandas.DataFrame
+    :param n: 周期
+    :type n: int
+    :param k: 标准差倍数
+    :type k: float
+    :return: (MID, UPPER, LOWER)
+    :rtype: tuple
+    """
+    arr = _as_2d(close)
+    mid = _rolling_2d(arr, n, "mean")
+    std = _rolling_2d(arr, n, "std")
+    return _wrap(mid, close), _wrap(mid + k * std, close), _wrap(mid - k * std, close)
+
+
+def atr(high: ArrayLike, low: ArrayLike, close: ArrayLike, n: int = 14):
+    """
+    平均真实波幅
+    TR = MAX(high - low, ABS(high - REF(close, 1)), ABS(low - REF(close, 1))), ATR = MA(TR, n)
+    :param high: 最高价面板
+    :type high: numpy.ndarray or pandas.DataFrame
+    :param low: 最低价面板
+    :type low: numpy.ndarray or pandas.DataFrame
+    :param close: 收盘价面板
+    :type close: numpy.ndarray or pandas.DataFrame
+    :param n: 周期
+    :type n: int
+    :return: ATR
+    :rtype: numpy.ndarray or pandas.DataFrame
+    """
+    close_arr = _as_2d(close)
+    tr = _true_range(_as_2d(high), _as_2d(low), _shift_2d(close_arr))
+    return _wrap(_rolling_2d(tr, n, "mean"), close)
+
+
+def beta(returns: ArrayLike, market_returns: ArrayLike, window: int = 60):
+    """
+    滚动贝塔系数, beta = COV(returns, market_returns) / VAR(market_returns)
+    :param returns: 股票收益率面板, 形状为 (时间, 股票)
+    :type returns: numpy.ndarray or pandas.DataFrame
+    :param market_returns: 市场收益率, 形状为 (时间,)
+    :type market_returns: numpy.ndarray or pandas.Series
+    :param window: 周期
+    :type window: int
+    :return: 滚动贝塔系数
+    :rtype: numpy.ndarray or pandas.DataFrame
+    """
+    arr = _as_2d(returns)
+    market = np.asarray(market_returns, dtype=float).reshape(-1, 1)
+    market_mean = _rolling_2d(market, window, "mean")
+    cov = (
+        _rolling_2d(arr * market, window, "mean")
+        - _rolling_2d(arr, window, "mean") * market_mean
+    )
+    var = _rolling_2d(market * market, window, "mean") - market_mean**2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = cov / var
+    return _wrap(result, returns)
+
+
+class EMAState:
+    """
+    指数移动平均-增量计算
+    """
+
+    def __init__(self, span: int = None, alpha: float = None, seed: float = None):
+        """
+        :param span: 周期, alpha = 2 / (span + 1)
+        :type span: int
+        :param alpha: 平滑系数, 与 span 二选一
+        :type alpha: float
+        :param seed: 初始值, 默认以第一个有效值作为初始值
+        :type seed: float
+        """
+        self.alpha = alpha if alpha is not None else 2 / (span + 1)
+        self.seed = seed
+        self.value = None
+
+    def fit(self, x: ArrayLike) -> np.ndarray:
+        """
+        用历史数据初始化
+        :param x: 历史数据, 形状为 (时间, 股票)
+        :type x: numpy.ndarray
+        :return: 历史数据的指标值
+        :rtype: numpy.ndarray
+        """
+        out = _ema_2d(_as_2d(x), self.alpha, self.seed)
+        self.value = out[-1].copy()
+        return out
+
+    def update(self, row: ArrayLike) -> np.ndarray:
+        """
+        追加一根 K 线
+        :param row: 新 K 线的数据, 形状为 (股票,)
+        :type row: numpy.ndarray
+        :return: 最新的指标值
+        :rtype: numpy.ndarray
+        """
+        row = np.atleast_1d(np.asarray(row, dtype=float))
+        if self.value is None:
+            self.value = np.full(row.shape, np.nan)
+        self.value = _ema_step(self.value, row, self.alpha, self.seed)
+        return self.value
+
+
+class RollingState:
+    """
+    滚动窗口-增量计算, 保存最近 window 根 K 线, 每次更新的计算量只与窗口长度有关
+    """
+
+    def __init__(self, window: int = 20):
+        """
+        :param window: 窗口长度
+        :type window: int
+        """
+        self.window = window
+        self._buffer = None
+        self._pos = 0
+        self._count = 0
+
+    def fit(self, x: ArrayLike):
+        """
+        用历史数据初始化
+        :param x: 历史数据, 形状为 (时间, 股票)
+        :type x: numpy.ndarray
+        """
+        arr = _as_2d(x)
+        self._buffer = np.full((self.window, arr.shape[1]), np.nan)
+        self._pos = 0
+        self._count = 0
+        for row in arr[-self.window :]:
+            self.update(row)
+        return self
+
+    def update(self, row: ArrayLike):
+        """
+        追加一根 K 线
+        :param row: 新 K 线的数据, 形状为 (股票,)
+        :type row: numpy.ndarray
+        """
+        row = np.atleast_1d(np.asarray(row, dtype=float))
+        if self._buffer is None:
+            self._buffer = np.full((self.window, row.shape[0]), np.nan)
+        self._buffer[self._pos] = row
+        self._pos = (self._pos + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+        return self
+
+    def _full(self, values: np.ndarray) -> np.ndarray:
+        if self._count < self.window:
+            return np.full(self._buffer.shape[1], np.nan)
+        return values
+
+    def mean(self) -> np.ndarray:
+        return self._full(self._buffer.mean(axis=0))
+
+    def max(self) -> np.ndarray:
+        return self._full(self._buffer.max(axis=0))
+
+    def min(self) -> np.ndarray:
+        return self._full(self._buffer.min(axis=0))
+
+    def std(self) -> np.ndarray:
+        return self._full(self._buffer.std(axis=0, ddof=1))
+
+
+class MACDState:
+    """
+    MACD 指标-增量计算
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = EMAState(span=fast)
+        self._slow = EMAState(span=slow)
+        self._signal = EMAState(span=signal)
+
+    def fit(self, close: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        用历史收盘价初始化
+        :param close: 收盘价面板, 形状为 (时间, 股票)
+        :type close: numpy.ndarray
+        :return: 历史数据的 (DIF, DEA, MACD 柱)
+        :rtype: tuple
+        """
+        dif = self._fast.fit(close) - self._slow.fit(close)
+        dea = self._signal.fit(dif)
+        return dif, dea, 2 * (dif - dea)
+
+    def update(self, close: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        追加一根 K 线
+        :param close: 新 K 线的收盘价, 形状为 (股票,)
+        :type close: numpy.ndarray
+        :return: 最新的 (DIF, DEA, MACD 柱)
+        :rtype: tuple
+        """
+        dif = self._fast.update(close) - self._slow.update(close)
+        dea = self._signal.update(dif)
+        return dif, dea, 2 * (dif - dea)
+
+
+class KDJState:
+    """
+    KDJ 指标-增量计算
+    """
+
+    def __init__(self, n: int = 9, m1: int = 3, m2: int = 3):
+        self._high = RollingState(window=n)
+        self._low = RollingState(window=n)
+        self._k = EMAState(alpha=1 / m1, seed=50.0)
+        self._d = EMAState(alpha=1 / m2, seed=50.0)
+
+    def fit(self, high: ArrayLike, low: ArrayLike, close: ArrayLike) -> Tuple:
+        """
+        用历史数据初始化
+        :return: 历史数据的 (K, D, J)
+        :rtype: tuple
+        """
+        self._high.fit(high)
+        self._low.fit(low)
+        rsv = _rsv(
+            _as_2d(close),
+            _rolling_2d(_as_2d(high), self._high.window, "max"),
+            _rolling_2d(_as_2d(low), self._low.window, "min"),
+        )
+        k = self._k.fit(rsv)
+        d = self._d.fit(k)
+        return k, d, 3 * k - 2 * d
+
+    def update(self, high: ArrayLike, low: ArrayLike, close: ArrayLike) -> Tuple:
+        """
+        追加一根 K 线
+        :return: 最新的 (K, D, J)
+        :rtype: tuple
+        """
+        hhv = self._high.update(high).max()
+        llv = self._low.update(low).min()
+        rsv = _rsv(np.atleast_1d(np.asarray(close, dtype=float)), hhv, llv)
+        k = self._k.update(rsv)
+        d = self._d.update(k)
+        return k, d, 3 * k - 2 * d
+
+
+class RSIState:
+    """
+    RSI 指标-增量计算
+    """
+
+    def __init__(self, n: int = 14):
+        self._up = EMAState(alpha=1 / n)
+        self._total = EMAState(alpha=1 / n)
+        self._prev_close = None
+
+    def fit(self, close: ArrayLike) -> np.ndarray:
+        """
+        用历史收盘价初始化
+        :return: 历史数据的 RSI
+        :rtype: numpy.ndarray
+        """
+        arr = _as_2d(close)
+        diff = arr - _shift_2d(arr)
+        up = self._up.fit(np.where(np.isnan(diff), np.nan, np.fmax(diff, 0)))
+        total = self._total.fit(np.abs(diff))
+        self._prev_close = arr[-1].copy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return up / total * 100
+
+    def update(self, close: ArrayLike) -> np.ndarray:
+        """
+        追加一根 K 线
+        :return: 最新的 RSI
+        :rtype: numpy.ndarray
+        """
+        close = np.atleast_1d(np.asarray(close, dtype=float))
+        if self._prev_close is None:
+            self._prev_close = np.full(close.shape, np.nan)
+        diff = close - self._prev_close
+        self._prev_close = close
+        up = self._up.update(np.where(np.isnan(diff), np.nan, np.fmax(diff, 0)))
+        total = self._total.update(np.abs(diff))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return up / total * 100
+
+
+class ATRState:
+    """
+    平均真实波幅-增量计算
+    """
+
+    def __init__(self, n: int = 14):
+        self._tr = RollingState(window=n)
+        self._prev_close = None
+
+    def fit(self, high: ArrayLike, low: ArrayLike, close: ArrayLike) -> np.ndarray:
+        """
+        用历史数据初始化
+        :return: 历史数据的 ATR
+        :rtype: numpy.ndarray
+        """
+        close_arr = _as_2d(close)
+        tr = _true_range(_as_2d(high), _as_2d(low), _shift_2d(close_arr))
+        self._tr.fit(tr)
+        self._prev_close = close_arr[-1].copy()
+        return _rolling_2d(tr, self._tr.window, "mean")
+
+    def update(self, high: ArrayLike, low: ArrayLike, close: ArrayLike) -> np.ndarray:
+        """
+        追加一根 K 线
+        :return: 最新的 ATR
+        :rtype: numpy.ndarray
+        """
+        close = np.atleast_1d(np.asarray(close, dtype=float))
+        if self._prev_close is None:
+            self._prev_close = np.full(close.shape, np.nan)
+        tr = _true_range(
+            np.atleast_1d(np.asarray(high, dtype=float)),
+            np.atleast_1d(np.asarray(low, dtype=float)),
+            self._prev_close,
+        )
+        self._prev_close = close
+        return self._tr.update(tr).mean()
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    close_panel = 10 + rng.standard_normal((250, 5000)).cumsum(axis=0) * 0.1
+    dif_arr, dea_arr, hist_arr = macd(close_panel)
+    ma55_arr = ma(close_panel, 55)
+    print(dif_arr[-1, :5], ma55_arr[-1, :5])
+
+    macd_state = MACDState()
+    macd_state.fit(close_panel[:-1])
+    print(macd_state.update(close_panel[-1])[0][:5])
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/6/25 15:00
+Date: 2026/10/15 18:00
 Desc: 碳排放交易
 北京市碳排放权电子交易平台-北京市碳排放权公开交易行情
 https://www.bjets.com.cn/article/jyxx/
@@ -26,7 +26,7 @@ import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 from akshare.utils.cons import headers
 
 
@@ -46,7 +46,7 @@ def energy_carbon_domestic(symbol: str = "湖北") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("(") + 1 : -1])
+    data_json = js_literal.loads(data_text[data_text.find("(") + 1 : -1])
     temp_df = pd.DataFrame(data_json[symbol])
     temp_df.columns = [
         "成交价",
@@ -210,7 +210,7 @@ def energy_carbon_hb() -> pd.DataFrame:
     )
     start_pos = data_text.find("cjj = '[") + 7  # 找到 JSON 数组开始的位置
     end_pos = data_text.rfind("cjj =") - 31  # 找到 JSON 数组结束的位置
-    data_json = demjson.decode(data_text[start_pos:end_pos])
+    data_json = js_literal.loads(data_text[start_pos:end_pos])
     temp_df = pd.DataFrame.from_dict(data_json)
     temp_df.rename(
         columns={
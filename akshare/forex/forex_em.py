@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/6/23 15:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-行情中心-外汇市场-所有汇率
 https://quote.eastmoney.com/center/gridlist.html#forex_all
 """
@@ -11,6 +11,7 @@ import requests
 
 from akshare.forex.cons import symbol_market_map
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.kline import parse_klines
 
 
 def forex_spot_em() -> pd.DataFrame:
@@ -64,12 +65,8 @@ def forex_spot_em() -> pd.DataFrame:
             "昨收",
         ]
     ]
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
     temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
     temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["今开"] = pd.to_numeric(temp_df["今开"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
     temp_df["昨收"] = pd.to_numeric(temp_df["昨收"], errors="coerce")
     return temp_df
 
@@ -99,27 +96,21 @@ def forex_hist_em(symbol: str = "USDCNH") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df["code"] = data_json["data"]["code"]
-    temp_df["name"] = data_json["data"]["name"]
-    temp_df.columns = [
-        "日期",
-        "今开",
-        "最新价",
-        "最高",
-        "最低",
-        "-",
-        "-",
-        "振幅",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "代码",
-        "名称",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "今开",
+            "最新价",
+            "最高",
+            "最低",
+            None,
+            None,
+            "振幅",
+        ],
+    )
+    temp_df["代码"] = data_json["data"]["code"]
+    temp_df["名称"] = data_json["data"]["name"]
     temp_df = temp_df[
         [
             "日期",
@@ -137,7 +128,6 @@ def forex_hist_em(symbol: str = "USDCNH") -> pd.DataFrame:
     temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
     temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
     temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
     return temp_df
 
 
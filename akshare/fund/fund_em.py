@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2026/1/20 17:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网站-天天基金网-基金数据-开放式基金净值
 https://fund.eastmoney.com/manager/default.html#dt14;mcreturnjson;ftall;pn20;pi1;scabbname;stasc
 1.基金经理基本数据, 建议包含:基金经理代码,基金经理姓名,从业起始日期,现任基金公司,管理资产总规模,上述数据可在"基金经理列表:
@@ -18,14 +18,17 @@ https://fundf10.eastmoney.com/jjjl_001810.html
 import json
 import math
 import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import StringIO
 
 import pandas as pd
-import py_mini_racer
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 from akshare.utils.cons import headers
+from akshare.utils.context import get_session
+from akshare.utils.js_vars import extract_js_vars
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -45,7 +48,7 @@ def fund_purchase_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     data_text = r.text
-    data_json = demjson.decode(data_text.strip("var reData="))
+    data_json = js_literal.loads(data_text.strip("var reData="))
     temp_df = pd.DataFrame(data_json["datas"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = temp_df.index + 1
@@ -104,9 +107,9 @@ def fund_name_em() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://fund.eastmoney.com/js/fundcode_search.js"
-    r = requests.get(url, headers=headers)
+    r = get_session(url).get(url, headers=headers)
     text_data = r.text
-    data_json = demjson.decode(text_data.strip("var r = ")[:-1])
+    data_json = js_literal.loads(text_data.strip("var r = ")[:-1])
     temp_df = pd.DataFrame(data_json)
     temp_df.columns = ["基金代码", "拼音缩写", "基金简称", "基金类型", "拼音全称"]
     return temp_df
@@ -286,7 +289,7 @@ def fund_open_fund_daily_em() -> pd.DataFrame:
     }
     res = requests.get(url, params=params, headers=headers)
     text_data = res.text
-    data_json = demjson.decode(text_data.strip("var db="))
+    data_json = js_literal.loads(text_data.strip("var db="))
     temp_df = pd.DataFrame(data_json["datas"])
     show_day = data_json["showday"]
     temp_df.columns = [
@@ -330,6 +333,174 @@ def fund_open_fund_daily_em() -> pd.DataFrame:
     return data_df
 
 
+def _ms_to_date(series: pd.Series) -> pd.Series:
+    """
+    毫秒时间戳转换为北京时间的日期
+    """
+    return (
+        pd.to_datetime(series, unit="ms", utc=True)
+        .dt.tz_convert("Asia/Shanghai")
+        .dt.date
+    )
+
+
+def _pingzhong_trend(data_json, columns: list) -> pd.DataFrame:
+    """
+    解析 [[时间戳, 值], ...] 或 [{"x": 时间戳, "y": 值, ...}, ...] 形式的走势数据
+    :param data_json: 走势数据
+    :type data_json: list
+    :param columns: 列名, 第一列为日期, 其余列为数值; 名称为 "_" 的列会被删除
+    :type columns: list
+    :return: 走势数据
+    :rtype: pandas.DataFrame
+    """
+    temp_df = pd.DataFrame(data_json)
+    if temp_df.empty:
+        return pd.DataFrame()
+    temp_df = temp_df.iloc[:, : len(columns)]
+    temp_df.columns = columns
+    temp_df = temp_df[[item for item in columns if item != "_"]]
+    temp_df[columns[0]] = _ms_to_date(temp_df[columns[0]])
+    for item in temp_df.columns[1:]:
+        temp_df[item] = pd.to_numeric(temp_df[item], errors="coerce")
+    return temp_df
+
+
+def _pingzhong_series(data_json) -> pd.DataFrame:
+    """
+    解析 {"categories": [报告日期, ...], "series": [{"name": 名称, "data": [...]}, ...]} 形式的数据
+    :param data_json: 报告期数据
+    :type data_json: dict
+    :return: 报告期数据
+    :rtype: pandas.DataFrame
+    """
+    if not data_json or not data_json.get("categories"):
+        return pd.DataFrame()
+    temp_df = pd.DataFrame({"报告日期": data_json["categories"]})
+    for item in data_json["series"]:
+        temp_df[item["name"]] = pd.to_numeric(
+            pd.Series(item["data"], dtype="object"), errors="coerce"
+        )
+    temp_df["报告日期"] = pd.to_datetime(temp_df["报告日期"], errors="coerce").dt.date
+    return temp_df
+
+
+def _pingzhong_scale(data_json) -> pd.DataFrame:
+    """
+    解析规模变动数据
+    :param data_json: 规模变动数据
+    :type data_json: dict
+    :return: 规模变动数据
+    :rtype: pandas.DataFrame
+    """
+    if not data_json or not data_json.get("categories"):
+        return pd.DataFrame()
+    temp_df = pd.DataFrame(data_json["series"])
+    temp_df = temp_df.reindex(columns=["y", "mom"])
+    temp_df.columns = ["净资产规模", "较上期环比"]
+    temp_df.insert(
+        0, "报告日期", pd.to_datetime(data_json["categories"], errors="coerce").date
+    )
+    temp_df["净资产规模"] = pd.to_numeric(temp_df["净资产规模"], errors="coerce")
+    return temp_df
+
+
+# pingzhongdata 中的指标: (变量名, 解析函数)
+_PINGZHONG_INDICATOR_MAP = {
+    "单位净值走势": (
+        "Data_netWorthTrend",
+        lambda data: _pingzhong_trend(data, ["净值日期", "单位净值", "日增长率", "_"]),
+    ),
+    "累计净值走势": (
+        "Data_ACWorthTrend",
+        lambda data: _pingzhong_trend(data, ["净值日期", "累计净值"]),
+    ),
+    "每万份收益": (
+        "Data_millionCopiesIncome",
+        lambda data: _pingzhong_trend(data, ["净值日期", "每万份收益"]),
+    ),
+    "7日年化收益率": (
+        "Data_sevenDaysYearIncome",
+        lambda data: _pingzhong_trend(data, ["净值日期", "7日年化收益率"]),
+    ),
+    "同类排名走势": (
+        "Data_rateInSimilarType",
+        lambda data: _pingzhong_trend(
+            data,
+            ["报告日期", "同类型排名-每日近三月排名", "总排名-每日近三月排名"],
+        ),
+    ),
+    "同类排名百分比": (
+        "Data_rateInSimilarPersent",
+        lambda data: _pingzhong_trend(
+            data, ["报告日期", "同类型排名-每日近3月收益排名百分比"]
+        ),
+    ),
+    "资产配置": ("Data_assetAllocation", _pingzhong_series),
+    "持有人结构": ("Data_holderStructure", _pingzhong_series),
+    "规模变动": ("Data_fluctuationScale", _pingzhong_scale),
+}
+
+
+def _fund_pingzhong_data_em(symbol: str = "710001") -> dict:
+    """
+    东方财富网-天天基金网-基金数据-pingzhongdata 中的全部变量
+    :param symbol: 基金代码
+    :type symbol: str
+    :return: {变量名: 变量值}
+    :rtype: dict
+    """
+    url = f"https://fund.eastmoney.com/pingzhongdata/{symbol}.js"  # 各类数据都在里面
+    # 批量获取时各线程共用该 host 的连接池和限速器
+    r = get_session(url).get(url, headers=headers)
+    var_names = [item[0] for item in _PINGZHONG_INDICATOR_MAP.values()]
+    return extract_js_vars(r.text, names=var_names)
+
+
+def fund_open_fund_info_all_em(symbol: str = "710001") -> dict:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值-全部指标
+    只下载并解析一次 pingzhongdata, 返回其中的全部指标
+    https://fund.eastmoney.com/fund.html
+    :param symbol: 基金代码; 可以通过调用 ak.fund_open_fund_daily_em() 获取所有开放式基金代码
+    :type symbol: str
+    :return: {指标名称: 数据}, 指标名称 choice of {"单位净值走势", "累计净值走势", "每万份收益", "7日年化收益率", "同类排名走势", "同类排名百分比", "资产配置", "持有人结构", "规模变动"}; 基金没有的指标为空的 DataFrame
+    :rtype: dict
+    """
+    data_dict = _fund_pingzhong_data_em(symbol=symbol)
+    result = {}
+    for indicator, (var_name, parse_func) in _PINGZHONG_INDICATOR_MAP.items():
+        data_json = data_dict.get(var_name)
+        result[indicator] = parse_func(data_json) if data_json else pd.DataFrame()
+    return result
+
+
+def fund_open_fund_info_all_batch_em(symbols: list, max_workers: int = 8) -> dict:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值-全部指标-批量获取
+    https://fund.eastmoney.com/fund.html
+    :param symbols: 基金代码列表
+    :type symbols: list
+    :param max_workers: 并发请求的线程数
+    :type max_workers: int
+    :return: {基金代码: {指标名称: 数据}}, 按输入顺序排列; 请求失败的基金会给出警告并跳过
+    :rtype: dict
+    """
+    result = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_symbol = {
+            executor.submit(fund_open_fund_info_all_em, symbol): symbol
+            for symbol in symbols
+        }
+        for future in as_completed(future_to_symbol):
+            symbol = future_to_symbol[future]
+            try:
+                result[symbol] = future.result()
+            except Exception as e:
+                warnings.warn(f"{symbol} 获取失败: {e}")
+    return {symbol: result[symbol] for symbol in symbols if symbol in result}
+
+
 def fund_open_fund_info_em(
     symbol: str = "710001", indicator: str = "单位净值走势", period: str = "成立来"
 ) -> pd.DataFrame:
@@ -345,132 +516,28 @@ def fund_open_fund_info_em(
     :return: 指定基金指定指标的数据
     :rtype: pandas.DataFrame
     """
-    from akshare.utils.cons import headers
-
-    url = f"https://fund.eastmoney.com/pingzhongdata/{symbol}.js"  # 各类数据都在里面
-    r = requests.get(url, headers=headers)
-    data_text = r.text
-
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(data_text)
-
-    # 单位净值走势
-    if indicator == "单位净值走势":
-        data_json = js_code.execute("Data_netWorthTrend")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
-        )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "净值日期",
-            "单位净值",
-            "日增长率",
-            "_",
-        ]
-        temp_df = temp_df[
-            [
-                "净值日期",
-                "单位净值",
-                "日增长率",
-            ]
-        ]
-        temp_df["净值日期"] = pd.to_datetime(
-            temp_df["净值日期"], errors="coerce"
-        ).dt.date
-        temp_df["单位净值"] = pd.to_numeric(temp_df["单位净值"], errors="coerce")
-        temp_df["日增长率"] = pd.to_numeric(temp_df["日增长率"], errors="coerce")
-        return temp_df
-
-    # 累计净值走势
-    if indicator == "累计净值走势":
-        data_json = js_code.execute("Data_ACWorthTrend")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
-        temp_df.columns = ["x", "y"]
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
-        )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "净值日期",
-            "累计净值",
-        ]
-        temp_df = temp_df[
-            [
-                "净值日期",
-                "累计净值",
-            ]
-        ]
-        temp_df["净值日期"] = pd.to_datetime(
-            temp_df["净值日期"], errors="coerce"
-        ).dt.date
-        temp_df["累计净值"] = pd.to_numeric(temp_df["累计净值"], errors="coerce")
-        return temp_df
-
-    # 每万份收益
-    if indicator == "每万份收益":
-        data_json = js_code.execute("Data_millionCopiesIncome")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
-        temp_df.columns = ["x", "y"]
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
-        )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "净值日期",
-            "每万份收益",
-        ]
-        temp_df = temp_df[
-            [
-                "净值日期",
-                "每万份收益",
-            ]
-        ]
-        temp_df["净值日期"] = pd.to_datetime(
-            temp_df["净值日期"], errors="coerce"
-        ).dt.date
-        temp_df["每万份收益"] = pd.to_numeric(temp_df["每万份收益"], errors="coerce")
-        return temp_df
+    request = _fund_open_fund_info_em_request(
+        symbol=symbol, indicator=indicator, period=period
+    )
+    if request is None:
+        return pd.DataFrame()
+    url, params, request_headers = request
+    r = requests.get(url, params=params, headers=request_headers)
+    return _fund_open_fund_info_em_parse(r.text, indicator=indicator)
 
-    # 7日年化收益率
-    if indicator == "7日年化收益率":
-        data_json = js_code.execute("Data_sevenDaysYearIncome")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
-        temp_df.columns = ["x", "y"]
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
-        )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "净值日期",
-            "7日年化收益率",
-        ]
-        temp_df = temp_df[
-            [
-                "净值日期",
-                "7日年化收益率",
-            ]
-        ]
-        temp_df["净值日期"] = pd.to_datetime(
-            temp_df["净值日期"], errors="coerce"
-        ).dt.date
-        temp_df["7日年化收益率"] = pd.to_numeric(
-            temp_df["7日年化收益率"], errors="coerce"
-        )
-        return temp_df
 
+def _fund_open_fund_info_em_request(symbol: str, indicator: str, period: str):
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值-请求地址, 请求参数和请求头, 参数说明见 fund_open_fund_info_em
+    :return: (请求地址, 请求参数, 请求头), 不支持的指标为 None
+    :rtype: tuple
+    """
+    if indicator in _PINGZHONG_INDICATOR_MAP:
+        url = f"https://fund.eastmoney.com/pingzhongdata/{symbol}.js"
+        return url, None, headers
     # 累计收益率走势
     if indicator == "累计收益率走势":
         url = "https://api.fund.eastmoney.com/pinzhong/LJSYLZS"
-        headers = {"Referer": "https://fund.eastmoney.com/"}
         period_map = {
             "1月": "m",
             "3月": "q",
@@ -486,8 +553,30 @@ def fund_open_fund_info_em(
             "indexcode": "000300",
             "type": period_map[period],
         }
-        r = requests.get(url, params=params, headers=headers)
-        data_json = r.json()
+        return url, params, {"Referer": "https://fund.eastmoney.com/"}
+    # 分红送配详情, 拆分详情
+    if indicator in ("分红送配详情", "拆分详情"):
+        return f"https://fundf10.eastmoney.com/fhsp_{symbol}.html", None, headers
+    return None
+
+
+def _fund_open_fund_info_em_parse(text: str, indicator: str) -> pd.DataFrame:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值-解析接口返回的内容, 同步和异步接口共用
+    :param text: 接口返回的内容
+    :type text: str
+    :param indicator: 需要获取的指标
+    :type indicator: str
+    :return: 指定指标的数据
+    :rtype: pandas.DataFrame
+    """
+    if indicator in _PINGZHONG_INDICATOR_MAP:
+        var_name, parse_func = _PINGZHONG_INDICATOR_MAP[indicator]
+        data_json = extract_js_vars(text, names=[var_name]).get(var_name)
+        return parse_func(data_json) if data_json else pd.DataFrame()
+
+    if indicator == "累计收益率走势":
+        data_json = json.loads(text)
         temp_df = pd.DataFrame(data_json["Data"][0]["data"])
         temp_df.columns = ["日期", "累计收益率"]
         temp_df["日期"] = pd.to_datetime(
@@ -497,92 +586,17 @@ def fund_open_fund_info_em(
         temp_df["累计收益率"] = pd.to_numeric(temp_df["累计收益率"], errors="coerce")
         return temp_df
 
-    # 同类排名走势
-    if indicator == "同类排名走势":
-        data_json = js_code.execute("Data_rateInSimilarType")
-        temp_df = pd.DataFrame(data_json)
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
-        )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "报告日期",
-            "同类型排名-每日近三月排名",
-            "总排名-每日近三月排名",
-        ]
-        temp_df = temp_df[
-            [
-                "报告日期",
-                "同类型排名-每日近三月排名",
-                "总排名-每日近三月排名",
-            ]
-        ]
-        temp_df["报告日期"] = pd.to_datetime(
-            temp_df["报告日期"], errors="coerce"
-        ).dt.date
-        temp_df["同类型排名-每日近三月排名"] = pd.to_numeric(
-            temp_df["同类型排名-每日近三月排名"], errors="coerce"
-        )
-        temp_df["总排名-每日近三月排名"] = pd.to_numeric(
-            temp_df["总排名-每日近三月排名"], errors="coerce"
-        )
-        return temp_df
-
-    # 同类排名百分比
-    if indicator == "同类排名百分比":
-        data_json = js_code.execute("Data_rateInSimilarPersent")
-        temp_df = pd.DataFrame(data_json)
-        temp_df.columns = ["x", "y"]
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
-        )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "报告日期",
-            "同类型排名-每日近3月收益排名百分比",
-        ]
-        temp_df = temp_df[
-            [
-                "报告日期",
-                "同类型排名-每日近3月收益排名百分比",
-            ]
-        ]
-        temp_df["报告日期"] = pd.to_datetime(
-            temp_df["报告日期"], errors="coerce"
-        ).dt.date
-        temp_df["同类型排名-每日近3月收益排名百分比"] = pd.to_numeric(
-            temp_df["同类型排名-每日近3月收益排名百分比"], errors="coerce"
-        )
-        return temp_df
-
-    # 分红送配详情
+    # 分红送配详情和拆分详情在同一个页面, 只解析一次表格
+    tables = pd.read_html(StringIO(text))
     if indicator == "分红送配详情":
-        url = f"https://fundf10.eastmoney.com/fhsp_{symbol}.html"
-        r = requests.get(url, headers=headers)
-        table_num = len(pd.read_html(StringIO(r.text)))
-        if table_num == 3:
-            temp_df = pd.read_html(StringIO(r.text))[1]
-        else:
-            temp_df = pd.read_html(StringIO(r.text))[0]
-        if temp_df.iloc[0, 1] == "暂无分红信息!":
-            return pd.DataFrame()
-        else:
-            return temp_df
-
-    # 拆分详情
-    if indicator == "拆分详情":
-        url = f"https://fundf10.eastmoney.com/fhsp_{symbol}.html"
-        r = requests.get(url, headers=headers)
-        table_num = len(pd.read_html(StringIO(r.text)))
-        if table_num == 3:
-            temp_df = pd.read_html(StringIO(r.text))[2]
-        else:
-            temp_df = pd.read_html(StringIO(r.text))[1]
-        if temp_df.iloc[0, 1] == "暂无拆分信息!":
-            return pd.DataFrame()
-        else:
-            return temp_df
-    return pd.DataFrame()
+        temp_df = tables[1] if len(tables) == 3 else tables[0]
+        empty_text = "暂无分红信息!"
+    else:
+        temp_df = tables[2] if len(tables) == 3 else tables[1]
+        empty_text = "暂无拆分信息!"
+    if temp_df.iloc[0, 1] == empty_text:
+        return pd.DataFrame()
+    return temp_df
 
 
 def fund_money_fund_daily_em() -> pd.DataFrame:
@@ -777,7 +791,7 @@ def fund_financial_fund_info_em(symbol: str = "000134") -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     text_data = r.text
-    data_json = demjson.decode(text_data[text_data.find("{") : -1])
+    data_json = js_literal.loads(text_data[text_data.find("{") : -1])
     temp_df = pd.DataFrame(data_json["Data"]["LSJZList"])
     temp_df.columns = [
         "净值日期",
@@ -839,7 +853,7 @@ def fund_graded_fund_daily_em() -> pd.DataFrame:
     }
     res = requests.get(url, params=params, headers=headers)
     text_data = res.text
-    data_json = demjson.decode(text_data.strip("var db="))
+    data_json = js_literal.loads(text_data.strip("var db="))
     temp_df = pd.DataFrame(data_json["datas"])
     show_day = data_json["showday"]
     temp_df.columns = [
@@ -1248,6 +1262,10 @@ if __name__ == "__main__":
     print(fund_open_fund_info_em_df)
     time.sleep(3)
 
+    fund_open_fund_info_all_em_dict = fund_open_fund_info_all_em(symbol="710001")
+    print(fund_open_fund_info_all_em_dict["资产配置"])
+    time.sleep(3)
+
     fund_open_fund_info_em_df = fund_open_fund_info_em(
         symbol="502010", indicator="累计净值走势", period="成立来"
     )
@@ -1,17 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/11/10 15:30
+Date: 2026/10/15 18:00
 Desc: 新浪财经-基金行情
 https://vip.stock.finance.sina.com.cn/fund_center/index.html#jjhqetf
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
-from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
+from akshare.utils import js_literal
+from akshare.utils.sina_decode import sina_kline_decode
 
 
 def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
@@ -42,7 +41,7 @@ def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("([") + 1 : -2])
+    data_json = js_literal.loads(data_text[data_text.find("([") + 1 : -2])
     temp_df = pd.DataFrame(data_json)
     if symbol == "封闭式基金":
         temp_df.columns = [
@@ -126,11 +125,9 @@ def fund_etf_hist_sina(symbol: str = "sh510050") -> pd.DataFrame:
         f"https://finance.sina.com.cn/realstock/company/{symbol}/hisdata_klc2/klc_kl.js"
     )
     r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
+    dict_list = sina_kline_decode(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
+    )  # 解密数据
     temp_df = pd.DataFrame(dict_list)
     if temp_df.empty:  # 处理获取数据为空的问题
         return pd.DataFrame()
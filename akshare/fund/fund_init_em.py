@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/11/7 18:30
+Date: 2026/10/15 18:00
 Desc: 基金数据-新发基金-新成立基金
 https://fund.eastmoney.com/data/xinfound.html
 """
@@ -9,7 +9,7 @@ https://fund.eastmoney.com/data/xinfound.html
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 
 
 def fund_new_found_em() -> pd.DataFrame:
@@ -30,7 +30,7 @@ def fund_new_found_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text.strip("var newfunddata="))
+    data_json = js_literal.loads(data_text.strip("var newfunddata="))
     temp_df = pd.DataFrame(data_json["datas"])
     temp_df.columns = [
         "基金代码",
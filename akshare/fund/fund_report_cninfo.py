@@ -1,16 +1,16 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/7/24 23:30
+Date: 2026/10/15 18:00
 Desc: 巨潮资讯-数据中心-专题统计-基金报表
 https://webapi.cninfo.com.cn/#/thematicStatistics
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
@@ -37,9 +37,8 @@ def fund_report_stock_cninfo(date: str = "20210630") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1112"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -104,9 +103,8 @@ def fund_report_industry_allocation_cninfo(date: str = "20210630") -> pd.DataFra
     :rtype: pandas.DataFrame
     """
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1113"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -166,9 +164,8 @@ def fund_report_asset_allocation_cninfo() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1114"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -1,7 +1,7 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2023/10/27 20:30
+Date: 2026/10/15 18:00
 Desc: 天天基金网-基金数据-规模份额
 https://fund.eastmoney.com/data/cyrjglist.html
 """
@@ -9,7 +9,7 @@ https://fund.eastmoney.com/data/cyrjglist.html
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 
 
 def fund_scale_change_em() -> pd.DataFrame:
@@ -30,14 +30,14 @@ def fund_scale_change_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = js_literal.loads(data_text[data_text.find("{") : -1])
     total_page = data_json["pages"]
     big_df = pd.DataFrame()
     for page in range(1, int(total_page) + 1):
         params.update({"pi": page})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -1])
+        data_json = js_literal.loads(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["data"])
         big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
     big_df.reset_index(inplace=True)
@@ -86,14 +86,14 @@ def fund_hold_structure_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = js_literal.loads(data_text[data_text.find("{") : -1])
     total_page = data_json["pages"]
     big_df = pd.DataFrame()
     for page in range(1, int(total_page) + 1):
         params.update({"pi": page})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -1])
+        data_json = js_literal.loads(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["data"])
         big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
     big_df.reset_index(inplace=True)
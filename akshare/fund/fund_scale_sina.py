@@ -1,7 +1,7 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/9/1 16:20
+Date: 2026/10/15 18:00
 Desc: 新浪财经-基金规模
 https://vip.stock.finance.sina.com.cn/fund_center/index.html#jjgmall
 """
@@ -9,7 +9,7 @@ https://vip.stock.finance.sina.com.cn/fund_center/index.html#jjgmall
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 
 
 def fund_scale_open_sina(symbol: str = "股票型基金") -> pd.DataFrame:
@@ -43,7 +43,7 @@ def fund_scale_open_sina(symbol: str = "股票型基金") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("({") + 1 : -2])
+    data_json = js_literal.loads(data_text[data_text.find("({") + 1 : -2])
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
@@ -114,7 +114,7 @@ def fund_scale_close_sina() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("({") + 1 : -2])
+    data_json = js_literal.loads(data_text[data_text.find("({") + 1 : -2])
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
@@ -185,7 +185,7 @@ def fund_scale_structured_sina() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("({") + 1 : -2])
+    data_json = js_literal.loads(data_text[data_text.find("({") + 1 : -2])
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/21 15:00
+Date: 2026/10/15 18:00
 Desc: 期货-中国-交易所-会员持仓数据接口
 大连商品交易所、上海期货交易所、郑州商品交易所、中国金融期货交易所、广州期货交易所
 采集前 20 会员持仓数据;
@@ -20,6 +20,7 @@ import re
 import time
 import warnings
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from io import StringIO
 
@@ -30,8 +31,9 @@ from bs4 import BeautifulSoup
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link
 from akshare.futures.symbol_var import symbol_varieties
+from akshare.utils.html_table import read_html_table
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
 rank_columns = [
     "vol_party_name",
     "vol",
@@ -51,6 +53,93 @@ intColumns = [
     "short_open_interest",
     "short_open_interest_chg",
 ]
+# 前 N 名会员持仓的汇总档位
+RANK_TOP_N = (5, 10, 15, 20)
+# 按合约并发下载排名表的线程数
+RANK_TABLE_WORKERS = 4
+# 大连商品交易所网页排名表的表头特征
+DCE_RANK_HEADERS = ["名次", "会员简称", "持买单量", "持卖单量"]
+
+
+def _rank_number(series: pd.Series) -> pd.Series:
+    """
+    将排名表中的数值列转换为数字: 去掉千分位逗号, "-" 和空字符串视为 0
+    :param series: 数值列
+    :type series: pandas.Series
+    :return: 转换后的数值列
+    :rtype: pandas.Series
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    text = series.astype(str).str.replace(",", "", regex=False).str.strip()
+    text = text.mask(text.isin(["-", ""]), "0")
+    return pd.to_numeric(text, errors="coerce")
+
+
+def _strip_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    去掉文本列的首尾空白, 空字符串视为缺失值
+    :param df: 排名表
+    :type df: pandas.DataFrame
+    :return: 处理后的排名表
+    :rtype: pandas.DataFrame
+    """
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        stripped = df[col].str.strip()
+        # 非字符串的单元格保持不变
+        stripped = stripped.where(stripped.notna(), df[col])
+        df[col] = stripped.mask(stripped == "")
+    return df
+
+
+def _rank_tables_to_long(big_dict: dict, date: datetime.date) -> pd.DataFrame:
+    """
+    将各合约的排名表合并为一张长表, 数值列统一为整数
+    :param big_dict: {合约: 排名表}
+    :type big_dict: dict
+    :param date: 交易日
+    :type date: datetime.date
+    :return: 长表, 每行为一个合约的一个名次
+    :rtype: pandas.DataFrame
+    """
+    columns = ["date", "symbol", "variety", "rank"] + rank_columns
+    frames = [
+        table
+        for table in big_dict.values()
+        if isinstance(table, pd.DataFrame) and not table.empty
+    ]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    df = pd.concat(frames, ignore_index=True, sort=False)
+    df["rank"] = pd.to_numeric(df["rank"], errors="coerce")
+    # 中金所的排名表带有名次为 999 的合计行
+    df = df[df["rank"].notna() & (df["rank"] != 999)].copy()
+    df["rank"] = df["rank"].astype("int64")
+    for col in intColumns:
+        df[col] = _rank_number(df[col]).fillna(0).astype("int64")
+    df["symbol"] = df["symbol"].astype(str)
+    varieties = {item: symbol_varieties(item) for item in df["symbol"].unique()}
+    df["variety"] = df["symbol"].map(varieties)
+    df["date"] = date.strftime("%Y%m%d")
+    return df[columns].reset_index(drop=True)
+
+
+def _rank_top_sum(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    一次分组计算每个合约前 5、前 10、前 15、前 20 名会员的汇总
+    :param df: _rank_tables_to_long 返回的长表
+    :type df: pandas.DataFrame
+    :return: 每个合约一行的汇总数据
+    :rtype: pandas.DataFrame
+    """
+    rank = df["rank"].to_numpy()
+    data = {"symbol": df["symbol"].to_numpy(), "variety": df["variety"].to_numpy()}
+    for n in RANK_TOP_N:
+        in_top = rank <= n
+        for col in intColumns:
+            data[f"{col}_top{n}"] = df[col].to_numpy() * in_top
+    temp_df = pd.DataFrame(data)
+    return temp_df.groupby(["symbol", "variety"], sort=False).sum().reset_index()
 
 
 def get_rank_sum_daily(
@@ -90,19 +179,15 @@ def get_rank_sum_daily(
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
     records = pd.DataFrame()
-    while start_day <= end_day:
+    for start_day in calendar.trading_days_between(start_day, end_day).tolist():
         print(start_day)
-        if start_day.strftime("%Y%m%d") in calendar:
-            data = get_rank_sum(start_day, vars_list)
-            if data is False:
-                print(
-                    f"{start_day.strftime('%Y-%m-%d')}日交易所数据连接失败，已超过20次，您的地址被网站墙了，请保存好返回数据，稍后从该日期起重试"
-                )
-                return records.reset_index(drop=True)
-            records = pd.concat(objs=[records, data], ignore_index=True)
-        else:
-            warnings.warn(f"{start_day.strftime('%Y%m%d')}非交易日")
-        start_day += datetime.timedelta(days=1)
+        data = get_rank_sum(start_day, vars_list)
+        if data is False:
+            print(
+                f"{start_day.strftime('%Y-%m-%d')}日交易所数据连接失败，已超过20次，您的地址被网站墙了，请保存好返回数据，稍后从该日期起重试"
+            )
+            return records.reset_index(drop=True)
+        records = pd.concat(objs=[records, data], ignore_index=True)
 
     return records.reset_index(drop=True)
 
@@ -129,147 +214,90 @@ def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols
     short_open_interest_chg_top5     持空单前5会员持空单变化总和      int
     vol_top10                        成交量前10会员成交量总和        int
     """
+    rank_df = get_rank_table(date, vars_list)
+    if rank_df is None or rank_df is False:
+        return rank_df
+    if rank_df.empty:
+        return pd.DataFrame()
+    date = cons.convert_date(date) if date is not None else datetime.date.today()
+    records = _rank_top_sum(rank_df)
+    # 上期所、中金所和大商所没有公布品种排名, 由各合约加总得到
+    add_vars = [
+        i
+        for i in cons.market_exchange_symbols["dce"]
+        + cons.market_exchange_symbols["shfe"]
+        + cons.market_exchange_symbols["cffex"]
+        if i in set(records["variety"])
+    ]
+    if add_vars:
+        var_records = (
+            records[records["variety"].isin(add_vars)]
+            .drop(columns=["symbol"])
+            .groupby("variety", sort=False)
+            .sum()
+            .reindex(add_vars)
+            .reset_index()
+        )
+        var_records.insert(0, "symbol", var_records["variety"])
+        records = pd.concat([records, var_records], ignore_index=True)
+    records["date"] = date.strftime("%Y%m%d")
+    return records.reset_index(drop=True)
+
+
+def get_rank_table(
+    date: str = "20210525", vars_list: list = cons.contract_symbols
+) -> pd.DataFrame:
+    """
+    五个期货交易所会员持仓排名明细的长表, 各交易所并发获取
+    :param date: 日期 format: YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
+    :type date: str
+    :param vars_list: 合约品种如 ['RB', 'AL'] 等列表为空时为所有商品
+    :type vars_list: list
+    :return: 持仓排名明细; 非交易日返回 None, 交易所数据获取失败时返回 False
+    :rtype: pandas.DataFrame
+    date                        日期                        string YYYYMMDD
+    symbol                      标的合约                     string
+    variety                     商品品种                     string
+    rank                        排名                        int
+    vol_party_name              成交量排序的当前名次会员        string(中文)
+    vol                         该会员成交量                  int
+    vol_chg                     该会员成交量变化量             int
+    long_party_name             持多单排序的当前名次会员        string(中文)
+    long_open_interest          该会员持多单                  int
+    long_open_interest_chg      该会员持多单变化量             int
+    short_party_name            持空单排序的当前名次会员        string(中文)
+    short_open_interest         该会员持空单                  int
+    short_open_interest_chg     该会员持空单变化量             int
+    """
     date = cons.convert_date(date) if date is not None else datetime.date.today()
     if date.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
         return None
-    dce_var = [i for i in vars_list if i in cons.market_exchange_symbols["dce"]]
-    shfe_var = [i for i in vars_list if i in cons.market_exchange_symbols["shfe"]]
-    czce_var = [i for i in vars_list if i in cons.market_exchange_symbols["czce"]]
-    cffex_var = [i for i in vars_list if i in cons.market_exchange_symbols["cffex"]]
-    gfex_var = [i for i in vars_list if i in cons.market_exchange_symbols["gfex"]]
+    jobs = {
+        "dce": lambda var_list: futures_dce_position_rank(date, var_list),
+        "shfe": lambda var_list: get_shfe_rank_table(date, var_list),
+        "czce": lambda var_list: get_rank_table_czce(date),
+        "cffex": lambda var_list: get_cffex_rank_table(date, var_list),
+        "gfex": lambda var_list: futures_gfex_position_rank(date, var_list),
+    }
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {}
+        for market, func in jobs.items():
+            var_list = [
+                i for i in vars_list if i in cons.market_exchange_symbols[market]
+            ]
+            if len(var_list) > 0:
+                futures[market] = executor.submit(func, var_list)
+        results = [futures[market].result() for market in jobs if market in futures]
     big_dict = {}
-    if len(dce_var) > 0:
-        data = futures_dce_position_rank(date, dce_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(shfe_var) > 0:
-        data = get_shfe_rank_table(date, shfe_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(czce_var) > 0:
-        data = get_rank_table_czce(date)
+    for data in results:
         if data is False:
             return False
-        big_dict.update(data)
-    if len(cffex_var) > 0:
-        data = get_cffex_rank_table(date, cffex_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(gfex_var) > 0:
-        data = futures_gfex_position_rank(date, gfex_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    records = pd.DataFrame()
-
-    for symbol, table in big_dict.items():
-        table = table.map(lambda x: 0 if x == "" else x)
-        for symbol_inner in set(table["symbol"]):
-            var = symbol_varieties(symbol_inner)
-            if var in vars_list:
-                if var in czce_var:
-                    for col in [
-                        item
-                        for item in table.columns
-                        if item.find("open_interest") > -1
-                    ] + ["vol", "vol_chg"]:
-                        table[col] = [
-                            float(value.replace(",", "")) if value != "-" else 0.0
-                            for value in table[col]
-                        ]
-
-                table_cut = table[table["symbol"] == symbol_inner]
-                table_cut["rank"] = table_cut["rank"].astype("float")
-                table_cut_top5 = table_cut[table_cut["rank"] <= 5]
-                table_cut_top10 = table_cut[table_cut["rank"] <= 10]
-                table_cut_top15 = table_cut[table_cut["rank"] <= 15]
-                table_cut_top20 = table_cut[table_cut["rank"] <= 20]
-
-                big_dict = {
-                    "symbol": symbol_inner,
-                    "variety": var,
-                    "vol_top5": table_cut_top5["vol"].sum(),
-                    "vol_chg_top5": table_cut_top5["vol_chg"].sum(),
-                    "long_open_interest_top5": table_cut_top5[
-                        "long_open_interest"
-                    ].sum(),
-                    "long_open_interest_chg_top5": table_cut_top5[
-                        "long_open_interest_chg"
-                    ].sum(),
-                    "short_open_interest_top5": table_cut_top5[
-                        "short_open_interest"
-                    ].sum(),
-                    "short_open_interest_chg_top5": table_cut_top5[
-                        "short_open_interest_chg"
-                    ].sum(),
-                    "vol_top10": table_cut_top10["vol"].sum(),
-                    "vol_chg_top10": table_cut_top10["vol_chg"].sum(),
-                    "long_open_interest_top10": table_cut_top10[
-                        "long_open_interest"
-                    ].sum(),
-                    "long_open_interest_chg_top10": table_cut_top10[
-                        "long_open_interest_chg"
-                    ].sum(),
-                    "short_open_interest_top10": table_cut_top10[
-                        "short_open_interest"
-                    ].sum(),
-                    "short_open_interest_chg_top10": table_cut_top10[
-                        "short_open_interest_chg"
-                    ].sum(),
-                    "vol_top15": table_cut_top15["vol"].sum(),
-                    "vol_chg_top15": table_cut_top15["vol_chg"].sum(),
-                    "long_open_interest_top15": table_cut_top15[
-                        "long_open_interest"
-                    ].sum(),
-                    "long_open_interest_chg_top15": table_cut_top15[
-                        "long_open_interest_chg"
-                    ].sum(),
-                    "short_open_interest_top15": table_cut_top15[
-                        "short_open_interest"
-                    ].sum(),
-                    "short_open_interest_chg_top15": table_cut_top15[
-                        "short_open_interest_chg"
-                    ].sum(),
-                    "vol_top20": table_cut_top20["vol"].sum(),
-                    "vol_chg_top20": table_cut_top20["vol_chg"].sum(),
-                    "long_open_interest_top20": table_cut_top20[
-                        "long_open_interest"
-                    ].sum(),
-                    "long_open_interest_chg_top20": table_cut_top20[
-                        "long_open_interest_chg"
-                    ].sum(),
-                    "short_open_interest_top20": table_cut_top20[
-                        "short_open_interest"
-                    ].sum(),
-                    "short_open_interest_chg_top20": table_cut_top20[
-                        "short_open_interest_chg"
-                    ].sum(),
-                    "date": date.strftime("%Y%m%d"),
-                }
-                records = pd.concat(
-                    [records, pd.DataFrame(big_dict, index=[0])], ignore_index=True
-                )
-
-    if len(big_dict.items()) > 0:
-        add_vars = [
-            i
-            for i in cons.market_exchange_symbols["dce"]
-            + cons.market_exchange_symbols["shfe"]
-            + cons.market_exchange_symbols["cffex"]
-            if i in records["variety"].tolist()
-        ]
-        for var in add_vars:
-            records_cut = records[records["variety"] == var]
-            var_record = pd.DataFrame(records_cut.sum()).T
-            var_record["date"] = date.strftime("%Y%m%d")
-            var_record.loc[:, ["variety", "symbol"]] = var
-            records = pd.concat([records, var_record], ignore_index=True)
-
-    return records.reset_index(drop=True)
+        if data:
+            big_dict.update(data)
+    rank_df = _rank_tables_to_long(big_dict, date)
+    rank_df = rank_df[rank_df["variety"].isin(vars_list)]
+    return rank_df.reset_index(drop=True)
 
 
 def get_shfe_rank_table(
@@ -336,9 +364,9 @@ def get_shfe_rank_table(
 
     if len(df.columns) < 3:
         return {}
-    df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
-    df = df.map(lambda x: None if x == "" else x)
-    df["variety"] = df["symbol"].apply(lambda x: symbol_varieties(x))
+    df = _strip_text_columns(df)
+    varieties = {item: symbol_varieties(item) for item in df["symbol"].unique()}
+    df["variety"] = df["symbol"].map(varieties)
     df = df[df["rank"] > 0]
     for col in [
         "PARTICIPANTID1",
@@ -351,14 +379,11 @@ def get_shfe_rank_table(
             del df[col]
         except:  # noqa: E722
             pass
-    get_vars = [var for var in vars_list if var in df["variety"].tolist()]
+    df = df[df["variety"].isin(vars_list)]
     big_dict = {}
-    for var in get_vars:
-        df_var = df[df["variety"] == var]
-        for symbol in set(df_var["symbol"]):
-            df_symbol = df_var[df_var["symbol"] == symbol].copy()
-            df_symbol["symbol"] = df_symbol["symbol"].str.upper()
-            big_dict[symbol] = df_symbol.reset_index(drop=True)
+    for symbol, df_symbol in df.groupby("symbol", sort=False):
+        df_symbol = df_symbol.assign(symbol=df_symbol["symbol"].str.upper())
+        big_dict[symbol] = df_symbol.reset_index(drop=True)
     return big_dict
 
 
@@ -597,119 +622,72 @@ def get_dce_rank_table(date: str = "20230706", vars_list=cons.contract_symbols)
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
         return {}
     vars_list = [i for i in vars_list if i in cons.market_exchange_symbols["dce"]]
-    big_dict = {}
-    for var in vars_list:
-        # var = 'V'
-        symbol_list = _get_dce_contract_list(date, var)
-        for symbol in symbol_list:
-            # print(symbol)
-            url = cons.DCE_VOL_RANK_URL_1 % (
-                var.lower(),
-                symbol,
-                var.lower(),
-                date.year,
-                date.month - 1,
-                date.day,
-            )
-            try:
-                temp_df = pd.read_excel(url[:-3] + "excel", header=0, skiprows=3)
-                temp_df.dropna(how="any", axis=0, inplace=True)
-                temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
-                del temp_df["名次.1"]
-                del temp_df["名次.2"]
-                temp_df.rename(
-                    columns={
-                        "名次": "rank",
-                        "会员简称": "vol_party_name",
-                        "成交量": "vol",
-                        "增减": "vol_chg",
-                        "会员简称.1": "long_party_name",
-                        "持买单量": "long_open_interest",
-                        "增减.1": "long_open_interest_chg",
-                        "会员简称.2": "short_party_name",
-                        "持卖单量": "short_open_interest",
-                        "增减.2": "short_open_interest_chg",
-                    },
-                    inplace=True,
-                )
-                temp_df["symbol"] = symbol.upper()
-                temp_df["var"] = var
-                temp_df["date"] = date_string
-                temp_df = temp_df.map(
-                    lambda x: str(x).replace("-", "0") if x == "-" else x
-                )
-                temp_df["rank"] = range(1, len(temp_df) + 1)
-                temp_df["vol"] = temp_df["vol"].astype(float)
-                temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
-                temp_df["long_open_interest"] = temp_df["long_open_interest"].astype(
-                    float
-                )
-                temp_df["long_open_interest_chg"] = temp_df[
-                    "long_open_interest_chg"
-                ].astype(float)
-                temp_df["short_open_interest"] = temp_df["short_open_interest"].astype(
-                    float
-                )
-                temp_df["short_open_interest_chg"] = temp_df[
-                    "short_open_interest_chg"
-                ].astype(float)
-                big_dict[symbol] = temp_df
-            except:  # noqa: E722
-                temp_url = "http://portal.dce.com.cn/publicweb/quotesdata/memberDealPosiQuotes.html"
-                payload = {
-                    "memberDealPosiQuotes.variety": var.lower(),
-                    "memberDealPosiQuotes.trade_type": "0",
-                    "year": date.year,
-                    "month": date.month - 1,
-                    "day": str(date.day).zfill(2),
-                    "contract.contract_id": symbol,
-                    "contract.variety_id": var.lower(),
-                    "contract": "",
-                }
-                r = requests.post(temp_url, data=payload)
-                if r.status_code != 200:
-                    big_dict[symbol] = {}
-                else:
-                    temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
-                    del temp_df["名次.1"]
-                    del temp_df["名次.2"]
-                    temp_df.rename(
-                        columns={
-                            "名次": "rank",
-                            "会员简称": "vol_party_name",
-                            "成交量": "vol",
-                            "增减": "vol_chg",
-                            "会员简称.1": "long_party_name",
-                            "持买单量": "long_open_interest",
-                            "增减.1": "long_open_interest_chg",
-                            "会员简称.2": "short_party_name",
-                            "持卖单量": "short_open_interest",
-                            "增减.2": "short_open_interest_chg",
-                        },
-                        inplace=True,
-                    )
-                    temp_df["symbol"] = symbol.upper()
-                    temp_df["var"] = var
-                    temp_df["date"] = date_string
-                    temp_df = temp_df.map(
-                        lambda x: str(x).replace("-", "0") if x == "-" else x
-                    )
-                    temp_df["rank"] = range(1, len(temp_df) + 1)
-                    temp_df["vol"] = temp_df["vol"].astype(float)
-                    temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
-                    temp_df["long_open_interest"] = temp_df[
-                        "long_open_interest"
-                    ].astype(float)
-                    temp_df["long_open_interest_chg"] = temp_df[
-                        "long_open_interest_chg"
-                    ].astype(float)
-                    temp_df["short_open_interest"] = temp_df[
-                        "short_open_interest"
-                    ].astype(float)
-                    temp_df["short_open_interest_chg"] = temp_df[
-                        "short_open_interest_chg"
-                    ].astype(float)
-                    big_dict[symbol] = temp_df
+
+    def _fetch_table(var: str, symbol: str):
+        url = cons.DCE_VOL_RANK_URL_1 % (
+            var.lower(),
+            symbol,
+            var.lower(),
+            date.year,
+            date.month - 1,
+            date.day,
+        )
+        try:
+            temp_df = pd.read_excel(url[:-3] + "excel", header=0, skiprows=3)
+            temp_df.dropna(how="any", axis=0, inplace=True)
+            temp_df = temp_df.drop(columns=["名次.1", "名次.2"])
+        except:  # noqa: E722
+            temp_url = "http://portal.dce.com.cn/publicweb/quotesdata/memberDealPosiQuotes.html"
+            payload = {
+                "memberDealPosiQuotes.variety": var.lower(),
+                "memberDealPosiQuotes.trade_type": "0",
+                "year": date.year,
+                "month": date.month - 1,
+                "day": str(date.day).zfill(2),
+                "contract.contract_id": symbol,
+                "contract.variety_id": var.lower(),
+                "contract": "",
+            }
+            r = requests.post(temp_url, data=payload)
+            if r.status_code != 200:
+                return {}
+            temp_df = read_html_table(
+                r.text, headers=DCE_RANK_HEADERS, na_values=("",)
+            ).iloc[:-1, :]
+            temp_df = temp_df.drop(columns=["名次.1", "名次.2"])
+        temp_df = temp_df.rename(
+            columns={
+                "名次": "rank",
+                "会员简称": "vol_party_name",
+                "成交量": "vol",
+                "增减": "vol_chg",
+                "会员简称.1": "long_party_name",
+                "持买单量": "long_open_interest",
+                "增减.1": "long_open_interest_chg",
+                "会员简称.2": "short_party_name",
+                "持卖单量": "short_open_interest",
+                "增减.2": "short_open_interest_chg",
+            }
+        )
+        temp_df["symbol"] = symbol.upper()
+        temp_df["var"] = var
+        temp_df["date"] = date_string
+        temp_df["rank"] = range(1, len(temp_df) + 1)
+        for col in intColumns:
+            temp_df[col] = _rank_number(temp_df[col]).astype(float)
+        return temp_df
+
+    with ThreadPoolExecutor(max_workers=RANK_TABLE_WORKERS) as executor:
+        contract_lists = executor.map(
+            lambda var: _get_dce_contract_list(date, var), vars_list
+        )
+        jobs = [
+            (var, symbol)
+            for var, symbol_list in zip(vars_list, contract_lists)
+            for symbol in symbol_list
+        ]
+        tables = executor.map(lambda job: _fetch_table(*job), jobs)
+        big_dict = {symbol: table for (_, symbol), table in zip(jobs, tables)}
     return big_dict
 
 
@@ -750,10 +728,8 @@ def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/81.0.4044.138 Safari/537.36",
     }
-    big_dict = {}
-    for var in vars_list:
-        # print(var)
-        # var = "IF"
+
+    def _fetch_table(var: str):
         url = cons.CFFEX_VOL_RANK_URL % (
             date.strftime("%Y%m"),
             date.strftime("%d"),
@@ -762,32 +738,37 @@ def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols
         # url = 'http://www.cffex.com.cn/sj/ccpm/201908/05/IF_1.csv'
         # url = 'http://www.cffex.com.cn/sj/ccpm/202308/08/IF_1.csv'
         r = requests.get(url, headers=headers)
+        if r.status_code != 200:
+            return None
+        try:
+            # 当所需要的合约没有数据时
+            temp_df = pd.read_table(BytesIO(r.content), encoding="gbk", header=None)
+        except:  # noqa: E722
+            return None
         # 20200316 开始数据结构变化，统一格式
-        if r.status_code == 200:
-            try:
-                # 当所需要的合约没有数据时
-                temp_df = pd.read_table(BytesIO(r.content), encoding="gbk", header=None)
-            except:  # noqa: E722
-                continue
-            need_index = temp_df.iloc[:, 0].str.contains("交易日")
-            if sum(need_index) > 2:
-                table = temp_df.iloc[temp_df[need_index].index[1] :, 0].str.split(
-                    ",", expand=True
-                )
-                table.columns = table.iloc[0, :]
-                table = table.iloc[2:, :].copy()
-                table.reset_index(inplace=True, drop=True)
-            else:
-                table = pd.read_csv(BytesIO(r.content), encoding="gbk")
+        need_index = temp_df.iloc[:, 0].str.contains("交易日")
+        if sum(need_index) > 2:
+            table = temp_df.iloc[temp_df[need_index].index[1] :, 0].str.split(
+                ",", expand=True
+            )
+            table.columns = table.iloc[0, :]
+            table = table.iloc[2:, :].copy()
+            table.reset_index(inplace=True, drop=True)
         else:
-            return
-        table = table.dropna(how="any")
-        table = table.map(lambda x: x.strip() if isinstance(x, str) else x)
+            table = pd.read_csv(BytesIO(r.content), encoding="gbk")
+        return table
+
+    with ThreadPoolExecutor(max_workers=RANK_TABLE_WORKERS) as executor:
+        tables = list(executor.map(_fetch_table, vars_list))
+    big_dict = {}
+    for table in tables:
+        if table is None:
+            continue
+        table = _strip_text_columns(table.dropna(how="any").copy())
         del table["交易日"]
-        for symbol in set(table["合约"]):
-            table_cut = table[table["合约"] == symbol]
-            table_cut.columns = ["symbol", "rank"] + rank_columns
-            table_cut = _table_cut_cal(pd.DataFrame(table_cut), symbol)
+        table.columns = ["symbol", "rank"] + rank_columns
+        for symbol, table_cut in table.groupby("symbol", sort=False):
+            table_cut = _table_cut_cal(table_cut.copy(), symbol)
             big_dict[symbol] = table_cut.reset_index(drop=True)
     return big_dict
 
@@ -929,22 +910,9 @@ def futures_dce_position_rank(
                         "variety",
                     ]
                 ]
-                temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
-                temp_df["long_open_interest"] = pd.to_numeric(
-                    temp_df["long_open_interest"], errors="coerce"
-                )
-                temp_df["long_open_interest_chg"] = pd.to_numeric(
-                    temp_df["long_open_interest_chg"], errors="coerce"
-                )
+                for col in intColumns:
+                    temp_df[col] = _rank_number(temp_df[col])
                 temp_df["rank"] = pd.to_numeric(temp_df["rank"], errors="coerce")
-                temp_df["short_open_interest"] = pd.to_numeric(
-                    temp_df["short_open_interest"], errors="coerce"
-                )
-                temp_df["short_open_interest_chg"] = pd.to_numeric(
-                    temp_df["short_open_interest_chg"], errors="coerce"
-                )
-                temp_df["vol"] = pd.to_numeric(temp_df["vol"], errors="coerce")
-                temp_df["vol_chg"] = pd.to_numeric(temp_df["vol_chg"], errors="coerce")
                 big_dict[file_name.split("_")[1]] = temp_df
             except UnicodeDecodeError:
                 try:
@@ -1023,22 +991,9 @@ def futures_dce_position_rank(
                         "variety",
                     ]
                 ]
-                temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
-                temp_df["long_open_interest"] = pd.to_numeric(
-                    temp_df["long_open_interest"], errors="coerce"
-                )
-                temp_df["long_open_interest_chg"] = pd.to_numeric(
-                    temp_df["long_open_interest_chg"], errors="coerce"
-                )
+                for col in intColumns:
+                    temp_df[col] = _rank_number(temp_df[col])
                 temp_df["rank"] = pd.to_numeric(temp_df["rank"], errors="coerce")
-                temp_df["short_open_interest"] = pd.to_numeric(
-                    temp_df["short_open_interest"], errors="coerce"
-                )
-                temp_df["short_open_interest_chg"] = pd.to_numeric(
-                    temp_df["short_open_interest_chg"], errors="coerce"
-                )
-                temp_df["vol"] = pd.to_numeric(temp_df["vol"], errors="coerce")
-                temp_df["vol_chg"] = pd.to_numeric(temp_df["vol_chg"], errors="coerce")
                 big_dict[file_name.split("_")[1]] = temp_df
     dict_keys = list(big_dict.keys())
     for item in dict_keys:
@@ -1112,7 +1067,9 @@ def futures_dce_position_rank_other(date: str = "20160104"):
                         "contract": "",
                     }
                     r = requests.post(url, data=payload)
-                    temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
+                    temp_df = read_html_table(
+                        r.text, headers=DCE_RANK_HEADERS, na_values=("",)
+                    ).iloc[:-1, :]
                     temp_df.columns = [
                         "rank",
                         "vol_party_name",
@@ -1310,21 +1267,33 @@ def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
     else:
         vars_list = [item.lower() for item in vars_list]
     big_dict = {}
-    for item in vars_list:
+    with ThreadPoolExecutor(max_workers=RANK_TABLE_WORKERS) as executor:
         try:
-            futures_contract_list = __futures_gfex_contract_list(
-                symbol=item.lower(), date=date
+            contract_lists = list(
+                executor.map(
+                    lambda item: __futures_gfex_contract_list(
+                        symbol=item.lower(), date=date
+                    ),
+                    vars_list,
+                )
             )
         except:  # noqa: E722
             return big_dict
-        for name in futures_contract_list:
+        jobs = {
+            name: executor.submit(
+                __futures_gfex_contract_data,
+                symbol=item.lower(),
+                contract_id=name,
+                date=date,
+            )
+            for item, contract_list in zip(vars_list, contract_lists)
+            for name in contract_list
+        }
+        for name, future in jobs.items():
             try:
-                temp_df = __futures_gfex_contract_data(
-                    symbol=item.lower(), contract_id=name, date=date
-                )
-                big_dict[name] = temp_df
-            except:  # noqa: E722
-                return big_dict
+                big_dict[name] = future.result()
+            except Exception as e:
+                warnings.warn(f"{name} 持仓排名获取失败, 已跳过: {e}")
     return big_dict
 
 
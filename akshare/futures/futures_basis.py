@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/12/12 17:00
+Date: 2026/10/15 18:00
 Desc: 生意社网站采集大宗商品现货价格及相应基差数据, 数据时间段从 20110104-至今
 备注：现期差 = 现货价格 - 期货价格(这里的期货价格为结算价)
 黄金为 元/克, 白银为 元/千克, 玻璃现货为 元/平方米, 鸡蛋现货为 元/公斤, 鸡蛋期货为 元/500千克, 其余为 元/吨.
@@ -25,7 +25,7 @@ from akshare.futures import cons
 from akshare.futures.requests_fun import pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
 
 
 def futures_spot_price_daily(
@@ -63,13 +63,12 @@ def futures_spot_price_daily(
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
     df_list = []
-    while start_day <= end_day:
+    for start_day in calendar.trading_days_between(start_day, end_day).tolist():
         temp_df = futures_spot_price(start_day, vars_list)
         if temp_df is False:
             return pd.concat(df_list).reset_index(drop=True)
         elif temp_df is not None:
             df_list.append(temp_df)
-        start_day += datetime.timedelta(days=1)
     if len(df_list) > 0:
         temp_df = pd.concat(df_list)
         temp_df.reset_index(drop=True, inplace=True)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/7/6 18:00
+Date: 2026/10/15 18:00
 Desc: openctp 期货交易费用参照表
 http://openctp.cn/fees.html
 """
@@ -10,9 +10,10 @@ from datetime import datetime
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.context import get_session
+
 
 def futures_fees_info() -> pd.DataFrame:
     """
@@ -22,7 +23,7 @@ def futures_fees_info() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "http://openctp.cn/fees.html"
-    r = requests.get(url)
+    r = get_session(url).get(url)
     r.encoding = "utf-8"
     soup = BeautifulSoup(r.text, features="lxml")
     datetime_str = soup.find("p").string.strip("Generated at ").strip(".")
@@ -1,15 +1,18 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/11/30 18:00
+Date: 2026/10/15 18:00
 Desc: 期货日线行情
 """
 
 import datetime
 import json
 import re
+import warnings
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO, StringIO
+from typing import Dict, List, Union
 
 import numpy as np
 import pandas as pd
@@ -18,7 +21,17 @@ import requests
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
+
+# 各交易所的默认并发请求数, 郑商所历史数据需要下载整年的压缩包, 因此只使用单线程
+FUTURES_DAILY_MARKET_WORKERS = {
+    "CFFEX": 2,
+    "CZCE": 1,
+    "SHFE": 2,
+    "DCE": 2,
+    "INE": 2,
+    "GFEX": 2,
+}
 
 
 def _futures_daily_czce(
@@ -634,6 +647,24 @@ def get_dce_daily(date: str = "20251027") -> pd.DataFrame:
     return temp_df
 
 
+def _futures_daily_func(market: str):
+    """
+    交易所对应的日交易数据接口
+    :param market: 交易所代码
+    :type market: str
+    :return: 日交易数据接口, 交易所代码错误时返回 None
+    :rtype: function
+    """
+    return {
+        "CFFEX": get_cffex_daily,
+        "CZCE": get_czce_daily,
+        "SHFE": get_shfe_daily,
+        "DCE": get_dce_daily,
+        "INE": get_ine_daily,
+        "GFEX": get_gfex_daily,
+    }.get(market.upper())
+
+
 def get_futures_daily(
     start_date: str = "20220208",
     end_date: str = "20220208",
@@ -647,25 +678,48 @@ def get_futures_daily(
     :type end_date: str
     :param market: 'CFFEX' 中金所, 'CZCE' 郑商所,  'SHFE' 上期所, 'DCE' 大商所 之一, 'INE' 上海国际能源交易中心, "GFEX" 广州期货交易所。默认为中金所
     :type market: str
-    :return: 交易所日交易数据
+    :return: 交易所日交易数据; 任意一个交易日请求失败时抛出该异常
     :rtype: pandas.DataFrame
     """
-    if market.upper() == "CFFEX":
-        f = get_cffex_daily
-    elif market.upper() == "CZCE":
-        f = get_czce_daily
-    elif market.upper() == "SHFE":
-        f = get_shfe_daily
-    elif market.upper() == "DCE":
-        f = get_dce_daily
-    elif market.upper() == "INE":
-        f = get_ine_daily
-    elif market.upper() == "GFEX":
-        f = get_gfex_daily
-    else:
+    if _futures_daily_func(market) is None:
         print("Invalid Market Symbol")
         return pd.DataFrame()
+    return get_futures_daily_batch(
+        start_date=start_date, end_date=end_date, markets=[market], errors="raise"
+    )
 
+
+def get_futures_daily_batch(
+    start_date: str = "20220208",
+    end_date: str = "20220208",
+    markets: List[str] = ("CFFEX", "CZCE", "SHFE", "DCE", "INE", "GFEX"),
+    max_workers: Union[int, Dict[str, int]] = None,
+    errors: str = "warn",
+) -> pd.DataFrame:
+    """
+    交易所日交易数据-多交易所批量获取
+    只请求交易日历中的交易日, 各交易所的 (交易所, 日期) 任务在各自的线程池中并发执行
+    :param start_date: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
+    :type start_date: str
+    :param end_date: 结束数据 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
+    :type end_date: str
+    :param markets: 交易所列表, choice of {"CFFEX", "INE", "CZCE", "DCE", "SHFE", "GFEX"}
+    :type markets: list
+    :param max_workers: 每个交易所的并发请求数, 可以传入 {交易所: 并发数} 的字典; 默认使用 FUTURES_DAILY_MARKET_WORKERS
+    :type max_workers: int or dict
+    :param errors: choice of {"warn", "raise"}; warn 时请求失败的 (交易所, 日期) 会给出警告并跳过, 返回的数据中缺少这些交易日; raise 时取消其余请求并抛出该异常
+    :type errors: str
+    :return: 交易所日交易数据, 按日期和交易所排序
+    :rtype: pandas.DataFrame
+    """
+    if errors not in ("warn", "raise"):
+        raise ValueError('errors 参数仅支持 "warn" 和 "raise"')
+    markets = [market.upper() for market in markets]
+    for market in markets:
+        if _futures_daily_func(market) is None:
+            raise ValueError(
+                f"market 参数仅支持 {list(FUTURES_DAILY_MARKET_WORKERS.keys())}"
+            )
     start_date = (
         cons.convert_date(start_date)
         if start_date is not None
@@ -676,25 +730,65 @@ def get_futures_daily(
         if end_date is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-
-    df_list = list()
-    while start_date <= end_date:
-        df = f(date=str(start_date).replace("-", ""))
-        if not df.empty:
-            df_list.append(df)
-        start_date += datetime.timedelta(days=1)
-
-    if len(df_list) == 0:
+    trade_dates = [
+        item.strftime("%Y%m%d")
+        for item in calendar.trading_days_between(start_date, end_date).tolist()
+    ]
+    if not trade_dates:
         return pd.DataFrame()
-    elif len(df_list) > 0:
-        temp_df = pd.concat(df_list).reset_index(drop=True)
-        temp_df = temp_df[~temp_df["symbol"].str.contains("efp")]
-        return temp_df
-    else:
+
+    executors = {}
+    for market in markets:
+        if isinstance(max_workers, dict):
+            workers = max_workers.get(market, FUTURES_DAILY_MARKET_WORKERS[market])
+        elif max_workers is not None:
+            workers = max_workers
+        else:
+            workers = FUTURES_DAILY_MARKET_WORKERS[market]
+        executors[market] = ThreadPoolExecutor(max_workers=max(int(workers), 1))
+
+    result_dict = {}
+    future_to_job = {}
+    try:
+        for date_index, date in enumerate(trade_dates):
+            for market_index, market in enumerate(markets):
+                future = executors[market].submit(_futures_daily_func(market), date)
+                future_to_job[future] = (date_index, market_index)
+        for future in as_completed(future_to_job):
+            date_index, market_index = future_to_job[future]
+            try:
+                temp_df = future.result()
+            except Exception as e:
+                if errors == "raise":
+                    raise
+                warnings.warn(
+                    f"{markets[market_index]} {trade_dates[date_index]} 获取失败: {e}"
+                )
+                continue
+            if isinstance(temp_df, pd.DataFrame) and not temp_df.empty:
+                result_dict[(date_index, market_index)] = temp_df
+    finally:
+        for future in future_to_job:
+            future.cancel()
+        for executor in executors.values():
+            executor.shutdown(wait=True)
+
+    if not result_dict:
         return pd.DataFrame()
+    temp_df = pd.concat(
+        [result_dict[key] for key in sorted(result_dict)], ignore_index=True
+    )
+    temp_df = temp_df[~temp_df["symbol"].str.contains("efp")]
+    temp_df.reset_index(inplace=True, drop=True)
+    return temp_df
 
 
 if __name__ == "__main__":
+    get_futures_daily_batch_df = get_futures_daily_batch(
+        start_date="20250701", end_date="20250708", markets=["DCE", "SHFE", "GFEX"]
+    )
+    print(get_futures_daily_batch_df)
+
     get_futures_daily_df = get_futures_daily(
         start_date="20250708", end_date="20250708", market="DCE"
     )
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/9 22:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-行情中心-期货市场-国际期货
 https://quote.eastmoney.com/center/gridlist.html#futures_global
 """
@@ -12,6 +12,7 @@ from typing import Optional
 import pandas as pd
 import requests
 
+from akshare.utils.kline import parse_klines
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -193,27 +194,28 @@ def futures_global_hist_em(symbol: str = "HG00Y") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df["code"] = data_json["data"]["code"]
-    temp_df["name"] = data_json["data"]["name"]
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "最新价",
-        "最高",
-        "最低",
-        "总量",
-        "-",
-        "-",
-        "涨幅",
-        "-",
-        "-",
-        "-",
-        "持仓",
-        "日增",
-        "代码",
-        "名称",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "最新价",
+            "最高",
+            "最低",
+            "总量",
+            None,
+            None,
+            "涨幅",
+            None,
+            None,
+            None,
+            "持仓",
+            "日增",
+        ],
+        text_columns=("日期", "持仓"),
+    )
+    temp_df["代码"] = data_json["data"]["code"]
+    temp_df["名称"] = data_json["data"]["name"]
     temp_df = temp_df[
         [
             "日期",
@@ -230,13 +232,6 @@ def futures_global_hist_em(symbol: str = "HG00Y") -> pd.DataFrame:
         ]
     ]
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["总量"] = pd.to_numeric(temp_df["总量"], errors="coerce")
-    temp_df["涨幅"] = pd.to_numeric(temp_df["涨幅"], errors="coerce")
-    temp_df["日增"] = pd.to_numeric(temp_df["日增"], errors="coerce")
     # 日增修复为有符号32位整数值
     unsigned_max, signed_max = (2**32) - 1, (2**31) - 1
     mask = temp_df["日增"] > signed_max
@@ -1,18 +1,22 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/2/20 17:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-期货行情
 https://qhweb.eastmoney.com/quote
 """
 
 import re
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Dict
 
 import pandas as pd
 import requests
 
+from akshare.utils.context import get_session
+from akshare.utils.kline import parse_klines
+from akshare.utils.symbol_map import cached_symbol_map
+
 
 def __futures_hist_separate_char_and_numbers_em(symbol: str = "焦煤2506") -> tuple:
     """
@@ -28,7 +32,7 @@ def __futures_hist_separate_char_and_numbers_em(symbol: str = "焦煤2506") -> t
     return char[0], numbers[0]
 
 
-@lru_cache()
+@cached_symbol_map("futures_exchange_symbol_em")
 def __fetch_exchange_symbol_raw_em() -> list:
     """
     东方财富网-期货行情-交易所品种对照表原始数据
@@ -37,23 +41,28 @@ def __fetch_exchange_symbol_raw_em() -> list:
     :rtype: pandas.DataFrame
     """
     url = "https://futsse-static.eastmoney.com/redis"
-    params = {"msgid": "gnweb"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    all_exchange_symbol_list = []
-    for item in data_json:
-        params = {"msgid": str(item["mktid"])}
-        r = requests.get(url, params=params)
-        inner_data_json = r.json()
-        for num in range(1, len(inner_data_json) + 1):
-            params = {"msgid": str(item["mktid"]) + f"_{num}"}
-            r = requests.get(url, params=params)
-            inner_data_json = r.json()
+
+    def _fetch(msgid: str) -> list:
+        r = get_session(url).get(url, params={"msgid": msgid})
+        return r.json()
+
+    data_json = _fetch("gnweb")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # 先获取每个交易所的分页数量, 再并发获取所有分页
+        page_list = list(
+            executor.map(lambda item: _fetch(str(item["mktid"])), data_json)
+        )
+        msgid_list = [
+            f"{item['mktid']}_{num}"
+            for item, pages in zip(data_json, page_list)
+            for num in range(1, len(pages) + 1)
+        ]
+        all_exchange_symbol_list = []
+        for inner_data_json in executor.map(_fetch, msgid_list):
             all_exchange_symbol_list.extend(inner_data_json)
     return all_exchange_symbol_list
 
 
-@lru_cache()
 def __get_exchange_symbol_map() -> Tuple[Dict, Dict, Dict, Dict]:
     """
     东方财富网-期货行情-交易所品种映射
@@ -135,25 +144,27 @@ def futures_hist_em(
     }
     r = requests.get(url, timeout=15, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "时间",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            None,
+            "涨跌幅",
+            "涨跌",
+            None,
+            None,
+            "持仓量",
+        ],
+        text_columns=("时间",),
+    )
     if temp_df.empty:
         return temp_df
-    temp_df.columns = [
-        "时间",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "-",
-        "涨跌幅",
-        "涨跌",
-        "_",
-        "_",
-        "持仓量",
-        "_",
-    ]
     temp_df = temp_df[
         [
             "时间",
@@ -171,15 +182,6 @@ def futures_hist_em(
     temp_df.index = pd.to_datetime(temp_df["时间"])
     temp_df = temp_df[start_date:end_date]
     temp_df.reset_index(drop=True, inplace=True)
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["涨跌"] = pd.to_numeric(temp_df["涨跌"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["持仓量"] = pd.to_numeric(temp_df["持仓量"], errors="coerce")
     temp_df["时间"] = pd.to_datetime(temp_df["时间"], errors="coerce").dt.date
     return temp_df
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/16 17:40
+Date: 2026/10/15 18:00
 Desc: 中国期货各合约展期收益率
 日线数据从 daily_bar 函数获取, 需要在收盘后运行
 """
@@ -14,10 +14,13 @@ import math
 import pandas as pd
 
 from akshare.futures import cons
-from akshare.futures.futures_daily_bar import get_futures_daily
+from akshare.futures.futures_daily_bar import (
+    get_futures_daily,
+    get_futures_daily_batch,
+)
 from akshare.futures.symbol_var import symbol_market, symbol_varieties
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
 
 
 def get_roll_yield(date=None, var="BB", symbol1=None, symbol2=None, df=None):
@@ -108,14 +111,11 @@ def get_roll_yield_bar(
         return df
 
     if type_method == "var":
-        df = pd.DataFrame()
-        for market in ["dce", "cffex", "shfe", "czce", "gfex"]:
-            df = pd.concat(
-                [
-                    df,
-                    get_futures_daily(start_date=date, end_date=date, market=market),
-                ]
-            )
+        df = get_futures_daily_batch(
+            start_date=date,
+            end_date=date,
+            markets=["DCE", "CFFEX", "SHFE", "CZCE", "GFEX"],
+        )
         var_list = list(set(df["variety"]))
         for i_remove in ["IO", "MO", "HO"]:
             if i_remove in var_list:
@@ -140,9 +140,24 @@ def get_roll_yield_bar(
 
     if type_method == "date":
         df_l = pd.DataFrame()
-        while start_day <= end_day:
+        # 一次性并发获取区间内的日线数据, 再按日计算展期收益率
+        market = symbol_market(var)
+        daily_df = (
+            get_futures_daily_batch(
+                start_date=start_day, end_date=end_day, markets=[market]
+            )
+            if market is not None
+            else pd.DataFrame()
+        )
+        for start_day in calendar.trading_days_between(start_day, end_day).tolist():
+            if daily_df.empty:
+                break
             try:
-                ry = get_roll_yield(start_day, var)
+                ry = get_roll_yield(
+                    start_day,
+                    var,
+                    df=daily_df[daily_df["date"] == start_day.strftime("%Y%m%d")],
+                )
                 if ry:
                     df_l = pd.concat(
                         [
@@ -156,7 +171,6 @@ def get_roll_yield_bar(
                     )
             except:  # noqa: E722
                 pass
-            start_day += datetime.timedelta(days=1)
         return df_l
 
 
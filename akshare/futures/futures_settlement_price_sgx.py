@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/1/18 16:25
+Date: 2026/10/15 18:00
 Desc: 新加坡交易所-衍生品-历史数据-历史结算价格
 https://www.sgx.com/zh-hans/research-education/derivatives
 https://links.sgx.com/1.0.0/derivatives-daily/5888/FUTURE.zip
@@ -39,24 +39,7 @@ def __fetch_ftse_index_futu(date: str = "20231108") -> int:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "date",
-        "-",
-        "open",
-        "close",
-        "high",
-        "low",
-        "volume",
-        "amount",
-        "_",
-        "-",
-        "open",
-        "close",
-        "high",
-        "low",
-    ]
-    num = temp_df["date"].index[-1] + 791
+    num = len(data_json["data"]["klines"]) - 1 + 791
     return num
 
 
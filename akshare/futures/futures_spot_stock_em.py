@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/3/21 12:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-数据中心-现货与股票
 https://data.eastmoney.com/ifdata/xhgp.html
 """
@@ -9,7 +9,7 @@ https://data.eastmoney.com/ifdata/xhgp.html
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 
 
 def futures_spot_stock(symbol: str = "能源") -> pd.DataFrame:
@@ -47,7 +47,7 @@ def futures_spot_stock(symbol: str = "能源") -> pd.DataFrame:
     }
     r = requests.get(url, headers=headers)
     data_text = r.text
-    temp_json = demjson.decode(
+    temp_json = js_literal.loads(
         data_text[
             data_text.find("pagedata") : data_text.find(
                 "/newstatic/js/common/emdataview.js"
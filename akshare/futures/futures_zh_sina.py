@@ -1,19 +1,20 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/3/20 16:00
+Date: 2026/10/15 18:00
 Desc: 新浪财经-国内期货-实时数据获取
 https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_3
 P.S. 注意采集速度, 容易封禁 IP, 如果不能访问请稍后再试
 """
 
 import json
+import random
 import time
 from functools import lru_cache
+from typing import Tuple
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.futures.cons import (
     zh_subscribe_exchange_symbol_url,
@@ -21,7 +22,8 @@ from akshare.futures.cons import (
     zh_match_main_contract_payload,
 )
 from akshare.futures.futures_contract_detail import futures_contract_detail
-from akshare.utils import demjson
+from akshare.utils import js_literal
+from akshare.utils.context import get_session
 
 
 @lru_cache()
@@ -35,11 +37,11 @@ def futures_symbol_mark() -> pd.DataFrame:
     url = (
         "https://vip.stock.finance.sina.com.cn/quotes_service/view/js/qihuohangqing.js"
     )
-    r = requests.get(url)
+    r = get_session(url).get(url)
     r.encoding = "gb2312"
     data_text = r.text
     raw_json = data_text[data_text.find("{") : data_text.find("}") + 1]
-    data_json = demjson.decode(raw_json)
+    data_json = js_literal.loads(raw_json)
     czce_mark_list = [item[1] for item in data_json["czce"][1:]]
     dce_mark_list = [item[1] for item in data_json["dce"][1:]]
     shfe_mark_list = [item[1] for item in data_json["shfe"][1:]]
@@ -148,7 +150,7 @@ def zh_subscribe_exchange_symbol(symbol: str = "cffex") -> pd.DataFrame:
     r = requests.get(zh_subscribe_exchange_symbol_url)
     r.encoding = "gbk"
     data_text = r.text
-    data_json = demjson.decode(
+    data_json = js_literal.loads(
         data_text[data_text.find("{") : data_text.find("};") + 1]
     )
     if symbol == "czce":
@@ -185,7 +187,7 @@ def match_main_contract(symbol: str = "cffex") -> str:
         res = requests.get(
             zh_match_main_contract_url, params=zh_match_main_contract_payload
         )
-        data_json = demjson.decode(res.text)
+        data_json = js_literal.loads(res.text)
         data_df = pd.DataFrame(data_json)
         try:
             main_contract = data_df[data_df.iloc[:, 3:].duplicated()]
@@ -219,9 +221,24 @@ def futures_zh_spot(
     :return: 期货的实时行情数据
     :rtype: pandas.DataFrame
     """
-    file_data = "Math.round(Math.random() * 2147483648).toString(16)"
-    ctx = py_mini_racer.MiniRacer()
-    rn_code = ctx.eval(file_data)
+    url, headers, subscribe_list = _futures_zh_spot_request(symbol=symbol)
+    r = requests.get(url, headers=headers)
+    contract_info = None
+    if adjust == "1":
+        contract_info = _futures_zh_spot_contract_info(subscribe_list)
+    return _futures_zh_spot_parse(r.text, market=market, contract_info=contract_info)
+
+
+def _futures_zh_spot_request(symbol: str) -> Tuple[str, dict, str]:
+    """
+    期货的实时行情数据-请求地址和请求头
+    :param symbol: 合约名称的字符串组合
+    :type symbol: str
+    :return: (请求地址, 请求头, 订阅列表)
+    :rtype: tuple
+    """
+    # 与 JS 的 Math.round(Math.random() * 2147483648).toString(16) 相同, 用于避免缓存
+    rn_code = format(round(random.random() * 2147483648), "x")
     subscribe_list = ",".join(["nf_" + item.strip() for item in symbol.split(",")])
     url = f"https://hq.sinajs.cn/rn={rn_code}&list={subscribe_list}"
     headers = {
@@ -236,26 +253,54 @@ def futures_zh_spot(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/97.0.4692.71 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    return url, headers, subscribe_list
+
+
+def _futures_zh_spot_contract_info(subscribe_list: str) -> Tuple[list, list, list]:
+    """
+    期货的实时行情数据-合约的交易所和最小变动价位
+    :param subscribe_list: 订阅列表, 例如 "nf_V2405,nf_V2409"
+    :type subscribe_list: str
+    :return: (合约列表, 交易所列表, 最小变动价位列表)
+    :rtype: tuple
+    """
+    contract_name_list = [item.split("_")[1] for item in subscribe_list.split(",")]
+    contract_min_list = []
+    contract_exchange_list = []
+    for contract_name in contract_name_list:
+        temp_df = futures_contract_detail(symbol=contract_name)
+        exchange_name = temp_df[temp_df["item"] == "上市交易所"]["value"].values[0]
+        contract_exchange_list.append(exchange_name)
+        contract_min = temp_df[temp_df["item"] == "最小变动价位"]["value"].values[0]
+        contract_min_list.append(contract_min)
+    return contract_name_list, contract_exchange_list, contract_min_list
+
+
+def _futures_zh_spot_parse(
+    text: str, market: str = "CF", contract_info: tuple = None
+) -> pd.DataFrame:
+    """
+    期货的实时行情数据-解析接口返回的内容, 同步和异步接口共用
+    :param text: 接口返回的内容
+    :type text: str
+    :param market: CF 为商品期货
+    :type market: str
+    :param contract_info: _futures_zh_spot_contract_info 的返回值, 为 None 时不返回合约、交易所和最小变动单位
+    :type contract_info: tuple
+    :return: 期货的实时行情数据
+    :rtype: pandas.DataFrame
+    """
     data_df = pd.DataFrame(
         [
             item.strip().split("=")[1].split(",")
-            for item in r.text.split(";")
+            for item in text.split(";")
             if item.strip() != ""
         ]
     )
     data_df.iloc[:, 0] = data_df.iloc[:, 0].str.replace('"', "")
     data_df.iloc[:, -1] = data_df.iloc[:, -1].str.replace('"', "")
-    if adjust == "1":
-        contract_name_list = [item.split("_")[1] for item in subscribe_list.split(",")]
-        contract_min_list = []
-        contract_exchange_list = []
-        for contract_name in contract_name_list:
-            temp_df = futures_contract_detail(symbol=contract_name)
-            exchange_name = temp_df[temp_df["item"] == "上市交易所"]["value"].values[0]
-            contract_exchange_list.append(exchange_name)
-            contract_min = temp_df[temp_df["item"] == "最小变动价位"]["value"].values[0]
-            contract_min_list.append(contract_min)
+    if contract_info is not None:
+        contract_name_list, contract_exchange_list, contract_min_list = contract_info
         if market == "CF":
             data_df.columns = [
                 "symbol",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/21 15:00
+Date: 2026/10/15 18:00
 Desc: 每日注册仓单数据
 大连商品交易所, 上海期货交易所, 郑州商品交易所, 广州期货交易所
 """
@@ -19,7 +19,7 @@ from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link, pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
 shfe_20100126 = pd.DataFrame(
     {
         "var": ["CU", "AL", "ZN", "RU", "FU", "AU", "RB", "WR"],
@@ -597,66 +597,62 @@ def get_receipt(
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
     records = pd.DataFrame()
-    while start_date <= end_date:
-        if start_date.strftime("%Y%m%d") not in calendar:
-            warnings.warn(f"{start_date.strftime('%Y%m%d')} 非交易日")
-        else:
-            print(start_date)
-            for market, market_vars in cons.market_exchange_symbols.items():
-                f = None
-                if market == "dce":
-                    if start_date >= datetime.date(2009, 4, 7):
-                        f = get_dce_receipt
-                    else:
-                        print("20090407 起，大连商品交易所每个交易日更新仓单数据")
-                        f = None
-                elif market == "shfe":
-                    if (
-                        datetime.date(2008, 10, 6)
-                        <= start_date
-                        <= datetime.date(2014, 5, 16)
-                    ):
-                        f = get_shfe_receipt_1
-                    elif (
-                        datetime.date(2014, 5, 16)
-                        <= start_date
-                        <= datetime.date(2025, 11, 17)
-                    ):
-                        f = get_shfe_receipt_2
-                    elif start_date > datetime.date(2025, 11, 17):
-                        f = get_shfe_receipt_3
-                    else:
-                        f = None
-                        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
-                elif market == "gfex":
-                    if start_date > datetime.date(2022, 12, 22):
-                        f = get_gfex_receipt
-                    else:
-                        f = None
-                        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
-                elif market == "czce":
-                    if (
-                        datetime.date(2008, 3, 3)
-                        <= start_date
-                        <= datetime.date(2010, 8, 24)
-                    ):
-                        f = get_czce_receipt_1
-                    elif (
-                        datetime.date(2010, 8, 24)
-                        < start_date
-                        <= datetime.date(2015, 11, 11)
-                    ):
-                        f = get_czce_receipt_2
-                    elif start_date > datetime.date(2015, 11, 11):
-                        f = get_czce_receipt_3
-                    else:
-                        f = None
-                        print("20080303 起，郑州商品交易所每个交易日更新仓单数据")
-                get_vars = [var for var in vars_list if var in market_vars]
-                if market != "cffex" and get_vars != []:
-                    if f is not None:
-                        records = pd.concat([records, f(start_date, get_vars)])
-        start_date += datetime.timedelta(days=1)
+    for start_date in calendar.trading_days_between(start_date, end_date).tolist():
+        print(start_date)
+        for market, market_vars in cons.market_exchange_symbols.items():
+            f = None
+            if market == "dce":
+                if start_date >= datetime.date(2009, 4, 7):
+                    f = get_dce_receipt
+                else:
+                    print("20090407 起，大连商品交易所每个交易日更新仓单数据")
+                    f = None
+            elif market == "shfe":
+                if (
+                    datetime.date(2008, 10, 6)
+                    <= start_date
+                    <= datetime.date(2014, 5, 16)
+                ):
+                    f = get_shfe_receipt_1
+                elif (
+                    datetime.date(2014, 5, 16)
+                    <= start_date
+                    <= datetime.date(2025, 11, 17)
+                ):
+                    f = get_shfe_receipt_2
+                elif start_date > datetime.date(2025, 11, 17):
+                    f = get_shfe_receipt_3
+                else:
+                    f = None
+                    print("20081006 起，上海期货交易所每个交易日更新仓单数据")
+            elif market == "gfex":
+                if start_date > datetime.date(2022, 12, 22):
+                    f = get_gfex_receipt
+                else:
+                    f = None
+                    print("20081006 起，上海期货交易所每个交易日更新仓单数据")
+            elif market == "czce":
+                if (
+                    datetime.date(2008, 3, 3)
+                    <= start_date
+                    <= datetime.date(2010, 8, 24)
+                ):
+                    f = get_czce_receipt_1
+                elif (
+                    datetime.date(2010, 8, 24)
+                    < start_date
+                    <= datetime.date(2015, 11, 11)
+                ):
+                    f = get_czce_receipt_2
+                elif start_date > datetime.date(2015, 11, 11):
+                    f = get_czce_receipt_3
+                else:
+                    f = None
+                    print("20080303 起，郑州商品交易所每个交易日更新仓单数据")
+            get_vars = [var for var in vars_list if var in market_vars]
+            if market != "cffex" and get_vars != []:
+                if f is not None:
+                    records = pd.concat([records, f(start_date, get_vars)])
     records.reset_index(drop=True, inplace=True)
     if records.empty:
         return records
@@ -1,16 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/5 18:00
+Date: 2026/10/15 18:00
 Desc: 新浪财经-期货-成交持仓
 https://vip.stock.finance.sina.com.cn/q/view/vFutures_Positions_cjcc.php
 """
 
-from io import StringIO
-
 import pandas as pd
 import requests
 
+from akshare.utils.html_table import read_html_table
+
 
 def futures_hold_pos_sina(
     symbol: str = "成交量", contract: str = "OI2501", date: str = "20240223"
@@ -32,7 +32,9 @@ def futures_hold_pos_sina(
     params = {"t_breed": contract, "t_date": date}
     r = requests.get(url, params=params)
     if symbol == "成交量":
-        temp_df = pd.read_html(StringIO(r.text))[2].iloc[:-1, :]
+        temp_df = read_html_table(
+            r.text, headers=["名次", "成交量", "比上交易增减"]
+        ).iloc[:-1, :]
         temp_df["名次"] = pd.to_numeric(temp_df["名次"], errors="coerce")
         temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
         temp_df["比上交易增减"] = pd.to_numeric(
@@ -40,7 +42,9 @@ def futures_hold_pos_sina(
         )
         return temp_df
     elif symbol == "多单持仓":
-        temp_df = pd.read_html(StringIO(r.text))[3].iloc[:-1, :]
+        temp_df = read_html_table(
+            r.text, headers=["名次", "多单持仓", "比上交易增减"]
+        ).iloc[:-1, :]
         temp_df["名次"] = pd.to_numeric(temp_df["名次"], errors="coerce")
         temp_df["多单持仓"] = pd.to_numeric(temp_df["多单持仓"], errors="coerce")
         temp_df["比上交易增减"] = pd.to_numeric(
@@ -48,7 +52,9 @@ def futures_hold_pos_sina(
         )
         return temp_df
     elif symbol == "空单持仓":
-        temp_df = pd.read_html(StringIO(r.text))[4].iloc[:-1, :]
+        temp_df = read_html_table(
+            r.text, headers=["名次", "空单持仓", "比上交易增减"]
+        ).iloc[:-1, :]
         temp_df["名次"] = pd.to_numeric(temp_df["名次"], errors="coerce")
         temp_df["空单持仓"] = pd.to_numeric(temp_df["空单持仓"], errors="coerce")
         temp_df["比上交易增减"] = pd.to_numeric(
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/6/17 14:00
+Date: 2026/10/15 18:00
 Desc: 股票指数成份股数据, 新浪有两个接口, 这里使用老接口:
 新接口：https://vip.stock.finance.sina.com.cn/mkt/#zhishu_000001
 老接口：https://vip.stock.finance.sina.com.cn/corp/view/vII_NewestComponent.php?page=1&indexid=399639
@@ -14,7 +14,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 
 
 def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
@@ -49,7 +49,8 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
             }
             r = requests.get(url, params=params)
             temp_df = pd.concat(
-                objs=[temp_df, pd.DataFrame(demjson.decode(r.text))], ignore_index=True
+                objs=[temp_df, pd.DataFrame(js_literal.loads(r.text))],
+                ignore_index=True,
             )
         return temp_df
 
@@ -63,7 +64,7 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
         "_s_r_a": "setlen",
     }
     r = requests.get(url, params=params)
-    temp = pd.DataFrame(demjson.decode(r.text))
+    temp = pd.DataFrame(js_literal.loads(r.text))
     return temp
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/9/26 18:00
+Date: 2026/10/15 18:00
 Desc: Drewry 集装箱指数
 https://www.drewry.co.uk/supply-chain-advisors/supply-chain-expertise/world-container-index-assessed-by-drewry
 https://infogram.com/world-container-index-1h17493095xl4zj
@@ -11,7 +11,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 
 
 def drewry_wci_index(symbol: str = "composite") -> pd.DataFrame:
@@ -38,7 +38,7 @@ def drewry_wci_index(symbol: str = "composite") -> pd.DataFrame:
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
     data_text = soup.find_all("script")[-4].string.strip("window.infographicData=")[:-1]
-    data_json = demjson.decode(data_text)
+    data_json = js_literal.loads(data_text)
     data_json_need = data_json["elements"]["content"]["content"]["entities"][
         "7a55585f-3fb3-44e6-9b54-beea1cd20b4d"
     ]["data"][symbol_map[symbol]]
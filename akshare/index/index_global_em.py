@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/7 17:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-行情中心-全球指数
 https://quote.eastmoney.com/center/gridlist.html#global_qtzs
 """
@@ -10,6 +10,7 @@ import pandas as pd
 import requests
 
 from akshare.index.cons import index_global_em_symbol_map
+from akshare.utils.kline import parse_klines
 
 
 def index_global_spot_em() -> pd.DataFrame:
@@ -117,27 +118,21 @@ def index_global_hist_em(symbol: str = "美元指数") -> pd.DataFrame:
     r = requests.get(url=url, params=params)
     data_json = r.json()
 
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df["code"] = data_json["data"]["code"]
-    temp_df["name"] = data_json["data"]["name"]
-    temp_df.columns = [
-        "日期",
-        "今开",
-        "最新价",
-        "最高",
-        "最低",
-        "-",
-        "-",
-        "振幅",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "代码",
-        "名称",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "今开",
+            "最新价",
+            "最高",
+            "最低",
+            None,
+            None,
+            "振幅",
+        ],
+    )
+    temp_df["代码"] = data_json["data"]["code"]
+    temp_df["名称"] = data_json["data"]["name"]
     temp_df = temp_df[
         [
             "日期",
@@ -151,11 +146,6 @@ def index_global_hist_em(symbol: str = "美元指数") -> pd.DataFrame:
         ]
     ]
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["今开"] = pd.to_numeric(temp_df["今开"], errors="coerce")
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
     return temp_df
 
 
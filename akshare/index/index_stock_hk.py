@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/15 22:30
+Date: 2026/10/15 18:00
 Desc: 港股股票指数数据-新浪-东财
 所有指数-实时行情数据和历史行情数据
 https://finance.sina.com.cn/realstock/company/sz399552/nc.shtml
@@ -12,12 +12,12 @@ import re
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from functools import lru_cache
 
-from akshare.stock.cons import hk_js_decode
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.kline import parse_klines
+from akshare.utils.sina_decode import sina_kline_decode
 
 
 def _replace_comma(x) -> str:
@@ -130,11 +130,9 @@ def stock_hk_index_daily_sina(symbol: str = "CES100") -> pd.DataFrame:
     url = f"https://finance.sina.com.cn/stock/hkstock/{symbol}/klc_kl.js"
     params = {"d": "2023_5_01"}
     res = requests.get(url, params=params)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
+    dict_list = sina_kline_decode(
+        res.text.split("=")[1].split(";")[0].replace('"', "")
+    )  # 解密数据
     temp_df = pd.DataFrame(dict_list)
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
     temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
@@ -263,28 +261,18 @@ def stock_hk_index_daily_em(symbol: str = "HSTECF2L") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "date",
-        "open",
-        "latest",
-        "high",
-        "low",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "date",
+            "open",
+            "latest",
+            "high",
+            "low",
+        ],
+        text_columns=("date",),
+    )
     temp_df = temp_df[["date", "open", "high", "low", "latest"]]
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["latest"] = pd.to_numeric(temp_df["latest"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
     return temp_df
 
 
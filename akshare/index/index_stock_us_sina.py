@@ -1,18 +1,18 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/3/17 18:20
+Date: 2026/10/15 18:00
 Desc: 新浪财经-美股指数行情
 https://stock.finance.sina.com.cn/usstock/quotes/.IXIC.html
 """
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.stock.cons import (
     zh_js_decode,
 )
+from akshare.utils.js_pool import get_js_context
 
 
 def index_us_stock_sina(symbol: str = ".INX") -> pd.DataFrame:
@@ -26,8 +26,7 @@ def index_us_stock_sina(symbol: str = ".INX") -> pd.DataFrame:
     """
     url = f"https://finance.sina.com.cn/staticdata/us/{symbol}"
     r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(zh_js_decode)
+    js_code = get_js_context(zh_js_decode)
     dict_list = js_code.call("d", r.text.split("=")[1].split(";")[0].replace('"', ""))
     temp_df = pd.DataFrame(dict_list)
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
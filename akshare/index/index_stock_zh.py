@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/10 18:30
+Date: 2026/10/15 18:00
 Desc: 股票指数数据-新浪-东财-腾讯
 所有指数-实时行情数据和历史行情数据
 https://finance.sina.com.cn/realstock/company/sz399552/nc.shtml
@@ -11,7 +11,6 @@ import datetime
 import re
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.index.cons import (
@@ -20,10 +19,11 @@ from akshare.index.cons import (
     zh_sina_index_stock_count_url,
     zh_sina_index_stock_hist_url,
 )
-from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
+from akshare.utils import js_literal
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.kline import parse_klines
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.sina_decode import sina_kline_decode
 
 
 def _replace_comma(x):
@@ -70,7 +70,7 @@ def stock_zh_index_spot_sina() -> pd.DataFrame:
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_stock_payload_copy.update({"page": page})
         res = requests.get(zh_sina_index_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(res.text)
+        data_json = js_literal.loads(res.text)
         big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
     big_df = big_df.map(_replace_comma)
     big_df["trade"] = pd.to_numeric(big_df["trade"], errors="coerce")
@@ -301,11 +301,9 @@ def stock_zh_index_daily(symbol: str = "sh000922") -> pd.DataFrame:
     """
     params = {"d": "2020_2_4"}
     res = requests.get(zh_sina_index_stock_hist_url.format(symbol), params=params)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
+    dict_list = sina_kline_decode(
+        res.text.split("=")[1].split(";")[0].replace('"', "")
+    )  # 解密数据
     temp_df = pd.DataFrame(dict_list)
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
     temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
@@ -334,7 +332,7 @@ def get_tx_start_year(symbol: str = "sh000919") -> str:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    if not demjson.decode(data_text[data_text.find("={") + 1 :])["data"]:
+    if not js_literal.loads(data_text[data_text.find("={") + 1 :])["data"]:
         url = "https://proxy.finance.qq.com/ifzqgtimg/appstock/app/newfqkline/get"
         params = {
             "_var": "kline_dayqfq",
@@ -343,11 +341,11 @@ def get_tx_start_year(symbol: str = "sh000919") -> str:
         }
         r = requests.get(url, params=params)
         data_text = r.text
-        start_date = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][
+        start_date = js_literal.loads(data_text[data_text.find("={") + 1 :])["data"][
             symbol
         ]["day"][0][0]
         return start_date
-    start_date = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][0][0]
+    start_date = js_literal.loads(data_text[data_text.find("={") + 1 :])["data"][0][0]
     return start_date
 
 
@@ -378,11 +376,11 @@ def stock_zh_index_daily_tx(symbol: str = "sz980017") -> pd.DataFrame:
         text = res.text
         try:
             inner_temp_df = pd.DataFrame(
-                demjson.decode(text[text.find("={") + 1 :])["data"][symbol]["day"]
+                js_literal.loads(text[text.find("={") + 1 :])["data"][symbol]["day"]
             )
         except:  # noqa: E722
             inner_temp_df = pd.DataFrame(
-                demjson.decode(text[text.find("={") + 1 :])["data"][symbol]["qfqday"]
+                js_literal.loads(text[text.find("={") + 1 :])["data"][symbol]["qfqday"]
             )
         temp_df = pd.concat(objs=[temp_df, inner_temp_df], ignore_index=True)
     if temp_df.shape[1] == 6:
@@ -440,17 +438,13 @@ def stock_zh_index_daily_em(
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=["date", "open", "close", "high", "low", "volume", "amount"],
+        text_columns=("date",),
+    )
     if temp_df.empty:
         return pd.DataFrame()
-    temp_df.columns = ["date", "open", "close", "high", "low", "volume", "amount", "_"]
-    temp_df = temp_df[["date", "open", "close", "high", "low", "volume", "amount"]]
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["volume"] = pd.to_numeric(temp_df["volume"], errors="coerce")
-    temp_df["amount"] = pd.to_numeric(temp_df["amount"], errors="coerce")
     return temp_df
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2021/11/16 20:40
+Date: 2026/10/15 18:00
 Desc: 艺恩-艺人
 艺人商业价值
 艺人流量价值
@@ -14,7 +14,8 @@ import os
 
 import pandas as pd  # type: ignore
 import requests
-import py_mini_racer  # type: ignore
+
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_js_path(name: str = "", module_file: str = "") -> str:
@@ -56,8 +57,7 @@ def decrypt(origin_data: str = "") -> str:
     :rtype: str
     """
     file_data = _get_file_content(file_name="jm.js")
-    ctx = py_mini_racer.MiniRacer()
-    ctx.eval(file_data)
+    ctx = get_js_context(file_data)
     data = ctx.call("webInstace.shell", origin_data)
     return data
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/2/20 14:00
+Date: 2026/10/15 18:00
 Desc: 电影票房数据
 https://ys.endata.cn/BoxOffice/Movie
 """
@@ -12,7 +12,8 @@ import os
 
 import pandas as pd
 import requests
-import py_mini_racer
+
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_js_path(name: str = "", module_file: str = "") -> str:
@@ -69,8 +70,7 @@ def decrypt(origin_data: str = "") -> str:
     :rtype: str
     """
     file_data = _get_file_content(file_name="jm.js")
-    ctx = py_mini_racer.MiniRacer()
-    ctx.eval(file_data)
+    ctx = get_js_context(file_data)
     data = ctx.call("webInstace.shell", origin_data)
     return data
 
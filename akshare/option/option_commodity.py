@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/10/17 21:00
+Date: 2026/10/15 18:00
 Desc: 商品期权数据
 说明：
 (1) 价格：自2019年12月02日起，纤维板报价单位由元/张改为元/立方米
@@ -22,11 +22,11 @@ import pandas as pd
 import requests
 
 from akshare.option.cons import (
-    get_calendar,
     convert_date,
     CZCE_DAILY_OPTION_URL_3,
     SHFE_HEADERS,
 )
+from akshare.utils.trade_calendar import get_trading_calendar
 
 
 def option_hist_dce(
@@ -63,7 +63,7 @@ def option_hist_dce(
         "生猪期权": "lh",
         "原木期权": "lg",
     }
-    calendar = get_calendar()
+    calendar = get_trading_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
@@ -199,7 +199,7 @@ def option_hist_czce(
     :return: 日频行情数据
     :rtype: pandas.DataFrame
     """
-    calendar = get_calendar()
+    calendar = get_trading_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("{}非交易日".format(day.strftime("%Y%m%d")))
@@ -376,7 +376,7 @@ def option_hist_shfe(
     :return: 日频行情数据
     :rtype: pandas.DataFrame
     """
-    calendar = get_calendar()
+    calendar = get_trading_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
@@ -456,7 +456,7 @@ def option_vol_shfe(
     :return: 日频行情数据
     :rtype: pandas.DataFrame
     """
-    calendar = get_calendar()
+    calendar = get_trading_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
@@ -514,7 +514,7 @@ def option_hist_gfex(
     :return: 日频行情数据
     :rtype: pandas.DataFrame
     """
-    calendar = get_calendar()
+    calendar = get_trading_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
@@ -606,7 +606,7 @@ def option_vol_gfex(symbol: str = "碳酸锂", trade_date: str = "20230724"):
         "碳酸锂": "lc",
         "多晶硅": "ps",
     }
-    calendar = get_calendar()
+    calendar = get_trading_calendar()
     day = convert_date(trade_date) if trade_date is not None else datetime.date.today()
     if day.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % day.strftime("%Y%m%d"))
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 """
-Date: 2024/6/21 18:00
+Date: 2026/10/15 18:00
 Desc: 新浪财经-股票期权
 https://stock.finance.sina.com.cn/option/quotes.html
 期权-中金所-沪深 300 指数
@@ -13,15 +13,86 @@ https://stock.finance.sina.com.cn/option/quotes.html
 
 import datetime
 import json
+import time
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Dict, List, Tuple
+from typing import Deque, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
 from akshare.option.option_em import option_current_em
+from akshare.utils.context import config, get_session
 from akshare.utils.func import set_df_columns
+from akshare.utils.kline import parse_klines
+
+
+# 新浪财经-上交所期权实时行情 CON_OP_ 的字段
+SSE_SPOT_FIELDS = [
+    "买量",
+    "买价",
+    "最新价",
+    "卖价",
+    "卖量",
+    "持仓量",
+    "涨幅",
+    "行权价",
+    "昨收价",
+    "开盘价",
+    "涨停价",
+    "跌停价",
+    "申卖价五",
+    "申卖量五",
+    "申卖价四",
+    "申卖量四",
+    "申卖价三",
+    "申卖量三",
+    "申卖价二",
+    "申卖量二",
+    "申卖价一",
+    "申卖量一",
+    "申买价一",
+    "申买量一 ",
+    "申买价二",
+    "申买量二",
+    "申买价三",
+    "申买量三",
+    "申买价四",
+    "申买量四",
+    "申买价五",
+    "申买量五",
+    "行情时间",
+    "主力合约标识",
+    "状态码",
+    "标的证券类型",
+    "标的股票",
+    "期权合约简称",
+    "振幅",
+    "最高价",
+    "最低价",
+    "成交量",
+    "成交额",
+]
+
+# 新浪财经-上交所期权希腊字母 CON_SO_ 的字段, 依次对应第 0 个和第 4 个之后的字段
+SSE_GREEKS_FIELDS = [
+    "期权合约简称",
+    "成交量",
+    "Delta",
+    "Gamma",
+    "Theta",
+    "Vega",
+    "隐含波动率",
+    "最高价",
+    "最低价",
+    "交易代码",
+    "行权价",
+    "最新价",
+    "理论价值",
+]
 
 
 # 期权-中金所-上证50指数
@@ -569,52 +640,9 @@ def option_sse_spot_price_sina(symbol: str = "10003720") -> pd.DataFrame:
     r = requests.get(url, headers=headers)
     data_text = r.text
     data_list = data_text[data_text.find('"') + 1 : data_text.rfind('"')].split(",")
-    field_list = [
-        "买量",
-        "买价",
-        "最新价",
-        "卖价",
-        "卖量",
-        "持仓量",
-        "涨幅",
-        "行权价",
-        "昨收价",
-        "开盘价",
-        "涨停价",
-        "跌停价",
-        "申卖价五",
-        "申卖量五",
-        "申卖价四",
-        "申卖量四",
-        "申卖价三",
-        "申卖量三",
-        "申卖价二",
-        "申卖量二",
-        "申卖价一",
-        "申卖量一",
-        "申买价一",
-        "申买量一 ",
-        "申买价二",
-        "申买量二",
-        "申买价三",
-        "申买量三",
-        "申买价四",
-        "申买量四",
-        "申买价五",
-        "申买量五",
-        "行情时间",
-        "主力合约标识",
-        "状态码",
-        "标的证券类型",
-        "标的股票",
-        "期权合约简称",
-        "振幅",
-        "最高价",
-        "最低价",
-        "成交量",
-        "成交额",
-    ]
-    data_df = pd.DataFrame(list(zip(field_list, data_list)), columns=["字段", "值"])
+    data_df = pd.DataFrame(
+        list(zip(SSE_SPOT_FIELDS, data_list)), columns=["字段", "值"]
+    )
     return data_df
 
 
@@ -707,28 +735,239 @@ def option_sse_greeks_sina(symbol: str = "10003045") -> pd.DataFrame:
     r = requests.get(url, headers=headers)
     data_text = r.text
     data_list = data_text[data_text.find('"') + 1 : data_text.rfind('"')].split(",")
-    field_list = [
-        "期权合约简称",
-        "成交量",
-        "Delta",
-        "Gamma",
-        "Theta",
-        "Vega",
-        "隐含波动率",
-        "最高价",
-        "最低价",
-        "交易代码",
-        "行权价",
-        "最新价",
-        "理论价值",
-    ]
     data_df = pd.DataFrame(
-        list(zip(field_list, [data_list[0]] + data_list[4:])),
+        list(zip(SSE_GREEKS_FIELDS, [data_list[0]] + data_list[4:])),
         columns=["字段", "值"],
     )
     return data_df
 
 
+# 新浪财经-上交所期权标的代码和 option_sse_list_sina 使用的品种名称
+SSE_OPTION_UNDERLYINGS = {"510050": "50ETF", "510300": "300ETF", "510500": "500ETF"}
+
+# hq.sinajs.cn 一次请求多个代码时的 URL 最大长度
+SINA_HQ_URL_MAX_LENGTH = 2000
+
+# 期权链中保持为字符串的字段
+_SSE_CHAIN_TEXT_FIELDS = {
+    "期权代码",
+    "到期月份",
+    "类型",
+    "主力合约标识",
+    "状态码",
+    "标的证券类型",
+    "标的股票",
+    "期权合约简称",
+    "交易代码",
+}
+
+_SINA_HQ_HEADERS = {
+    "Accept": "*/*",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Cache-Control": "no-cache",
+    "Host": "hq.sinajs.cn",
+    "Pragma": "no-cache",
+    "Referer": "https://vip.stock.finance.sina.com.cn/",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/97.0.4692.71 Safari/537.36",
+}
+
+
+def _sina_hq_batches(
+    symbols: List[str], max_length: int = SINA_HQ_URL_MAX_LENGTH
+) -> List[List[str]]:
+    """
+    按 URL 长度把代码分组, 每组用一次 hq.sinajs.cn 请求获取
+    """
+    batches = []
+    batch = []
+    length = len("https://hq.sinajs.cn/list=")
+    for symbol in symbols:
+        if batch and length + len(symbol) + 1 > max_length:
+            batches.append(batch)
+            batch = []
+            length = len("https://hq.sinajs.cn/list=")
+        batch.append(symbol)
+        length += len(symbol) + 1
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _sina_hq_text(symbols: List[str], timeout: float = 15) -> str:
+    url = "https://hq.sinajs.cn/list=" + ",".join(symbols)
+    r = get_session(url).get(
+        url, headers=_SINA_HQ_HEADERS, timeout=timeout, proxies=config.proxies
+    )
+    r.raise_for_status()
+    return r.text
+
+
+def _option_sse_chain_parse(text: str) -> pd.DataFrame:
+    """
+    解析 CON_OP_ 和 CON_SO_ 的批量行情, 每个合约一行
+    :param text: 接口返回的内容
+    :type text: str
+    :return: 以期权代码为索引的行情和希腊字母
+    :rtype: pandas.DataFrame
+    """
+    lines = pd.Series(text.split(";"), dtype=object)
+    temp_df = lines.str.extract(r'hq_str_CON_(OP|SO)_(\w+)="([^"]*)"').dropna()
+    # 不存在的合约返回空字符串
+    temp_df = temp_df[temp_df[2] != ""]
+    quote_text = temp_df[temp_df[0] == "OP"]
+    greeks_text = temp_df[temp_df[0] == "SO"]
+    quote_df = (
+        quote_text[2]
+        .str.split(",", expand=True)
+        .reindex(columns=range(len(SSE_SPOT_FIELDS)))
+    )
+    quote_df.columns = [item.strip() for item in SSE_SPOT_FIELDS]
+    quote_df.index = quote_text[1].tolist()
+    greeks_df = (
+        greeks_text[2]
+        .str.split(",", expand=True)
+        .reindex(columns=[0] + list(range(4, len(SSE_GREEKS_FIELDS) + 3)))
+    )
+    greeks_df.columns = SSE_GREEKS_FIELDS
+    greeks_df.index = greeks_text[1].tolist()
+    # 与行情重复的字段以行情为准
+    greeks_df = greeks_df[
+        [item for item in SSE_GREEKS_FIELDS if item not in quote_df.columns]
+    ]
+    return quote_df.join(greeks_df, how="outer")
+
+
+def _option_sse_chain_codes(
+    underlying: str, expiry: Union[str, List[str], None]
+) -> pd.DataFrame:
+    """
+    上交所期权链的全部合约代码
+    :return: 期权代码, 到期月份, 类型
+    :rtype: pandas.DataFrame
+    """
+    if expiry is None:
+        if underlying not in SSE_OPTION_UNDERLYINGS:
+            raise ValueError(
+                f"{underlying} 需要指定 expiry, 可选标的: {list(SSE_OPTION_UNDERLYINGS)}"
+            )
+        expiry = option_sse_list_sina(symbol=SSE_OPTION_UNDERLYINGS[underlying])
+    elif isinstance(expiry, str):
+        expiry = [expiry]
+    frames = [pd.DataFrame(columns=["期权代码", "到期月份", "类型"])]
+    for trade_date in expiry:
+        for option_type in ("看涨期权", "看跌期权"):
+            temp_df = option_sse_codes_sina(
+                symbol=option_type, trade_date=trade_date, underlying=underlying
+            )
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "期权代码": temp_df["期权代码"],
+                        "到期月份": str(trade_date),
+                        "类型": option_type,
+                    }
+                )
+            )
+    return pd.concat(frames, ignore_index=True)
+
+
+def _option_sse_chain_fetch(
+    codes_df: pd.DataFrame, max_workers: int = 4, timeout: float = 15
+) -> pd.DataFrame:
+    symbols = []
+    for code in codes_df["期权代码"]:
+        symbols += [f"CON_OP_{code}", f"CON_SO_{code}"]
+    batches = _sina_hq_batches(symbols)
+    # 各批次同时请求, 使整个期权链的行情时间尽量接近
+    workers = max(min(max_workers, len(batches)), 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        texts = list(executor.map(lambda batch: _sina_hq_text(batch, timeout), batches))
+    hq_df = _option_sse_chain_parse("".join(texts))
+    temp_df = codes_df.join(hq_df, on="期权代码")
+    for column in temp_df.columns:
+        if column == "行情时间":
+            temp_df[column] = pd.to_datetime(temp_df[column], errors="coerce")
+        elif column not in _SSE_CHAIN_TEXT_FIELDS:
+            temp_df[column] = pd.to_numeric(temp_df[column], errors="coerce")
+    return temp_df
+
+
+def option_sse_chain_snapshot_sina(
+    underlying: str = "510050",
+    expiry: Union[str, List[str], None] = None,
+    max_workers: int = 4,
+    timeout: float = 15,
+) -> pd.DataFrame:
+    """
+    新浪财经-上交所期权链快照, 整个期权链的行情和希腊字母按 URL 长度分批请求
+    https://stock.finance.sina.com.cn/option/quotes.html
+    :param underlying: 标的产品代码, choice of {"510050", "510300", "510500"}
+    :type underlying: str
+    :param expiry: 到期月份, 例如 "202412" 或 ["202412", "202501"]; 为 None 时返回全部到期月份
+    :type expiry: str or list
+    :param max_workers: 同时请求的批次数
+    :type max_workers: int
+    :param timeout: 单个请求的超时时间
+    :type timeout: float
+    :return: 期权链快照, 每个合约一行
+    :rtype: pandas.DataFrame
+    """
+    codes_df = _option_sse_chain_codes(underlying=underlying, expiry=expiry)
+    return _option_sse_chain_fetch(codes_df, max_workers=max_workers, timeout=timeout)
+
+
+def option_sse_chain_snapshot_sina_poll(
+    underlying: str = "510050",
+    expiry: Union[str, List[str], None] = None,
+    interval: float = 3,
+    count: int = 10,
+    maxlen: int = 100,
+    buffer: Optional[Deque] = None,
+    max_workers: int = 4,
+    timeout: float = 15,
+) -> Deque[Tuple[pd.Timestamp, pd.DataFrame]]:
+    """
+    新浪财经-上交所期权链快照, 按固定间隔获取并保存到环形缓冲区, 合约代码只查询一次
+    https://stock.finance.sina.com.cn/option/quotes.html
+    :param underlying: 标的产品代码, choice of {"510050", "510300", "510500"}
+    :type underlying: str
+    :param expiry: 到期月份, 例如 "202412" 或 ["202412", "202501"]; 为 None 时返回全部到期月份
+    :type expiry: str or list
+    :param interval: 两次快照的开始时间间隔（秒）
+    :type interval: float
+    :param count: 快照次数
+    :type count: int
+    :param maxlen: 环形缓冲区保存的快照数量, 超出后丢弃最早的快照
+    :type maxlen: int
+    :param buffer: 已有的缓冲区, 可以在其他线程中读取; 为 None 时新建
+    :type buffer: collections.deque
+    :param max_workers: 同时请求的批次数
+    :type max_workers: int
+    :param timeout: 单个请求的超时时间
+    :type timeout: float
+    :return: (获取时间, 期权链快照) 的环形缓冲区
+    :rtype: collections.deque
+    """
+    if buffer is None:
+        buffer = deque(maxlen=maxlen)
+    codes_df = _option_sse_chain_codes(underlying=underlying, expiry=expiry)
+    start = time.monotonic()
+    for i in range(count):
+        if i > 0:
+            time.sleep(max(start + i * interval - time.monotonic(), 0))
+        try:
+            temp_df = _option_sse_chain_fetch(
+                codes_df, max_workers=max_workers, timeout=timeout
+            )
+        except Exception as e:
+            warnings.warn(f"第 {i + 1} 次期权链快照获取失败: {e}")
+            continue
+        buffer.append((pd.Timestamp.now(), temp_df))
+    return buffer
+
+
 def option_sse_minute_sina(symbol: str = "10003720") -> pd.DataFrame:
     """
     指定期权品种在当前交易日的分钟数据, 只能获取当前交易日的数据, 不能获取历史分钟数据
@@ -894,14 +1133,11 @@ def option_minute_em(symbol: str = "MO2404-P-4450") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_text = r.text
     data_json = json.loads(data_text[data_text.find("(") + 1 : data_text.rfind(")")])
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["trends"]])
-    temp_df.columns = ["time", "close", "high", "low", "volume", "amount", "-"]
-    temp_df = temp_df[["time", "close", "high", "low", "volume", "amount"]]
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["volume"] = pd.to_numeric(temp_df["volume"], errors="coerce")
-    temp_df["amount"] = pd.to_numeric(temp_df["amount"], errors="coerce")
+    temp_df = parse_klines(
+        data_json["data"]["trends"],
+        columns=["time", "close", "high", "low", "volume", "amount"],
+        text_columns=("time",),
+    )
     return temp_df
 
 
@@ -963,6 +1199,11 @@ if __name__ == "__main__":
     option_sse_greeks_sina_df = option_sse_greeks_sina(symbol="10004023")
     print(option_sse_greeks_sina_df)
 
+    option_sse_chain_snapshot_sina_df = option_sse_chain_snapshot_sina(
+        underlying="510050"
+    )
+    print(option_sse_chain_snapshot_sina_df)
+
     option_sse_minute_sina_df = option_sse_minute_sina(symbol="10004023")
     print(option_sse_minute_sina_df)
 
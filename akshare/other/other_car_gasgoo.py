@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/4/3 19:00
+Date: 2026/10/15 18:00
 Desc: 汽车行业制造企业数据库
 http://i.gasgoo.com/data/ranking
 """
@@ -9,7 +9,7 @@ http://i.gasgoo.com/data/ranking
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 
 
 def car_sale_rank_gasgoo(symbol: str = "车企榜", date: str = "202109") -> pd.DataFrame:
@@ -68,7 +68,7 @@ def car_sale_rank_gasgoo(symbol: str = "车企榜", date: str = "202109") -> pd.
     }
     r = requests.post(url, json=payload, headers=headers)
     data_json = r.json()
-    data_json = demjson.decode(data_json["d"])
+    data_json = js_literal.loads(data_json["d"])
     temp_df = pd.DataFrame(data_json)
     return temp_df
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/8/26 15:00
+Date: 2026/10/15 18:00
 Desc: REITs 行情及信息
 https://quote.eastmoney.com/center/gridlist.html#fund_reits_all
 https://www.jisilu.cn/data/cnreits/#CnReits
@@ -13,6 +13,8 @@ from typing import Dict
 import pandas as pd
 import requests
 
+from akshare.utils.kline import parse_klines
+
 
 @lru_cache()
 def __reits_code_market_map() -> Dict:
@@ -138,34 +140,25 @@ def reits_hist_em(symbol: str = "508097") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "今开",
-        "最新价",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "-",
-        "-",
-        "换手",
-        "-",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "今开",
+            "最新价",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            None,
+            None,
+            "换手",
+        ],
+    )
     temp_df = temp_df[
         ["日期", "今开", "最高", "最低", "最新价", "成交量", "成交额", "振幅", "换手"]
     ]
-    temp_df["今开"] = pd.to_numeric(temp_df["今开"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["换手"] = pd.to_numeric(temp_df["换手"], errors="coerce")
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
     return temp_df
 
@@ -192,22 +185,19 @@ def reits_hist_min_em(symbol: str = "508097") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["trends"]])
-    temp_df.columns = [
-        "时间",
-        "最新价",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "昨收",
-    ]
-
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
+    temp_df = parse_klines(
+        data_json["data"]["trends"],
+        columns=[
+            "时间",
+            "最新价",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "昨收",
+        ],
+        text_columns=("时间", "昨收"),
+    )
     return temp_df
 
 
@@ -1,10 +1,9 @@
 import time
 
-import requests
 from requests.exceptions import RequestException
 
 from akshare.exceptions import NetworkError, APIError, RateLimitError, DataParsingError
-from akshare.utils.context import config
+from akshare.utils.context import config, get_session
 
 
 def make_request_with_retry_json(
@@ -25,7 +24,7 @@ def make_request_with_retry_json(
         proxies = config.proxies
     for attempt in range(max_retries):
         try:
-            response = requests.get(
+            response = get_session(url).get(
                 url, params=params, headers=headers, proxies=proxies
             )
             if response.status_code == 200:
@@ -80,7 +79,7 @@ def make_request_with_retry_text(
         proxies = config.proxies
     for attempt in range(max_retries):
         try:
-            response = requests.get(
+            response = get_session(url).get(
                 url, params=params, headers=headers, proxies=proxies
             )
             if response.status_code == 200:
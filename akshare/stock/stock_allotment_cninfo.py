@@ -1,16 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/10/22 15:00
+Date: 2026/10/15 18:00
 Desc: 巨潮资讯-数据浏览器-筹资指标-公司配股实施方案
 https://webapi.cninfo.com.cn/#/dataBrowse
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
@@ -52,9 +52,8 @@ def stock_allotment_cninfo(
         if not end_date
         else f"{end_date[0:4]}-{end_date[4:6]}-{end_date[6:8]}",
     }
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -1,27 +1,28 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/12 17:00
+Date: 2026/10/15 18:00
 Desc: 东方财富-沪深板块-概念板块
 https://quote.eastmoney.com/center/boardlist.html#concept_board
 """
 
 import re
-from functools import lru_cache
 
 import pandas as pd
 import requests
 
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.kline import parse_klines
+from akshare.utils.symbol_map import cached_symbol_map
 
 
-@lru_cache()
-def __stock_board_concept_name_em() -> pd.DataFrame:
+@cached_symbol_map("stock_board_concept_em")
+def _stock_board_concept_code_map_em() -> dict:
     """
-    东方财富网-行情中心-沪深京板块-概念板块-名称
+    东方财富网-行情中心-沪深京板块-概念板块-名称和代码映射
     https://quote.eastmoney.com/center/boardlist.html#concept_board
-    :return: 概念板块-名称
-    :rtype: pandas.DataFrame
+    :return: 概念板块名称和板块代码映射
+    :rtype: dict
     """
     url = "https://79.push2.eastmoney.com/api/qt/clist/get"
     params = {
@@ -34,65 +35,30 @@ def __stock_board_concept_name_em() -> pd.DataFrame:
         "invt": "2",
         "fid": "f12",
         "fs": "m:90 t:3 f:!50",
-        "fields": "f2,f3,f4,f8,f12,f14,f15,f16,f17,f18,f20,f21,f24,f25,f22,f33,f11,f62,f128,f124,f107,f104,f105,f136",
+        "fields": "f3,f12,f14",
     }
     temp_df = fetch_paginated_data(url, params)
-    temp_df.columns = [
-        "排名",
-        "最新价",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-        "_",
-        "板块代码",
-        "板块名称",
-        "_",
-        "_",
-        "_",
-        "_",
-        "总市值",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-        "上涨家数",
-        "下跌家数",
-        "_",
-        "_",
-        "领涨股票",
-        "_",
-        "_",
-        "领涨股票-涨跌幅",
-    ]
-    temp_df = temp_df[
-        [
-            "排名",
-            "板块名称",
-            "板块代码",
-            "最新价",
-            "涨跌额",
-            "涨跌幅",
-            "总市值",
-            "换手率",
-            "上涨家数",
-            "下跌家数",
-            "领涨股票",
-            "领涨股票-涨跌幅",
-        ]
-    ]
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["总市值"] = pd.to_numeric(temp_df["总市值"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
-    temp_df["上涨家数"] = pd.to_numeric(temp_df["上涨家数"], errors="coerce")
-    temp_df["下跌家数"] = pd.to_numeric(temp_df["下跌家数"], errors="coerce")
-    temp_df["领涨股票-涨跌幅"] = pd.to_numeric(
-        temp_df["领涨股票-涨跌幅"], errors="coerce"
-    )
-    return temp_df
+    temp_dict = dict(zip(temp_df["f14"], temp_df["f12"]))
+    return temp_dict
+
+
+def _stock_board_concept_code_em(symbol: str) -> str:
+    """
+    概念板块名称转换为板块代码, 板块代码原样返回
+    :param symbol: 板块名称或者板块代码
+    :type symbol: str
+    :return: 板块代码, 例如 "BK0715"
+    :rtype: str
+    """
+    if re.match(pattern=r"^BK\d+", string=symbol):
+        return symbol
+    code_map = _stock_board_concept_code_map_em()
+    if symbol not in code_map:
+        # 新上线的板块不在本地缓存中, 重新下载一次映射表
+        code_map = _stock_board_concept_code_map_em.refresh()
+    if symbol not in code_map:
+        raise ValueError(f"{symbol} 不是有效的概念板块名称")
+    return code_map[symbol]
 
 
 def stock_board_concept_name_em() -> pd.DataFrame:
@@ -197,11 +163,7 @@ def stock_board_concept_spot_em(symbol: str = "可燃冰") -> pd.DataFrame:
         "f169": "涨跌额",
     }
 
-    if re.match(pattern=r"^BK\d+", string=symbol):
-        em_code = symbol
-    else:
-        industry_listing = __stock_board_concept_name_em()
-        em_code = industry_listing.query("板块名称 == @symbol")["板块代码"].values[0]
+    em_code = _stock_board_concept_code_em(symbol)
     params = dict(
         fields=",".join(field_map.keys()),
         mpi="1000",
@@ -234,7 +196,7 @@ def stock_board_concept_hist_em(
     """
     东方财富网-沪深板块-概念板块-历史行情
     https://quote.eastmoney.com/bk/90.BK0715.html
-    :param symbol: 板块名称
+    :param symbol: 板块名称或者板块代码
     :type symbol: str
     :type period: 周期; choice of {"daily", "weekly", "monthly"}
     :param period: 板块名称
@@ -252,10 +214,7 @@ def stock_board_concept_hist_em(
         "weekly": "102",
         "monthly": "103",
     }
-    stock_board_concept_em_map = __stock_board_concept_name_em()
-    stock_board_code = stock_board_concept_em_map[
-        stock_board_concept_em_map["板块名称"] == symbol
-    ]["板块代码"].values[0]
+    stock_board_code = _stock_board_concept_code_em(symbol)
     adjust_map = {"": "0", "qfq": "1", "hfq": "2"}
     url = "https://91.push2his.eastmoney.com/api/qt/stock/kline/get"
     params = {
@@ -271,20 +230,22 @@ def stock_board_concept_hist_em(
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            "涨跌幅",
+            "涨跌额",
+            "换手率",
+        ],
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -300,16 +261,6 @@ def stock_board_concept_hist_em(
             "换手率",
         ]
     ]
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
     return temp_df
 
 
@@ -319,17 +270,14 @@ def stock_board_concept_hist_min_em(
     """
     东方财富网-沪深板块-概念板块-分时历史行情
     https://quote.eastmoney.com/bk/90.BK0715.html
-    :param symbol: 板块名称
+    :param symbol: 板块名称或者板块代码
     :type symbol: str
     :param period: choice of {"1", "5", "15", "30", "60"}
     :type period: str
     :return: 分时历史行情
     :rtype: pandas.DataFrame
     """
-    stock_board_concept_em_map = __stock_board_concept_name_em()
-    stock_board_code = stock_board_concept_em_map[
-        stock_board_concept_em_map["板块名称"] == symbol
-    ]["板块代码"].values[0]
+    stock_board_code = _stock_board_concept_code_em(symbol)
     if period == "1":
         url = "https://push2his.eastmoney.com/api/qt/stock/trends2/get"
         params = {
@@ -341,26 +289,20 @@ def stock_board_concept_hist_min_em(
         }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+        temp_df = parse_klines(
+            data_json["data"]["trends"],
+            columns=[
+                "日期时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "最新价",
+            ],
+            text_columns=("日期时间",),
         )
-        temp_df.columns = [
-            "日期时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "最新价",
-        ]
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
         return temp_df
     else:
         url = "https://91.push2his.eastmoney.com/api/qt/stock/kline/get"
@@ -375,22 +317,23 @@ def stock_board_concept_hist_min_em(
         }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        temp_df = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "日期时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            text_columns=("日期时间",),
         )
-        temp_df.columns = [
-            "日期时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
         temp_df = temp_df[
             [
                 "日期时间",
@@ -406,16 +349,6 @@ def stock_board_concept_hist_min_em(
                 "换手率",
             ]
         ]
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-        temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-        temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
         return temp_df
 
 
@@ -428,13 +361,7 @@ def stock_board_concept_cons_em(symbol: str = "融资融券") -> pd.DataFrame:
     :return: 板块成份
     :rtype: pandas.DataFrame
     """
-    if re.match(pattern=r"^BK\d+", string=symbol):
-        stock_board_code = symbol
-    else:
-        stock_board_concept_em_map = __stock_board_concept_name_em()
-        stock_board_code = stock_board_concept_em_map[
-            stock_board_concept_em_map["板块名称"] == symbol
-        ]["板块代码"].values[0]
+    stock_board_code = _stock_board_concept_code_em(symbol)
     url = "https://29.push2.eastmoney.com/api/qt/clist/get"
     params = {
         "pn": "1",
@@ -1,27 +1,28 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/10 19:30
+Date: 2026/10/15 18:00
 Desc: 东方财富-沪深板块-行业板块
 https://quote.eastmoney.com/center/boardlist.html#industry_board
 """
 
 import re
-from functools import lru_cache
 
 import pandas as pd
 import requests
 
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.kline import parse_klines
+from akshare.utils.symbol_map import cached_symbol_map
 
 
-@lru_cache()
-def __stock_board_industry_name_em() -> pd.DataFrame:
+@cached_symbol_map("stock_board_industry_em")
+def _stock_board_industry_code_map_em() -> dict:
     """
-    东方财富网-沪深板块-行业板块-名称
+    东方财富网-沪深板块-行业板块-名称和代码映射
     https://quote.eastmoney.com/center/boardlist.html#industry_board
-    :return: 行业板块-名称
-    :rtype: pandas.DataFrame
+    :return: 行业板块名称和板块代码映射
+    :rtype: dict
     """
     url = "https://17.push2.eastmoney.com/api/qt/clist/get"
     params = {
@@ -34,82 +35,30 @@ def __stock_board_industry_name_em() -> pd.DataFrame:
         "invt": "2",
         "fid": "f3",
         "fs": "m:90 t:2 f:!50",
-        "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,"
-        "f23,f24,f25,f26,f22,f33,f11,f62,f128,f136,f115,f152,f124,f107,f104,f105,"
-        "f140,f141,f207,f208,f209,f222",
+        "fields": "f3,f12,f14",
     }
     temp_df = fetch_paginated_data(url, params)
-    temp_df.columns = [
-        "排名",
-        "-",
-        "最新价",
-        "涨跌幅",
-        "涨跌额",
-        "-",
-        "_",
-        "-",
-        "换手率",
-        "-",
-        "-",
-        "-",
-        "板块代码",
-        "-",
-        "板块名称",
-        "-",
-        "-",
-        "-",
-        "-",
-        "总市值",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-        "上涨家数",
-        "下跌家数",
-        "-",
-        "-",
-        "-",
-        "领涨股票",
-        "-",
-        "-",
-        "领涨股票-涨跌幅",
-        "-",
-        "-",
-        "-",
-        "-",
-        "-",
-    ]
-    temp_df = temp_df[
-        [
-            "排名",
-            "板块名称",
-            "板块代码",
-            "最新价",
-            "涨跌额",
-            "涨跌幅",
-            "总市值",
-            "换手率",
-            "上涨家数",
-            "下跌家数",
-            "领涨股票",
-            "领涨股票-涨跌幅",
-        ]
-    ]
-    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["总市值"] = pd.to_numeric(temp_df["总市值"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
-    temp_df["上涨家数"] = pd.to_numeric(temp_df["上涨家数"], errors="coerce")
-    temp_df["下跌家数"] = pd.to_numeric(temp_df["下跌家数"], errors="coerce")
-    temp_df["领涨股票-涨跌幅"] = pd.to_numeric(
-        temp_df["领涨股票-涨跌幅"], errors="coerce"
-    )
-    return temp_df
+    temp_dict = dict(zip(temp_df["f14"], temp_df["f12"]))
+    return temp_dict
+
+
+def _stock_board_industry_code_em(symbol: str) -> str:
+    """
+    行业板块名称转换为板块代码, 板块代码原样返回
+    :param symbol: 板块名称或者板块代码
+    :type symbol: str
+    :return: 板块代码, 例如 "BK1027"
+    :rtype: str
+    """
+    if re.match(pattern=r"^BK\d+", string=symbol):
+        return symbol
+    code_map = _stock_board_industry_code_map_em()
+    if symbol not in code_map:
+        # 新上线的板块不在本地缓存中, 重新下载一次映射表
+        code_map = _stock_board_industry_code_map_em.refresh()
+    if symbol not in code_map:
+        raise ValueError(f"{symbol} 不是有效的行业板块名称")
+    return code_map[symbol]
 
 
 def stock_board_industry_name_em() -> pd.DataFrame:
@@ -231,11 +180,7 @@ def stock_board_industry_spot_em(symbol: str = "小金属") -> pd.DataFrame:
         "f169": "涨跌额",
     }
 
-    if re.match(pattern=r"^BK\d+", string=symbol):
-        em_code = symbol
-    else:
-        industry_listing = __stock_board_industry_name_em()
-        em_code = industry_listing.query("板块名称 == @symbol")["板块代码"].values[0]
+    em_code = _stock_board_industry_code_em(symbol)
     params = dict(
         fields=",".join(field_map.keys()),
         mpi="1000",
@@ -268,7 +213,7 @@ def stock_board_industry_hist_em(
     """
     东方财富网-沪深板块-行业板块-历史行情
     https://quote.eastmoney.com/bk/90.BK1027.html
-    :param symbol: 板块名称
+    :param symbol: 板块名称或者板块代码
     :type symbol: str
     :param start_date: 开始时间
     :type start_date: str
@@ -281,11 +226,7 @@ def stock_board_industry_hist_em(
     :return: 历史行情
     :rtype: pandas.DataFrame
     """
-    if re.match(pattern=r"^BK\d+", string=symbol):
-        em_code = symbol
-    else:
-        industry_listing = __stock_board_industry_name_em()
-        em_code = industry_listing.query("板块名称 == @symbol")["板块代码"].values[0]
+    em_code = _stock_board_industry_code_em(symbol)
     period_map = {
         "日k": "101",
         "周k": "102",
@@ -306,20 +247,22 @@ def stock_board_industry_hist_em(
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "开盘",
-        "收盘",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "振幅",
-        "涨跌幅",
-        "涨跌额",
-        "换手率",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "开盘",
+            "收盘",
+            "最高",
+            "最低",
+            "成交量",
+            "成交额",
+            "振幅",
+            "涨跌幅",
+            "涨跌额",
+            "换手率",
+        ],
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -335,16 +278,6 @@ def stock_board_industry_hist_em(
             "换手率",
         ]
     ]
-    temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-    temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-    temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-    temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-    temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-    temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-    temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-    temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-    temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
     return temp_df
 
 
@@ -354,18 +287,14 @@ def stock_board_industry_hist_min_em(
     """
     东方财富网-沪深板块-行业板块-分时历史行情
     https://quote.eastmoney.com/bk/90.BK1027.html
-    :param symbol: 板块名称
+    :param symbol: 板块名称或者板块代码
     :type symbol: str
     :param period: choice of {"1", "5", "15", "30", "60"}
     :type period: str
     :return: 分时历史行情
     :rtype: pandas.DataFrame
     """
-    if re.match(pattern=r"^BK\d+", string=symbol):
-        em_code = symbol
-    else:
-        industry_listing = __stock_board_industry_name_em()
-        em_code = industry_listing.query("板块名称 == @symbol")["板块代码"].values[0]
+    em_code = _stock_board_industry_code_em(symbol)
     if period == "1":
         url = "https://push2his.eastmoney.com/api/qt/stock/trends2/get"
         params = {
@@ -377,27 +306,21 @@ def stock_board_industry_hist_min_em(
         }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+        temp_df = parse_klines(
+            data_json["data"]["trends"],
+            columns=[
+                "日期时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "最新价",
+            ],
+            text_columns=("日期时间",),
         )
-        temp_df.columns = [
-            "日期时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "最新价",
-        ]
 
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
         return temp_df
     else:
         url = "https://7.push2his.eastmoney.com/api/qt/stock/kline/get"
@@ -414,22 +337,23 @@ def stock_board_industry_hist_min_em(
         }
         r = requests.get(url, params=params)
         data_json = r.json()
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+        temp_df = parse_klines(
+            data_json["data"]["klines"],
+            columns=[
+                "日期时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
+            text_columns=("日期时间",),
         )
-        temp_df.columns = [
-            "日期时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
         temp_df = temp_df[
             [
                 "日期时间",
@@ -445,16 +369,6 @@ def stock_board_industry_hist_min_em(
                 "换手率",
             ]
         ]
-        temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
-        temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
-        temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
-        temp_df["最低"] = pd.to_numeric(temp_df["最低"], errors="coerce")
-        temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
-        temp_df["涨跌额"] = pd.to_numeric(temp_df["涨跌额"], errors="coerce")
-        temp_df["成交量"] = pd.to_numeric(temp_df["成交量"], errors="coerce")
-        temp_df["成交额"] = pd.to_numeric(temp_df["成交额"], errors="coerce")
-        temp_df["振幅"] = pd.to_numeric(temp_df["振幅"], errors="coerce")
-        temp_df["换手率"] = pd.to_numeric(temp_df["换手率"], errors="coerce")
         return temp_df
 
 
@@ -467,13 +381,7 @@ def stock_board_industry_cons_em(symbol: str = "小金属") -> pd.DataFrame:
     :return: 板块成份
     :rtype: pandas.DataFrame
     """
-    if re.match(pattern=r"^BK\d+", string=symbol):
-        stock_board_code = symbol
-    else:
-        stock_board_concept_em_map = __stock_board_industry_name_em()
-        stock_board_code = stock_board_concept_em_map[
-            stock_board_concept_em_map["板块名称"] == symbol
-        ]["板块代码"].values[0]
+    stock_board_code = _stock_board_industry_code_em(symbol)
     url = "https://29.push2.eastmoney.com/api/qt/clist/get"
     params = {
         "pn": "1",
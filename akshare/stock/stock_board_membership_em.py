@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 东方财富-沪深板块-股票所属行业板块和概念板块
+首次调用时并发获取全部板块的成份股, 整理为 股票代码 -> 板块代码 的倒排索引并保存到本地缓存目录, 之后只重新获取过期或新增的板块
+https://quote.eastmoney.com/center/boardlist.html#industry_board
+"""
+
+import json
+import math
+import os
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from akshare.stock.stock_board_concept_em import _stock_board_concept_code_map_em
+from akshare.stock.stock_board_industry_em import _stock_board_industry_code_map_em
+from akshare.utils.context import get_cache_dir
+from akshare.utils.rate_limit import TokenBucket
+from akshare.utils.request import request_with_retry
+from akshare.utils.tqdm import get_tqdm
+
+# 板块类型和对应的板块名称与代码映射表
+BOARD_CODE_MAPS = {
+    "行业": _stock_board_industry_code_map_em,
+    "概念": _stock_board_concept_code_map_em,
+}
+
+_membership_lock = threading.Lock()
+
+
+def _membership_path() -> str:
+    return os.path.join(
+        get_cache_dir(), "board_membership", "stock_board_membership_em.json"
+    )
+
+
+def _read_membership() -> Tuple[Dict, Dict]:
+    """
+    读取本地保存的板块信息和倒排索引
+    :return: ({板块代码: [板块类型, 板块名称, 获取时间]}, {股票代码: [板块代码, ...]})
+    :rtype: tuple
+    """
+    try:
+        with open(_membership_path(), "r", encoding="utf-8") as f:
+            data_json = json.load(f)
+        return data_json["boards"], data_json["index"]
+    except (OSError, ValueError, KeyError):
+        return {}, {}
+
+
+def _write_membership(boards: Dict, index: Dict):
+    fp = _membership_path()
+    tmp_fp = f"{fp}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(fp), exist_ok=True)
+        with open(tmp_fp, "w", encoding="utf-8") as f:
+            json.dump(
+                {"boards": boards, "index": index},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_fp, fp)
+    except OSError as e:
+        warnings.warn(f"板块成份股索引写入本地缓存失败: {e}")
+
+
+def _invert(mapping: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """
+    板块 -> 成份股 与 股票 -> 所属板块 互相转换
+    """
+    result = {}
+    for key, values in mapping.items():
+        for value in values:
+            result.setdefault(value, []).append(key)
+    return {key: sorted(values) for key, values in sorted(result.items())}
+
+
+def _stock_board_cons_codes_em(
+    board_code: str, bucket: TokenBucket, timeout: float = 15
+) -> List[str]:
+    """
+    东方财富网-沪深板块-板块成份股代码
+    https://quote.eastmoney.com/center/boardlist.html#boards-BK1027
+    :param board_code: 板块代码, 例如 "BK1027"
+    :type board_code: str
+    :param bucket: 所有线程共享的限速器
+    :type bucket: akshare.utils.rate_limit.TokenBucket
+    :param timeout: 单个请求的超时时间
+    :type timeout: float
+    :return: 成份股代码
+    :rtype: list
+    """
+    url = "https://29.push2.eastmoney.com/api/qt/clist/get"
+    params = {
+        "pn": "1",
+        "pz": "100",
+        "po": "1",
+        "np": "1",
+        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
+        "fltt": "2",
+        "invt": "2",
+        "fid": "f12",
+        "fs": f"b:{board_code} f:!50",
+        "fields": "f12",
+    }
+    bucket.acquire()
+    r = request_with_retry(url, params=params, timeout=timeout)
+    data_json = r.json()["data"]
+    if not data_json or not data_json["diff"]:
+        return []
+    codes = [item["f12"] for item in data_json["diff"]]
+    total_page = math.ceil(data_json["total"] / len(data_json["diff"]))
+    for page in range(2, total_page + 1):
+        params.update({"pn": page})
+        bucket.acquire()
+        r = request_with_retry(url, params=params, timeout=timeout)
+        codes.extend(item["f12"] for item in r.json()["data"]["diff"])
+    return codes
+
+
+def stock_board_membership_em(
+    symbol: str = "600519",
+    refresh: bool = False,
+    ttl: float = 86400,
+    max_workers: int = 8,
+    rate: float = 10.0,
+    timeout: float = 15,
+) -> pd.DataFrame:
+    """
+    东方财富网-沪深板块-股票所属行业板块和概念板块
+    https://quote.eastmoney.com/center/boardlist.html#industry_board
+    :param symbol: 股票代码, 如 "600519"; 为 "" 时返回全部股票
+    :type symbol: str
+    :param refresh: True 重新获取全部板块的成份股, False 只获取过期或新增的板块
+    :type refresh: bool
+    :param ttl: 板块成份股的有效期（秒）
+    :type ttl: float
+    :param max_workers: 并发请求的线程数
+    :type max_workers: int
+    :param rate: 所有线程共享的每秒最大请求数
+    :type rate: float
+    :param timeout: 单个请求的超时时间
+    :type timeout: float
+    :return: 股票所属板块
+    :rtype: pandas.DataFrame
+    """
+    with _membership_lock:
+        boards, index = _read_membership()
+        catalog = {}
+        for board_type, code_map_func in BOARD_CODE_MAPS.items():
+            for board_name, board_code in code_map_func().items():
+                catalog[board_code] = [board_type, board_name]
+        now = time.time()
+        stale_codes = [
+            board_code
+            for board_code in catalog
+            if refresh or board_code not in boards or now - boards[board_code][2] >= ttl
+        ]
+        removed_codes = [
+            board_code for board_code in boards if board_code not in catalog
+        ]
+        for board_code in boards:
+            if board_code in catalog:
+                boards[board_code][:2] = catalog[board_code]
+        if stale_codes or removed_codes:
+            members = _invert(index)
+            for board_code in removed_codes:
+                members.pop(board_code, None)
+                del boards[board_code]
+            bucket = TokenBucket(rate=rate)
+            tqdm = get_tqdm()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_code = {
+                    executor.submit(
+                        _stock_board_cons_codes_em, board_code, bucket, timeout
+                    ): board_code
+                    for board_code in stale_codes
+                }
+                for future in tqdm(
+                    as_completed(future_to_code), total=len(future_to_code), leave=False
+                ):
+                    board_code = future_to_code[future]
+                    try:
+                        members[board_code] = future.result()
+                    except Exception as e:
+                        # 保留该板块原有的成份股, 下次调用时重新获取
+                        warnings.warn(f"{board_code} 成份股获取失败: {e}")
+                        continue
+                    boards[board_code] = catalog[board_code] + [time.time()]
+            index = _invert(members)
+            _write_membership(boards, index)
+    symbols = [symbol] if symbol else list(index)
+    temp_df = pd.DataFrame(
+        [
+            [stock_code, boards[board_code][0], board_code, boards[board_code][1]]
+            for stock_code in symbols
+            for board_code in index.get(stock_code, [])
+            if board_code in boards
+        ],
+        columns=["代码", "板块类型", "板块代码", "板块名称"],
+    )
+    temp_df.sort_values(
+        ["代码", "板块类型", "板块代码"],
+        ascending=[True, False, True],
+        inplace=True,
+        ignore_index=True,
+    )
+    return temp_df
+
+
+if __name__ == "__main__":
+    stock_board_membership_em_df = stock_board_membership_em(symbol="600519")
+    print(stock_board_membership_em_df)
@@ -1,16 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/19 18:34
+Date: 2026/10/15 18:00
 Desc: 巨潮资讯-数据中心-专题统计-公司治理-对外担保
 https://webapi.cninfo.com.cn/#/thematicStatistics
 """
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_file_content_ths(file: str = "cninfo.js") -> str:
@@ -50,9 +50,8 @@ def stock_cg_guarantee_cninfo(
         "科创板": "012029",
     }
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1054"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2021/9/29 16:19
+Date: 2026/10/15 18:00
 Desc: 巨潮资讯-数据中心-专题统计-公司治理-公司诉讼
 http://webapi.cninfo.com.cn/#/thematicStatistics
 """
@@ -10,7 +10,8 @@ import time
 
 import pandas as pd
 import requests
-import py_mini_racer
+
+from akshare.utils.js_pool import get_js_context
 
 js_str = """
     function mcode(input) {
@@ -67,8 +68,7 @@ def stock_cg_lawsuit_cninfo(
     }
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1055"
     random_time_str = str(int(time.time()))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(js_str)
+    js_code = get_js_context(js_str)
     mcode = js_code.call("mcode", random_time_str)
     headers = {
         "Accept": "*/*",
@@ -1,16 +1,16 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2025/11/20 22:00
+Date: 2026/10/15 18:00
 Desc: 巨潮资讯-个股-历史分红
 https://webapi.cninfo.com.cn/#/company?companyid=600009
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_file_content_ths(file: str = "cninfo.js") -> str:
@@ -38,9 +38,8 @@ def stock_dividend_cninfo(symbol: str = "600009") -> pd.DataFrame:
     """
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1139"
     params = {"scode": symbol}
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/10 19:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-数据中心-资金流向
 https://data.eastmoney.com/zjlx/detail.html
 """
@@ -14,6 +14,7 @@ import pandas as pd
 import requests
 
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.kline import parse_klines
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -48,24 +49,24 @@ def stock_individual_fund_flow(
     r = requests.get(url, params=params, headers=headers)
     data_json = r.json()
     content_list = data_json["data"]["klines"]
-    temp_df = pd.DataFrame([item.split(",") for item in content_list])
-    temp_df.columns = [
-        "日期",
-        "主力净流入-净额",
-        "小单净流入-净额",
-        "中单净流入-净额",
-        "大单净流入-净额",
-        "超大单净流入-净额",
-        "主力净流入-净占比",
-        "小单净流入-净占比",
-        "中单净流入-净占比",
-        "大单净流入-净占比",
-        "超大单净流入-净占比",
-        "收盘价",
-        "涨跌幅",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        content_list,
+        columns=[
+            "日期",
+            "主力净流入-净额",
+            "小单净流入-净额",
+            "中单净流入-净额",
+            "大单净流入-净额",
+            "超大单净流入-净额",
+            "主力净流入-净占比",
+            "小单净流入-净占比",
+            "中单净流入-净占比",
+            "大单净流入-净占比",
+            "超大单净流入-净占比",
+            "收盘价",
+            "涨跌幅",
+        ],
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -84,38 +85,6 @@ def stock_individual_fund_flow(
         ]
     ]
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["主力净流入-净额"] = pd.to_numeric(
-        temp_df["主力净流入-净额"], errors="coerce"
-    )
-    temp_df["小单净流入-净额"] = pd.to_numeric(
-        temp_df["小单净流入-净额"], errors="coerce"
-    )
-    temp_df["中单净流入-净额"] = pd.to_numeric(
-        temp_df["中单净流入-净额"], errors="coerce"
-    )
-    temp_df["大单净流入-净额"] = pd.to_numeric(
-        temp_df["大单净流入-净额"], errors="coerce"
-    )
-    temp_df["超大单净流入-净额"] = pd.to_numeric(
-        temp_df["超大单净流入-净额"], errors="coerce"
-    )
-    temp_df["主力净流入-净占比"] = pd.to_numeric(
-        temp_df["主力净流入-净占比"], errors="coerce"
-    )
-    temp_df["小单净流入-净占比"] = pd.to_numeric(
-        temp_df["小单净流入-净占比"], errors="coerce"
-    )
-    temp_df["中单净流入-净占比"] = pd.to_numeric(
-        temp_df["中单净流入-净占比"], errors="coerce"
-    )
-    temp_df["大单净流入-净占比"] = pd.to_numeric(
-        temp_df["大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["超大单净流入-净占比"] = pd.to_numeric(
-        temp_df["超大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["收盘价"] = pd.to_numeric(temp_df["收盘价"], errors="coerce")
-    temp_df["涨跌幅"] = pd.to_numeric(temp_df["涨跌幅"], errors="coerce")
     return temp_df
 
 
@@ -369,24 +338,26 @@ def stock_market_fund_flow() -> pd.DataFrame:
     r = requests.get(url, params=params, headers=headers)
     data_json = r.json()
     content_list = data_json["data"]["klines"]
-    temp_df = pd.DataFrame([item.split(",") for item in content_list])
-    temp_df.columns = [
-        "日期",
-        "主力净流入-净额",
-        "小单净流入-净额",
-        "中单净流入-净额",
-        "大单净流入-净额",
-        "超大单净流入-净额",
-        "主力净流入-净占比",
-        "小单净流入-净占比",
-        "中单净流入-净占比",
-        "大单净流入-净占比",
-        "超大单净流入-净占比",
-        "上证-收盘价",
-        "上证-涨跌幅",
-        "深证-收盘价",
-        "深证-涨跌幅",
-    ]
+    temp_df = parse_klines(
+        content_list,
+        columns=[
+            "日期",
+            "主力净流入-净额",
+            "小单净流入-净额",
+            "中单净流入-净额",
+            "大单净流入-净额",
+            "超大单净流入-净额",
+            "主力净流入-净占比",
+            "小单净流入-净占比",
+            "中单净流入-净占比",
+            "大单净流入-净占比",
+            "超大单净流入-净占比",
+            "上证-收盘价",
+            "上证-涨跌幅",
+            "深证-收盘价",
+            "深证-涨跌幅",
+        ],
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -407,40 +378,6 @@ def stock_market_fund_flow() -> pd.DataFrame:
         ]
     ]
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["上证-收盘价"] = pd.to_numeric(temp_df["上证-收盘价"], errors="coerce")
-    temp_df["上证-涨跌幅"] = pd.to_numeric(temp_df["上证-涨跌幅"], errors="coerce")
-    temp_df["深证-收盘价"] = pd.to_numeric(temp_df["深证-收盘价"], errors="coerce")
-    temp_df["深证-涨跌幅"] = pd.to_numeric(temp_df["深证-涨跌幅"], errors="coerce")
-    temp_df["主力净流入-净额"] = pd.to_numeric(
-        temp_df["主力净流入-净额"], errors="coerce"
-    )
-    temp_df["主力净流入-净占比"] = pd.to_numeric(
-        temp_df["主力净流入-净占比"], errors="coerce"
-    )
-    temp_df["超大单净流入-净额"] = pd.to_numeric(
-        temp_df["超大单净流入-净额"], errors="coerce"
-    )
-    temp_df["超大单净流入-净占比"] = pd.to_numeric(
-        temp_df["超大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["大单净流入-净额"] = pd.to_numeric(
-        temp_df["大单净流入-净额"], errors="coerce"
-    )
-    temp_df["大单净流入-净占比"] = pd.to_numeric(
-        temp_df["大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["中单净流入-净额"] = pd.to_numeric(
-        temp_df["中单净流入-净额"], errors="coerce"
-    )
-    temp_df["中单净流入-净占比"] = pd.to_numeric(
-        temp_df["中单净流入-净占比"], errors="coerce"
-    )
-    temp_df["小单净流入-净额"] = pd.to_numeric(
-        temp_df["小单净流入-净额"], errors="coerce"
-    )
-    temp_df["小单净流入-净占比"] = pd.to_numeric(
-        temp_df["小单净流入-净占比"], errors="coerce"
-    )
     return temp_df
 
 
@@ -979,24 +916,22 @@ def stock_sector_fund_flow_hist(symbol: str = "汽车服务") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "主力净流入-净额",
-        "小单净流入-净额",
-        "中单净流入-净额",
-        "大单净流入-净额",
-        "超大单净流入-净额",
-        "主力净流入-净占比",
-        "小单净流入-净占比",
-        "中单净流入-净占比",
-        "大单净流入-净占比",
-        "超大单净流入-净占比",
-        "-",
-        "-",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "主力净流入-净额",
+            "小单净流入-净额",
+            "中单净流入-净额",
+            "大单净流入-净额",
+            "超大单净流入-净额",
+            "主力净流入-净占比",
+            "小单净流入-净占比",
+            "中单净流入-净占比",
+            "大单净流入-净占比",
+            "超大单净流入-净占比",
+        ],
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -1012,36 +947,6 @@ def stock_sector_fund_flow_hist(symbol: str = "汽车服务") -> pd.DataFrame:
             "小单净流入-净占比",
         ]
     ]
-    temp_df["主力净流入-净额"] = pd.to_numeric(
-        temp_df["主力净流入-净额"], errors="coerce"
-    )
-    temp_df["主力净流入-净占比"] = pd.to_numeric(
-        temp_df["主力净流入-净占比"], errors="coerce"
-    )
-    temp_df["超大单净流入-净额"] = pd.to_numeric(
-        temp_df["超大单净流入-净额"], errors="coerce"
-    )
-    temp_df["超大单净流入-净占比"] = pd.to_numeric(
-        temp_df["超大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["大单净流入-净额"] = pd.to_numeric(
-        temp_df["大单净流入-净额"], errors="coerce"
-    )
-    temp_df["大单净流入-净占比"] = pd.to_numeric(
-        temp_df["大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["中单净流入-净额"] = pd.to_numeric(
-        temp_df["中单净流入-净额"], errors="coerce"
-    )
-    temp_df["中单净流入-净占比"] = pd.to_numeric(
-        temp_df["中单净流入-净占比"], errors="coerce"
-    )
-    temp_df["小单净流入-净额"] = pd.to_numeric(
-        temp_df["小单净流入-净额"], errors="coerce"
-    )
-    temp_df["小单净流入-净占比"] = pd.to_numeric(
-        temp_df["小单净流入-净占比"], errors="coerce"
-    )
     temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
     return temp_df
 
@@ -1091,24 +996,22 @@ def stock_concept_fund_flow_hist(symbol: str = "数据要素") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "日期",
-        "主力净流入-净额",
-        "小单净流入-净额",
-        "中单净流入-净额",
-        "大单净流入-净额",
-        "超大单净流入-净额",
-        "主力净流入-净占比",
-        "小单净流入-净占比",
-        "中单净流入-净占比",
-        "大单净流入-净占比",
-        "超大单净流入-净占比",
-        "-",
-        "-",
-        "-",
-        "-",
-    ]
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "日期",
+            "主力净流入-净额",
+            "小单净流入-净额",
+            "中单净流入-净额",
+            "大单净流入-净额",
+            "超大单净流入-净额",
+            "主力净流入-净占比",
+            "小单净流入-净占比",
+            "中单净流入-净占比",
+            "大单净流入-净占比",
+            "超大单净流入-净占比",
+        ],
+    )
     temp_df = temp_df[
         [
             "日期",
@@ -1124,36 +1027,6 @@ def stock_concept_fund_flow_hist(symbol: str = "数据要素") -> pd.DataFrame:
             "小单净流入-净占比",
         ]
     ]
-    temp_df["主力净流入-净额"] = pd.to_numeric(
-        temp_df["主力净流入-净额"], errors="coerce"
-    )
-    temp_df["主力净流入-净占比"] = pd.to_numeric(
-        temp_df["主力净流入-净占比"], errors="coerce"
-    )
-    temp_df["超大单净流入-净额"] = pd.to_numeric(
-        temp_df["超大单净流入-净额"], errors="coerce"
-    )
-    temp_df["超大单净流入-净占比"] = pd.to_numeric(
-        temp_df["超大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["大单净流入-净额"] = pd.to_numeric(
-        temp_df["大单净流入-净额"], errors="coerce"
-    )
-    temp_df["大单净流入-净占比"] = pd.to_numeric(
-        temp_df["大单净流入-净占比"], errors="coerce"
-    )
-    temp_df["中单净流入-净额"] = pd.to_numeric(
-        temp_df["中单净流入-净额"], errors="coerce"
-    )
-    temp_df["中单净流入-净占比"] = pd.to_numeric(
-        temp_df["中单净流入-净占比"], errors="coerce"
-    )
-    temp_df["小单净流入-净额"] = pd.to_numeric(
-        temp_df["小单净流入-净额"], errors="coerce"
-    )
-    temp_df["小单净流入-净占比"] = pd.to_numeric(
-        temp_df["小单净流入-净占比"], errors="coerce"
-    )
     temp_df["日期"] = pd.to_datetime(temp_df["日期"]).dt.date
     return temp_df
 
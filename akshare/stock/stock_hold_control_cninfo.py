@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/7/24 23:30
+Date: 2026/10/15 18:00
 Desc: 巨潮资讯-数据中心-专题统计-股东股本-实际控制人持股变动
 https://webapi.cninfo.com.cn/#/thematicStatistics
 
@@ -12,10 +12,10 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 import datetime
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
@@ -49,9 +49,8 @@ def stock_hold_control_cninfo(symbol: str = "全部") -> pd.DataFrame:
         "全部": "",
     }
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1033"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -118,9 +117,8 @@ def stock_hold_management_detail_cninfo(symbol: str = "增持") -> pd.DataFrame:
     }
     current_date = datetime.datetime.now().date().isoformat()
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1030"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -213,9 +211,8 @@ def stock_hold_change_cninfo(symbol: str = "全部") -> pd.DataFrame:
         "全部": "",
     }
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1029"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "/",
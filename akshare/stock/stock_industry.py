@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/5/9 17:06
+Date: 2026/10/15 18:00
 Desc: 新浪行业-板块行情
 http://finance.sina.com.cn/stock/sl/
 """
@@ -12,7 +12,7 @@ import math
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 from tqdm import tqdm
 
 
@@ -102,7 +102,7 @@ def stock_sector_detail(sector: str = "gn_gfgn") -> pd.DataFrame:
         }
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text)
+        data_json = js_literal.loads(data_text)
         temp_df = pd.DataFrame(data_json)
         big_df = pd.concat([big_df, temp_df], ignore_index=True)
     big_df["trade"] = pd.to_numeric(big_df["trade"], errors="coerce")
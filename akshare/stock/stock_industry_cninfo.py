@@ -1,7 +1,7 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/5/19 18:34
+Date: 2026/10/15 18:00
 Desc: 巨潮资讯-行业分类数据
 https://webapi.cninfo.com.cn/#/apiDoc
 https://webapi.cninfo.com.cn/api/stock/p_stock2110
@@ -10,9 +10,9 @@ https://webapi.cninfo.com.cn/api/stock/p_stock2110
 import numpy as np
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_file_content_ths(file: str = "cninfo.js") -> str:
@@ -52,9 +52,8 @@ def stock_industry_category_cninfo(symbol: str = "巨潮行业分类标准") ->
     }
     url = "https://webapi.cninfo.com.cn/api/stock/p_public0002"
     params = {"indcode": "", "indtype": symbol_map[symbol], "format": "json"}
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -126,9 +125,8 @@ def stock_industry_change_cninfo(
         "sdate": "-".join([start_date[:4], start_date[4:6], start_date[6:]]),
         "edate": "-".join([end_date[:4], end_date[4:6], end_date[6:]]),
     }
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/27 15:30
+Date: 2026/10/15 18:00
 Desc: 股票基本信息
 """
 
@@ -13,6 +13,8 @@ from io import StringIO
 
 import pandas as pd
 import requests
+
+from akshare.utils.context import get_session
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -39,7 +41,7 @@ def stock_info_sz_name_code(symbol: str = "A股列表") -> pd.DataFrame:
         "TABKEY": indicator_map[symbol],
         "random": "0.6935816432433362",
     }
-    r = requests.get(url, params=params, timeout=15)
+    r = get_session(url).get(url, params=params, timeout=15)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
         temp_df = pd.read_excel(BytesIO(r.content))
@@ -152,7 +154,7 @@ def stock_info_sh_name_code(symbol: str = "主板A股") -> pd.DataFrame:
         "pageHelp.pageNo": "1",
         "pageHelp.endPage": "1",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = get_session(url).get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"])
     col_stock_code = "B_STOCK_CODE" if symbol == "主板B股" else "A_STOCK_CODE"
@@ -202,7 +204,7 @@ def stock_info_bj_name_code() -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/110.0.0.0 Safari/537.36"
     }
-    r = requests.post(url, data=payload, headers=headers)
+    r = get_session(url).post(url, data=payload, headers=headers)
     data_text = r.text
     data_json = json.loads(data_text[data_text.find("[") : -1])
     total_page = data_json[0]["totalPages"]
@@ -210,7 +212,7 @@ def stock_info_bj_name_code() -> pd.DataFrame:
     tqdm = get_tqdm()
     for page in tqdm(range(total_page), leave=False):
         payload.update({"page": page})
-        r = requests.post(url, data=payload, headers=headers)
+        r = get_session(url).post(url, data=payload, headers=headers)
         data_text = r.text
         data_json = json.loads(data_text[data_text.find("[") : -1])
         temp_df = data_json[0]["content"]
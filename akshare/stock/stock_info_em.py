@@ -1,11 +1,13 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2025/2/15 22:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-个股-股票信息
 https://quote.eastmoney.com/concept/sh603777.html?from=classic
 """
 
+from typing import Dict, Tuple
+
 import pandas as pd
 import requests
 
@@ -23,6 +25,19 @@ def stock_individual_info_em(
     :return: 股票信息
     :rtype: pandas.DataFrame
     """
+    url, params = _stock_individual_info_em_params(symbol=symbol)
+    r = requests.get(url, params=params, timeout=timeout)
+    return _stock_individual_info_em_parse(r.json())
+
+
+def _stock_individual_info_em_params(symbol: str) -> Tuple[str, Dict]:
+    """
+    东方财富-个股-股票信息-请求地址和请求参数
+    :param symbol: 股票代码
+    :type symbol: str
+    :return: (请求地址, 请求参数)
+    :rtype: tuple
+    """
     url = "https://push2.eastmoney.com/api/qt/stock/get"
     market_code = 1 if symbol.startswith("6") else 0
     params = {
@@ -37,8 +52,17 @@ def stock_individual_info_em(
         "f275,f276,f265,f266,f289,f290,f286,f285,f292,f293,f294,f295,f43",
         "secid": f"{market_code}.{symbol}",
     }
-    r = requests.get(url, params=params, timeout=timeout)
-    data_json = r.json()
+    return url, params
+
+
+def _stock_individual_info_em_parse(data_json: Dict) -> pd.DataFrame:
+    """
+    东方财富-个股-股票信息-解析接口返回的数据, 同步和异步接口共用
+    :param data_json: 接口返回的 JSON
+    :type data_json: dict
+    :return: 股票信息
+    :rtype: pandas.DataFrame
+    """
     temp_df = pd.DataFrame(data_json)
     temp_df.reset_index(inplace=True)
     del temp_df["rc"]
@@ -1,29 +1,70 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/10 18:00
+Date: 2026/10/15 18:00
 Desc: 东财财富-日内分时数据
 https://quote.eastmoney.com/f1.html?newcode=0.000001
+stock_intraday_em 只取推送的第一个事件; stock_intraday_em_stream 和 stock_intraday_em_subscribe 保持连接,
+每只股票一个连接, 连接建立时推送最近的逐笔成交, 之后只推送新增的逐笔成交; 断线后重新连接, 按已收到的最后几笔成交对齐, 去掉重复的部分
 """
 
 import json
+import queue
+import threading
+import warnings
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 import requests
 
+from akshare.utils.context import config
+from akshare.utils.kline import parse_klines
+
+# 买卖盘性质的代码
+SIDE_MAP = {2: "买盘", 1: "卖盘", 4: "中性盘"}
+
+# 断线重连后用已收到的最后几笔成交与新推送的数据对齐
+RESUME_OVERLAP = 64
 
-def __event_stream(url, params):
-    # 使用 stream=True 参数来启用流式请求
-    response = requests.get(url, params=params, stream=True)
-    event_data = ""
 
+def _intraday_params(symbol: str, mpi: int = 2000) -> Dict:
+    market_code = 1 if symbol.startswith("6") else 0
+    return {
+        "fields1": "f1,f2,f3,f4",
+        "fields2": "f51,f52,f53,f54,f55",
+        "mpi": str(mpi),
+        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
+        "fltt": "2",
+        "pos": "-0",
+        "secid": f"{market_code}.{symbol}",
+        "wbp2u": "|0|0|0|web",
+    }
+
+
+def _sse_events(response: requests.Response) -> Iterator[str]:
+    """
+    按 server-sent events 格式读取事件, 返回每个事件 data 字段的内容
+    """
+    data_lines = []
     for line in response.iter_lines():
-        # 过滤掉保持连接的空行
-        if line:
-            event_data += line.decode() + "\n"
-        elif event_data:
-            yield event_data
-            event_data = ""
+        line = line.decode("utf-8") if isinstance(line, bytes) else line
+        # 空行表示一个事件结束
+        if not line:
+            if data_lines:
+                yield "\n".join(data_lines)
+                data_lines = []
+        elif line.startswith("data:"):
+            data_lines.append(line[5:].lstrip(" "))
+    if data_lines:
+        yield "\n".join(data_lines)
+
+
+def __event_stream(url, params):
+    # 使用 stream=True 参数来启用流式请求, 退出时关闭连接
+    with requests.get(url, params=params, stream=True) as response:
+        yield from _sse_events(response)
 
 
 def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
@@ -35,41 +76,371 @@ def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
     :return: 分时数据
     :rtype: pandas.DataFrame
     """
-    market_code = 1 if symbol.startswith("6") else 0
     url = "https://70.push2.eastmoney.com/api/qt/stock/details/sse"
-    params = {
-        "fields1": "f1,f2,f3,f4",
-        "fields2": "f51,f52,f53,f54,f55",
-        "mpi": "2000",
-        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
-        "fltt": "2",
-        "pos": "-0",
-        "secid": f"{market_code}.{symbol}",
-        "wbp2u": "|0|0|0|web",
-    }
+    params = _intraday_params(symbol)
 
     big_df = pd.DataFrame()  # 创建一个空的 DataFrame
 
     for event in __event_stream(url, params):
-        # 从每个事件的数据行中删除 "data: "，然后解析 JSON
-        event_json = json.loads(event.replace("data: ", ""))
+        event_json = json.loads(event)
         # 将 JSON 数据转换为 DataFrame，然后添加到主 DataFrame 中
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in event_json["data"]["details"]]
+        temp_df = parse_klines(
+            event_json["data"]["details"],
+            columns=["时间", "成交价", "手数", None, "买卖盘性质"],
+            text_columns=("时间", "买卖盘性质"),
         )
         big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
         break
 
-    big_df.columns = ["时间", "成交价", "手数", "-", "买卖盘性质"]
     big_df["买卖盘性质"] = big_df["买卖盘性质"].map(
         {"2": "买盘", "1": "卖盘", "4": "中性盘"}
     )
     big_df = big_df[["时间", "成交价", "手数", "买卖盘性质"]]
-    big_df["成交价"] = pd.to_numeric(big_df["成交价"], errors="coerce")
-    big_df["手数"] = pd.to_numeric(big_df["手数"], errors="coerce")
     return big_df
 
 
+class IntradayTickBuffer:
+    """
+    单只股票当日逐笔成交的列式缓冲区
+    预先分配数组, 容量不足时按倍数扩容; 写入和读取加锁, 可以在其他线程中读取
+    """
+
+    def __init__(self, capacity: int = 8192):
+        """
+        :param capacity: 初始容量, 一只股票一个交易日通常有几千笔
+        :type capacity: int
+        """
+        self._lock = threading.Lock()
+        self._size = 0
+        self._seconds = np.empty(capacity, dtype=np.int32)
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._volume = np.empty(capacity, dtype=np.int64)
+        self._side = np.empty(capacity, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, size: int):
+        capacity = len(self._seconds)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in ("_seconds", "_price", "_volume", "_side"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+
+    def extend(self, details: Sequence[str]) -> Tuple[int, int]:
+        """
+        追加逐笔成交
+        :param details: 接口返回的逐笔成交, 例如 "09:25:00,10.60,1547,0,4"
+        :type details: list
+        :return: 新增数据的位置 (start, stop)
+        :rtype: tuple
+        """
+        rows = [item.split(",") for item in details]
+        with self._lock:
+            start = self._size
+            stop = start + len(rows)
+            self._reserve(stop)
+            for i, row in enumerate(rows, start):
+                hour, minute, second = row[0].split(":")
+                self._seconds[i] = int(hour) * 3600 + int(minute) * 60 + int(second)
+                self._price[i] = float(row[1])
+                self._volume[i] = int(float(row[2]))
+                self._side[i] = int(row[4])
+            self._size = stop
+        return start, stop
+
+    def to_frame(self, start: int = 0, stop: Optional[int] = None) -> pd.DataFrame:
+        """
+        转换为与 stock_intraday_em 相同格式的 DataFrame
+        :param start: 开始位置
+        :type start: int
+        :param stop: 结束位置, 为 None 时到最后一笔
+        :type stop: int
+        :return: 逐笔成交
+        :rtype: pandas.DataFrame
+        """
+        with self._lock:
+            stop = self._size if stop is None else min(stop, self._size)
+            seconds = self._seconds[start:stop].copy()
+            price = self._price[start:stop].copy()
+            volume = self._volume[start:stop].copy()
+            side = self._side[start:stop].copy()
+        temp_df = pd.DataFrame(
+            {
+                "时间": [
+                    f"{item // 3600:02d}:{item // 60 % 60:02d}:{item % 60:02d}"
+                    for item in seconds.tolist()
+                ],
+                "成交价": price,
+                "手数": volume,
+                "买卖盘性质": pd.Series(side, dtype=object).map(SIDE_MAP).to_numpy(),
+            },
+            index=pd.RangeIndex(start, stop),
+        )
+        return temp_df
+
+
+def _resume_offset(tail: Sequence[str], details: Sequence[str]) -> Optional[int]:
+    """
+    重新连接后推送的是最近的逐笔成交, 与已收到的最后几笔对齐
+    :return: details 中第一笔新成交的位置; 没有重叠时返回 None
+    :rtype: int
+    """
+    if not tail:
+        return 0
+    tail = list(tail)
+    last = tail[-1]
+    for end in range(len(details), 0, -1):
+        if details[end - 1] != last:
+            continue
+        size = min(len(tail), end)
+        if list(details[end - size : end]) == tail[-size:]:
+            return end
+    return None
+
+
+class StockIntradaySubscription:
+    """
+    东方财富-分时数据-逐笔成交订阅
+    每只股票保持一个 server-sent events 连接, 新增的逐笔成交写入该股票的 IntradayTickBuffer,
+    并交给 callback 或者放入队列供 stock_intraday_em_stream 读取
+    """
+
+    url = "https://70.push2.eastmoney.com/api/qt/stock/details/sse"
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        callback: Optional[Callable[[str, pd.DataFrame], None]] = None,
+        capacity: int = 8192,
+        mpi: int = 2000,
+        read_timeout: float = 60,
+        reconnect_delay: float = 1,
+        max_reconnect_delay: float = 30,
+    ):
+        """
+        :param symbols: 股票代码
+        :type symbols: list
+        :param callback: 收到新增逐笔成交时调用 callback(股票代码, 新增数据), 在连接所在的线程中执行; 为 None 时放入队列
+        :type callback: function
+        :param capacity: 每只股票缓冲区的初始容量
+        :type capacity: int
+        :param mpi: 连接建立时推送的最近逐笔成交笔数, 断线时间较长时可以调大
+        :type mpi: int
+        :param read_timeout: 超过该时间没有收到数据时重新连接（秒）
+        :type read_timeout: float
+        :param reconnect_delay: 断线后第一次重连的等待时间（秒）, 之后每次加倍
+        :type reconnect_delay: float
+        :param max_reconnect_delay: 重连的最长等待时间（秒）
+        :type max_reconnect_delay: float
+        """
+        self.symbols = list(dict.fromkeys(symbols))
+        self.callback = callback
+        self.mpi = mpi
+        self.read_timeout = read_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.buffers = {symbol: IntradayTickBuffer(capacity) for symbol in self.symbols}
+        self._tails = {symbol: deque(maxlen=RESUME_OVERLAP) for symbol in self.symbols}
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._responses = {}
+        self._threads = []
+
+    def start(self) -> "StockIntradaySubscription":
+        if self._threads:
+            return self
+        self._stop.clear()
+        # 丢弃上次 stop() 放入的结束标记, 否则重新启动后 __iter__ 会立即退出; 未取走的数据保留
+        pending = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                pending.append(item)
+        for item in pending:
+            self._queue.put(item)
+        for symbol in self.symbols:
+            thread = threading.Thread(
+                target=self._run, args=(symbol,), name=f"intraday-{symbol}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        """
+        关闭所有连接, 缓冲区中的数据保留
+        """
+        self._stop.set()
+        for response in list(self._responses.values()):
+            response.close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+        # 唤醒正在等待队列的 stock_intraday_em_stream
+        self._queue.put(None)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        """
+        指定股票订阅以来已收到的全部逐笔成交
+        """
+        return self.buffers[symbol].to_frame()
+
+    def _merge(self, symbol: str, details: List[str], resume: bool) -> Optional[Tuple]:
+        tail = self._tails[symbol]
+        if resume:
+            offset = _resume_offset(tail, details)
+            if offset is None:
+                warnings.warn(
+                    f"{symbol} 断线期间的逐笔成交超过 {len(details)} 笔, 中间的数据可能缺失"
+                )
+                offset = 0
+            details = details[offset:]
+        if not details:
+            return None
+        tail.extend(details)
+        return self.buffers[symbol].extend(details)
+
+    def _publish(self, symbol: str, start: int, stop: int):
+        temp_df = self.buffers[symbol].to_frame(start, stop)
+        if self.callback is None:
+            self._queue.put((symbol, temp_df))
+            return
+        try:
+            self.callback(symbol, temp_df)
+        except Exception as e:
+            warnings.warn(f"{symbol} 分时数据回调函数出错: {e}")
+
+    def _consume(self, symbol: str):
+        with requests.get(
+            self.url,
+            params=_intraday_params(symbol, mpi=self.mpi),
+            stream=True,
+            timeout=(10, self.read_timeout),
+            proxies=config.proxies,
+        ) as response:
+            self._responses[symbol] = response
+            response.raise_for_status()
+            # 每次连接的第一个事件是最近的逐笔成交, 需要与已收到的数据对齐
+            resume = True
+            for event in _sse_events(response):
+                if self._stop.is_set():
+                    return
+                data_json = json.loads(event).get("data") or {}
+                details = data_json.get("details") or []
+                position = self._merge(symbol, details, resume=resume)
+                resume = False
+                if position is not None:
+                    self._publish(symbol, *position)
+
+    def _run(self, symbol: str):
+        delay = self.reconnect_delay
+        while not self._stop.is_set():
+            received = len(self.buffers[symbol])
+            try:
+                self._consume(symbol)
+            except Exception as e:
+                # stop() 关闭连接时正在读取的线程也会在这里退出
+                if self._stop.is_set():
+                    break
+                warnings.warn(f"{symbol} 分时数据连接中断, 将重新连接: {e}")
+            finally:
+                self._responses.pop(symbol, None)
+            if len(self.buffers[symbol]) > received:
+                delay = self.reconnect_delay
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def __iter__(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        while not self._stop.is_set():
+            item = self._queue.get()
+            if item is None:
+                break
+            yield item
+
+
+def stock_intraday_em_subscribe(
+    symbols: Sequence[str] = ("000001",),
+    callback: Optional[Callable[[str, pd.DataFrame], None]] = None,
+    capacity: int = 8192,
+    mpi: int = 2000,
+    read_timeout: float = 60,
+) -> StockIntradaySubscription:
+    """
+    东方财富-分时数据-订阅逐笔成交, 在后台线程中保持连接, 每只股票收到新增的逐笔成交时调用 callback
+    https://quote.eastmoney.com/f1.html?newcode=0.000001
+    :param symbols: 股票代码
+    :type symbols: list
+    :param callback: callback(股票代码, 新增数据), 新增数据的格式与 stock_intraday_em 相同, 索引为该笔成交在订阅以来收到的逐笔成交中的位置, 从连接建立时推送的第一笔开始计数
+    :type callback: function
+    :param capacity: 每只股票缓冲区的初始容量
+    :type capacity: int
+    :param mpi: 连接建立时推送的最近逐笔成交笔数
+    :type mpi: int
+    :param read_timeout: 超过该时间没有收到数据时重新连接（秒）
+    :type read_timeout: float
+    :return: 已启动的订阅, 调用 stop() 结束; frame(股票代码) 返回订阅以来已收到的全部逐笔成交
+    :rtype: akshare.stock.stock_intraday_em.StockIntradaySubscription
+    """
+    return StockIntradaySubscription(
+        symbols,
+        callback=callback,
+        capacity=capacity,
+        mpi=mpi,
+        read_timeout=read_timeout,
+    ).start()
+
+
+def stock_intraday_em_stream(
+    symbols: Sequence[str] = ("000001",),
+    capacity: int = 8192,
+    mpi: int = 2000,
+    read_timeout: float = 60,
+) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    东方财富-分时数据-持续返回新增的逐笔成交, 关闭生成器时断开所有连接
+    https://quote.eastmoney.com/f1.html?newcode=0.000001
+    :param symbols: 股票代码
+    :type symbols: list
+    :param capacity: 每只股票缓冲区的初始容量
+    :type capacity: int
+    :param mpi: 连接建立时推送的最近逐笔成交笔数
+    :type mpi: int
+    :param read_timeout: 超过该时间没有收到数据时重新连接（秒）
+    :type read_timeout: float
+    :return: (股票代码, 新增数据), 第一次返回连接建立时推送的最近逐笔成交
+    :rtype: generator
+    """
+    subscription = StockIntradaySubscription(
+        symbols, capacity=capacity, mpi=mpi, read_timeout=read_timeout
+    ).start()
+    try:
+        yield from subscription
+    finally:
+        subscription.stop()
+
+
 if __name__ == "__main__":
     stock_intraday_em_df = stock_intraday_em(symbol="000001")
     print(stock_intraday_em_df)
+
+    for stock_code, stock_intraday_em_new_df in stock_intraday_em_stream(
+        symbols=["000001", "600519"]
+    ):
+        print(stock_code, stock_intraday_em_new_df)
+        break
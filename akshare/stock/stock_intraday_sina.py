@@ -1,12 +1,13 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/9/28 13:30
+Date: 2026/10/15 18:00
 Desc: 新浪财经-日内分时数据
 https://quote.eastmoney.com/f1.html?newcode=0.000001
 """
 
 import math
+from typing import Iterator, Tuple
 
 import pandas as pd
 import requests
@@ -14,18 +15,20 @@ import requests
 from akshare.utils.tqdm import get_tqdm
 
 
-def stock_intraday_sina(
-    symbol: str = "sz000001", date: str = "20240321"
-) -> pd.DataFrame:
+def stock_intraday_sina_iter(
+    symbol: str = "sz000001", date: str = "20240321", start_page: int = 1
+) -> Iterator[Tuple[int, pd.DataFrame]]:
     """
-    新浪财经-日内分时数据
+    新浪财经-日内分时数据-逐页返回
     https://vip.stock.finance.sina.com.cn/quotes_service/view/cn_bill.php?symbol=sz000001
     :param symbol: 股票代码
     :type symbol: str
     :param date: 交易日
     :type date: str
-    :return: 分时数据
-    :rtype: pandas.DataFrame
+    :param start_page: 起始页码, 中断后可从最后收到的页码加 1 继续获取
+    :type start_page: int
+    :return: (页码, 该页的分时数据), 每页 60 条, 按成交时间倒序
+    :rtype: generator
     """
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/CN_Bill.GetBillListCount"
     params = {
@@ -48,18 +51,40 @@ def stock_intraday_sina(
     data_json = r.json()
     total_page = math.ceil(int(data_json) / 60)
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/CN_Bill.GetBillList"
-    big_df = pd.DataFrame()
     tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
+    for page in tqdm(range(start_page, total_page + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url=url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        if temp_df.empty:
+            continue
+        temp_df["price"] = pd.to_numeric(temp_df["price"], errors="coerce")
+        temp_df["volume"] = pd.to_numeric(temp_df["volume"], errors="coerce")
+        temp_df["prev_price"] = pd.to_numeric(temp_df["prev_price"], errors="coerce")
+        yield page, temp_df
+
+
+def stock_intraday_sina(
+    symbol: str = "sz000001", date: str = "20240321"
+) -> pd.DataFrame:
+    """
+    新浪财经-日内分时数据
+    https://vip.stock.finance.sina.com.cn/quotes_service/view/cn_bill.php?symbol=sz000001
+    :param symbol: 股票代码
+    :type symbol: str
+    :param date: 交易日
+    :type date: str
+    :return: 分时数据
+    :rtype: pandas.DataFrame
+    """
+    frames = [
+        temp_df for _, temp_df in stock_intraday_sina_iter(symbol=symbol, date=date)
+    ]
+    if not frames:
+        return pd.DataFrame()
+    big_df = pd.concat(frames, ignore_index=True)
     big_df.sort_values(by=["ticktime"], inplace=True, ignore_index=True)
-    big_df["price"] = pd.to_numeric(big_df["price"], errors="coerce")
-    big_df["volume"] = pd.to_numeric(big_df["volume"], errors="coerce")
-    big_df["prev_price"] = pd.to_numeric(big_df["prev_price"], errors="coerce")
     return big_df
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/1/14 17:00
+Date: 2026/10/15 18:00
 Desc: 新浪财经-美股实时行情数据和历史行情数据
 https://finance.sina.com.cn/stock/usstock/sector.shtml
 """
@@ -11,7 +11,6 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-import py_mini_racer
 from tqdm import tqdm
 
 from akshare.stock.cons import (
@@ -21,6 +20,7 @@ from akshare.stock.cons import (
     us_sina_stock_dict_payload,
     us_sina_stock_hist_qfq_url,
 )
+from akshare.utils.js_pool import get_js_context
 
 
 @lru_cache()
@@ -35,8 +35,7 @@ def __get_us_page_count() -> int:
     us_js_decode = (
         f"US_CategoryService.getList?page={page}&num=20&sort=&asc=0&market=&id="
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(js_hash_text)
+    js_code = get_js_context(js_hash_text)
     dict_list = js_code.call("d", us_js_decode)  # 执行js解密代码
     us_sina_stock_dict_payload.update({"page": "{}".format(page)})
     res = requests.get(
@@ -68,8 +67,7 @@ def get_us_stock_name() -> pd.DataFrame:
                 page
             )
         )
-        js_code = py_mini_racer.MiniRacer()
-        js_code.eval(js_hash_text)
+        js_code = get_js_context(js_hash_text)
         dict_list = js_code.call("d", us_js_decode)  # 执行js解密代码
         us_sina_stock_dict_payload.update({"page": "{}".format(page)})
         res = requests.get(
@@ -99,8 +97,7 @@ def stock_us_spot() -> pd.DataFrame:
                 page
             )
         )
-        js_code = py_mini_racer.MiniRacer()
-        js_code.eval(js_hash_text)
+        js_code = get_js_context(js_hash_text)
         dict_list = js_code.call("d", us_js_decode)  # 执行js解密代码
         us_sina_stock_dict_payload.update({"page": "{}".format(page)})
         res = requests.get(
@@ -130,8 +127,7 @@ def stock_us_daily(symbol: str = "FB", adjust: str = "") -> pd.DataFrame:
     """
     url = f"https://finance.sina.com.cn/staticdata/us/{symbol}"
     res = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(zh_js_decode)
+    js_code = get_js_context(zh_js_decode)
     dict_list = js_code.call("d", res.text.split("=")[1].split(";")[0].replace('"', ""))
     data_df = pd.DataFrame(dict_list)
     data_df["date"] = pd.to_datetime(data_df["date"]).dt.date
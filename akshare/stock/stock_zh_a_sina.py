@@ -1,16 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2026/1/9 22:00
+Date: 2026/10/15 18:00
 Desc: 新浪财经-A股-实时行情数据和历史行情数据(包含前复权和后复权因子)
 https://finance.sina.com.cn/realstock/company/sh689009/nc.shtml
 """
 
 import json
 import re
+from typing import Iterator, Tuple
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.stock.cons import (
@@ -18,13 +18,13 @@ from akshare.stock.cons import (
     zh_sina_a_stock_url,
     zh_sina_a_stock_count_url,
     zh_sina_a_stock_hist_url,
-    hk_js_decode,
     zh_sina_a_stock_hfq_url,
     zh_sina_a_stock_qfq_url,
     zh_sina_a_stock_amount_url,
 )
-from akshare.utils import demjson
+from akshare.utils import js_literal
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.sina_decode import sina_kline_decode
 
 
 def _get_zh_a_page_count() -> int:
@@ -42,70 +42,50 @@ def _get_zh_a_page_count() -> int:
         return int(page_count) + 1
 
 
-def stock_zh_a_spot() -> pd.DataFrame:
+def stock_zh_a_spot_iter(start_page: int = 1) -> Iterator[Tuple[int, pd.DataFrame]]:
     """
-    新浪财经-所有 A 股的实时行情数据; 重复运行本函数会被新浪暂时封 IP
+    新浪财经-所有 A 股的实时行情数据-逐页返回; 重复运行本函数会被新浪暂时封 IP
     https://vip.stock.finance.sina.com.cn/mkt/#hs_a
-    :return: 所有股票的实时行情数据
-    :rtype: pandas.DataFrame
+    :param start_page: 起始页码, 中断后可从最后收到的页码加 1 继续获取
+    :type start_page: int
+    :return: (页码, 该页股票的实时行情数据), 每页 80 只股票
+    :rtype: generator
     """
-    big_df = pd.DataFrame()
     page_count = _get_zh_a_page_count()
     zh_sina_stock_payload_copy = zh_sina_a_stock_payload.copy()
     tqdm = get_tqdm()
     for page in tqdm(
-        range(1, page_count + 1), leave=False, desc="Please wait for a moment"
+        range(start_page, page_count + 1), leave=False, desc="Please wait for a moment"
     ):
         zh_sina_stock_payload_copy.update({"page": page})
         r = requests.get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(r.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
-
-    big_df = big_df.astype(
-        {
-            "trade": "float",
-            "pricechange": "float",
-            "changepercent": "float",
-            "buy": "float",
-            "sell": "float",
-            "settlement": "float",
-            "open": "float",
-            "high": "float",
-            "low": "float",
-            "volume": "float",
-            "amount": "float",
-            "per": "float",
-            "pb": "float",
-            "mktcap": "float",
-            "nmc": "float",
-            "turnoverratio": "float",
-        }
-    )
-    big_df.columns = [
-        "代码",
-        "_",
-        "名称",
-        "最新价",
-        "涨跌额",
-        "涨跌幅",
-        "买入",
-        "卖出",
-        "昨收",
-        "今开",
-        "最高",
-        "最低",
-        "成交量",
-        "成交额",
-        "时间戳",
-        "_",
-        "_",
-        "_",
-        "_",
-        "_",
-    ]
-    big_df = big_df[
-        [
+        data_json = js_literal.loads(r.text)
+        temp_df = pd.DataFrame(data_json)
+        if temp_df.empty:
+            continue
+        temp_df = temp_df.astype(
+            {
+                "trade": "float",
+                "pricechange": "float",
+                "changepercent": "float",
+                "buy": "float",
+                "sell": "float",
+                "settlement": "float",
+                "open": "float",
+                "high": "float",
+                "low": "float",
+                "volume": "float",
+                "amount": "float",
+                "per": "float",
+                "pb": "float",
+                "mktcap": "float",
+                "nmc": "float",
+                "turnoverratio": "float",
+            }
+        )
+        temp_df.columns = [
             "代码",
+            "_",
             "名称",
             "最新价",
             "涨跌额",
@@ -119,8 +99,44 @@ def stock_zh_a_spot() -> pd.DataFrame:
             "成交量",
             "成交额",
             "时间戳",
+            "_",
+            "_",
+            "_",
+            "_",
+            "_",
         ]
-    ]
+        temp_df = temp_df[
+            [
+                "代码",
+                "名称",
+                "最新价",
+                "涨跌额",
+                "涨跌幅",
+                "买入",
+                "卖出",
+                "昨收",
+                "今开",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "时间戳",
+            ]
+        ]
+        yield page, temp_df
+
+
+def stock_zh_a_spot() -> pd.DataFrame:
+    """
+    新浪财经-所有 A 股的实时行情数据; 重复运行本函数会被新浪暂时封 IP
+    https://vip.stock.finance.sina.com.cn/mkt/#hs_a
+    :return: 所有股票的实时行情数据
+    :rtype: pandas.DataFrame
+    """
+    frames = [temp_df for _, temp_df in stock_zh_a_spot_iter()]
+    if not frames:
+        return pd.DataFrame()
+    big_df = pd.concat(frames, ignore_index=True)
     return big_df
 
 
@@ -175,11 +191,9 @@ def stock_zh_a_daily(
         return _fq_factor(adjust.split("-")[0])
 
     r = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
+    dict_list = sina_kline_decode(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
+    )  # 解密数据
     data_df = pd.DataFrame(dict_list)
     data_df.index = pd.to_datetime(data_df["date"]).dt.date
     del data_df["date"]
@@ -194,7 +208,9 @@ def stock_zh_a_daily(
         pass
     data_df = data_df.astype("float")
     r = requests.get(zh_sina_a_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    amount_data_json = js_literal.loads(
+        r.text[r.text.find("[") : r.text.rfind("]") + 1]
+    )
     amount_data_df = pd.DataFrame(amount_data_json)
     amount_data_df.columns = ["date", "outstanding_share"]
     amount_data_df.index = pd.to_datetime(amount_data_df.date)
@@ -345,11 +361,9 @@ def stock_zh_a_cdr_daily(
     :rtype: pandas.DataFrame
     """
     res = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
+    dict_list = sina_kline_decode(
+        res.text.split("=")[1].split(";")[0].replace('"', "")
+    )  # 解密数据
     data_df = pd.DataFrame(dict_list)
     data_df.index = pd.to_datetime(data_df["date"])
     del data_df["date"]
@@ -1,30 +1,39 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/10/27 22:08
+Date: 2026/10/15 18:00
 Desc: 腾讯-股票-实时行情-成交明细
 成交明细-每个交易日 16:00 提供当日数据
 港股报价延时 15 分钟
 """
 
 import warnings
+from typing import Iterator, Tuple
 
 import pandas as pd
 import requests
 
 
-def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
+def stock_zh_a_tick_tx_js_iter(
+    symbol: str = "sz000001", start_page: int = 0
+) -> Iterator[Tuple[int, pd.DataFrame]]:
     """
-    腾讯财经-历史分笔数据
+    腾讯财经-历史分笔数据-逐页返回
     https://gu.qq.com/sz300494/gp/detail
     :param symbol: 股票代码
     :type symbol: str
-    :return: 历史分笔数据
-    :rtype: pandas.DataFrame
+    :param start_page: 起始页码, 从 0 开始; 中断后可从最后收到的页码加 1 继续获取
+    :type start_page: int
+    :return: (页码, 该页的历史分笔数据)
+    :rtype: generator
     """
-    big_df = pd.DataFrame()
-    page = 0
+    page = start_page
     warnings.warn("正在下载数据，请稍等")
+    property_map = {
+        "S": "卖盘",
+        "B": "买盘",
+        "M": "中性盘",
+    }
     while True:
         try:
             url = "http://stock.gtimg.cn/data/index.php"
@@ -41,13 +50,10 @@ def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
                 .iloc[:, 0]
                 .str.split("/", expand=True)
             )
-            page += 1
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
         except:  # noqa: E722
             break
-    if not big_df.empty:
-        big_df = big_df.iloc[:, 1:].copy()
-        big_df.columns = [
+        temp_df = temp_df.iloc[:, 1:].copy()
+        temp_df.columns = [
             "成交时间",
             "成交价格",
             "价格变动",
@@ -55,14 +61,8 @@ def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
             "成交金额",
             "性质",
         ]
-        big_df.reset_index(drop=True, inplace=True)
-        property_map = {
-            "S": "卖盘",
-            "B": "买盘",
-            "M": "中性盘",
-        }
-        big_df["性质"] = big_df["性质"].map(property_map)
-        big_df = big_df.astype(
+        temp_df["性质"] = temp_df["性质"].map(property_map)
+        temp_df = temp_df.astype(
             {
                 "成交时间": str,
                 "成交价格": float,
@@ -72,6 +72,23 @@ def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
                 "性质": str,
             }
         )
+        yield page, temp_df
+        page += 1
+
+
+def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
+    """
+    腾讯财经-历史分笔数据
+    https://gu.qq.com/sz300494/gp/detail
+    :param symbol: 股票代码
+    :type symbol: str
+    :return: 历史分笔数据
+    :rtype: pandas.DataFrame
+    """
+    frames = [temp_df for _, temp_df in stock_zh_a_tick_tx_js_iter(symbol=symbol)]
+    if not frames:
+        return pd.DataFrame()
+    big_df = pd.concat(frames, ignore_index=True)
     return big_df
 
 
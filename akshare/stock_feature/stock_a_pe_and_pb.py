@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/20 20:00
+Date: 2026/10/15 18:00
 Desc: 乐咕乐股-A 股市盈率和市净率
 https://legulegu.com/stockdata/shanghaiPE
 """
@@ -9,10 +9,10 @@ https://legulegu.com/stockdata/shanghaiPE
 from datetime import datetime
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.stock_feature.stock_a_indicator import get_cookie_csrf
+from akshare.utils.js_pool import get_js_context
 
 hash_code = """
 function e(n) {
@@ -328,8 +328,7 @@ def stock_market_pe_lg(symbol: str = "深证") -> pd.DataFrame:
     :return: 指定市场的市盈率数据
     :rtype: pandas.DataFrame
     """
-    js_functions = py_mini_racer.MiniRacer()
-    js_functions.eval(hash_code)
+    js_functions = get_js_context(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
     if symbol in {"上证", "深证", "创业板"}:
         url = "https://legulegu.com/api/stock-data/market-pe"
@@ -404,8 +403,7 @@ def stock_index_pe_lg(symbol: str = "沪深300") -> pd.DataFrame:
     :return: 指定指数的市盈率数据
     :rtype: pandas.DataFrame
     """
-    js_functions = py_mini_racer.MiniRacer()
-    js_functions.eval(hash_code)
+    js_functions = get_js_context(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
     symbol_map = {
         "上证50": "000016.SH",
@@ -469,8 +467,7 @@ def stock_market_pb_lg(symbol: str = "上证") -> pd.DataFrame:
     :return: 指定市场的市净率数据
     :rtype: pandas.DataFrame
     """
-    js_functions = py_mini_racer.MiniRacer()
-    js_functions.eval(hash_code)
+    js_functions = get_js_context(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
     url = "https://legulegu.com/api/stockdata/index-basic-pb"
     symbol_map = {"上证": "1", "深证": "2", "创业板": "4", "科创版": "7"}
@@ -517,8 +514,7 @@ def stock_index_pb_lg(symbol: str = "上证50") -> pd.DataFrame:
     :return: 指定指数的市净率数据
     :rtype: pandas.DataFrame
     """
-    js_functions = py_mini_racer.MiniRacer()
-    js_functions.eval(hash_code)
+    js_functions = get_js_context(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
     symbol_map = {
         "上证50": "000016.SH",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/27 14:20
+Date: 2026/10/15 18:00
 Desc: 同花顺-板块-概念板块
 https://q.10jqka.com.cn/thshy/
 """
@@ -14,10 +14,10 @@ from io import StringIO
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
-from akshare.utils import demjson
+from akshare.utils import js_literal
+from akshare.utils.js_pool import get_js_context
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -42,9 +42,8 @@ def _get_stock_board_concept_name_ths() -> dict:
     :return: 获取同花顺概念板块代码和名称字典
     :rtype: dict
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -138,9 +137,8 @@ def stock_board_concept_index_ths(
     :return: 指数数据
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
 
     code_map = _get_stock_board_concept_name_ths()
@@ -170,10 +168,10 @@ def stock_board_concept_index_ths(
         data_text = r.text
 
         try:
-            demjson.decode(data_text[data_text.find("{") : -1])
+            js_literal.loads(data_text[data_text.find("{") : -1])
         except:  # noqa: E722
             continue
-        temp_df = demjson.decode(data_text[data_text.find("{") : -1])
+        temp_df = js_literal.loads(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(temp_df["data"].split(";"))
         temp_df = temp_df.iloc[:, 0].str.split(",", expand=True)
         big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
@@ -239,9 +237,8 @@ def __stock_board_concept_summary_ths() -> Dict:
     :return: 概念时间表
     :rtype: dict
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -277,9 +274,8 @@ def stock_board_concept_summary_ths() -> pd.DataFrame:
     :return: 概念时间表
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/2/28 13:20
+Date: 2026/10/15 18:00
 Desc: 同花顺-板块-同花顺行业
 https://q.10jqka.com.cn/thshy/
 """
@@ -13,10 +13,10 @@ from io import StringIO
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
-from akshare.utils import demjson
+from akshare.utils import js_literal
+from akshare.utils.js_pool import get_js_context
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -41,9 +41,8 @@ def _get_stock_board_industry_name_ths() -> dict:
     :return: 获取同花顺行业代码和名称字典
     :rtype: dict
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -141,9 +140,8 @@ def stock_board_industry_index_ths(
     current_year = datetime.now().year
     begin_year = int(start_date[:4])
     tqdm = get_tqdm()
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     for year in tqdm(range(begin_year, current_year + 1), leave=False):
         url = f"https://d.10jqka.com.cn/v4/line/bk_{symbol_code}/01/{year}.js"
@@ -158,10 +156,10 @@ def stock_board_industry_index_ths(
         data_text = r.text
 
         try:
-            demjson.decode(data_text[data_text.find("{") : -1])
+            js_literal.loads(data_text[data_text.find("{") : -1])
         except:  # noqa: E722
             continue
-        temp_df = demjson.decode(data_text[data_text.find("{") : -1])
+        temp_df = js_literal.loads(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(temp_df["data"].split(";"))
         temp_df = temp_df.iloc[:, 0].str.split(",", expand=True)
         big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
@@ -226,9 +224,8 @@ def stock_xgsr_ths() -> pd.DataFrame:
     :return: 新股上市首日
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -278,9 +275,8 @@ def stock_ipo_benefit_ths() -> pd.DataFrame:
     :return: IPO受益股
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -335,9 +331,8 @@ def stock_board_industry_summary_ths() -> pd.DataFrame:
     :return: 同花顺行业一览表
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
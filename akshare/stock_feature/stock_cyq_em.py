@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/11/4 18:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-概念板-行情中心-日K-筹码分布
 https://quote.eastmoney.com/concept/sz000001.html
 """
@@ -9,9 +9,11 @@ https://quote.eastmoney.com/concept/sz000001.html
 from datetime import datetime
 
 import pandas as pd
-import py_mini_racer
 import requests
 
+from akshare.utils.js_pool import get_js_context
+from akshare.utils.kline import parse_klines
+
 
 def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
     """
@@ -216,8 +218,7 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
         return array;
     }
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(html_str)
+    js_code = get_js_context(html_str)
     adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
     market_code = 1 if symbol.startswith("6") else 0
     url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
@@ -232,22 +233,23 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
-    temp_df.columns = [
-        "date",
-        "open",
-        "close",
-        "high",
-        "low",
-        "volume",
-        "volume_money",
-        "zf",
-        "zdf",
-        "zde",
-        "hsl",
-    ]
-    for item in temp_df.columns[1:]:
-        temp_df[item] = pd.to_numeric(temp_df[item])
+    temp_df = parse_klines(
+        data_json["data"]["klines"],
+        columns=[
+            "date",
+            "open",
+            "close",
+            "high",
+            "low",
+            "volume",
+            "volume_money",
+            "zf",
+            "zdf",
+            "zde",
+            "hsl",
+        ],
+        text_columns=("date",),
+    )
     temp_df["index"] = range(0, len(temp_df))
     records = temp_df.to_dict(orient="records")
     date_list = []
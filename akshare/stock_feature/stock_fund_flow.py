@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/8/15 18:00
+Date: 2026/10/15 18:00
 Desc: 同花顺-数据中心-资金流向
 同花顺-数据中心-资金流向-个股资金流
 https://data.10jqka.com.cn/funds/ggzjl/#refCountId=data_55f13c2c_254
@@ -18,10 +18,10 @@ from io import StringIO
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import py_mini_racer
 from akshare.utils.tqdm import get_tqdm
 
 from akshare.datasets import get_ths_js
+from akshare.utils.js_pool import get_js_context
 
 
 def _get_file_content_ths(file: str = "ths.js") -> str:
@@ -47,9 +47,8 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
     :return: 个股资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "Accept": "text/html, */*; q=0.01",
@@ -83,9 +82,8 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
     big_df = pd.DataFrame()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
         js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
+        js_code = get_js_context(js_content)
         v_code = js_code.call("v")
         headers = {
             "Accept": "text/html, */*; q=0.01",
@@ -143,9 +141,8 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
     :return: 概念资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "Accept": "text/html, */*; q=0.01",
@@ -181,9 +178,8 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
     big_df = pd.DataFrame()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
         js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
+        js_code = get_js_context(js_content)
         v_code = js_code.call("v")
         headers = {
             "Accept": "text/html, */*; q=0.01",
@@ -249,9 +245,8 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
     :return: 行业资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "Accept": "text/html, */*; q=0.01",
@@ -287,9 +282,8 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
     big_df = pd.DataFrame()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
         js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
+        js_code = get_js_context(js_content)
         v_code = js_code.call("v")
         headers = {
             "Accept": "text/html, */*; q=0.01",
@@ -353,9 +347,8 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
     :return: 大单追踪
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_context(js_content)
     v_code = js_code.call("v")
     headers = {
         "Accept": "text/html, */*; q=0.01",
@@ -380,9 +373,8 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
     big_df = pd.DataFrame()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
         js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
+        js_code = get_js_context(js_content)
         v_code = js_code.call("v")
         headers = {
             "Accept": "text/html, */*; q=0.01",
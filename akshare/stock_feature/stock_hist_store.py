@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 沪深京 A 股-历史行情-本地增量存储
+首次调用下载全部历史数据并保存到本地, 之后只下载最新的行情并追加
+"""
+
+import numpy as np
+import pandas as pd
+
+from akshare.stock.stock_zh_a_sina import stock_zh_a_daily
+from akshare.stock_feature.stock_hist_em import stock_zh_a_hist
+from akshare.stock_feature.stock_hist_tx import stock_zh_a_hist_tx
+from akshare.utils.store import OHLCVStore
+
+# 数据源: (获取函数, 日期列, 收盘价列)
+_SOURCE_MAP = {
+    "em": (stock_zh_a_hist, "日期", "收盘"),
+    "tx": (stock_zh_a_hist_tx, "date", "close"),
+    "sina": (stock_zh_a_daily, "date", "close"),
+}
+
+
+def _fetch_hist(
+    source: str, symbol: str, period: str, adjust: str, start_date: str = None
+) -> pd.DataFrame:
+    """
+    调用对应数据源的历史行情接口, start_date 为 None 时下载全部历史
+    """
+    func = _SOURCE_MAP[source][0]
+    kwargs = {"symbol": symbol, "adjust": adjust}
+    if source == "em":
+        kwargs["period"] = period
+    if start_date is not None:
+        kwargs["start_date"] = start_date
+    return func(**kwargs)
+
+
+def stock_zh_a_hist_store(
+    symbol: str = "000001",
+    source: str = "em",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+    store_dir: str = None,
+) -> pd.DataFrame:
+    """
+    沪深京 A 股-历史行情-本地增量存储
+    本地已有数据时, 从倒数第二根 K 线开始下载并覆盖最后一根 K 线; 若倒数第二根 K 线的收盘价
+    与本地不一致, 说明复权因子已变化, 此时重新下载该股票的全部历史数据
+    :param symbol: 股票代码, 与对应数据源接口的格式一致, em 为 000001, tx 和 sina 为 sz000001
+    :type symbol: str
+    :param source: choice of {"em": "stock_zh_a_hist", "tx": "stock_zh_a_hist_tx", "sina": "stock_zh_a_daily"}
+    :type source: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}; 仅 em 数据源支持 weekly 和 monthly
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param store_dir: 本地存储目录, 默认为缓存目录下的 ohlcv 文件夹
+    :type store_dir: str
+    :return: 历史行情
+    :rtype: pandas.DataFrame
+    """
+    if source not in _SOURCE_MAP:
+        raise ValueError(f"source 参数仅支持 {list(_SOURCE_MAP.keys())}")
+    if source != "em" and period != "daily":
+        raise ValueError(f"{source} 数据源仅支持 daily 周期")
+    if adjust not in ("", "qfq", "hfq"):
+        # sina 的 qfq-factor 和 hfq-factor 返回的是复权因子, 没有收盘价, 不能增量更新
+        raise ValueError('adjust 参数仅支持 "qfq", "hfq" 和 ""')
+    _, date_col, close_col = _SOURCE_MAP[source]
+    store = OHLCVStore(root=store_dir)
+    stored_df = store.read(source, symbol, period, adjust)
+    if stored_df is None or stored_df.shape[0] < 2:
+        big_df = _fetch_hist(source, symbol, period, adjust)
+    else:
+        stored_dates = pd.to_datetime(stored_df[date_col])
+        check_date = stored_dates.iloc[-2]
+        last_date = stored_dates.iloc[-1]
+        new_df = _fetch_hist(
+            source, symbol, period, adjust, start_date=check_date.strftime("%Y%m%d")
+        )
+        if new_df.empty:
+            big_df = stored_df
+        else:
+            new_dates = pd.to_datetime(new_df[date_col])
+            fresh_close = new_df.loc[(new_dates == check_date).values, close_col]
+            if fresh_close.empty or not np.isclose(
+                fresh_close.iloc[0], stored_df[close_col].iloc[-2]
+            ):
+                # 复权因子变化, 重新下载全部历史
+                big_df = _fetch_hist(source, symbol, period, adjust)
+            else:
+                big_df = pd.concat(
+                    [
+                        stored_df[(stored_dates < last_date).values],
+                        new_df[(new_dates >= last_date).values],
+                    ],
+                    ignore_index=True,
+                )
+    if big_df.empty:
+        return big_df
+    if big_df is not stored_df:
+        store.write(big_df, source, symbol, period, adjust)
+    dates = pd.to_datetime(big_df[date_col])
+    mask = (dates >= pd.to_datetime(start_date)) & (dates <= pd.to_datetime(end_date))
+    return big_df[mask.values].reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    stock_zh_a_hist_store_df = stock_zh_a_hist_store(
+        symbol="000001",
+        source="em",
+        period="daily",
+        start_date="20240101",
+        end_date="20501231",
+        adjust="qfq",
+    )
+    print(stock_zh_a_hist_store_df)
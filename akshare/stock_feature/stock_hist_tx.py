@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/10/15 22:30
+Date: 2026/10/15 18:00
 Desc: 腾讯证券-行情首页-沪深京A股
 https://quote.eastmoney.com/
 """
@@ -12,7 +12,7 @@ import pandas as pd
 import requests
 
 from akshare.index.index_stock_zh import get_tx_start_year
-from akshare.utils import demjson
+from akshare.utils import js_literal
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -58,7 +58,7 @@ def stock_zh_a_hist_tx(
         }
         r = requests.get(url, params=params, timeout=timeout)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][
+        data_json = js_literal.loads(data_text[data_text.find("={") + 1 :])["data"][
             symbol
         ]
         if "day" in data_json.keys():
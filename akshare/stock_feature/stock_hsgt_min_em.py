@@ -1,7 +1,7 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/2/5 18:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-数据中心-沪深港通-市场概括
 https://data.eastmoney.com/hsgt/hsgtDetail/scgk.html
 """
@@ -9,6 +9,8 @@ https://data.eastmoney.com/hsgt/hsgtDetail/scgk.html
 import pandas as pd
 import requests
 
+from akshare.utils.kline import parse_klines
+
 
 def stock_hsgt_fund_min_em(symbol: str = "北向资金") -> pd.DataFrame:
     """
@@ -31,27 +33,25 @@ def stock_hsgt_fund_min_em(symbol: str = "北向资金") -> pd.DataFrame:
 
     if symbol == "南向资金":
         n2s_str_list = data_json["data"]["n2s"]
-        temp_df = pd.DataFrame([item.split(",") for item in n2s_str_list])
-        temp_df["date"] = data_json["data"]["n2sDate"]
-        temp_df = temp_df.iloc[:, [0, 1, 3, 5, -1]]
-        temp_df.columns = ["时间", "港股通(沪)", "港股通(深)", "南向资金", "日期"]
+        temp_df = parse_klines(
+            n2s_str_list,
+            columns=["时间", "港股通(沪)", None, "港股通(深)", None, "南向资金"],
+            text_columns=("时间",),
+        )
+        temp_df["日期"] = data_json["data"]["n2sDate"]
         temp_df = temp_df[["日期", "时间", "港股通(沪)", "港股通(深)", "南向资金"]]
         temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-        temp_df["港股通(沪)"] = pd.to_numeric(temp_df["港股通(沪)"], errors="coerce")
-        temp_df["港股通(深)"] = pd.to_numeric(temp_df["港股通(深)"], errors="coerce")
-        temp_df["南向资金"] = pd.to_numeric(temp_df["南向资金"], errors="coerce")
         return temp_df
     else:
         s2n_str_list = data_json["data"]["s2n"]
-        temp_df = pd.DataFrame([item.split(",") for item in s2n_str_list])
-        temp_df["date"] = data_json["data"]["s2nDate"]
-        temp_df = temp_df.iloc[:, [0, 1, 3, 5, -1]]
-        temp_df.columns = ["时间", "沪股通", "深股通", "北向资金", "日期"]
+        temp_df = parse_klines(
+            s2n_str_list,
+            columns=["时间", "沪股通", None, "深股通", None, "北向资金"],
+            text_columns=("时间",),
+        )
+        temp_df["日期"] = data_json["data"]["s2nDate"]
         temp_df = temp_df[["日期", "时间", "沪股通", "深股通", "北向资金"]]
         temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-        temp_df["沪股通"] = pd.to_numeric(temp_df["沪股通"], errors="coerce")
-        temp_df["深股通"] = pd.to_numeric(temp_df["深股通"], errors="coerce")
-        temp_df["北向资金"] = pd.to_numeric(temp_df["北向资金"], errors="coerce")
         return temp_df
 
 
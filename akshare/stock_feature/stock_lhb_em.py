@@ -1,15 +1,44 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/4/22 14:00
+Date: 2026/10/15 18:00
 Desc: 东方财富网-数据中心-龙虎榜单
 https://data.eastmoney.com/stock/tradedetail.html
 """
 
+from typing import Iterator, Tuple
+
 import pandas as pd
 import requests
+
+from akshare.utils.em_datacenter import DatacenterClient
 from akshare.utils.tqdm import get_tqdm
 
+LHB_DETAIL_PAGE_SIZE = 5000
+LHB_YYB_DETAIL_PAGE_SIZE = 100
+
+
+def _stock_lhb_detail_em_client(start_date: str, end_date: str) -> DatacenterClient:
+    """
+    东方财富网-数据中心-龙虎榜单-龙虎榜详情-分页查询
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :return: 数据中心分页查询
+    :rtype: akshare.utils.em_datacenter.DatacenterClient
+    """
+    start_date = "-".join([start_date[:4], start_date[4:6], start_date[6:]])
+    end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
+    return DatacenterClient(
+        report_name="RPT_DAILYBILLBOARD_DETAILSNEW",
+        filter=f"(TRADE_DATE<='{end_date}')(TRADE_DATE>='{start_date}')",
+        sort_columns="SECURITY_CODE,TRADE_DATE",
+        sort_types="1,-1",
+        page_size=LHB_DETAIL_PAGE_SIZE,
+        params={"source": "WEB", "client": "WEB"},
+    )
+
 
 def stock_lhb_detail_em(
     start_date: str = "20230403", end_date: str = "20230417"
@@ -24,116 +53,36 @@ def stock_lhb_detail_em(
     :return: 龙虎榜详情
     :rtype: pandas.DataFrame
     """
-    start_date = "-".join([start_date[:4], start_date[4:6], start_date[6:]])
-    end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    params = {
-        "sortColumns": "SECURITY_CODE,TRADE_DATE",
-        "sortTypes": "1,-1",
-        "pageSize": "5000",
-        "pageNumber": "1",
-        "reportName": "RPT_DAILYBILLBOARD_DETAILSNEW",
-        "columns": "SECURITY_CODE,SECUCODE,SECURITY_NAME_ABBR,TRADE_DATE,EXPLAIN,CLOSE_PRICE,CHANGE_RATE,"
-        "BILLBOARD_NET_AMT,BILLBOARD_BUY_AMT,BILLBOARD_SELL_AMT,BILLBOARD_DEAL_AMT,ACCUM_AMOUNT,"
-        "DEAL_NET_RATIO,DEAL_AMOUNT_RATIO,TURNOVERRATE,FREE_MARKET_CAP,EXPLANATION,D1_CLOSE_ADJCHRATE,"
-        "D2_CLOSE_ADJCHRATE,D5_CLOSE_ADJCHRATE,D10_CLOSE_ADJCHRATE,SECURITY_TYPE_CODE",
-        "source": "WEB",
-        "client": "WEB",
-        "filter": f"(TRADE_DATE<='{end_date}')(TRADE_DATE>='{start_date}')",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page_num + 1), leave=False):
-        params.update(
-            {
-                "pageNumber": page,
-            }
-        )
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.rename(
-        columns={
-            "index": "序号",
-            "SECURITY_CODE": "代码",
-            "SECUCODE": "-",
-            "SECURITY_NAME_ABBR": "名称",
-            "TRADE_DATE": "上榜日",
-            "EXPLAIN": "解读",
-            "CLOSE_PRICE": "收盘价",
-            "CHANGE_RATE": "涨跌幅",
-            "BILLBOARD_NET_AMT": "龙虎榜净买额",
-            "BILLBOARD_BUY_AMT": "龙虎榜买入额",
-            "BILLBOARD_SELL_AMT": "龙虎榜卖出额",
-            "BILLBOARD_DEAL_AMT": "龙虎榜成交额",
-            "ACCUM_AMOUNT": "市场总成交额",
-            "DEAL_NET_RATIO": "净买额占总成交比",
-            "DEAL_AMOUNT_RATIO": "成交额占总成交比",
-            "TURNOVERRATE": "换手率",
-            "FREE_MARKET_CAP": "流通市值",
-            "EXPLANATION": "上榜原因",
-            "D1_CLOSE_ADJCHRATE": "上榜后1日",
-            "D2_CLOSE_ADJCHRATE": "上榜后2日",
-            "D5_CLOSE_ADJCHRATE": "上榜后5日",
-            "D10_CLOSE_ADJCHRATE": "上榜后10日",
-        },
-        inplace=True,
-    )
-
-    big_df = big_df[
-        [
-            "序号",
-            "代码",
-            "名称",
-            "上榜日",
-            "解读",
-            "收盘价",
-            "涨跌幅",
-            "龙虎榜净买额",
-            "龙虎榜买入额",
-            "龙虎榜卖出额",
-            "龙虎榜成交额",
-            "市场总成交额",
-            "净买额占总成交比",
-            "成交额占总成交比",
-            "换手率",
-            "流通市值",
-            "上榜原因",
-            "上榜后1日",
-            "上榜后2日",
-            "上榜后5日",
-            "上榜后10日",
-        ]
-    ]
-    big_df["上榜日"] = pd.to_datetime(big_df["上榜日"], errors="coerce").dt.date
-    big_df["收盘价"] = pd.to_numeric(big_df["收盘价"], errors="coerce")
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"], errors="coerce")
-    big_df["龙虎榜净买额"] = pd.to_numeric(big_df["龙虎榜净买额"], errors="coerce")
-    big_df["龙虎榜买入额"] = pd.to_numeric(big_df["龙虎榜买入额"], errors="coerce")
-    big_df["龙虎榜卖出额"] = pd.to_numeric(big_df["龙虎榜卖出额"], errors="coerce")
-    big_df["龙虎榜成交额"] = pd.to_numeric(big_df["龙虎榜成交额"], errors="coerce")
-    big_df["市场总成交额"] = pd.to_numeric(big_df["市场总成交额"], errors="coerce")
-    big_df["净买额占总成交比"] = pd.to_numeric(
-        big_df["净买额占总成交比"], errors="coerce"
-    )
-    big_df["成交额占总成交比"] = pd.to_numeric(
-        big_df["成交额占总成交比"], errors="coerce"
-    )
-    big_df["换手率"] = pd.to_numeric(big_df["换手率"], errors="coerce")
-    big_df["流通市值"] = pd.to_numeric(big_df["流通市值"], errors="coerce")
-    big_df["上榜后1日"] = pd.to_numeric(big_df["上榜后1日"], errors="coerce")
-    big_df["上榜后2日"] = pd.to_numeric(big_df["上榜后2日"], errors="coerce")
-    big_df["上榜后5日"] = pd.to_numeric(big_df["上榜后5日"], errors="coerce")
-    big_df["上榜后10日"] = pd.to_numeric(big_df["上榜后10日"], errors="coerce")
+    big_df = _stock_lhb_detail_em_client(start_date, end_date).fetch()
+    if big_df.empty:
+        return big_df
+    big_df.insert(0, "序号", range(1, len(big_df) + 1))
     return big_df
 
 
+def stock_lhb_detail_em_iter(
+    start_date: str = "20230403", end_date: str = "20230417", start_page: int = 1
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    东方财富网-数据中心-龙虎榜单-龙虎榜详情-逐页返回
+    https://data.eastmoney.com/stock/tradedetail.html
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param start_page: 起始页码, 中断后可从最后收到的页码加 1 继续获取
+    :type start_page: int
+    :return: (页码, 该页的龙虎榜详情), 字段与 stock_lhb_detail_em 一致
+    :rtype: generator
+    """
+    client = _stock_lhb_detail_em_client(start_date, end_date)
+    frames = client.iter_frames(start_page=start_page)
+    for page, temp_df in enumerate(frames, start_page):
+        offset = (page - 1) * LHB_DETAIL_PAGE_SIZE
+        temp_df.insert(0, "序号", range(offset + 1, offset + len(temp_df) + 1))
+        yield page, temp_df
+
+
 def stock_lhb_stock_statistic_em(symbol: str = "近一月") -> pd.DataFrame:
     """
     东方财富网-数据中心-龙虎榜单-个股上榜统计
@@ -901,43 +850,14 @@ def stock_lhb_stock_detail_em(
     return temp_df
 
 
-def stock_lhb_yyb_detail_em(symbol: str = "10188715") -> pd.DataFrame:
+def _stock_lhb_yyb_detail_em_format(temp_df: pd.DataFrame) -> pd.DataFrame:
     """
-    东方财富网-数据中心-龙虎榜单-营业部历史交易明细-营业部交易明细
-    https://data.eastmoney.com/stock/lhb/yyb/10188715.html
-    :param symbol: 营业部代码, 如 "10188715", 通过 ak.stock_lhb_hyyyb_em() 接口获取
-    :type symbol: str
-    :return: 营业部交易明细数据
+    东方财富网-数据中心-龙虎榜单-营业部历史交易明细-营业部交易明细-整理单页数据
+    :param temp_df: 接口返回的单页数据
+    :type temp_df: pandas.DataFrame
+    :return: 重命名并转换类型后的数据, 不含序号列
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    params = {
-        "sortColumns": "TRADE_DATE,SECURITY_CODE",
-        "sortTypes": "-1,1",
-        "pageSize": "100",
-        "pageNumber": "1",
-        "reportName": "RPT_OPERATEDEPT_TRADE_DETAILSNEW",
-        "columns": "ALL",
-        "source": "WEB",
-        "client": "WEB",
-        "filter": f'(OPERATEDEPT_CODE="{symbol}")',
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    # 检查DataFrame是否为空
-    if big_df.empty:
-        return pd.DataFrame()
-
     # 确保列名与实际返回的JSON数据结构一致
     column_map = {
         "OPERATEDEPT_CODE": "营业部代码",
@@ -963,15 +883,10 @@ def stock_lhb_yyb_detail_em(symbol: str = "10188715") -> pd.DataFrame:
     }
 
     # 重命名列
-    big_df.rename(columns=column_map, inplace=True)
-
-    # 添加序号列
-    big_df.reset_index(inplace=True)
-    big_df["序号"] = big_df.index + 1
+    temp_df = temp_df.rename(columns=column_map)
 
     # 选择需要的列并排序
     result_columns = [
-        "序号",
         "营业部代码",
         "营业部名称",
         "营业部简称",
@@ -994,13 +909,13 @@ def stock_lhb_yyb_detail_em(symbol: str = "10188715") -> pd.DataFrame:
 
     # 确保所有列都存在
     for col in result_columns:
-        if col not in big_df.columns and col != "序号":
-            big_df[col] = None
+        if col not in temp_df.columns:
+            temp_df[col] = None
 
-    big_df = big_df[result_columns]
+    temp_df = temp_df[result_columns]
 
     # 处理日期格式
-    big_df["交易日期"] = pd.to_datetime(big_df["交易日期"], errors="coerce").dt.date
+    temp_df["交易日期"] = pd.to_datetime(temp_df["交易日期"], errors="coerce").dt.date
 
     # 处理数值列
     numeric_cols = [
@@ -1017,8 +932,59 @@ def stock_lhb_yyb_detail_em(symbol: str = "10188715") -> pd.DataFrame:
         "30日后涨跌幅",
     ]
     for col in numeric_cols:
-        big_df[col] = pd.to_numeric(big_df[col], errors="coerce")
+        temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
+
+    return temp_df
+
+
+def stock_lhb_yyb_detail_em_iter(
+    symbol: str = "10188715", start_page: int = 1
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    东方财富网-数据中心-龙虎榜单-营业部历史交易明细-营业部交易明细-逐页返回
+    https://data.eastmoney.com/stock/lhb/yyb/10188715.html
+    :param symbol: 营业部代码, 如 "10188715", 通过 ak.stock_lhb_hyyyb_em() 接口获取
+    :type symbol: str
+    :param start_page: 起始页码, 中断后可从最后收到的页码加 1 继续获取
+    :type start_page: int
+    :return: (页码, 该页的营业部交易明细), 字段与 stock_lhb_yyb_detail_em 一致;
+    序号按实际收到的行数连续编号, 续传时假定之前的页面都是满页
+    :rtype: generator
+    """
+    client = DatacenterClient(
+        report_name="RPT_OPERATEDEPT_TRADE_DETAILSNEW",
+        filter=f'(OPERATEDEPT_CODE="{symbol}")',
+        columns="ALL",
+        sort_columns="TRADE_DATE,SECURITY_CODE",
+        sort_types="-1,1",
+        page_size=LHB_YYB_DETAIL_PAGE_SIZE,
+        params={"source": "WEB", "client": "WEB"},
+    )
+    offset = (start_page - 1) * LHB_YYB_DETAIL_PAGE_SIZE
+    frames = client.iter_frames(start_page=start_page)
+    for page, temp_df in enumerate(frames, start_page):
+        if temp_df.empty:
+            continue
+        temp_df = _stock_lhb_yyb_detail_em_format(temp_df)
+        temp_df.insert(0, "序号", range(offset + 1, offset + len(temp_df) + 1))
+        offset += len(temp_df)
+        yield page, temp_df
+
 
+def stock_lhb_yyb_detail_em(symbol: str = "10188715") -> pd.DataFrame:
+    """
+    东方财富网-数据中心-龙虎榜单-营业部历史交易明细-营业部交易明细
+    https://data.eastmoney.com/stock/lhb/yyb/10188715.html
+    :param symbol: 营业部代码, 如 "10188715", 通过 ak.stock_lhb_hyyyb_em() 接口获取
+    :type symbol: str
+    :return: 营业部交易明细数据
+    :rtype: pandas.DataFrame
+    """
+    frames = [temp_df for _, temp_df in stock_lhb_yyb_detail_em_iter(symbol=symbol)]
+    if not frames:
+        return pd.DataFrame()
+    big_df = pd.concat(frames, ignore_index=True)
+    big_df["序号"] = range(1, len(big_df) + 1)
     return big_df
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/10/2 9:00
+Date: 2026/10/15 18:00
 Desc: 股票基本面数据
 新浪财经-财务报表-财务摘要
 https://vip.stock.finance.sina.com.cn/corp/go.php/vFD_FinanceSummary/stockid/600004.phtml
@@ -18,6 +18,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.html_table import read_html_table
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -258,7 +259,10 @@ def stock_financial_analysis_indicator(
             f"stockid/{symbol}/ctrl/{year_item}/displaytype/4.phtml"
         )
         r = requests.get(url)
-        temp_df = pd.read_html(StringIO(r.text))[12].iloc[:, :-1]
+        # 只解析包含财务指标的表格, 不再转换页面中的全部表格
+        temp_df = read_html_table(
+            r.text, match="每股指标", header=None, na_values=("",), convert=False
+        ).iloc[:, :-1]
         temp_df.columns = temp_df.iloc[0, :]
         temp_df = temp_df.iloc[1:, :]
         big_df = pd.DataFrame()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/2/21 11:00
+Date: 2026/10/15 18:00
 Desc: 新浪财经-股票-机构持股
 https://vip.stock.finance.sina.com.cn/q/go.php/vComStockHold/kind/jgcg/index.phtml
 """
@@ -11,7 +11,7 @@ from io import StringIO
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import js_literal
 
 
 def stock_institute_hold(symbol: str = "20051") -> pd.DataFrame:
@@ -75,7 +75,7 @@ def stock_institute_hold_detail(
     }
     r = requests.get(url, params=params)
     text_data = r.text
-    json_data = demjson.decode(text_data[text_data.find("{") : -2])
+    json_data = js_literal.loads(text_data[text_data.find("{") : -2])
     big_df = pd.DataFrame()
     for item in json_data["data"].keys():
         inner_temp_df = pd.DataFrame(json_data["data"][item]).T.iloc[:-1, :]
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/3/25 16:30
+Date: 2026/10/15 18:00
 Desc: 新浪财经-交易日历
 https://finance.sina.com.cn/realstock/company/klc_td_sh.txt
 此处可以用来更新 calendar.json 文件，注意末尾没有 "," 号
@@ -10,10 +10,9 @@ https://finance.sina.com.cn/realstock/company/klc_td_sh.txt
 import datetime
 
 import pandas as pd
-import requests
-import py_mini_racer
 
-from akshare.stock.cons import hk_js_decode
+from akshare.utils.context import get_session
+from akshare.utils.sina_decode import sina_kline_decode
 
 
 def tool_trade_date_hist_sina() -> pd.DataFrame:
@@ -24,10 +23,8 @@ def tool_trade_date_hist_sina() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://finance.sina.com.cn/realstock/company/klc_td_sh.txt"
-    r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call("d", r.text.split("=")[1].split(";")[0].replace('"', ""))
+    r = get_session(url).get(url)
+    dict_list = sina_kline_decode(r.text.split("=")[1].split(";")[0].replace('"', ""))
     temp_df = pd.DataFrame(dict_list)
     temp_df.columns = ["trade_date"]
     temp_df["trade_date"] = pd.to_datetime(temp_df["trade_date"]).dt.date
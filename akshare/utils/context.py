@@ -1,3 +1,15 @@
+import os
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from akshare.utils.http_cache import default_http_cache
+from akshare.utils.rate_limit import DEFAULT_HOST_LIMITS, HostLimiter, match_host_rule
+
+
 class AkshareConfig:
     _instance = None
 
@@ -5,6 +17,16 @@ class AkshareConfig:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.proxies = None
+            cls._instance.pool_connections = 10
+            cls._instance.pool_maxsize = 32
+            cls._instance.keep_alive = True
+            cls._instance.retry_policies = {}
+            cls._instance.cache_dir = os.path.join(os.path.expanduser("~"), ".akshare")
+            cls._instance.symbol_map_ttl = 86400
+            cls._instance.rate_limits = {
+                host: dict(limit) for host, limit in DEFAULT_HOST_LIMITS.items()
+            }
+            cls._instance.rate_limit_enabled = True
         return cls._instance
 
     @classmethod
@@ -41,3 +63,253 @@ class ProxyContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         config.set_proxies(self.old_proxies)
         return False  # 不处理异常
+
+
+def set_cache_dir(cache_dir: str):
+    """
+    设置本地缓存目录，本地行情存储等数据均保存在该目录下
+    :param cache_dir: 缓存目录
+    :type cache_dir: str
+    """
+    config.cache_dir = cache_dir
+
+
+def get_cache_dir() -> str:
+    """
+    获取本地缓存目录
+    :return: 缓存目录
+    :rtype: str
+    """
+    return config.cache_dir
+
+
+# 默认重试策略，未单独设置的 host 均使用该策略
+DEFAULT_RETRY_POLICY = {"max_retries": 3, "base_delay": 1.0}
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+_limiters: Dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _host_of(url: str) -> str:
+    """
+    从 URL 中解析出 host，作为连接池的键
+    :param url: 请求地址或 host
+    :type url: str
+    :return: host
+    :rtype: str
+    """
+    if "://" not in url:
+        return url.lower()
+    return urlsplit(url).netloc.lower()
+
+
+def set_pool_size(pool_connections: int = 10, pool_maxsize: int = 32):
+    """
+    设置每个 host 的连接池大小，对之后新建的 Session 生效
+    :param pool_connections: 缓存的连接池数量
+    :type pool_connections: int
+    :param pool_maxsize: 单个连接池的最大连接数，并发线程数较多时应调大
+    :type pool_maxsize: int
+    """
+    config.pool_connections = pool_connections
+    config.pool_maxsize = pool_maxsize
+    reset_sessions()
+
+
+def set_keep_alive(keep_alive: bool = True):
+    """
+    设置是否复用 TCP/TLS 连接
+    :param keep_alive: False 时每次请求后关闭连接
+    :type keep_alive: bool
+    """
+    config.keep_alive = keep_alive
+    reset_sessions()
+
+
+def set_retry_policy(host: str, max_retries: int = 3, base_delay: float = 1.0):
+    """
+    设置指定 host 的重试策略
+    :param host: host 或 URL, 例如 "push2his.eastmoney.com"
+    :type host: str
+    :param max_retries: 最大重试次数
+    :type max_retries: int
+    :param base_delay: 指数退避的基础延迟时间（秒）
+    :type base_delay: float
+    """
+    config.retry_policies[_host_of(host)] = {
+        "max_retries": max_retries,
+        "base_delay": base_delay,
+    }
+
+
+def get_retry_policy(url: str) -> Dict:
+    """
+    获取指定 URL 所属 host 的重试策略
+    :param url: 请求地址或 host
+    :type url: str
+    :return: 包含 max_retries 和 base_delay 的字典
+    :rtype: dict
+    """
+    return config.retry_policies.get(_host_of(url), DEFAULT_RETRY_POLICY)
+
+
+def set_rate_limit(
+    host: str, rate: float = None, capacity: float = None, max_concurrency: int = None
+):
+    """
+    设置指定 host 的限速, 对该 host 及其所有子域名生效
+    :param host: host 或 URL, 例如 "push2his.eastmoney.com" 或 "eastmoney.com"
+    :type host: str
+    :param rate: 每秒最多发起的请求数, 为 None 时不限制速率
+    :type rate: float
+    :param capacity: 允许的突发请求数, 默认与 rate 相同
+    :type capacity: float
+    :param max_concurrency: 最多同时进行的请求数, 为 None 时不限制; rate 和 max_concurrency 均为 None 时取消该 host 的限速
+    :type max_concurrency: int
+    """
+    host = _host_of(host)
+    with _limiters_lock:
+        if rate is None and max_concurrency is None:
+            config.rate_limits.pop(host, None)
+        else:
+            config.rate_limits[host] = {
+                "rate": rate,
+                "capacity": capacity,
+                "max_concurrency": max_concurrency,
+            }
+        _limiters.clear()
+
+
+def get_rate_limits() -> Dict[str, Dict]:
+    """
+    获取当前全部 host 的限速设置
+    :return: {host 后缀: {"rate": 每秒请求数, "max_concurrency": 最大并发数}}
+    :rtype: dict
+    """
+    return {host: dict(limit) for host, limit in config.rate_limits.items()}
+
+
+def set_rate_limit_enabled(enabled: bool = True):
+    """
+    开启或关闭全局限速, 例如使用自己的代理池时可以关闭
+    :param enabled: False 时所有请求都不限速
+    :type enabled: bool
+    """
+    config.rate_limit_enabled = enabled
+
+
+def get_rate_limiter(url: str) -> Optional[HostLimiter]:
+    """
+    获取 URL 所属 host 的共享限速器, 同一限速规则下的所有 host 共享一个限速器
+    :param url: 请求地址或 host
+    :type url: str
+    :return: 限速器, 未设置限速或已关闭限速时为 None
+    :rtype: akshare.utils.rate_limit.HostLimiter
+    """
+    if not config.rate_limit_enabled:
+        return None
+    rule = match_host_rule(_host_of(url), config.rate_limits)
+    if rule is None:
+        return None
+    limiter = _limiters.get(rule)
+    if limiter is not None:
+        return limiter
+    with _limiters_lock:
+        limiter = _limiters.get(rule)
+        if limiter is None:
+            limit = config.rate_limits[rule]
+            limiter = HostLimiter(
+                rate=limit.get("rate"),
+                capacity=limit.get("capacity"),
+                max_concurrency=limit.get("max_concurrency"),
+            )
+            _limiters[rule] = limiter
+    return limiter
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    发送请求前按 host 限速的 HTTPAdapter, 共享 Session 的所有请求都经过这里
+    """
+
+    def send(self, request, **kwargs):
+        limiter = get_rate_limiter(request.url)
+        if limiter is None:
+            return super().send(request, **kwargs)
+        with limiter.limit():
+            return super().send(request, **kwargs)
+
+
+class CachingAdapter(RateLimitedAdapter):
+    """
+    先查询响应缓存再按 host 限速发送请求的 HTTPAdapter, 缓存命中时不占用限速额度
+    缓存策略见 akshare.utils.http_cache
+    """
+
+    def send(self, request, **kwargs):
+        if kwargs.get("stream"):
+            return super().send(request, **kwargs)
+        key, ttl, entry, fresh = default_http_cache.lookup(request)
+        if ttl is None:
+            return super().send(request, **kwargs)
+        if fresh:
+            return default_http_cache.hit(entry, request)
+        if entry is not None:
+            default_http_cache.add_validators(request, entry)
+        response = super().send(request, **kwargs)
+        return default_http_cache.handle_response(key, entry, request, response)
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    获取 URL 所属 host 的共享 Session，同一 host 的请求复用连接池，避免重复 TLS 握手
+    :param url: 请求地址或 host
+    :type url: str
+    :return: 共享的 Session 对象
+    :rtype: requests.Session
+    """
+    host = _host_of(url)
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = CachingAdapter(
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if not config.keep_alive:
+                session.headers.update({"Connection": "close"})
+            _sessions[host] = session
+    return session
+
+
+def reset_sessions():
+    """
+    关闭并清空所有共享 Session，下次请求时按当前配置重新创建
+    """
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def _reset_sessions_after_fork():
+    # 子进程不能复用父进程的 socket，直接丢弃而不关闭
+    global _sessions_lock, _limiters_lock
+    _sessions.clear()
+    _sessions_lock = threading.Lock()
+    # 父进程中可能有线程持有信号量, 子进程重新创建限速器
+    _limiters.clear()
+    _limiters_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sessions_after_fork)
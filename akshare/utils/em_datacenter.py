@@ -0,0 +1,329 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/15 18:00
+Desc: 东方财富-数据中心通用接口
+https://datacenter-web.eastmoney.com/api/data/v1/get
+按 reportName, filter 和 columns 分页获取数据: 先请求第一页得到总页数, 其余页面并发获取, 每页单独重试
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from akshare.utils.rate_limit import TokenBucket
+from akshare.utils.request import request_with_retry
+
+DATACENTER_URL = "https://datacenter-web.eastmoney.com/api/data/v1/get"
+
+# 各报表的字段说明: {reportName: {字段: (中文名称, 类型)}}
+# 类型为 "str", "float", "int" 或 "date"; 字段的顺序即返回数据的列顺序
+REPORT_SCHEMAS: Dict[str, Dict[str, Tuple[str, str]]] = {
+    # 年报季报-业绩报表
+    "RPT_LICO_FN_CPD": {
+        "SECURITY_CODE": ("股票代码", "str"),
+        "SECURITY_NAME_ABBR": ("股票简称", "str"),
+        "BASIC_EPS": ("每股收益", "float"),
+        "TOTAL_OPERATE_INCOME": ("营业总收入-营业总收入", "float"),
+        "YSTZ": ("营业总收入-同比增长", "float"),
+        "YSHZ": ("营业总收入-季度环比增长", "float"),
+        "PARENT_NETPROFIT": ("净利润-净利润", "float"),
+        "SJLTZ": ("净利润-同比增长", "float"),
+        "SJLHZ": ("净利润-季度环比增长", "float"),
+        "BPS": ("每股净资产", "float"),
+        "WEIGHTAVG_ROE": ("净资产收益率", "float"),
+        "MGJYXJJE": ("每股经营现金流量", "float"),
+        "XSMLL": ("销售毛利率", "float"),
+        "PUBLISHNAME": ("所处行业", "str"),
+        "UPDATE_DATE": ("最新公告日期", "date"),
+    },
+    # 龙虎榜单-龙虎榜详情
+    "RPT_DAILYBILLBOARD_DETAILSNEW": {
+        "SECURITY_CODE": ("代码", "str"),
+        "SECURITY_NAME_ABBR": ("名称", "str"),
+        "TRADE_DATE": ("上榜日", "date"),
+        "EXPLAIN": ("解读", "str"),
+        "CLOSE_PRICE": ("收盘价", "float"),
+        "CHANGE_RATE": ("涨跌幅", "float"),
+        "BILLBOARD_NET_AMT": ("龙虎榜净买额", "float"),
+        "BILLBOARD_BUY_AMT": ("龙虎榜买入额", "float"),
+        "BILLBOARD_SELL_AMT": ("龙虎榜卖出额", "float"),
+        "BILLBOARD_DEAL_AMT": ("龙虎榜成交额", "float"),
+        "ACCUM_AMOUNT": ("市场总成交额", "float"),
+        "DEAL_NET_RATIO": ("净买额占总成交比", "float"),
+        "DEAL_AMOUNT_RATIO": ("成交额占总成交比", "float"),
+        "TURNOVERRATE": ("换手率", "float"),
+        "FREE_MARKET_CAP": ("流通市值", "float"),
+        "EXPLANATION": ("上榜原因", "str"),
+        "D1_CLOSE_ADJCHRATE": ("上榜后1日", "float"),
+        "D2_CLOSE_ADJCHRATE": ("上榜后2日", "float"),
+        "D5_CLOSE_ADJCHRATE": ("上榜后5日", "float"),
+        "D10_CLOSE_ADJCHRATE": ("上榜后10日", "float"),
+    },
+}
+
+
+def _join(value: Union[str, Sequence[str], None]) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return ",".join(value)
+
+
+def _convert_types(df: pd.DataFrame, types: Dict[str, str]) -> pd.DataFrame:
+    """
+    按字段类型转换数据
+    :param df: 数据
+    :type df: pandas.DataFrame
+    :param types: {列名: 类型}
+    :type types: dict
+    :return: 转换后的数据
+    :rtype: pandas.DataFrame
+    """
+    for column, dtype in types.items():
+        if column not in df.columns:
+            continue
+        if dtype == "float":
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+        elif dtype == "int":
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype("Int64")
+        elif dtype == "date":
+            df[column] = pd.to_datetime(df[column], errors="coerce").dt.date
+    return df
+
+
+class DatacenterClient:
+    """
+    东方财富-数据中心分页查询
+    """
+
+    def __init__(
+        self,
+        report_name: str,
+        filter: str = None,
+        columns: Union[str, Sequence[str], None] = None,
+        sort_columns: Union[str, Sequence[str], None] = None,
+        sort_types: Union[str, Sequence[str], None] = None,
+        page_size: int = 500,
+        params: Dict = None,
+        url: str = DATACENTER_URL,
+        timeout: int = 15,
+        max_workers: int = 4,
+        rate: float = 5.0,
+    ):
+        """
+        :param report_name: 报表名称, 例如 "RPT_LICO_FN_CPD"
+        :type report_name: str
+        :param filter: 过滤条件, 例如 "(REPORTDATE='2024-03-31')"
+        :type filter: str
+        :param columns: 需要返回的字段, 默认为 REPORT_SCHEMAS 中该报表的字段, 没有字段说明时为 "ALL"
+        :type columns: str or list
+        :param sort_columns: 排序字段
+        :type sort_columns: str or list
+        :param sort_types: 排序方式, 1 为升序, -1 为降序
+        :type sort_types: str or list
+        :param page_size: 每页数据条数
+        :type page_size: int
+        :param params: 其他请求参数, 例如 {"source": "WEB", "client": "WEB"}
+        :type params: dict
+        :param url: 接口地址, 部分报表使用 datacenter.eastmoney.com/securities/api/data/v1/get
+        :type url: str
+        :param timeout: 请求超时时间
+        :type timeout: int
+        :param max_workers: 并发请求的线程数, 为 1 时逐页串行获取
+        :type max_workers: int
+        :param rate: 每秒最多发起的请求数, 由令牌桶控制
+        :type rate: float
+        """
+        self.report_name = report_name
+        self.schema = REPORT_SCHEMAS.get(report_name, {})
+        if columns is None:
+            columns = list(self.schema) if self.schema else "ALL"
+        self.url = url
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.rate = rate
+        self.params = {
+            "reportName": report_name,
+            "columns": _join(columns),
+            "pageSize": str(page_size),
+            "pageNumber": "1",
+        }
+        if filter:
+            self.params["filter"] = filter
+        if sort_columns:
+            self.params["sortColumns"] = _join(sort_columns)
+            self.params["sortTypes"] = _join(sort_types) or ",".join(
+                ["1"] * len(self.params["sortColumns"].split(","))
+            )
+        if params:
+            self.params.update(params)
+
+    def fetch_page(self, page: int) -> Dict:
+        """
+        获取单页数据
+        :param page: 页码, 从 1 开始
+        :type page: int
+        :return: 接口返回的 result 字段, 没有数据时为 None
+        :rtype: dict
+        """
+        page_params = self.params.copy()
+        page_params["pageNumber"] = str(page)
+        r = request_with_retry(self.url, params=page_params, timeout=self.timeout)
+        return r.json()["result"]
+
+    def _frame(self, rows: List) -> pd.DataFrame:
+        columns = self.params["columns"]
+        if columns == "ALL":
+            return pd.DataFrame(rows)
+        return pd.DataFrame(rows, columns=columns.split(","))
+
+    def iter_pages(self, start_page: int = 1) -> Iterator[pd.DataFrame]:
+        """
+        按页码顺序逐页返回数据, 后续页面在后台并发预取
+        :param start_page: 起始页码, 中断后可从下一页继续获取
+        :type start_page: int
+        :return: 每页的原始数据, 列名为接口字段名
+        :rtype: generator
+        """
+        result = self.fetch_page(start_page)
+        if not result or not result.get("data"):
+            return
+        yield self._frame(result["data"])
+        total_page = int(result.get("pages") or 1)
+        if total_page <= start_page:
+            return
+        pages = range(start_page + 1, total_page + 1)
+        bucket = TokenBucket(rate=self.rate)
+
+        def _fetch(page: int) -> pd.DataFrame:
+            bucket.acquire()
+            page_result = self.fetch_page(page)
+            return self._frame(page_result["data"] if page_result else [])
+
+        if self.max_workers <= 1:
+            for page in pages:
+                yield _fetch(page)
+        else:
+            # 最多保留 max_workers * 2 个已提交但未取走的页面, 每取走一页再提交下一页
+            page_iter = iter(pages)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pending = deque(
+                    executor.submit(_fetch, page)
+                    for page in islice(page_iter, self.max_workers * 2)
+                )
+                try:
+                    while pending:
+                        df = pending.popleft().result()
+                        for page in islice(page_iter, 1):
+                            pending.append(executor.submit(_fetch, page))
+                        yield df
+                finally:
+                    # 提前停止迭代时不再获取剩余页面
+                    for future in pending:
+                        future.cancel()
+
+    def format(self, df: pd.DataFrame, rename: bool = True) -> pd.DataFrame:
+        """
+        按报表的字段说明转换类型并重命名为中文列名
+        :param df: 原始数据
+        :type df: pandas.DataFrame
+        :param rename: 是否重命名为中文列名
+        :type rename: bool
+        :return: 转换后的数据
+        :rtype: pandas.DataFrame
+        """
+        _convert_types(df, {key: dtype for key, (_, dtype) in self.schema.items()})
+        if rename and self.schema:
+            df = df.rename(
+                columns={key: name for key, (name, _) in self.schema.items()}
+            )
+        return df
+
+    def iter_frames(
+        self, rename: bool = True, start_page: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        逐页返回转换后的数据, 适合数据量较大时边获取边处理
+        :param rename: 是否重命名为中文列名
+        :type rename: bool
+        :param start_page: 起始页码, 中断后可从下一页继续获取
+        :type start_page: int
+        :return: 每页转换后的数据
+        :rtype: generator
+        """
+        for df in self.iter_pages(start_page=start_page):
+            yield self.format(df, rename=rename)
+
+    def fetch(self, rename: bool = True) -> pd.DataFrame:
+        """
+        获取全部页面并合并
+        :param rename: 是否重命名为中文列名
+        :type rename: bool
+        :return: 全部数据
+        :rtype: pandas.DataFrame
+        """
+        frames = list(self.iter_pages())
+        if not frames:
+            return pd.DataFrame()
+        big_df = pd.concat(frames, ignore_index=True)
+        return self.format(big_df, rename=rename)
+
+
+def fetch_datacenter_em(
+    report_name: str,
+    filter: str = None,
+    columns: Union[str, Sequence[str], None] = None,
+    sort_columns: Union[str, Sequence[str], None] = None,
+    sort_types: Union[str, Sequence[str], None] = None,
+    page_size: int = 500,
+    params: Dict = None,
+    max_workers: int = 4,
+    rename: bool = True,
+) -> pd.DataFrame:
+    """
+    东方财富-数据中心-获取报表的全部数据
+    https://datacenter-web.eastmoney.com/api/data/v1/get
+    :param report_name: 报表名称, 例如 "RPT_LICO_FN_CPD"
+    :type report_name: str
+    :param filter: 过滤条件, 例如 "(REPORTDATE='2024-03-31')"
+    :type filter: str
+    :param columns: 需要返回的字段, 默认为 REPORT_SCHEMAS 中该报表的字段, 没有字段说明时为 "ALL"
+    :type columns: str or list
+    :param sort_columns: 排序字段
+    :type sort_columns: str or list
+    :param sort_types: 排序方式, 1 为升序, -1 为降序
+    :type sort_types: str or list
+    :param page_size: 每页数据条数
+    :type page_size: int
+    :param params: 其他请求参数
+    :type params: dict
+    :param max_workers: 并发请求的线程数
+    :type max_workers: int
+    :param rename: 是否按 REPORT_SCHEMAS 重命名为中文列名
+    :type rename: bool
+    :return: 报表数据
+    :rtype: pandas.DataFrame
+    """
+    client = DatacenterClient(
+        report_name=report_name,
+        filter=filter,
+        columns=columns,
+        sort_columns=sort_columns,
+        sort_types=sort_types,
+        page_size=page_size,
+        params=params,
+        max_workers=max_workers,
+    )
+    return client.fetch(rename=rename)
+
+
+if __name__ == "__main__":
+    fetch_datacenter_em_df = fetch_datacenter_em(
+        report_name="RPT_LICO_FN_CPD",
+        filter="(REPORTDATE='2024-03-31')",
+        sort_columns="UPDATE_DATE,SECURITY_CODE",
+        sort_types="-1,-1",
+    )
+    print(fetch_datacenter_em_df)
@@ -1,21 +1,27 @@
 # !/usr/bin/env python
 """
-Date: 2025/3/10 18:00
+Date: 2026/10/15 18:00
 Desc: 通用帮助函数
 """
 
 import math
-import random
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 
 import pandas as pd
 
+from akshare.utils.rate_limit import TokenBucket
 from akshare.utils.request import request_with_retry
 from akshare.utils.tqdm import get_tqdm
 
 
-def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
+def fetch_paginated_data(
+    url: str,
+    base_params: Dict,
+    timeout: int = 15,
+    max_workers: int = 4,
+    rate: float = 5.0,
+):
     """
     东方财富-分页获取数据并合并结果
     https://quote.eastmoney.com/f1.html?newcode=0.000001
@@ -25,6 +31,10 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     :type base_params: dict
     :param timeout: 请求超时时间
     :type timeout: str
+    :param max_workers: 并发请求的线程数，为 1 时逐页串行获取
+    :type max_workers: int
+    :param rate: 每秒最多发起的请求数，由令牌桶控制
+    :type rate: float
     :return: 合并后的数据
     :rtype: pandas.DataFrame
     """
@@ -36,23 +46,49 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     # 计算分页信息
     per_page_num = len(data_json["data"]["diff"])
     total_page = math.ceil(data_json["data"]["total"] / per_page_num)
-    # 存储所有页面数据
-    temp_list = []
-    # 添加第一页数据
-    temp_list.append(pd.DataFrame(data_json["data"]["diff"]))
+    # 按页码存储所有页面数据，保证合并后的顺序
+    page_rows = [None] * total_page
+    page_rows[0] = data_json["data"]["diff"]
+    # 令牌桶限速，避免请求过于频繁
+    bucket = TokenBucket(rate=rate)
+
+    def _fetch_page(page: int) -> List:
+        page_params = params.copy()
+        page_params.update({"pn": page})
+        bucket.acquire()
+        inner_r = request_with_retry(url, params=page_params, timeout=timeout)
+        return inner_r.json()["data"]["diff"]
+
     # 获取进度条
     tqdm = get_tqdm()
     # 获取剩余页面数据
-    for page in tqdm(range(2, total_page + 1), leave=False):
-        params.update({"pn": page})
-        # 添加随机延迟，避免请求过于频繁
-        time.sleep(random.uniform(0.5, 1.5))
-        r = request_with_retry(url, params=params, timeout=timeout)
-        data_json = r.json()
-        inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
-        temp_list.append(inner_temp_df)
-    # 合并所有数据
-    temp_df = pd.concat(temp_list, ignore_index=True)
+    pages = range(2, total_page + 1)
+    if max_workers <= 1:
+        for page in tqdm(pages, leave=False):
+            page_rows[page - 1] = _fetch_page(page)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_page = {
+                executor.submit(_fetch_page, page): page for page in pages
+            }
+            for future in tqdm(
+                as_completed(future_to_page), total=len(future_to_page), leave=False
+            ):
+                page_rows[future_to_page[future] - 1] = future.result()
+    return merge_paginated_rows(page_rows)
+
+
+def merge_paginated_rows(page_rows: List[List]) -> pd.DataFrame:
+    """
+    东方财富-合并各页数据, 按涨跌幅 f3 降序排列并添加从 1 开始的序号
+    fetch_paginated_data 与 akshare.aio 中的异步版本共用
+    :param page_rows: 按页码排列的各页 data.diff
+    :type page_rows: list
+    :return: 合并后的数据
+    :rtype: pandas.DataFrame
+    """
+    # 一次性构造数据框，避免逐页 concat
+    temp_df = pd.DataFrame([row for rows in page_rows if rows for row in rows])
     temp_df["f3"] = pd.to_numeric(temp_df["f3"], errors="coerce")
     temp_df.sort_values(by=["f3"], ascending=False, inplace=True, ignore_index=True)
     temp_df.reset_index(inplace=True)
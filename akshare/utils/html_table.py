@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 网页表格解析
+pd.read_html 会把网页中的所有表格都转换为 DataFrame, 这里用 lxml 解析一次网页, 只转换选中的表格
+"""
+
+import re
+from typing import List, Optional, Sequence, Union
+
+import pandas as pd
+from lxml import etree
+
+# 数值列中表示缺失的占位符
+NA_VALUES = ("", "-", "--")
+
+# 按表头特征选择表格时, 在表格的前几行中查找表头
+HEADER_SEARCH_ROWS = 5
+
+# 与 pd.read_html 一致: 连续换行或连续空白替换为一个空格
+_WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+_DISPLAY_NONE = re.compile(r"display:\s*none")
+_CELL_TAGS = ("td", "th")
+
+
+def _text(element) -> str:
+    if len(element) == 0:
+        return element.text or ""
+    return "".join(element.itertext())
+
+
+def _cell_text(cell) -> str:
+    text = _text(cell).strip()
+    if "\n" in text or "\r" in text or "  " in text:
+        text = _WHITESPACE.sub(" ", text)
+    return text
+
+
+def _span(value: Optional[str]) -> int:
+    if value is None:
+        return 1
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        return 1
+
+
+def _drop_hidden(table):
+    """
+    与 pd.read_html 一致, 去掉 display: none 的元素, 保留其后的文本
+    """
+    for element in table.xpath(".//*[@style]"):
+        if not _DISPLAY_NONE.search(element.get("style")):
+            continue
+        parent = element.getparent()
+        if parent is None:
+            continue
+        if element.tail:
+            previous = element.getprevious()
+            if previous is not None:
+                previous.tail = (previous.tail or "") + element.tail
+            else:
+                parent.text = (parent.text or "") + element.tail
+        parent.remove(element)
+
+
+def _table_rows(table, max_rows: Optional[int] = None) -> List[List[Optional[str]]]:
+    """
+    按行读取表格的单元格文本, colspan 和 rowspan 合并的单元格在每个位置重复填充
+    """
+    _drop_hidden(table)
+    rows = []
+    # 列位置 -> [文本, 剩余行数]
+    spans = {}
+
+    def _fill_spans(row: List):
+        while len(row) in spans:
+            span = spans[len(row)]
+            row.append(span[0])
+            span[1] -= 1
+            if span[1] == 0:
+                del spans[len(row) - 1]
+
+    for tr in table.xpath("./thead/tr|./tbody/tr|./tr|./tfoot/tr"):
+        if max_rows is not None and len(rows) >= max_rows:
+            break
+        row = []
+        for cell in tr:
+            if cell.tag not in _CELL_TAGS:
+                continue
+            if spans:
+                _fill_spans(row)
+            text = _cell_text(cell)
+            rowspan = _span(cell.get("rowspan"))
+            for _ in range(_span(cell.get("colspan"))):
+                if rowspan > 1:
+                    spans[len(row)] = [text, rowspan - 1]
+                row.append(text)
+        if spans:
+            _fill_spans(row)
+        rows.append(row)
+    width = max((len(row) for row in rows), default=0)
+    return [row + [None] * (width - len(row)) for row in rows]
+
+
+def _find_header(rows: List[List[Optional[str]]], headers: Sequence[str]) -> int:
+    for i, row in enumerate(rows[:HEADER_SEARCH_ROWS]):
+        if all(name in row for name in headers):
+            return i
+    return -1
+
+
+def _column_names(row: List[Optional[str]]) -> List[str]:
+    """
+    表头为空的列命名为 Unnamed: 列号, 重复的列名依次加上 .1, .2 后缀, 与 pd.read_html 一致
+    """
+    names = []
+    counts = {}
+    for i, name in enumerate(row):
+        name = name if name else f"Unnamed: {i}"
+        if name in counts:
+            counts[name] += 1
+            name = f"{name}.{counts[name]}"
+        else:
+            counts[name] = 0
+        names.append(name)
+    return names
+
+
+def _convert(series: pd.Series, thousands: Optional[str], convert: bool) -> pd.Series:
+    """
+    整列都可以解析为数值时转换为数值列, 否则保留字符串; 与 pd.read_html 一致, 数值单元格去掉千分位分隔符
+    """
+    if not thousands and not convert:
+        return series
+    text = series
+    if thousands:
+        text = series.astype(object).str.replace(thousands, "", regex=False)
+    numeric = pd.to_numeric(text, errors="coerce")
+    if convert and numeric.notna().sum() == series.notna().sum():
+        return numeric
+    return series.where(numeric.isna(), text)
+
+
+def read_html_table(
+    html: Union[str, bytes],
+    table_id: Optional[str] = None,
+    xpath: Optional[str] = None,
+    css: Optional[str] = None,
+    match: Optional[str] = None,
+    headers: Optional[Sequence[str]] = None,
+    index: int = 0,
+    header: Optional[int] = 0,
+    text_columns: Sequence = (),
+    na_values: Sequence[str] = NA_VALUES,
+    thousands: Optional[str] = ",",
+    convert: bool = True,
+) -> pd.DataFrame:
+    """
+    解析网页中的指定表格, 多个选择条件同时使用时需要全部满足
+    :param html: 网页内容
+    :type html: str or bytes
+    :param table_id: 表格的 id 属性
+    :type table_id: str
+    :param xpath: 选择表格的 XPath, 例如 "//div[@id='con02-1']//table"
+    :type xpath: str
+    :param css: 选择表格的 CSS 选择器, 需要安装 cssselect
+    :type css: str
+    :param match: 正则表达式, 选择文本中包含匹配内容的最内层表格
+    :type match: str
+    :param headers: 表头特征, 选择前几行中某一行包含全部这些单元格的表格, 该行作为表头
+    :type headers: list
+    :param index: 符合条件的第几个表格, 从 0 开始
+    :type index: int
+    :param header: 作为表头的行号, 之前的行丢弃; 为 None 时没有表头, 列名为列号; 指定 headers 时不使用
+    :type header: int
+    :param text_columns: 保留为字符串的列
+    :type text_columns: list
+    :param na_values: 视为缺失值的单元格文本
+    :type na_values: list
+    :param thousands: 数值中的千分位分隔符
+    :type thousands: str
+    :param convert: 是否把整列都是数值的列转换为数值列
+    :type convert: bool
+    :return: 选中的表格
+    :rtype: pandas.DataFrame
+    """
+    if isinstance(html, str):
+        # lxml 不接受带有 encoding 声明的 str
+        html = html.encode("utf-8")
+        parser = etree.HTMLParser(encoding="utf-8")
+    else:
+        parser = etree.HTMLParser()
+    root = etree.fromstring(html, parser=parser)
+    if root is None:
+        raise ValueError("没有找到符合条件的表格")
+    if css is not None:
+        try:
+            from lxml.cssselect import CSSSelector
+        except ImportError as e:
+            raise ImportError(
+                "使用 css 参数需要安装 cssselect: pip install cssselect"
+            ) from e
+        tables = CSSSelector(css)(root)
+    elif xpath is not None:
+        tables = root.xpath(xpath)
+    else:
+        tables = root.iter("table")
+    tables = [table for table in tables if getattr(table, "tag", None) == "table"]
+    if table_id is not None:
+        tables = [table for table in tables if table.get("id") == table_id]
+    if match is not None:
+        pattern = re.compile(match)
+        matched = [table for table in tables if pattern.search(_text(table))]
+        matched_ids = {id(table) for table in matched}
+        # 外层布局表格也包含内层表格的文本, 只保留最内层的表格
+        tables = [
+            table
+            for table in matched
+            if not any(
+                id(inner) in matched_ids for inner in table.iterdescendants("table")
+            )
+        ]
+    header_row = header
+    if headers is not None:
+        candidates = []
+        for table in tables:
+            row_number = _find_header(
+                _table_rows(table, max_rows=HEADER_SEARCH_ROWS), headers
+            )
+            if row_number >= 0:
+                candidates.append((table, row_number))
+        if len(candidates) <= index:
+            raise ValueError(f"没有找到表头包含 {list(headers)} 的表格")
+        table, header_row = candidates[index]
+    else:
+        if len(tables) <= index:
+            raise ValueError("没有找到符合条件的表格")
+        table = tables[index]
+    rows = _table_rows(table)
+    if header_row is None:
+        temp_df = pd.DataFrame(rows)
+    else:
+        columns = _column_names(rows[header_row]) if len(rows) > header_row else []
+        temp_df = pd.DataFrame(rows[header_row + 1 :], columns=columns or None)
+    if temp_df.empty:
+        return temp_df
+    for column in temp_df.columns:
+        series = temp_df[column].mask(temp_df[column].isin(na_values))
+        if column not in text_columns:
+            series = _convert(series, thousands, convert=convert)
+        temp_df[column] = series
+    return temp_df
+
+
+if __name__ == "__main__":
+    page = """
+    <table id="nav"><tr><td>导航</td></tr></table>
+    <table id="data">
+      <tr><th>名次</th><th>会员简称</th><th>成交量</th></tr>
+      <tr><td>1</td><td>中信期货</td><td>12,345</td></tr>
+      <tr><td>2</td><td>国泰君安</td><td>-</td></tr>
+    </table>
+    """
+    temp_df = read_html_table(page, headers=["名次", "成交量"])
+    print(temp_df.dtypes)
+    print(temp_df)
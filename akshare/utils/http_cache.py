@@ -0,0 +1,453 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/15 18:00
+Desc: HTTP 响应缓存
+按请求方法, URL（含参数）和请求体缓存响应, 经由共享 Session 发出的请求都会先查询缓存:
+1. 按 URL 前缀设置有效期, 默认只缓存代码表, 交易日历等每日最多更新一次的参考数据;
+2. 也可以用 with http_cache(ttl=...) 或 @http_cache(ttl=...) 临时为任意接口开启缓存;
+3. 过期后如果服务器返回过 ETag 或 Last-Modified, 带上 If-None-Match 或 If-Modified-Since 重新验证, 304 时继续使用缓存的内容;
+缓存默认保存在内存（LRU）和本地缓存目录下的 SQLite 文件中, 进程重启后仍然有效
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import ContextDecorator
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# 各接口的缓存有效期: {URL 前缀: 有效期（秒）}, URL 包含按请求顺序拼接的参数, 按最长前缀匹配
+DEFAULT_CACHE_POLICIES: Dict[str, float] = {
+    # 深圳证券交易所-股票列表
+    "https://www.szse.cn/api/report/ShowReport?SHOWTYPE=xlsx&CATALOGID=1110&": 86400,
+    # 上海证券交易所-股票列表
+    "https://query.sse.com.cn/sseQuery/commonQuery.do?STOCK_TYPE=": 86400,
+    # 北京证券交易所-股票列表
+    "https://www.bse.cn/nqxxController/nqxxCnzq.do": 86400,
+    # 天天基金网-所有基金的名称和类型
+    "https://fund.eastmoney.com/js/fundcode_search.js": 86400,
+    # 新浪财经-期货的品种和代码映射
+    "https://vip.stock.finance.sina.com.cn/quotes_service/view/js/qihuohangqing.js": 86400,
+    # 东方财富网-期货行情-交易所品种对照表
+    "https://futsse-static.eastmoney.com/redis": 86400,
+    # openctp-期货交易费用参照表, 每个交易日盘后更新
+    "http://openctp.cn/fees.html": 3600,
+    # 新浪财经-交易日历
+    "https://finance.sina.com.cn/realstock/company/klc_td_sh.txt": 86400,
+}
+
+# 缓存命中时不需要保留的响应头, 缓存的是解压后的内容
+_DROP_HEADERS = {
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "set-cookie",
+}
+
+_override_ttl = contextvars.ContextVar("akshare_http_cache_ttl", default=None)
+
+
+class MemoryCache:
+    """
+    进程内的 LRU 缓存
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        :param max_entries: 最多缓存的响应数量
+        :type max_entries: int
+        """
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict):
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class SQLiteCache:
+    """
+    保存在本地 SQLite 文件中的缓存, 多个进程可以共享
+    """
+
+    def __init__(self, path: str = None):
+        """
+        :param path: SQLite 文件路径, 默认为本地缓存目录下的 http_cache.sqlite
+        :type path: str
+        """
+        self._path = path
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            from akshare.utils.context import get_cache_dir
+
+            return os.path.join(get_cache_dir(), "http_cache.sqlite")
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        # fork 后的子进程不能复用父进程的连接
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, meta TEXT NOT NULL, content BLOB NOT NULL)"
+            )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT meta, content FROM responses WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        entry = json.loads(row[0])
+        entry["content"] = bytes(row[1])
+        return entry
+
+    def set(self, key: str, entry: Dict):
+        meta = {k: v for k, v in entry.items() if k != "content"}
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, meta, content) VALUES (?, ?, ?)",
+                (key, json.dumps(meta, ensure_ascii=False), entry["content"]),
+            )
+            conn.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+
+class TieredCache:
+    """
+    多级缓存, 依次查询, 命中后回填前面的缓存; 写入时写入所有缓存
+    """
+
+    def __init__(self, *backends):
+        self.backends = backends
+
+    def get(self, key: str) -> Optional[Dict]:
+        for index, backend in enumerate(self.backends):
+            entry = backend.get(key)
+            if entry is not None:
+                for upper in self.backends[:index]:
+                    upper.set(key, entry)
+                return entry
+        return None
+
+    def set(self, key: str, entry: Dict):
+        for backend in self.backends:
+            backend.set(key, entry)
+
+    def delete(self, key: str):
+        for backend in self.backends:
+            backend.delete(key)
+
+    def clear(self):
+        for backend in self.backends:
+            backend.clear()
+
+
+class HTTPCache:
+    """
+    响应缓存的策略和命中统计, 由 akshare.utils.context 中共享 Session 的 Adapter 调用
+    """
+
+    def __init__(self, backend=None, policies: Dict[str, float] = None):
+        self.backend = (
+            backend
+            if backend is not None
+            else TieredCache(MemoryCache(), SQLiteCache())
+        )
+        self.policies = dict(DEFAULT_CACHE_POLICIES if policies is None else policies)
+        self.enabled = True
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {
+                "hits": 0,
+                "revalidated": 0,
+                "misses": 0,
+                "stores": 0,
+                "errors": 0,
+                "bytes_saved": 0,
+            }
+
+    def _count(self, name: str, value: int = 1):
+        with self._stats_lock:
+            self._stats[name] += value
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["hits"] + stats["revalidated"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """
+        获取 URL 的缓存有效期, 优先使用 http_cache 临时指定的有效期
+        :param url: 含参数的完整 URL
+        :type url: str
+        :return: 有效期（秒）, 不缓存时为 None
+        :rtype: float
+        """
+        if not self.enabled:
+            return None
+        override = _override_ttl.get()
+        if override is not None:
+            return override if override > 0 else None
+        matched = None
+        for prefix in self.policies:
+            if url.startswith(prefix) and (
+                matched is None or len(prefix) > len(matched)
+            ):
+                matched = prefix
+        return self.policies[matched] if matched is not None else None
+
+    @staticmethod
+    def key_for(request: requests.PreparedRequest) -> str:
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest() if body else ""
+        return f"{request.method} {request.url} {digest}"
+
+    def _safe(self, func, *args):
+        # 缓存读写失败不影响正常请求
+        try:
+            return True, func(*args)
+        except (sqlite3.Error, OSError, ValueError):
+            self._count("errors")
+            return False, None
+
+    def lookup(self, request: requests.PreparedRequest):
+        """
+        查询缓存
+        :return: (缓存键, 有效期, 缓存内容, 是否仍在有效期内); 不缓存该请求时有效期为 None
+        :rtype: tuple
+        """
+        if request.method not in ("GET", "POST"):
+            return None, None, None, False
+        ttl = self.ttl_for(request.url)
+        if ttl is None:
+            return None, None, None, False
+        key = self.key_for(request)
+        _, entry = self._safe(self.backend.get, key)
+        if entry is None:
+            return key, ttl, None, False
+        fresh = time.time() - entry["stored_at"] < ttl
+        return key, ttl, entry, fresh
+
+    def build_response(
+        self, entry: Dict, request: requests.PreparedRequest
+    ) -> requests.Response:
+        """
+        用缓存内容构造 Response
+        """
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason", "OK")
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["content"]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def hit(self, entry: Dict, request: requests.PreparedRequest) -> requests.Response:
+        self._count("hits")
+        self._count("bytes_saved", len(entry["content"]))
+        return self.build_response(entry, request)
+
+    def handle_response(
+        self,
+        key: str,
+        entry: Optional[Dict],
+        request: requests.PreparedRequest,
+        response: requests.Response,
+    ) -> requests.Response:
+        """
+        处理服务器返回的响应: 304 时延长缓存的有效期并返回缓存内容, 200 时写入缓存
+        """
+        if response.status_code == 304 and entry is not None:
+            entry = dict(entry, stored_at=time.time())
+            self._safe(self.backend.set, key, entry)
+            self._count("revalidated")
+            self._count("bytes_saved", len(entry["content"]))
+            return self.build_response(entry, request)
+        self._count("misses")
+        if response.status_code == 200:
+            headers = {
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in _DROP_HEADERS
+            }
+            new_entry = {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": headers,
+                "content": response.content,
+                "stored_at": time.time(),
+            }
+            stored, _ = self._safe(self.backend.set, key, new_entry)
+            if stored:
+                self._count("stores")
+        return response
+
+    @staticmethod
+    def add_validators(request: requests.PreparedRequest, entry: Dict):
+        """
+        为过期的缓存添加条件请求头
+        """
+        headers = CaseInsensitiveDict(entry["headers"])
+        if "ETag" in headers:
+            request.headers["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            request.headers["If-Modified-Since"] = headers["Last-Modified"]
+
+    def clear(self):
+        self._safe(self.backend.clear)
+
+
+default_http_cache = HTTPCache()
+
+
+class http_cache(ContextDecorator):
+    """
+    在 with 语句或被装饰的函数中, 为经由共享 Session 发出的所有请求开启缓存
+    with http_cache(ttl=3600):
+        df = ak.stock_board_industry_name_em()
+    """
+
+    def __init__(self, ttl: float = 86400):
+        """
+        :param ttl: 缓存有效期（秒）, 为 0 时该范围内的请求都不使用缓存
+        :type ttl: float
+        """
+        self.ttl = ttl
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_override_ttl.set(self.ttl))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _override_ttl.reset(self._tokens.pop())
+        return False
+
+
+def set_http_cache_backend(backend):
+    """
+    设置响应缓存的存储方式
+    :param backend: MemoryCache(), SQLiteCache(path) 或 TieredCache(...), 也可以是实现了 get, set, delete, clear 方法的对象
+    :type backend: object
+    """
+    default_http_cache.backend = backend
+
+
+def set_http_cache_enabled(enabled: bool = True):
+    """
+    开启或关闭响应缓存
+    :param enabled: False 时所有请求都不使用缓存
+    :type enabled: bool
+    """
+    default_http_cache.enabled = enabled
+
+
+def set_cache_policy(url_prefix: str, ttl: Optional[float]):
+    """
+    设置以 url_prefix 开头的请求的缓存有效期
+    :param url_prefix: URL 前缀, 可以包含参数, 例如 "https://fund.eastmoney.com/js/fundcode_search.js"
+    :type url_prefix: str
+    :param ttl: 有效期（秒）, 为 None 时取消该前缀的缓存
+    :type ttl: float
+    """
+    if ttl is None:
+        default_http_cache.policies.pop(url_prefix, None)
+    else:
+        default_http_cache.policies[url_prefix] = ttl
+
+
+def get_cache_stats() -> Dict:
+    """
+    获取响应缓存的命中统计
+    :return: hits 为有效期内命中次数, revalidated 为服务器返回 304 的次数, misses 为从服务器下载的次数,
+    stores 为写入缓存的次数, errors 为缓存读写失败的次数, bytes_saved 为缓存提供的字节数, hit_rate 为命中率
+    :rtype: dict
+    """
+    return default_http_cache.stats()
+
+
+def reset_cache_stats():
+    """
+    清零响应缓存的命中统计
+    """
+    default_http_cache.reset_stats()
+
+
+def clear_http_cache():
+    """
+    清空全部缓存的响应
+    """
+    default_http_cache.clear()
+
+
+if __name__ == "__main__":
+    import akshare as ak
+
+    for _ in range(2):
+        fund_name_em_df = ak.fund_name_em()
+    print(fund_name_em_df)
+    print(get_cache_stats())
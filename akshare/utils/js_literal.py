@@ -0,0 +1,179 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/15 18:00
+Desc: JSON/JSONP/JS 字面量解析
+依次尝试: orjson 或标准库 json; 将 JS 字面量（无引号的键, 单引号字符串, 末尾逗号, 注释等）转换为 JSON 后用 json 解析;
+最后才使用纯 Python 实现的 demjson, 以兼容其他少见的写法
+"""
+
+import json
+import re
+from typing import Union
+
+try:
+    import orjson
+
+    def _json_loads(text: str):
+        return orjson.loads(text)
+
+except ImportError:
+
+    def _json_loads(text: str):
+        return json.loads(text, strict=False)
+
+
+# var x = ...; 或 callback(...); 形式的外层包装, 前面可以有 /*...*/ 注释
+_WRAPPER_PATTERN = re.compile(
+    r"\s*(?:/\*.*?\*/\s*)?(?:var\s+)?[A-Za-z_$][\w$.]*\s*(?P<op>[=(])", re.S
+)
+
+# 只匹配需要改写的片段, 其余字符（标点, 空白, 合法的 JSON 数字）原样保留
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<dq>"(?:[^"\\]|\\.)*")
+    |(?P<sq>'(?:[^'\\]|\\.)*')
+    |(?P<comment>/\*.*?\*/|//[^\n]*)
+    |(?P<comma>,(?=\s*[\]}]))
+    |(?P<num>(?<![\w$.])(?:
+        [-+]?0[xX][0-9a-fA-F]+
+        |[-+]?\.\d+(?:[eE][-+]?\d+)?
+        |[-+]?\d+\.(?!\d)(?:[eE][-+]?\d+)?
+        |[-+]?0\d+
+        |\+\d+(?:\.\d+)?(?:[eE][-+]?\d+)?
+    )(?![\w$.]))
+    |(?P<ident>(?<![\w$.])[A-Za-z_$][\w$]*)
+    """,
+    re.S | re.X,
+)
+
+_ESCAPE_PATTERN = re.compile(r"\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|\r\n|.)|\"", re.S)
+_JSON_ESCAPES = set('"\\/bfnrtu')
+_JS_ESCAPES = {"'": "'", "v": "\\u000b", "0": "\\u0000", "\n": "", "\r\n": "", "\r": ""}
+_KEY_FOLLOW_PATTERN = re.compile(r"\s*:")
+_KEYWORDS = {"true": "true", "false": "false", "null": "null", "undefined": "null"}
+_KEYWORDS.update({"NaN": "NaN", "Infinity": "Infinity"})
+
+
+def _escape_repl(match) -> str:
+    escape = match.group(1)
+    if escape is None:
+        # 单引号字符串中未转义的双引号
+        return '\\"'
+    if escape[0] == "x":
+        return "\\u00" + escape[1:]
+    if escape[0] in _JSON_ESCAPES:
+        return match.group(0)
+    if escape in _JS_ESCAPES:
+        return _JS_ESCAPES[escape]
+    # JS 中未定义的转义序列等价于字符本身
+    return json.dumps(escape)[1:-1]
+
+
+def _convert_string(body: str) -> str:
+    """
+    将 JS 字符串的内容转换为 JSON 字符串
+    :param body: 去掉引号后的字符串内容
+    :type body: str
+    :return: 带双引号的 JSON 字符串
+    :rtype: str
+    """
+    return '"' + _ESCAPE_PATTERN.sub(_escape_repl, body) + '"'
+
+
+def _convert_number(text: str) -> str:
+    sign = "-" if text[0] == "-" else ""
+    text = text.lstrip("+-")
+    if text[:2] in ("0x", "0X"):
+        return sign + str(int(text, 16))
+    if "." not in text and "e" not in text.lower():
+        return sign + str(int(text))
+    mantissa, _, exponent = text.lower().partition("e")
+    integer, _, fraction = mantissa.partition(".")
+    number = f"{integer or '0'}.{fraction or '0'}"
+    return sign + (f"{number}e{exponent}" if exponent else number)
+
+
+def _token_repl(match) -> str:
+    kind = match.lastgroup
+    text = match.group(0)
+    if kind == "dq":
+        if "\\" in text and re.search(r"\\[^\"\\/bfnrtu]", text):
+            return _convert_string(text[1:-1])
+        return text
+    if kind == "sq":
+        return _convert_string(text[1:-1])
+    if kind == "num":
+        return _convert_number(text)
+    if kind == "ident":
+        if text in _KEYWORDS:
+            return _KEYWORDS[text]
+        if _KEY_FOLLOW_PATTERN.match(match.string, match.end()):
+            return '"' + text + '"'
+        raise ValueError(f"无法解析的标识符: {text}")
+    # 注释和末尾逗号
+    return " "
+
+
+def js_to_json(text: str) -> str:
+    """
+    将 JS 字面量转换为 JSON 文本
+    :param text: JS 字面量
+    :type text: str
+    :return: JSON 文本
+    :rtype: str
+    """
+    return _TOKEN_PATTERN.sub(_token_repl, text)
+
+
+def unwrap(text: str) -> str:
+    """
+    去掉 var x = ...; 和 callback(...); 形式的外层包装
+    :param text: JS 脚本或 JSONP 返回值
+    :type text: str
+    :return: 字面量部分
+    :rtype: str
+    """
+    stripped = text.lstrip()
+    if not stripped or stripped[0] in "{[\"'-0123456789":
+        return text
+    match = _WRAPPER_PATTERN.match(text)
+    if match is None:
+        return text
+    value = text[match.end() :].rstrip().rstrip(";").rstrip()
+    if match.group("op") == "(":
+        if not value.endswith(")"):
+            return text
+        value = value[:-1]
+    return value
+
+
+def loads(text: Union[str, bytes]):
+    """
+    解析 JSON, JSONP 或 JS 字面量
+    与 demjson.decode 不同, JS 的 undefined 解析为 None 而不是 demjson.undefined;
+    只有回退到 demjson 解析的少见写法仍返回 demjson.undefined
+    :param text: 待解析的文本, 可以带有 var x = ...; 或 callback(...); 包装
+    :type text: str
+    :return: 解析后的 Python 对象
+    :rtype: object
+    """
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    text = unwrap(text)
+    try:
+        return _json_loads(text)
+    except ValueError:
+        pass
+    try:
+        return json.loads(js_to_json(text), strict=False)
+    except ValueError:
+        pass
+    # demjson 是纯 Python 实现, 加载较慢, 只在少见写法需要时导入
+    from akshare.utils import demjson
+
+    return demjson.decode(text)
+
+
+if __name__ == "__main__":
+    print(loads("var a = [{symbol:'sh600000', name:\"浦发银行\", price:.5,},];"))
+    print(loads('jQuery123({"rc": 0, data: {total: 0x10}})'))
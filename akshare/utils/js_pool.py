@@ -0,0 +1,203 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/15 18:00
+Desc: JS 执行环境池
+按脚本内容缓存已经执行过脚本的 MiniRacer 环境, 之后的调用直接复用, 不再重复创建环境和执行脚本;
+每个环境同一时间只被一个线程使用, 每个脚本最多 max_size 个环境, 最多缓存 max_scripts 个脚本
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import List
+
+
+class _Slot:
+    """
+    单个 JS 环境及其锁
+    """
+
+    def __init__(self):
+        self.ctx = None
+        self.lock = threading.Lock()
+
+
+class _ScriptEntry:
+    """
+    同一个脚本的全部 JS 环境
+    """
+
+    def __init__(self):
+        self.slots: List[_Slot] = []
+        self.lock = threading.Lock()
+        self.next_slot = 0
+
+
+class JSContextPool:
+    """
+    线程安全的 JS 执行环境池
+    """
+
+    def __init__(self, max_size: int = 2, max_scripts: int = 16):
+        """
+        :param max_size: 每个脚本最多创建的环境数量, 即同一脚本的最大并发数
+        :type max_size: int
+        :param max_scripts: 最多缓存的脚本数量, 超出时丢弃最久未使用的脚本的环境
+        :type max_scripts: int
+        """
+        self.max_size = max_size
+        self.max_scripts = max_scripts
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _new_context(source: str):
+        from py_mini_racer import MiniRacer
+
+        ctx = MiniRacer()
+        if source:
+            ctx.eval(source)
+        return ctx
+
+    def _entry(self, source: str) -> _ScriptEntry:
+        with self._lock:
+            entry = self._entries.get(source)
+            if entry is None:
+                entry = _ScriptEntry()
+                self._entries[source] = entry
+                # 正在使用中的环境由调用方持有引用, 用完后自然释放
+                while len(self._entries) > self.max_scripts:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(source)
+            return entry
+
+    def _acquire(self, source: str) -> _Slot:
+        entry = self._entry(source)
+        while True:
+            for slot in list(entry.slots):
+                if slot.lock.acquire(blocking=False):
+                    if slot.ctx is not None:
+                        return slot
+                    slot.lock.release()
+            with entry.lock:
+                if len(entry.slots) < self.max_size:
+                    slot = _Slot()
+                    slot.lock.acquire()
+                    entry.slots.append(slot)
+                    create = True
+                else:
+                    slot = entry.slots[entry.next_slot % len(entry.slots)]
+                    entry.next_slot += 1
+                    create = False
+            if create:
+                # 在锁外执行脚本, 避免阻塞其他脚本
+                try:
+                    slot.ctx = self._new_context(source)
+                except BaseException:
+                    with entry.lock:
+                        entry.slots.remove(slot)
+                    slot.lock.release()
+                    raise
+                return slot
+            # 环境数量已达上限, 等待其中一个环境空闲
+            slot.lock.acquire()
+            if slot.ctx is not None:
+                return slot
+            slot.lock.release()
+
+    @contextmanager
+    def context(self, source: str):
+        """
+        取出一个已经执行过 source 的 JS 环境, 退出 with 语句时归还
+        :param source: JS 脚本
+        :type source: str
+        :return: MiniRacer 环境
+        :rtype: py_mini_racer.MiniRacer
+        """
+        slot = self._acquire(source)
+        try:
+            yield slot.ctx
+        finally:
+            slot.lock.release()
+
+    def call(self, source: str, func_name: str, *args):
+        """
+        调用脚本中的函数
+        :param source: JS 脚本
+        :type source: str
+        :param func_name: 函数名
+        :type func_name: str
+        :return: 函数返回值
+        :rtype: object
+        """
+        with self.context(source) as ctx:
+            return ctx.call(func_name, *args)
+
+    def eval(self, source: str, code: str):
+        """
+        在已经执行过 source 的环境中执行代码
+        :param source: JS 脚本
+        :type source: str
+        :param code: 需要执行的 JS 代码
+        :type code: str
+        :return: 执行结果
+        :rtype: object
+        """
+        with self.context(source) as ctx:
+            return ctx.eval(code)
+
+    def clear(self):
+        """
+        清空全部缓存的环境
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class JSContext:
+    """
+    绑定了脚本的 JS 环境, 用法与 MiniRacer 相同, 每次 call 或 eval 时从环境池中取出环境
+    """
+
+    def __init__(self, source: str, pool: JSContextPool):
+        self.source = source
+        self.pool = pool
+
+    def call(self, func_name: str, *args):
+        return self.pool.call(self.source, func_name, *args)
+
+    def eval(self, code: str):
+        return self.pool.eval(self.source, code)
+
+
+js_context_pool = JSContextPool()
+
+
+def get_js_context(source: str = "") -> JSContext:
+    """
+    获取已经执行过 source 的 JS 环境, 替代 MiniRacer() 后再 eval(source) 的写法
+    :param source: JS 脚本, 为空时为空白环境
+    :type source: str
+    :return: JS 环境
+    :rtype: JSContext
+    """
+    return JSContext(source, js_context_pool)
+
+
+def set_js_pool_size(max_size: int = 2, max_scripts: int = 16):
+    """
+    设置 JS 环境池的大小, 已缓存的环境会被清空
+    :param max_size: 每个脚本最多创建的环境数量
+    :type max_size: int
+    :param max_scripts: 最多缓存的脚本数量
+    :type max_scripts: int
+    """
+    js_context_pool.clear()
+    js_context_pool.max_size = max_size
+    js_context_pool.max_scripts = max_scripts
+
+
+if __name__ == "__main__":
+    js_code = get_js_context("function add(a, b) { return a + b; }")
+    print(js_code.call("add", 1, 2))
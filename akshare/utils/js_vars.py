@@ -0,0 +1,92 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/15 18:00
+Desc: 从 JS 脚本中提取 var 变量赋值, 不需要执行 JS 代码
+适用于 var Data_xxx = [...]; 形式的数据文件, 例如天天基金网的 pingzhongdata
+"""
+
+import re
+from typing import Dict, Iterable, Optional
+
+from akshare.utils import js_literal
+
+_VAR_PATTERN = re.compile(r"\bvar\s+([A-Za-z_$][\w$]*)\s*=\s*")
+
+
+def _find_value_end(text: str, start: int) -> int:
+    """
+    找到从 start 开始的赋值表达式的结束位置, 即括号外的第一个分号或换行
+    :param text: JS 脚本
+    :type text: str
+    :param start: 赋值表达式的开始位置
+    :type start: int
+    :return: 结束位置
+    :rtype: int
+    """
+    depth = 0
+    quote = None
+    i = start
+    n = len(text)
+    while i < n:
+        char = text[i]
+        if quote is not None:
+            if char == "\\":
+                i += 2
+                continue
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "[{(":
+            depth += 1
+        elif char in "]})":
+            depth -= 1
+        elif depth <= 0 and (char == ";" or char == "\n"):
+            return i
+        elif depth <= 0 and text.startswith("/*", i):
+            # 紧跟在赋值后的注释, 例如 var a = 1/*注释*/var b = 2
+            return i
+        i += 1
+    return n
+
+
+def parse_js_value(value_text: str):
+    """
+    解析 JS 字面量
+    :param value_text: JS 字面量
+    :type value_text: str
+    :return: 解析后的 Python 对象
+    :rtype: object
+    """
+    return js_literal.loads(value_text)
+
+
+def extract_js_vars(text: str, names: Optional[Iterable[str]] = None) -> Dict:
+    """
+    提取 JS 脚本中的 var 变量赋值
+    :param text: JS 脚本
+    :type text: str
+    :param names: 需要提取的变量名, 默认为全部变量
+    :type names: list
+    :return: {变量名: 变量值}; 无法解析的变量会被跳过
+    :rtype: dict
+    """
+    names = set(names) if names is not None else None
+    result = {}
+    pos = 0
+    while True:
+        match = _VAR_PATTERN.search(text, pos)
+        if match is None:
+            break
+        start = match.end()
+        end = _find_value_end(text, start)
+        pos = max(end, start + 1)
+        name = match.group(1)
+        if names is not None and name not in names:
+            continue
+        value_text = text[start:end].strip()
+        try:
+            result[name] = parse_js_value(value_text)
+        except Exception:
+            continue
+    return result
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 东方财富 K 线数据解析
+接口返回的 klines/trends 为逗号分隔的字符串列表, 拼接后一次性交给 pandas 的 C 解析器, 直接得到 float64/int64 列
+"""
+
+import csv
+import io
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+# 数值列中表示缺失的占位符, 与 pd.to_numeric(errors="coerce") 的结果一致
+NA_VALUES = ["", "-", "--"]
+
+
+def parse_klines(
+    lines: List[str],
+    columns: Sequence[Optional[str]],
+    text_columns: Sequence[str] = ("日期",),
+) -> pd.DataFrame:
+    """
+    解析逗号分隔的 K 线字符串列表
+    :param lines: 接口返回的 klines 或 trends, 如 ["2024-01-02,9.39,9.21,...", ...]
+    :type lines: list
+    :param columns: 按字段顺序的列名, 为 None 的字段不解析; 字段数多于列名时忽略多出的字段
+    :type columns: list
+    :param text_columns: 保留为字符串的列, 其余列解析为数值, 无法解析的值为 NaN
+    :type text_columns: list
+    :return: 解析后的数据
+    :rtype: pandas.DataFrame
+    """
+    positions = [i for i, name in enumerate(columns) if name is not None]
+    names = [columns[i] for i in positions]
+    if not lines:
+        return pd.DataFrame(columns=names)
+    text_positions = [i for i in positions if columns[i] in text_columns]
+    numeric_positions = [i for i in positions if columns[i] not in text_columns]
+    temp_df = pd.read_csv(
+        io.StringIO("\n".join(lines)),
+        header=None,
+        usecols=positions,
+        dtype={i: str for i in text_positions},
+        keep_default_na=False,
+        na_values={i: NA_VALUES for i in numeric_positions},
+        quoting=csv.QUOTE_NONE,
+    )
+    temp_df.columns = names
+    for i in numeric_positions:
+        name = columns[i]
+        if not pd.api.types.is_numeric_dtype(temp_df[name]):
+            # 出现其他非数值内容时, 与逐列 pd.to_numeric(errors="coerce") 的结果保持一致
+            temp_df[name] = pd.to_numeric(temp_df[name], errors="coerce")
+    return temp_df
+
+
+if __name__ == "__main__":
+    kline_df = parse_klines(
+        lines=[
+            "2024-01-02,9.39,9.21,9.42,9.21,1158366",
+            "2024-01-03,9.19,9.20,9.22,9.14,-",
+        ],
+        columns=["日期", "开盘", "收盘", "最高", "最低", "成交量"],
+    )
+    print(kline_df.dtypes)
+    print(kline_df)
@@ -0,0 +1,242 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/15 18:00
+Desc: 请求限速工具
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    线程安全的令牌桶限速器
+    以 rate 个/秒的速度补充令牌，最多积累 capacity 个，每次请求消耗一个令牌
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: float = None):
+        """
+        :param rate: 每秒补充的令牌数，即长期平均请求速率
+        :type rate: float
+        :param capacity: 令牌桶容量，即允许的突发请求数，默认与 rate 相同
+        :type capacity: float
+        """
+        if rate <= 0:
+            raise ValueError("rate 必须大于 0")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        预占令牌并返回需要等待的秒数，不阻塞
+        :param tokens: 需要消耗的令牌数
+        :type tokens: float
+        :return: 需要等待的秒数
+        :rtype: float
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0):
+        """
+        阻塞直到获得令牌
+        :param tokens: 需要消耗的令牌数
+        :type tokens: float
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0):
+        """
+        asyncio 版本的 acquire, 等待期间不阻塞事件循环
+        :param tokens: 需要消耗的令牌数
+        :type tokens: float
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HostLimiter:
+    """
+    单个 host 的限速器: 令牌桶控制请求速率, 信号量控制同时进行的请求数
+    线程和 asyncio 任务共享同一个限速器
+    """
+
+    def __init__(
+        self, rate: float = None, capacity: float = None, max_concurrency: int = None
+    ):
+        """
+        :param rate: 每秒最多发起的请求数, 为 None 时不限制速率
+        :type rate: float
+        :param capacity: 允许的突发请求数, 默认与 rate 相同
+        :type capacity: float
+        :param max_concurrency: 最多同时进行的请求数, 为 None 时不限制
+        :type max_concurrency: int
+        """
+        self.rate = rate
+        self.max_concurrency = max_concurrency
+        self.bucket = TokenBucket(rate=rate, capacity=capacity) if rate else None
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
+        # 等待并发名额的 asyncio 任务: (事件循环, future), 由 release 按顺序唤醒
+        self._lock = threading.Lock()
+        self._waiters = deque()
+
+    def acquire(self):
+        """
+        阻塞直到可以发起请求, 请求结束后必须调用 release
+        """
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        if self.bucket is not None:
+            try:
+                self.bucket.acquire()
+            except BaseException:
+                self.release()
+                raise
+
+    async def acquire_async(self):
+        """
+        asyncio 版本的 acquire, 请求结束后必须调用 release
+        等待期间任务被取消时, 已占用的并发名额会被归还
+        """
+        if self._semaphore is not None:
+            await self._acquire_slot_async()
+        if self.bucket is not None:
+            try:
+                await self.bucket.acquire_async()
+            except BaseException:
+                self.release()
+                raise
+
+    async def _acquire_slot_async(self):
+        # 线程信号量不能 await: 名额已满时挂起在 future 上, 由 release 唤醒后重试
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._semaphore.acquire(blocking=False):
+                    return
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            except BaseException:
+                with self._lock:
+                    try:
+                        self._waiters.remove((loop, waiter))
+                    except ValueError:
+                        # 已被唤醒但没有去取名额, 把唤醒转交给下一个等待者
+                        self._wake_next()
+                raise
+
+    def _wake_next(self):
+        # 调用方需持有 self._lock
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_set_waiter, waiter)
+                return
+            except RuntimeError:
+                # 事件循环已关闭
+                continue
+
+    def release(self):
+        if self._semaphore is None:
+            return
+        with self._lock:
+            self._semaphore.release()
+            self._wake_next()
+
+    @contextmanager
+    def limit(self):
+        """
+        with limiter.limit(): 包裹一次请求
+        """
+        self.acquire()
+        try:
+            yield self
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def limit_async(self):
+        """
+        async with limiter.limit_async(): 包裹一次请求
+        """
+        await self.acquire_async()
+        try:
+            yield self
+        finally:
+            self.release()
+
+
+def _set_waiter(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# 各 host 的默认限速: {host 后缀: {"rate": 每秒请求数, "max_concurrency": 最大并发数}}
+# 按最长后缀匹配, 例如 82.push2.eastmoney.com 使用 push2.eastmoney.com 的限速, 同一后缀的所有 host 共享一个限速器
+# 未匹配的 host 不限速
+DEFAULT_HOST_LIMITS: Dict[str, Dict] = {
+    # 东方财富
+    "push2.eastmoney.com": {"rate": 10.0, "max_concurrency": 8},
+    "push2his.eastmoney.com": {"rate": 5.0, "max_concurrency": 4},
+    "datacenter-web.eastmoney.com": {"rate": 5.0, "max_concurrency": 4},
+    "datacenter.eastmoney.com": {"rate": 5.0, "max_concurrency": 4},
+    "eastmoney.com": {"rate": 10.0, "max_concurrency": 8},
+    # 新浪财经
+    "sina.com.cn": {"rate": 5.0, "max_concurrency": 4},
+    "sinajs.cn": {"rate": 5.0, "max_concurrency": 4},
+    # 腾讯财经
+    "qq.com": {"rate": 10.0, "max_concurrency": 8},
+    "gtimg.cn": {"rate": 10.0, "max_concurrency": 8},
+    # 交易所
+    "sse.com.cn": {"rate": 3.0, "max_concurrency": 2},
+    "szse.cn": {"rate": 3.0, "max_concurrency": 2},
+    "bse.cn": {"rate": 3.0, "max_concurrency": 2},
+    "cffex.com.cn": {"rate": 2.0, "max_concurrency": 2},
+    "shfe.com.cn": {"rate": 2.0, "max_concurrency": 2},
+    "ine.cn": {"rate": 2.0, "max_concurrency": 2},
+    "dce.com.cn": {"rate": 2.0, "max_concurrency": 2},
+    "czce.com.cn": {"rate": 2.0, "max_concurrency": 2},
+    "gfex.com.cn": {"rate": 2.0, "max_concurrency": 2},
+}
+
+
+def match_host_rule(host: str, rules) -> Optional[str]:
+    """
+    按最长后缀匹配 host 对应的限速规则
+    :param host: host, 例如 "82.push2.eastmoney.com"
+    :type host: str
+    :param rules: 全部规则的 host 后缀
+    :type rules: iterable
+    :return: 匹配到的 host 后缀, 没有匹配时为 None
+    :rtype: str
+    """
+    host = host.split(":")[0]
+    matched = None
+    for rule in rules:
+        if host == rule or host.endswith("." + rule):
+            if matched is None or len(rule) > len(matched):
+                matched = rule
+    return matched
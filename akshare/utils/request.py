@@ -1,6 +1,6 @@
 # !/usr/bin/env python
 """
-Date: 2025/12/31
+Date: 2026/10/15
 Desc: HTTP 请求工具函数
 """
 
@@ -9,15 +9,16 @@ import time
 from typing import Dict, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
+
+from akshare.utils.context import config, get_retry_policy, get_session
 
 
 def request_with_retry(
     url: str,
     params: Dict = None,
     timeout: int = 15,
-    max_retries: int = 3,
-    base_delay: float = 1.0,
+    max_retries: int = None,
+    base_delay: float = None,
     random_delay_range: Tuple[float, float] = (0.5, 1.5),
 ) -> requests.Response:
     """
@@ -28,9 +29,9 @@ def request_with_retry(
     :type params: dict
     :param timeout: 超时时间（秒）
     :type timeout: int
-    :param max_retries: 最大重试次数
+    :param max_retries: 最大重试次数，默认使用该 host 的重试策略
     :type max_retries: int
-    :param base_delay: 基础延迟时间（秒），用于指数退避
+    :param base_delay: 基础延迟时间（秒），用于指数退避，默认使用该 host 的重试策略
     :type base_delay: float
     :param random_delay_range: 随机延迟范围（秒）
     :type random_delay_range: tuple
@@ -38,20 +39,22 @@ def request_with_retry(
     :rtype: requests.Response
     :raises: 最后一次请求的异常
     """
+    policy = get_retry_policy(url)
+    if max_retries is None:
+        max_retries = policy["max_retries"]
+    if base_delay is None:
+        base_delay = policy["base_delay"]
     last_exception = None
 
     for attempt in range(max_retries):
         try:
-            # 每次请求创建新的 Session，避免复用连接
-            with requests.Session() as session:
-                # 禁用连接池复用
-                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
-                session.mount("http://", adapter)
-                session.mount("https://", adapter)
-
-                response = session.get(url, params=params, timeout=timeout)
-                response.raise_for_status()
-                return response
+            # 同一 host 共享连接池，复用已建立的连接
+            session = get_session(url)
+            response = session.get(
+                url, params=params, timeout=timeout, proxies=config.proxies
+            )
+            response.raise_for_status()
+            return response
 
         except (requests.RequestException, ValueError) as e:
             last_exception = e
@@ -0,0 +1,94 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/15
+Desc: 本地行情数据存储
+安装 pyarrow 时以 Parquet 格式存储，否则退回 pickle 格式
+"""
+
+import os
+import threading
+from typing import Optional
+
+import pandas as pd
+
+from akshare.utils.context import get_cache_dir
+
+try:
+    import pyarrow  # noqa: F401
+
+    _SUFFIX = ".parquet"
+except ImportError:
+    _SUFFIX = ".pkl"
+
+
+class OHLCVStore:
+    """
+    按 (数据源, 代码, 周期, 复权方式) 分文件存储的本地行情库
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        :param root: 存储目录, 默认为缓存目录下的 ohlcv 文件夹
+        :type root: str
+        """
+        self.root = root if root is not None else os.path.join(get_cache_dir(), "ohlcv")
+        self._lock = threading.Lock()
+
+    def path(self, source: str, symbol: str, period: str, adjust: str) -> str:
+        """
+        数据文件路径
+        :param source: 数据源
+        :type source: str
+        :param symbol: 代码
+        :type symbol: str
+        :param period: 周期
+        :type period: str
+        :param adjust: 复权方式, 不复权时为空字符串
+        :type adjust: str
+        :return: 数据文件路径
+        :rtype: str
+        """
+        return os.path.join(
+            self.root, source, period, adjust or "none", f"{symbol}{_SUFFIX}"
+        )
+
+    def read(
+        self, source: str, symbol: str, period: str, adjust: str
+    ) -> Optional[pd.DataFrame]:
+        """
+        读取本地数据, 不存在时返回 None
+        :return: 本地行情数据
+        :rtype: pandas.DataFrame
+        """
+        fp = self.path(source, symbol, period, adjust)
+        if not os.path.exists(fp):
+            return None
+        if _SUFFIX == ".parquet":
+            return pd.read_parquet(fp)
+        return pd.read_pickle(fp)
+
+    def write(
+        self, df: pd.DataFrame, source: str, symbol: str, period: str, adjust: str
+    ):
+        """
+        整体写入本地数据, 先写临时文件再替换, 避免中断时损坏已有数据
+        :param df: 行情数据
+        :type df: pandas.DataFrame
+        """
+        fp = self.path(source, symbol, period, adjust)
+        tmp_fp = f"{fp}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._lock:
+            os.makedirs(os.path.dirname(fp), exist_ok=True)
+            if _SUFFIX == ".parquet":
+                df.to_parquet(tmp_fp, index=False)
+            else:
+                df.to_pickle(tmp_fp)
+            os.replace(tmp_fp, fp)
+
+    def delete(self, source: str, symbol: str, period: str, adjust: str):
+        """
+        删除本地数据
+        """
+        fp = self.path(source, symbol, period, adjust)
+        if os.path.exists(fp):
+            os.remove(fp)
@@ -0,0 +1,179 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/15 18:00
+Desc: 代码和市场标识映射的缓存
+映射表首次使用时加载一次并保存到本地缓存目录, 过期后先返回旧数据, 同时在后台线程中刷新
+"""
+
+import functools
+import importlib
+import json
+import os
+import threading
+import time
+import warnings
+from typing import Any, Callable, Optional
+
+from akshare.utils.context import config, get_cache_dir
+
+# 各类证券的映射表所在的模块和函数, 供 resolve_secid 按需导入
+SECID_MAP_FUNCS = {
+    "index": ("akshare.index.index_zh_em", "index_code_id_map_em"),
+    "lof": ("akshare.fund.fund_lof_em", "_fund_lof_code_id_map_em"),
+    "etf": ("akshare.fund.fund_etf_em", "_fund_etf_code_id_map_em"),
+    "bond_cov": ("akshare.bond.bond_zh_cov", "_code_id_map"),
+}
+
+
+def set_symbol_map_ttl(ttl: float = 86400):
+    """
+    设置代码映射表的有效期, 过期后在后台刷新
+    :param ttl: 有效期（秒）
+    :type ttl: float
+    """
+    config.symbol_map_ttl = ttl
+
+
+def _to_json(obj):
+    # numpy 整数等类型无法直接序列化
+    return obj.item() if hasattr(obj, "item") else str(obj)
+
+
+class _SymbolMapCache:
+    """
+    单个映射表的内存和本地文件缓存
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self.loader = loader
+        self._data = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._refreshing = False
+
+    @property
+    def path(self) -> str:
+        return os.path.join(get_cache_dir(), "symbol_map", f"{self.name}.json")
+
+    def _is_fresh(self) -> bool:
+        return time.time() - self._loaded_at < config.symbol_map_ttl
+
+    def _read_disk(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data_json = json.load(f)
+            data, loaded_at = data_json["data"], float(data_json["time"])
+        except (OSError, ValueError, KeyError, TypeError):
+            # 缓存文件不存在或已损坏时重新下载
+            return
+        self._data = data
+        self._loaded_at = loaded_at
+
+    def _write_disk(self, data, loaded_at: float):
+        fp = self.path
+        tmp_fp = f"{fp}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(fp), exist_ok=True)
+            with open(tmp_fp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"time": loaded_at, "data": data},
+                    f,
+                    ensure_ascii=False,
+                    default=_to_json,
+                )
+            os.replace(tmp_fp, fp)
+        except OSError as e:
+            warnings.warn(f"{self.name} 映射表写入本地缓存失败: {e}")
+
+    def refresh(self):
+        """
+        重新下载映射表并保存到本地
+        """
+        data = self.loader()
+        loaded_at = time.time()
+        with self._lock:
+            self._data = data
+            self._loaded_at = loaded_at
+        self._write_disk(data, loaded_at)
+        return data
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            warnings.warn(f"{self.name} 映射表后台刷新失败, 继续使用旧数据: {e}")
+        finally:
+            self._refreshing = False
+
+    def get(self):
+        with self._lock:
+            if self._data is None:
+                self._read_disk()
+            if self._data is not None:
+                if not self._is_fresh() and not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(
+                        target=self._refresh_in_background, daemon=True
+                    ).start()
+                return self._data
+        # 没有任何缓存时同步下载, 并发调用时只下载一次
+        with self._load_lock:
+            if self._data is not None:
+                return self._data
+            return self.refresh()
+
+    def clear(self):
+        """
+        清空内存和本地缓存
+        """
+        with self._lock:
+            self._data = None
+            self._loaded_at = 0.0
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def cached_symbol_map(name: str):
+    """
+    代码映射表缓存装饰器, 用于无参数的映射表函数
+    被装饰的函数增加 refresh() 和 cache_clear() 方法
+    :param name: 缓存名称, 即本地缓存的文件名
+    :type name: str
+    """
+
+    def decorator(func):
+        cache = _SymbolMapCache(name, func)
+
+        @functools.wraps(func)
+        def wrapper():
+            return cache.get()
+
+        wrapper.refresh = cache.refresh
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def resolve_secid(code: str, kind: str = "index") -> Optional[str]:
+    """
+    东方财富-根据代码查询 secid, 即 "市场标识.代码"
+    :param code: 代码, 例如 "000300"
+    :type code: str
+    :param kind: choice of {"index", "lof", "etf", "bond_cov"}
+    :type kind: str
+    :return: secid, 例如 "1.000300"; 映射表中不存在该代码时返回 None
+    :rtype: str
+    """
+    module_name, func_name = SECID_MAP_FUNCS[kind]
+    code_id_dict = getattr(importlib.import_module(module_name), func_name)()
+    market_id = code_id_dict.get(code)
+    if market_id is None:
+        return None
+    return f"{market_id}.{code}"
+
+
+if __name__ == "__main__":
+    print(resolve_secid(code="000300", kind="index"))
@@ -0,0 +1,179 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/15 18:00
+Desc: 交易日历
+只在首次使用时读取 file_fold/calendar.json, 之后复用同一个日历对象
+"""
+
+import datetime
+import json
+import os
+import re
+from functools import lru_cache
+from typing import List, Union
+
+import numpy as np
+
+DayLike = Union[str, datetime.date, np.datetime64]
+
+_DATE_PATTERN = re.compile(r"^([0-9]{4})[-/]?([0-9]{2})[-/]?([0-9]{2})")
+
+
+def _to_day(day: DayLike) -> np.datetime64:
+    """
+    将 YYYYMMDD, YYYY-MM-DD 字符串, datetime.date 或 datetime.datetime 转换为 datetime64[D]
+    :param day: 日期
+    :type day: str or datetime.date
+    :return: 日期
+    :rtype: numpy.datetime64
+    """
+    if isinstance(day, np.datetime64):
+        return day.astype("datetime64[D]")
+    if isinstance(day, datetime.datetime):
+        day = day.date()
+    if isinstance(day, datetime.date):
+        return np.datetime64(day, "D")
+    if isinstance(day, str):
+        match = _DATE_PATTERN.match(day)
+        if match:
+            return np.datetime64("-".join(match.groups()), "D")
+    raise ValueError(f"无法识别的日期: {day!r}")
+
+
+class TradingCalendar:
+    """
+    交易日历
+    交易日保存在排序后的 datetime64[D] 数组中, 同时维护一个集合用于判断是否为交易日
+    """
+
+    def __init__(self, dates: List[str]):
+        """
+        :param dates: 交易日列表, 格式为 YYYYMMDD
+        :type dates: list
+        """
+        self.days = np.unique(np.array([_to_day(item) for item in dates]))
+        self._day_set = set(self.days.tolist())
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def __contains__(self, day) -> bool:
+        try:
+            return self.is_trading_day(day)
+        except ValueError:
+            return False
+
+    def is_trading_day(self, day: DayLike) -> bool:
+        """
+        是否为交易日
+        :param day: 日期
+        :type day: str or datetime.date
+        :return: 是否为交易日
+        :rtype: bool
+        """
+        return _to_day(day).item() in self._day_set
+
+    def offset(self, day: DayLike, n: int) -> datetime.date:
+        """
+        从 day 开始偏移 n 个交易日; day 不是交易日时, n > 0 时其后的第一个交易日为第 1 个,
+        n < 0 时其前的第一个交易日为第 -1 个, n = 0 返回 day 之前的最近一个交易日
+        :param day: 日期
+        :type day: str or datetime.date
+        :param n: 偏移的交易日数量, 负数表示向前偏移
+        :type n: int
+        :return: 交易日, 超出日历范围时返回 None
+        :rtype: datetime.date
+        """
+        day = _to_day(day)
+        pos = int(np.searchsorted(self.days, day, side="left"))
+        on_day = pos < len(self.days) and self.days[pos] == day
+        if on_day or n < 0:
+            # day 不是交易日时, pos 是其后的第一个交易日, pos - 1 是其前的第一个交易日
+            index = pos + n
+        elif n > 0:
+            index = pos + n - 1
+        else:
+            index = pos - 1
+        if index < 0 or index >= len(self.days):
+            return None
+        return self.days[index].item()
+
+    def prev(self, day: DayLike, n: int = 1) -> datetime.date:
+        """
+        day 之前的第 n 个交易日, 不包含 day 本身
+        :param day: 日期
+        :type day: str or datetime.date
+        :param n: 第几个交易日
+        :type n: int
+        :return: 交易日, 超出日历范围时返回 None
+        :rtype: datetime.date
+        """
+        return self.offset(day, -n)
+
+    def next(self, day: DayLike, n: int = 1) -> datetime.date:
+        """
+        day 之后的第 n 个交易日, 不包含 day 本身
+        :param day: 日期
+        :type day: str or datetime.date
+        :param n: 第几个交易日
+        :type n: int
+        :return: 交易日, 超出日历范围时返回 None
+        :rtype: datetime.date
+        """
+        return self.offset(day, n)
+
+    def latest(self, day: DayLike) -> datetime.date:
+        """
+        不晚于 day 的最近一个交易日
+        :param day: 日期
+        :type day: str or datetime.date
+        :return: 交易日, 早于日历开始日期时返回 None
+        :rtype: datetime.date
+        """
+        return self.offset(day, 0)
+
+    def trading_days_between(self, start: DayLike, end: DayLike) -> np.ndarray:
+        """
+        [start, end] 区间内的全部交易日
+        :param start: 开始日期
+        :type start: str or datetime.date
+        :param end: 结束日期
+        :type end: str or datetime.date
+        :return: 交易日数组, 可通过 tolist() 转换为 datetime.date 列表
+        :rtype: numpy.ndarray
+        """
+        left = np.searchsorted(self.days, _to_day(start), side="left")
+        right = np.searchsorted(self.days, _to_day(end), side="right")
+        return self.days[left:right]
+
+    def to_list(self) -> List[str]:
+        """
+        交易日列表, 格式为 YYYYMMDD
+        :return: 交易日列表
+        :rtype: list
+        """
+        return np.char.replace(self.days.astype(str), "-", "").tolist()
+
+
+@lru_cache(maxsize=1)
+def get_trading_calendar() -> TradingCalendar:
+    """
+    获取交易日历, 主要是从新浪获取的, 需要按年更新 file_fold/calendar.json
+    :return: 交易日历
+    :rtype: TradingCalendar
+    """
+    setting_file_path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "file_fold",
+        "calendar.json",
+    )
+    with open(setting_file_path, "r", encoding="utf-8") as f:
+        data_json = json.load(f)
+    return TradingCalendar(data_json)
+
+
+if __name__ == "__main__":
+    trading_calendar = get_trading_calendar()
+    print(trading_calendar.is_trading_day("20241008"))
+    print(trading_calendar.prev("20241008"), trading_calendar.next("20240930"))
+    print(trading_calendar.trading_days_between("20240925", "20241010"))
@@ -10,7 +10,6 @@ Desc: 量化选股脚本 - MACD趋势过滤 + MA55贴近度排序
 3. 输出前20名
 """
 
-import time
 import random
 from datetime import datetime, timedelta
 
@@ -183,9 +182,6 @@ def run_screener(top_n: int = 20, sample_ratio: float = 1.0) -> pd.DataFrame:
         result = screen_single_stock(symbol, name, end_date)
         if result:
             results.append(result)
-        
-        # 避免请求过快被限流
-        time.sleep(0.1)
     
     print(f"\n   符合 DEA > 0 条件的股票: {len(results)} 只")
     
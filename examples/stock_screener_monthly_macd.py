@@ -17,6 +17,7 @@ import time
 from datetime import datetime, timedelta
 
 import akshare as ak
+from akshare.cal.indicator import macd
 import pandas as pd
 from tqdm import tqdm
 
@@ -25,12 +26,7 @@ def calculate_macd(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int
     """
     计算 MACD 指标
     """
-    close = df['收盘']
-    ema_fast = close.ewm(span=fast, adjust=False).mean()
-    ema_slow = close.ewm(span=slow, adjust=False).mean()
-    df['DIF'] = ema_fast - ema_slow
-    df['DEA'] = df['DIF'].ewm(span=signal, adjust=False).mean()
-    df['MACD柱'] = 2 * (df['DIF'] - df['DEA'])
+    df['DIF'], df['DEA'], df['MACD柱'] = macd(df['收盘'], fast, slow, signal)
     return df
 
 
@@ -234,9 +230,6 @@ def run_screener(top_n: int = 20, sample_ratio: float = 1.0) -> pd.DataFrame:
         result = screen_single_stock(symbol, name, end_date)
         if result:
             results.append(result)
-        
-        # 避免请求过快
-        time.sleep(0.1)
     
     print(f"\n   符合条件的股票: {len(results)} 只")
     print(f"   数据源统计: 东方财富成功 {DATA_SOURCE_STATS['eastmoney']} 只, 失败 {DATA_SOURCE_STATS['failed']} 只")
@@ -17,6 +17,7 @@ from flask import Flask, render_template_string, jsonify, request, send_file
 from io import BytesIO
 
 import akshare as ak
+from akshare.cal.indicator import macd
 import pandas as pd
 import numpy as np
 
@@ -91,12 +92,7 @@ DATA_SOURCE_HEALTH = {"eastmoney_ok": None}
 
 # ==================== 通用函数 ====================
 def calculate_macd(df, fast=12, slow=26, signal=9):
-    close = df['收盘']
-    ema_fast = close.ewm(span=fast, adjust=False).mean()
-    ema_slow = close.ewm(span=slow, adjust=False).mean()
-    df['DIF'] = ema_fast - ema_slow
-    df['DEA'] = df['DIF'].ewm(span=signal, adjust=False).mean()
-    df['MACD柱'] = 2 * (df['DIF'] - df['DEA'])
+    df['DIF'], df['DEA'], df['MACD柱'] = macd(df['收盘'], fast, slow, signal)
     return df
 
 
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: pd.read_html 取其中一个表格与 akshare.utils.html_table.read_html_table 的耗时对比
+按新浪财经-财务指标页面和交易所持仓排名页面的结构生成网页: 多个布局表格嵌套, 目标表格只是其中一个
+python scripts/benchmark_html_table.py
+python scripts/benchmark_html_table.py 5000
+"""
+
+import random
+import sys
+import time
+from io import StringIO
+
+import pandas as pd
+
+from akshare.utils.html_table import read_html_table
+
+
+def _layout_tables(n: int) -> str:
+    return "".join(
+        f"<table><tr><td><a href='#'>导航{i}</a></td><td>说明{i}</td></tr></table>"
+        for i in range(n)
+    )
+
+
+def finance_page(n_rows: int) -> str:
+    """
+    新浪财经-财务指标: 布局表格中嵌套十几个表格, 财务指标表格每行是一个指标, 每列是一个报告期
+    """
+    dates = "".join(f"<td>20{year:02d}-12-31</td>" for year in range(24, 4, -1))
+    rows = [f"<tr><td>报告日期</td>{dates}<td></td></tr>"]
+    for i in range(n_rows):
+        values = "".join(
+            f"<td>{random.uniform(-1e4, 1e4):,.2f}</td>" for _ in range(20)
+        )
+        rows.append(f"<tr><td>每股指标{i}(元)</td>{values}<td></td></tr>")
+    table = f"<table>{''.join(rows)}</table>"
+    return (
+        f"<html><body><table><tr><td>{_layout_tables(12)}</td>"
+        f"<td>{table}</td></tr></table>{_layout_tables(20)}</body></html>"
+    )
+
+
+def rank_page(n_rows: int) -> str:
+    """
+    交易所持仓排名: 查询表单等多个表格和一个 12 列的排名表格
+    """
+    header = [
+        "名次",
+        "会员简称",
+        "成交量",
+        "增减",
+        "名次",
+        "会员简称",
+        "持买单量",
+        "增减",
+    ]
+    header += ["名次", "会员简称", "持卖单量", "增减"]
+    rows = ["<tr>" + "".join(f"<th>{name}</th>" for name in header) + "</tr>"]
+    for i in range(1, n_rows + 1):
+        cells = []
+        for name in ("成交", "买", "卖"):
+            cells += [i, f"{name}会员{i}", f"{random.randint(0, 10**6):,}"]
+            cells.append(random.choice(["-", str(random.randint(-5000, 5000))]))
+        rows.append("<tr>" + "".join(f"<td>{cell}</td>" for cell in cells) + "</tr>")
+    table = f"<table>{''.join(rows)}</table>"
+    return f"<html><body>{_layout_tables(30)}{table}{_layout_tables(30)}</body></html>"
+
+
+def best_of(func, repeat: int = 3) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed) * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    random.seed(0)
+    pages = {
+        "财务指标": (finance_page(n // 10), 13, dict(match="每股指标", header=None)),
+        "持仓排名": (rank_page(n), 30, dict(headers=["名次", "持买单量", "持卖单量"])),
+    }
+    cases = {
+        "read_html(lxml)": lambda text, position, kwargs: pd.read_html(
+            StringIO(text), flavor="lxml"
+        )[position],
+        "read_html(bs4)": lambda text, position, kwargs: pd.read_html(
+            StringIO(text), flavor="bs4"
+        )[position],
+        "read_html_table": lambda text, position, kwargs: read_html_table(
+            text, **kwargs
+        ),
+    }
+    print(f"{'网页':<8}{'大小(KB)':>10}{'方式':>18}{'耗时(ms)':>12}")
+    for page_name, (text, position, kwargs) in pages.items():
+        for case_name, case in cases.items():
+            try:
+                elapsed = best_of(lambda: case(text, position, kwargs))
+            except ImportError:
+                # bs4 和 html5lib 未安装时跳过
+                continue
+            print(
+                f"{page_name:<8}{len(text) / 1024:>10.0f}{case_name:>18}{elapsed:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: import akshare 的耗时和内存占用
+每次测试都在新的子进程中运行, 避免模块缓存的影响
+python scripts/benchmark_import.py
+"""
+
+import json
+import subprocess
+import sys
+
+CASES = {
+    "import akshare": "import akshare",
+    "import akshare + stock_zh_a_hist": "import akshare; akshare.stock_zh_a_hist",
+    "import akshare + 全部接口": "import akshare; [getattr(akshare, name) for name in akshare.__all__ if name != 'xt_api']",
+}
+
+CODE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "max_rss_mb": rss / (1024 * 1024 if sys.platform == "darwin" else 1024), "modules": len(sys.modules)}}))
+"""
+
+
+def main(repeat: int = 3):
+    for name, statement in CASES.items():
+        results = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", CODE.format(statement=statement)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+        best = min(results, key=lambda item: item["seconds"])
+        print(
+            f"{name}: {best['seconds']:.3f}s, "
+            f"max RSS {best['max_rss_mb']:.1f} MB, {best['modules']} modules"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: js_literal.loads 与 demjson.decode 的解析耗时对比
+不带参数时使用内置的样例数据; 也可以传入保存下来的接口原始返回内容（每个文件一个响应）进行回放:
+python scripts/benchmark_js_literal.py
+python scripts/benchmark_js_literal.py payloads/*.txt
+"""
+
+import json
+import pathlib
+import sys
+import time
+
+from akshare.utils import demjson
+from akshare.utils.js_literal import loads, unwrap
+
+
+def _sample_payloads() -> dict:
+    """
+    仿照各接口返回格式构造的样例数据
+    """
+    sina_rows = ",".join(
+        f'{{symbol:"sh6{i:05d}",code:"6{i:05d}",name:"名称",trade:"7.230",'
+        f"pricechange:-0.05,changepercent:-0.687,volume:{i},amount:12345678}}"
+        for i in range(300)
+    )
+    tx_rows = json.dumps(
+        [["2024-01-02", "7.10", "7.20", "7.30", "7.00", "1000.000"]] * 250
+    )
+    fund_rows = json.dumps(
+        [
+            [f"{i:06d}", "HXCZHH", "华夏成长混合", "混合型-偏股", "HUAXIA"]
+            for i in range(2000)
+        ],
+        ensure_ascii=False,
+    )
+    return {
+        "新浪-无引号的键": f"[{sina_rows}]",
+        "腾讯-K 线": f'kline_dayqfq2024={{"code":0,"data":{{"sh600000":{{"qfqday":{tx_rows}}}}}}}',
+        "天天基金-基金列表": f"var r = {fund_rows};",
+        "单引号和末尾逗号": "{"
+        + ",".join(f"k{i}: ['{i}', .5, 0x1F,]" for i in range(500))
+        + "}",
+    }
+
+
+def _best(func, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(paths: list, repeat: int = 3):
+    if paths:
+        payloads = {
+            path: pathlib.Path(path).read_text(encoding="utf-8") for path in paths
+        }
+    else:
+        payloads = _sample_payloads()
+    for name, text in payloads.items():
+        fast = _best(loads, text, repeat)
+        # demjson 不处理外层包装, 与各接口一样先截取字面量部分
+        slow = _best(demjson.decode, unwrap(text), 1)
+        print(
+            f"{name}: {len(text) / 1024:.0f} KB, loads {fast * 1000:.2f} ms, "
+            f"demjson {slow * 1000:.2f} ms, {slow / fast:.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
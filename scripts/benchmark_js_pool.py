@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 每次新建 MiniRacer 环境与使用 JS 环境池的耗时和内存对比
+以同花顺 ths.js 中生成 v 参数的 v() 函数为例, 分别在子进程中运行, 避免相互影响:
+python scripts/benchmark_js_pool.py
+python scripts/benchmark_js_pool.py 200
+"""
+
+import json
+import subprocess
+import sys
+
+CASE_CODE = r"""
+import json, resource, sys, time
+from akshare.datasets import get_ths_js
+
+with open(get_ths_js("ths.js"), encoding="utf-8") as f:
+    source = f.read()
+n = int(sys.argv[2])
+if sys.argv[1] == "fresh":
+    from py_mini_racer import MiniRacer
+
+    def call():
+        ctx = MiniRacer()
+        ctx.eval(source)
+        return ctx.call("v")
+else:
+    from akshare.utils.js_pool import get_js_context
+
+    def call():
+        return get_js_context(source).call("v")
+
+call()
+start = time.perf_counter()
+for _ in range(n):
+    call()
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps({"per_call_ms": elapsed / n * 1000, "max_rss_mb": rss}))
+"""
+
+
+def run_case(case: str, n: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CASE_CODE, case, str(n)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print(f"{'方式':<8}{'单次耗时(ms)':>14}{'最大内存(MB)':>14}")
+    for case, label in (("fresh", "新建环境"), ("pool", "环境池")):
+        result = run_case(case, n)
+        print(f"{label:<8}{result['per_call_ms']:>14.3f}{result['max_rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: K 线数据逐行 split 后逐列 pd.to_numeric 与 akshare.utils.kline.parse_klines 的耗时和内存对比
+以 stock_zh_a_hist_min_em 的 11 个字段为例, 分别在子进程中运行, 避免相互影响:
+python scripts/benchmark_kline.py
+python scripts/benchmark_kline.py 500000
+"""
+
+import json
+import subprocess
+import sys
+
+CASE_CODE = r"""
+import json, random, resource, sys, time
+import pandas as pd
+
+columns = ["时间", "开盘", "收盘", "最高", "最低", "成交量", "成交额", "振幅", "涨跌幅", "涨跌额", "换手率"]
+random.seed(0)
+lines = []
+for i in range(int(sys.argv[2])):
+    price = [f"{random.uniform(5, 50):.2f}" for _ in range(4)]
+    lines.append(
+        ",".join(
+            [f"2024-01-02 {9 + i % 6:02d}:{i % 60:02d}", *price]
+            + [str(random.randint(0, 10**6)), f"{random.uniform(0, 1e8):.2f}"]
+            + [f"{random.uniform(-10, 10):.2f}" for _ in range(4)]
+        )
+    )
+base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+if sys.argv[1] == "split":
+    temp_df = pd.DataFrame([item.split(",") for item in lines])
+    temp_df.columns = columns
+    for column in columns[1:]:
+        temp_df[column] = pd.to_numeric(temp_df[column], errors="coerce")
+else:
+    from akshare.utils.kline import parse_klines
+
+    temp_df = parse_klines(lines, columns=columns, text_columns=("时间",))
+elapsed = time.perf_counter() - start
+rss = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base_rss) / 1024
+print(json.dumps({"elapsed_ms": elapsed * 1000, "extra_rss_mb": rss}))
+"""
+
+
+def run_case(case: str, n: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CASE_CODE, case, str(n)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{n} 行")
+    print(f"{'方式':<18}{'耗时(ms)':>12}{'新增内存(MB)':>14}")
+    for case, label in (("split", "split+to_numeric"), ("kline", "parse_klines")):
+        result = run_case(case, n)
+        print(
+            f"{label:<18}{result['elapsed_ms']:>12.1f}{result['extra_rss_mb']:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
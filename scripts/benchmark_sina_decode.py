@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 新浪财经-K 线数据解码, 纯 Python 版本 sina_kline_decode_py 与 MiniRacer 执行 JS 版本的耗时对比
+MiniRacer 冷启动为原来每次调用都新建 MiniRacer 并 eval(hk_js_decode) 的写法, 复用环境为 sina_kline_decode_js
+不带参数时使用按各解码分支随机构造的样例数据; 也可以传入保存下来的接口原始返回内容（例如 klc_kl.js, 每个文件一个响应）进行回放:
+python scripts/benchmark_sina_decode.py
+python scripts/benchmark_sina_decode.py payloads/*.js
+"""
+
+import pathlib
+import random
+import sys
+import time
+
+from akshare.stock.cons import hk_js_decode
+from akshare.utils.sina_decode import sina_kline_decode_js, sina_kline_decode_py
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+# 解码分支: 样例数据的长度
+DECODERS = {1479: 20000, 136: 20000, 200: 4000, 139: 2000, 197: 20000, 3466: 20000}
+
+
+def _sample_payloads() -> dict:
+    """
+    按解码分支构造的样例数据, 前 18 位为解码分支和版本号; 跳过解码出错或没有数据的随机数据
+    """
+    rnd = random.Random(0)
+    payloads = {}
+    for decoder_id, length in DECODERS.items():
+        head = [decoder_id & 63, (decoder_id >> 6) & 63, 63]
+        for _ in range(100):
+            body = [rnd.randrange(64) for _ in range(length)]
+            payload = "".join(ALPHABET[item] for item in head + body)
+            try:
+                if sina_kline_decode_py(payload):
+                    payloads[f"分支 {decoder_id}"] = payload
+                    break
+            except Exception:
+                continue
+    return payloads
+
+
+def _unwrap(text: str) -> str:
+    """
+    与各接口一样截取 var KLC_KL_xxx="..."; 中的加密字符串
+    """
+    text = text.strip()
+    if "=" in text:
+        text = text.split("=", 1)[1].split(";")[0]
+    return text.replace('"', "")
+
+
+def _decode_cold(payload: str):
+    import py_mini_racer
+
+    js_code = py_mini_racer.MiniRacer()
+    js_code.eval(hk_js_decode)
+    return js_code.call("d", payload)
+
+
+def _best(func, payload: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(paths: list, repeat: int = 5):
+    if paths:
+        payloads = {
+            path: _unwrap(pathlib.Path(path).read_text(encoding="utf-8"))
+            for path in paths
+        }
+    else:
+        payloads = _sample_payloads()
+    # 先执行一次 sina_kline_decode_js, 复用环境的耗时不计入创建环境和加载 JS 的时间
+    sina_kline_decode_js(next(iter(payloads.values())))
+    for name, payload in payloads.items():
+        rows = sina_kline_decode_py(payload)
+        same = rows == sina_kline_decode_js(payload)
+        python_ms = _best(sina_kline_decode_py, payload, repeat) * 1000
+        cold_ms = _best(_decode_cold, payload, repeat) * 1000
+        warm_ms = _best(sina_kline_decode_js, payload, repeat) * 1000
+        print(
+            f"{name}: {len(rows)} 行, python {python_ms:.2f} ms, "
+            f"MiniRacer 冷启动 {cold_ms:.2f} ms, MiniRacer 复用环境 {warm_ms:.2f} ms, "
+            f"结果一致: {same}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 根据 akshare/__init__.py 中 TYPE_CHECKING 块的导入语句生成 akshare/_lazy_exports.py
+新增接口时, 在 akshare/__init__.py 的 TYPE_CHECKING 块中添加导入语句后运行本脚本:
+python scripts/gen_lazy_exports.py
+"""
+
+import ast
+import pathlib
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+INIT_PATH = ROOT / "akshare" / "__init__.py"
+OUTPUT_PATH = ROOT / "akshare" / "_lazy_exports.py"
+
+HEADER = '''#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Desc: akshare 顶层接口和所在模块的对照表, 用于 akshare/__init__.py 的延迟导入
+由 scripts/gen_lazy_exports.py 根据 akshare/__init__.py 中 TYPE_CHECKING 块生成, 请勿手动修改
+"""
+'''
+
+
+def _type_checking_block(tree: ast.Module) -> list:
+    """
+    找到 if TYPE_CHECKING: 块中的语句
+    """
+    for node in tree.body:
+        if (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Name)
+            and node.test.id == "TYPE_CHECKING"
+        ):
+            return node.body
+    raise ValueError("akshare/__init__.py 中没有 if TYPE_CHECKING: 块")
+
+
+def _module_name(node: ast.ImportFrom) -> str:
+    if node.level:
+        return "akshare" + ("." + node.module if node.module else "")
+    return node.module
+
+
+def parse_exports(source: str):
+    """
+    解析 TYPE_CHECKING 块中的导入语句
+    :param source: akshare/__init__.py 的源代码
+    :type source: str
+    :return: ([(分组说明, [(接口名称, 模块)])], 可选依赖的接口名称集合)
+    :rtype: tuple
+    """
+    groups = []
+    optional = set()
+    seen = set()
+    title = ""
+
+    def _add(node: ast.ImportFrom, is_optional: bool):
+        if not groups or groups[-1][0] != title:
+            groups.append((title, []))
+        for alias in node.names:
+            name = alias.asname or alias.name
+            if name in seen:
+                continue
+            seen.add(name)
+            groups[-1][1].append((name, _module_name(node)))
+            if is_optional:
+                optional.add(name)
+
+    for node in _type_checking_block(ast.parse(source)):
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            title = " ".join(str(node.value.value).split())
+        elif isinstance(node, ast.ImportFrom):
+            _add(node, is_optional=False)
+        elif isinstance(node, ast.Try):
+            for inner in node.body:
+                if isinstance(inner, ast.ImportFrom):
+                    _add(inner, is_optional=True)
+    return groups, optional
+
+
+def render(groups: list, optional: set) -> str:
+    lines = [HEADER, "LAZY_EXPORTS = {"]
+    for title, items in groups:
+        if title:
+            lines.append(f"    # {title}")
+        for name, module in items:
+            lines.append(f'    "{name}": "{module}",')
+    lines.append("}")
+    lines.append("")
+    lines.append("# 依赖可选的第三方库, 未安装时视为不存在该接口")
+    lines.append("OPTIONAL_EXPORTS = {")
+    for name in sorted(optional):
+        lines.append(f'    "{name}",')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    groups, optional = parse_exports(INIT_PATH.read_text(encoding="utf-8"))
+    OUTPUT_PATH.write_text(render(groups, optional), encoding="utf-8")
+    print(f"{sum(len(items) for _, items in groups)} exports -> {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
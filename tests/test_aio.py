@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 异步接口测试, 使用模拟的接口返回数据, 与同步接口的结果比较
+"""
+
+import asyncio
+import json
+from unittest import mock
+
+import pandas as pd
+
+import akshare.aio as ak_aio
+from akshare.aio import client
+from akshare.stock_feature import stock_hist_em
+from akshare.utils import context
+
+KLINE_JSON = {
+    "data": {
+        "klines": [
+            "2024-01-02,9.39,9.21,9.42,9.21,1158366,1075742252.45,2.24,-1.92,-0.18,0.60",
+            "2024-01-03,9.19,9.20,9.22,9.14,733610,673673613.49,0.87,-0.11,-0.01,0.38",
+        ]
+    }
+}
+
+
+def _spot_page(params: dict) -> dict:
+    page = int(params.get("pn", 1))
+    # 接口实际返回的字段比请求的多两个, 与解析代码中的列数一致
+    fields = params["fields"].split(",") + ["f100", "f265"]
+    rows = [{field: f"{page}.{j}" for field in fields} for j in range(2)]
+    return {"data": {"total": 6, "diff": rows}}
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self._data = data
+        self.text = json.dumps(data)
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+def _fake_get(url, params=None, **kwargs):
+    if "clist" in url:
+        return FakeResponse(_spot_page(params))
+    return FakeResponse(KLINE_JSON)
+
+
+async def _async_fake_get(self, url, params=None, **kwargs):
+    await asyncio.sleep(0)
+    return _fake_get(url, params=params)
+
+
+def _run(coro):
+    async def _main():
+        try:
+            return await coro
+        finally:
+            await client.close_async_session()
+
+    return asyncio.run(_main())
+
+
+def test_aio_matches_sync_parsing():
+    with mock.patch.object(client.AsyncSession, "get", _async_fake_get):
+        async_hist = _run(ak_aio.stock_zh_a_hist(symbol="000001"))
+        async_spot = _run(ak_aio.stock_zh_a_spot_em())
+    session = mock.Mock(get=_fake_get)
+    with mock.patch.object(stock_hist_em, "get_session", return_value=session):
+        sync_hist = stock_hist_em.stock_zh_a_hist(symbol="000001")
+    with mock.patch("akshare.utils.func.request_with_retry", _fake_get):
+        sync_spot = stock_hist_em.stock_zh_a_spot_em()
+    pd.testing.assert_frame_equal(async_hist, sync_hist)
+    pd.testing.assert_frame_equal(async_spot, sync_spot)
+    assert len(async_spot) == 6
+
+
+def test_async_request_releases_slots_on_cancel():
+    host = "aio-cancel.example.com"
+    # 前两个请求取到令牌后挂起, 第三个请求在等待令牌时被取消, 第四个在等待名额时被取消
+    context.set_rate_limit(host, rate=0.5, capacity=2, max_concurrency=3)
+    started = []
+
+    async def _hang(self, url, **kwargs):
+        started.append(url)
+        await asyncio.sleep(10)
+
+    async def _main():
+        tasks = [
+            asyncio.ensure_future(client.async_request(f"https://{host}/{i}"))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0.05)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        limiter = context.get_rate_limiter(f"https://{host}")
+        assert limiter._semaphore._value == 3
+        limiter.bucket = None
+        for _ in range(3):
+            await asyncio.wait_for(limiter.acquire_async(), timeout=1)
+        for _ in range(3):
+            limiter.release()
+
+    try:
+        with mock.patch.object(client.AsyncSession, "get", _hang):
+            _run(_main())
+    finally:
+        context.set_rate_limit(host)
+    assert len(started) == 2
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 股票所属板块索引测试
+"""
+
+from unittest import mock
+
+from akshare.stock import stock_board_membership_em as membership
+from akshare.utils import context
+
+MEMBERS = {"BK0001": ["600519", "000858"], "BK0002": ["600519"], "BK0003": ["000001"]}
+
+
+def test_membership_index_refreshes_incrementally(tmp_path):
+    requested = []
+
+    def _cons_codes(board_code, bucket, timeout=15):
+        requested.append(board_code)
+        return MEMBERS[board_code]
+
+    catalog = {
+        "行业": mock.Mock(return_value={"白酒": "BK0001"}),
+        "概念": mock.Mock(return_value={"消费": "BK0002", "银行": "BK0003"}),
+    }
+    old_cache_dir = context.get_cache_dir()
+    context.set_cache_dir(str(tmp_path))
+    try:
+        with mock.patch.multiple(
+            membership, BOARD_CODE_MAPS=catalog, _stock_board_cons_codes_em=_cons_codes
+        ):
+            temp_df = membership.stock_board_membership_em(symbol="600519")
+            assert temp_df.values.tolist() == [
+                ["600519", "行业", "BK0001", "白酒"],
+                ["600519", "概念", "BK0002", "消费"],
+            ]
+            assert sorted(requested) == ["BK0001", "BK0002", "BK0003"]
+            # 有效期内直接读取本地索引; 下架的板块从索引中删除
+            catalog["概念"].return_value = {"消费": "BK0002"}
+            temp_df = membership.stock_board_membership_em(symbol="")
+            assert len(requested) == 3
+            assert sorted(temp_df["代码"].unique()) == ["000858", "600519"]
+            membership.stock_board_membership_em(ttl=0)
+            assert len(requested) == 5
+    finally:
+        context.set_cache_dir(old_cache_dir)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 期货会员持仓排名汇总测试, 与原逐行循环的计算结果比较
+"""
+
+import datetime
+
+import pandas as pd
+
+from akshare.futures import cot
+from akshare.futures.symbol_var import symbol_varieties
+
+
+def _rank_table(symbol: str, rows: list) -> pd.DataFrame:
+    table = pd.DataFrame(rows, columns=["rank"] + cot.rank_columns)
+    table["symbol"] = symbol
+    return table
+
+
+def _member(rank: int, *values) -> list:
+    return [
+        rank,
+        f"会员{rank}",
+        values[0],
+        values[1],
+        f"会员{rank}",
+        values[2],
+        values[3],
+        f"会员{rank}",
+        values[4],
+        values[5],
+    ]
+
+
+def _fixture() -> dict:
+    # 郑商所: 字符串单元格, 带千分位逗号和 "-"
+    czce_rows = [
+        _member(
+            rank,
+            f"{rank * 1100:,}",
+            "-" if rank % 4 == 0 else str(rank - 10),
+            f"{rank * 2300:,}",
+            str(3 - rank),
+            "-" if rank == 7 else f"{rank * 1700:,}",
+            "",
+        )
+        for rank in range(1, 23)
+    ]
+    # 上期所: 数值单元格, 只有 7 个名次
+    shfe_rows = [
+        _member(rank, rank * 100, -rank, rank * 50, rank, rank * 40, -2 * rank)
+        for rank in range(1, 8)
+    ]
+    # 中金所: 带名次为 999 的合计行
+    cffex_rows = [
+        _member(rank, rank * 10, 1, rank * 20, 2, rank * 30, 3) for rank in range(1, 13)
+    ]
+    cffex_rows.append(_member(999, 99999, 9, 99999, 9, 99999, 9))
+    return {
+        "SR405": _rank_table("SR405", czce_rows),
+        "rb2405": _rank_table("rb2405", shfe_rows),
+        "IF2405": _rank_table("IF2405", cffex_rows),
+    }
+
+
+def _loop_rank_sum(big_dict: dict) -> pd.DataFrame:
+    """
+    原 get_rank_sum 中逐个合约, 逐个名次区间求和的写法
+    """
+    records = []
+    for table in big_dict.values():
+        table = table.map(lambda x: 0 if x == "" else x)
+        for col in cot.intColumns:
+            # 原写法只对郑商所的字符串单元格做转换
+            if table[col].map(lambda x: isinstance(x, str)).any():
+                table[col] = [
+                    float(value.replace(",", "")) if value != "-" else 0.0
+                    for value in table[col]
+                ]
+        for symbol in table["symbol"].unique():
+            table_cut = table[table["symbol"] == symbol]
+            rank = table_cut["rank"].astype("float")
+            record = {"symbol": symbol, "variety": symbol_varieties(symbol)}
+            for n in cot.RANK_TOP_N:
+                for col in cot.intColumns:
+                    record[f"{col}_top{n}"] = table_cut[rank <= n][col].sum()
+            records.append(record)
+    return pd.DataFrame(records)
+
+
+def test_rank_number_handles_dash_and_thousands():
+    series = pd.Series(["1,234", "-", "", " 56 ", "-7"])
+    assert cot._rank_number(series).tolist() == [1234, 0, 0, 56, -7]
+
+
+def test_rank_top_sum_matches_loop():
+    big_dict = _fixture()
+    long_df = cot._rank_tables_to_long(big_dict, datetime.date(2024, 4, 1))
+    assert long_df["rank"].max() == 22
+    assert long_df["date"].unique().tolist() == ["20240401"]
+    result = cot._rank_top_sum(long_df)
+    expected = _loop_rank_sum(big_dict)
+    assert result["symbol"].tolist() == ["SR405", "rb2405", "IF2405"]
+    assert result["variety"].tolist() == ["SR", "RB", "IF"]
+    pd.testing.assert_frame_equal(
+        result.drop(columns=["symbol", "variety"]),
+        expected.drop(columns=["symbol", "variety"]).astype("int64"),
+    )
+    # 不足 20 名的合约, 前 10 到前 20 名的汇总相同
+    rb = result.iloc[1]
+    assert rb["vol_top10"] == rb["vol_top20"] == sum(rank * 100 for rank in range(1, 8))
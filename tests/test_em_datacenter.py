@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 东方财富-数据中心分页查询测试
+"""
+
+import datetime
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from akshare.stock_feature import stock_lhb_em, stock_yjbb_em
+from akshare.stock_feature.stock_lhb_em import stock_lhb_detail_em_iter
+from akshare.utils import em_datacenter
+from akshare.utils.em_datacenter import REPORT_SCHEMAS, DatacenterClient
+
+
+def _fetch_page(self, page):
+    return {"pages": 4, "data": [{"SECURITY_CODE": f"{page}{i}"} for i in range(2)]}
+
+
+def test_iter_pages_resumes_from_start_page():
+    client = DatacenterClient(report_name="RPT_TEST", columns="ALL", max_workers=2)
+    with mock.patch.object(DatacenterClient, "fetch_page", _fetch_page):
+        codes = [df["SECURITY_CODE"].tolist() for df in client.iter_pages(start_page=3)]
+        assert codes == [["30", "31"], ["40", "41"]]
+        assert len(client.fetch()) == 8
+        pages = list(stock_lhb_detail_em_iter(start_page=4))
+    # 序号按页码连续编号, 续传时与一次性获取的结果一致
+    assert [(page, df["序号"].tolist()) for page, df in pages] == [(4, [15001, 15002])]
+
+
+def test_iter_pages_bounds_pages_in_flight():
+    client = DatacenterClient(
+        report_name="RPT_TEST", columns="ALL", max_workers=2, rate=1000
+    )
+    requested = []
+
+    def _record(self, page):
+        requested.append(page)
+        return {"pages": 50, "data": [{"SECURITY_CODE": str(page)}]}
+
+    with mock.patch.object(DatacenterClient, "fetch_page", _record):
+        pages = client.iter_pages()
+        for _ in range(3):
+            next(pages)
+        # 第一页, 已取走的两页, 以及最多 max_workers * 2 个预取页面
+        assert len(requested) <= 3 + 4
+        pages.close()
+        codes = [df["SECURITY_CODE"].tolist()[0] for df in client.iter_pages()]
+    assert codes == [str(page) for page in range(1, 51)]
+
+
+def _api_row(report_name: str, index: int) -> dict:
+    """
+    按字段类型构造接口返回的一行数据, 数值和日期与接口一样可能为字符串或 None
+    """
+    row = {}
+    for key, (_, dtype) in REPORT_SCHEMAS[report_name].items():
+        if dtype == "float":
+            row[key] = None if index == 1 else f"{index}.5"
+        elif dtype == "date":
+            row[key] = f"2024-04-{index + 10:02d} 00:00:00"
+        else:
+            row[key] = f"{key}{index}"
+    row["EXTRA_FIELD"] = "x"
+    return row
+
+
+def _transport(pages: list):
+    """
+    模拟 request_with_retry, 按 pageNumber 返回 pages 中对应的 result, 并记录请求参数
+    """
+    calls = []
+
+    def _request(url, params=None, timeout=None):
+        calls.append(params)
+        response = mock.Mock()
+        response.json.return_value = {"result": pages[int(params["pageNumber"]) - 1]}
+        return response
+
+    return calls, mock.patch.object(em_datacenter, "request_with_retry", _request)
+
+
+@pytest.mark.parametrize(
+    "report_name, func",
+    [
+        ("RPT_LICO_FN_CPD", lambda: stock_yjbb_em.stock_yjbb_em(date="20240331")),
+        (
+            "RPT_DAILYBILLBOARD_DETAILSNEW",
+            lambda: stock_lhb_em.stock_lhb_detail_em("20240401", "20240430"),
+        ),
+    ],
+)
+def test_ported_endpoints_map_and_type_columns(report_name, func):
+    schema = REPORT_SCHEMAS[report_name]
+    pages = [
+        {"pages": 2, "data": [_api_row(report_name, 0), _api_row(report_name, 1)]},
+        {"pages": 2, "data": [_api_row(report_name, 2)]},
+    ]
+    calls, patch = _transport(pages)
+    with patch:
+        df = func()
+    assert calls[0]["reportName"] == report_name
+    assert calls[0]["columns"] == ",".join(schema)
+    assert sorted(call["pageNumber"] for call in calls) == ["1", "2"]
+    assert df.columns.tolist() == ["序号"] + [name for name, _ in schema.values()]
+    assert df["序号"].tolist() == [1, 2, 3]
+    for key, (name, dtype) in schema.items():
+        if dtype == "float":
+            assert df[name].dtype == "float64", name
+            assert df[name].isna().tolist() == [False, True, False], name
+            assert df[name].iloc[2] == 2.5
+        elif dtype == "date":
+            assert df[name].tolist() == [
+                datetime.date(2024, 4, day) for day in (10, 11, 12)
+            ], name
+        else:
+            assert df[name].tolist() == [f"{key}{index}" for index in range(3)], name
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda: stock_yjbb_em.stock_yjbb_em(date="20240331"),
+        lambda: stock_lhb_em.stock_lhb_detail_em("20240401", "20240430"),
+    ],
+)
+def test_ported_endpoints_empty_result(func):
+    calls, patch = _transport([None])
+    with patch:
+        df = func()
+        pages = list(stock_lhb_detail_em_iter("20240401", "20240430"))
+    assert isinstance(df, pd.DataFrame)
+    assert df.empty
+    assert pages == []
+    assert [call["pageNumber"] for call in calls] == ["1", "1"]
+
+
+def _yyb_page(pages: int, codes: list) -> dict:
+    data = [
+        {"OPERATEDEPT_CODE": "10188715", "SECURITY_CODE": code, "ACT_BUY": "1.5"}
+        for code in codes
+    ]
+    return {"pages": pages, "data": data}
+
+
+def test_yyb_detail_iter_numbers_rows_received():
+    # 第 2 页实际只返回 1 行, 第 3 页为空
+    pages = [
+        _yyb_page(4, ["000001", "000002"]),
+        _yyb_page(4, ["000003"]),
+        _yyb_page(4, []),
+        _yyb_page(4, ["000004", "000005"]),
+    ]
+    calls, patch = _transport(pages)
+    with patch:
+        result = list(stock_lhb_em.stock_lhb_yyb_detail_em_iter(symbol="10188715"))
+        resumed = list(
+            stock_lhb_em.stock_lhb_yyb_detail_em_iter(symbol="10188715", start_page=4)
+        )
+        big_df = stock_lhb_em.stock_lhb_yyb_detail_em(symbol="10188715")
+    assert calls[0]["reportName"] == "RPT_OPERATEDEPT_TRADE_DETAILSNEW"
+    assert calls[0]["filter"] == '(OPERATEDEPT_CODE="10188715")'
+    assert calls[0]["pageSize"] == str(stock_lhb_em.LHB_YYB_DETAIL_PAGE_SIZE)
+    assert [(page, df["序号"].tolist()) for page, df in result] == [
+        (1, [1, 2]),
+        (2, [3]),
+        (4, [4, 5]),
+    ]
+    assert result[2][1]["股票代码"].tolist() == ["000004", "000005"]
+    assert result[0][1]["买入金额"].tolist() == [1.5, 1.5]
+    # 续传时假定之前的页面都是满页
+    offset = 3 * stock_lhb_em.LHB_YYB_DETAIL_PAGE_SIZE
+    assert [(page, df["序号"].tolist()) for page, df in resumed] == [
+        (4, [offset + 1, offset + 2])
+    ]
+    assert big_df["序号"].tolist() == [1, 2, 3, 4, 5]
+    assert big_df.columns.tolist() == result[0][1].columns.tolist()
+
+
+def test_yyb_detail_iter_empty_result():
+    calls, patch = _transport([None])
+    with patch:
+        assert list(stock_lhb_em.stock_lhb_yyb_detail_em_iter()) == []
+        assert stock_lhb_em.stock_lhb_yyb_detail_em().empty
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 天天基金网-pingzhongdata 全部指标测试, 与单个指标接口的结果比较
+"""
+
+import json
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from akshare.fund import fund_em
+
+DAY = 86400000
+TS = [1704124800000 + i * DAY for i in range(3)]
+
+PINGZHONG_VARS = {
+    "Data_netWorthTrend": [
+        {"x": ts, "y": 1.2 + i / 100, "equityReturn": i * 0.1, "unitMoney": ""}
+        for i, ts in enumerate(TS)
+    ],
+    "Data_ACWorthTrend": [[ts, 2.5 + i / 100] for i, ts in enumerate(TS)],
+    "Data_sevenDaysYearIncome": [
+        [ts, None if i == 1 else 1.8] for i, ts in enumerate(TS)
+    ],
+    "Data_rateInSimilarType": [
+        {"x": ts, "y": 100 + i, "sc": "2000"} for i, ts in enumerate(TS)
+    ],
+    "Data_rateInSimilarPersent": [[ts, 45.5 + i] for i, ts in enumerate(TS)],
+    "Data_assetAllocation": {
+        "series": [
+            {"name": "股票占净比", "type": None, "data": [80.1, None]},
+            {"name": "债券占净比", "type": None, "data": ["5.2", 6.3]},
+        ],
+        "categories": ["2024-03-31", "2024-06-30"],
+    },
+    "Data_holderStructure": {"series": [], "categories": []},
+    "Data_fluctuationScale": {
+        "categories": ["2024-03-31", "2024-06-30"],
+        "series": [{"y": 12.3, "mom": "-1.20%"}, {"y": 13.1, "mom": "6.50%"}],
+    },
+}
+
+# 每万份收益没有出现在数据中
+PINGZHONG_TEXT = '/*fund*/var fS_name = "测试基金";' + "".join(
+    f"var {name} = {json.dumps(value, ensure_ascii=False)};"
+    for name, value in PINGZHONG_VARS.items()
+)
+
+
+class _Response:
+    text = PINGZHONG_TEXT
+
+
+def _get(*args, **kwargs):
+    return _Response()
+
+
+@pytest.fixture
+def patched():
+    session = mock.Mock(get=mock.Mock(side_effect=_get))
+    with mock.patch.object(fund_em, "get_session", return_value=session):
+        with mock.patch.object(fund_em.requests, "get", side_effect=_get):
+            yield session
+
+
+def test_all_indicators_match_single_indicator(patched):
+    result = fund_em.fund_open_fund_info_all_em(symbol="710001")
+    assert list(result) == list(fund_em._PINGZHONG_INDICATOR_MAP)
+    for indicator, temp_df in result.items():
+        single_df = fund_em.fund_open_fund_info_em(symbol="710001", indicator=indicator)
+        pd.testing.assert_frame_equal(temp_df, single_df, obj=indicator)
+    assert result["单位净值走势"].columns.tolist() == [
+        "净值日期",
+        "单位净值",
+        "日增长率",
+    ]
+    assert result["单位净值走势"]["净值日期"].astype(str).tolist() == [
+        "2024-01-02",
+        "2024-01-03",
+        "2024-01-04",
+    ]
+    assert result["每万份收益"].empty
+    assert result["持有人结构"].empty
+    assert result["资产配置"]["债券占净比"].tolist() == [5.2, 6.3]
+    assert result["规模变动"].columns.tolist() == [
+        "报告日期",
+        "净资产规模",
+        "较上期环比",
+    ]
+
+
+def test_batch_uses_shared_session(patched):
+    result = fund_em.fund_open_fund_info_all_batch_em(["710001", "000001"])
+    assert list(result) == ["710001", "000001"]
+    urls = sorted(call.args[0] for call in patched.get.call_args_list)
+    assert urls == [
+        "https://fund.eastmoney.com/pingzhongdata/000001.js",
+        "https://fund.eastmoney.com/pingzhongdata/710001.js",
+    ]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 期货日线行情多交易所批量获取测试, 使用模拟的单日接口
+"""
+
+import time
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from akshare.futures import futures_daily_bar
+
+# 2024 年国庆前后的交易日
+TRADE_DATES = ["20240926", "20240927", "20240930", "20241008", "20241009"]
+
+
+def _make_daily(market: str, fail_date: str = None):
+    def _daily(date: str) -> pd.DataFrame:
+        if date == fail_date:
+            raise ConnectionError("timeout")
+        # 越早的日期越晚返回, 检查结果仍按日期和交易所排序
+        time.sleep(0.002 * (len(TRADE_DATES) - TRADE_DATES.index(date)))
+        return pd.DataFrame(
+            {
+                "symbol": [f"{market}2412", f"{market}efp"],
+                "date": date,
+                "close": [1.0, 2.0],
+            }
+        )
+
+    return _daily
+
+
+def _funcs(fail_date: str = None) -> dict:
+    return {
+        "DCE": _make_daily("DCE"),
+        "SHFE": _make_daily("SHFE", fail_date=fail_date),
+    }
+
+
+def test_batch_orders_and_merges_by_date_and_market():
+    funcs = _funcs()
+    with mock.patch.object(futures_daily_bar, "_futures_daily_func", funcs.get):
+        temp_df = futures_daily_bar.get_futures_daily_batch(
+            start_date="20240926",
+            end_date="20241009",
+            markets=["DCE", "SHFE"],
+            max_workers=4,
+        )
+    # 非交易日不请求, efp 合约被剔除
+    assert temp_df[["date", "symbol"]].values.tolist() == [
+        [date, f"{market}2412"] for date in TRADE_DATES for market in ("DCE", "SHFE")
+    ]
+    assert temp_df.index.tolist() == list(range(len(TRADE_DATES) * 2))
+
+
+def test_batch_warns_and_single_market_raises_on_failure():
+    funcs = _funcs(fail_date="20240930")
+    with mock.patch.object(futures_daily_bar, "_futures_daily_func", funcs.get):
+        with pytest.warns(UserWarning, match="SHFE 20240930 获取失败"):
+            temp_df = futures_daily_bar.get_futures_daily_batch(
+                start_date="20240926", end_date="20241009", markets=["DCE", "SHFE"]
+            )
+        with pytest.raises(ConnectionError):
+            futures_daily_bar.get_futures_daily(
+                start_date="20240926", end_date="20241009", market="SHFE"
+            )
+        with pytest.raises(ValueError):
+            futures_daily_bar.get_futures_daily_batch(markets=["DCE"], errors="ignore")
+    assert len(temp_df) == len(TRADE_DATES) * 2 - 1
+    assert (
+        "20240930" not in temp_df.loc[temp_df["symbol"] == "SHFE2412", "date"].tolist()
+    )
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 期权隐含波动率和希腊字母计算测试
+"""
+
+import numpy as np
+import pandas as pd
+
+from akshare.cal.greeks import (
+    implied_volatility,
+    option_chain_greeks,
+    option_greeks,
+    option_price,
+)
+
+
+def test_implied_volatility_recovers_sigma():
+    rng = np.random.default_rng(0)
+    s = rng.uniform(2, 4, 2000)
+    k = rng.uniform(2, 4, 2000)
+    t = rng.uniform(5, 400, 2000) / 365
+    sigma = rng.uniform(0.05, 1.2, 2000)
+    option_type = np.where(rng.random(2000) < 0.5, "认购", "认沽")
+    for model in ("bs", "black76"):
+        price = option_price(s, k, t, sigma, 0.02, option_type, 0.01, model)
+        iv = implied_volatility(price, s, k, t, 0.02, option_type, 0.01, model)
+        vega = option_greeks(s, k, t, sigma, 0.02, option_type, 0.01, model)[2]
+        # 深度实值或虚值的合约价格对波动率不敏感, 无法反解
+        sensitive = vega > 1e-6
+        assert np.nanmax(np.abs(iv - sigma)[sensitive]) < 1e-7
+        assert not np.isnan(iv[sensitive]).any()
+
+
+def test_greeks_match_finite_differences():
+    args = dict(k=3000, t=0.25, sigma=0.2, r=0.02, option_type="P", model="black76")
+    delta, gamma, vega, theta, rho = option_greeks(s=2950, **args)
+    h = 0.01
+    up = option_price(s=2950 + h, **args)
+    down = option_price(s=2950 - h, **args)
+    assert abs(delta - (up - down) / (2 * h)) < 1e-6
+    assert abs(gamma - (up - 2 * option_price(s=2950, **args) + down) / h**2) < 1e-4
+    bumped = dict(args, sigma=0.21)
+    bumped_price = option_price(s=2950, **bumped) - option_price(s=2950, **args)
+    assert abs(vega - bumped_price) < 0.05
+
+
+def test_option_chain_greeks_parses_contract_codes():
+    chain_df = pd.DataFrame(
+        {
+            "合约代码": ["SR501C5000", "SR501P5000", "小计"],
+            "今收盘": [120.0, 80.0, None],
+        }
+    )
+    temp_df = option_chain_greeks(
+        chain_df,
+        underlying_price=5050,
+        expiry="2024-12-06",
+        trade_date="2024-11-01",
+        model="black76",
+    )
+    assert temp_df["行权价"].tolist()[:2] == [5000, 5000]
+    assert temp_df["Delta"].iloc[0] > 0 > temp_df["Delta"].iloc[1]
+    price = option_price(
+        5050,
+        5000,
+        temp_df["剩余期限"].iloc[0],
+        temp_df["隐含波动率"].iloc[0],
+        model="black76",
+    )
+    assert abs(price - 120) < 1e-4
+    assert np.isnan(temp_df["隐含波动率"].iloc[2])
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 沪深京 A 股历史行情批量获取测试, 使用模拟的单只股票接口
+"""
+
+import time
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from akshare.stock_feature import stock_hist_em
+
+SYMBOLS = ["000001", "000002", "600000", "600519"]
+
+
+def _fake_hist(symbol, **kwargs):
+    if symbol == "000002":
+        raise ValueError("no data")
+    # 后面的股票先返回, 检查批量结果按输入顺序排列
+    time.sleep(0.01 * (len(SYMBOLS) - SYMBOLS.index(symbol)))
+    if symbol == "600000":
+        return pd.DataFrame(columns=["日期", "股票代码", "收盘"])
+    return pd.DataFrame(
+        {"日期": ["2024-01-02", "2024-01-03"], "股票代码": symbol, "收盘": [1.0, 2.0]}
+    )
+
+
+def test_batch_iter_warns_and_skips_failed_symbols():
+    with mock.patch.object(stock_hist_em, "stock_zh_a_hist", _fake_hist):
+        with pytest.warns(UserWarning, match="000002 获取失败"):
+            result = dict(
+                stock_hist_em.stock_zh_a_hist_batch_iter(
+                    SYMBOLS, max_workers=4, rate=1000
+                )
+            )
+    assert sorted(result) == ["000001", "600000", "600519"]
+    assert result["600000"].empty
+
+
+def test_batch_keeps_input_order():
+    with mock.patch.object(stock_hist_em, "stock_zh_a_hist", _fake_hist):
+        with pytest.warns(UserWarning):
+            result = stock_hist_em.stock_zh_a_hist_batch(
+                SYMBOLS, max_workers=4, rate=1000, return_dict=True
+            )
+        with pytest.warns(UserWarning):
+            temp_df = stock_hist_em.stock_zh_a_hist_batch(
+                SYMBOLS, max_workers=4, rate=1000
+            )
+    assert list(result) == ["000001", "600000", "600519"]
+    # 空数据不进入长表
+    assert temp_df["股票代码"].tolist() == ["000001"] * 2 + ["600519"] * 2
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 历史行情本地增量存储测试, 使用模拟的数据源
+"""
+
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from akshare.stock_feature import stock_hist_store
+from akshare.utils import context
+
+
+class _FakeSource:
+    """
+    模拟的 em 数据源, 记录每次调用的 start_date
+    """
+
+    def __init__(self, closes: dict):
+        self.closes = closes
+        self.calls = []
+
+    def __call__(self, symbol, adjust, period, start_date="19700101"):
+        self.calls.append(start_date)
+        days = sorted(day for day in self.closes if day >= start_date)
+        return pd.DataFrame(
+            {
+                "日期": [f"{day[:4]}-{day[4:6]}-{day[6:]}" for day in days],
+                "收盘": [self.closes[day] for day in days],
+            }
+        )
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    old_cache_dir = context.get_cache_dir()
+    context.set_cache_dir(str(tmp_path))
+    yield tmp_path
+    context.set_cache_dir(old_cache_dir)
+
+
+def _store(source):
+    with mock.patch.dict(
+        stock_hist_store._SOURCE_MAP, {"em": (source, "日期", "收盘")}
+    ):
+        return stock_hist_store.stock_zh_a_hist_store(symbol="000001", adjust="qfq")
+
+
+def test_first_download_and_overlapping_append(cache_dir):
+    source = _FakeSource({"20240102": 10.0, "20240103": 10.5, "20240104": 10.2})
+    temp_df = _store(source)
+    assert source.calls == ["19700101"]
+    assert temp_df["收盘"].tolist() == [10.0, 10.5, 10.2]
+
+    # 最后一根 K 线盘中未走完, 再次获取时被覆盖, 并追加新的 K 线
+    source.closes.update({"20240104": 10.3, "20240105": 10.8})
+    temp_df = _store(source)
+    assert source.calls == ["19700101", "20240103"]
+    assert temp_df["日期"].tolist() == [
+        "2024-01-02",
+        "2024-01-03",
+        "2024-01-04",
+        "2024-01-05",
+    ]
+    assert temp_df["收盘"].tolist() == [10.0, 10.5, 10.3, 10.8]
+
+
+def test_changed_close_triggers_full_download(cache_dir):
+    source = _FakeSource({"20240102": 10.0, "20240103": 10.5, "20240104": 10.2})
+    _store(source)
+
+    # 除权后前复权价格整体变化, 倒数第二根 K 线的收盘价与本地不一致
+    source.closes = {
+        "20240102": 9.0,
+        "20240103": 9.5,
+        "20240104": 9.2,
+        "20240105": 9.6,
+    }
+    temp_df = _store(source)
+    assert source.calls == ["19700101", "20240103", "19700101"]
+    assert temp_df["收盘"].tolist() == [9.0, 9.5, 9.2, 9.6]
+
+
+def test_factor_adjust_rejected(cache_dir):
+    for adjust in ("qfq-factor", "hfq-factor"):
+        with pytest.raises(ValueError):
+            stock_hist_store.stock_zh_a_hist_store(
+                symbol="sz000001", source="sina", adjust=adjust
+            )
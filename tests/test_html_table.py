@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 网页表格解析测试
+"""
+
+from io import StringIO
+
+import pandas as pd
+
+from akshare.utils.html_table import read_html_table
+
+PAGE = """
+<html><body>
+<table id="nav"><tr><td><table><tr><td>导航</td></tr></table></td></tr></table>
+<table id="rank">
+  <thead><tr><th>名次</th><th colspan="2">会员</th><th>成交量</th><th></th></tr></thead>
+  <tbody>
+    <tr><td rowspan="2">1</td><td>中信</td><td>期货</td><td>12,345</td><td>a</td></tr>
+    <tr><td>国泰</td><td>君安</td><td>-</td><td>b</td></tr>
+    <tr><td>3</td><td>永安<span style="display:none">隐藏</span>期货</td><td>x</td>
+        <td>6,789</td><td>c</td></tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+
+def test_selected_table_matches_read_html():
+    expected = pd.read_html(StringIO(PAGE), flavor="lxml")[2]
+    for kwargs in (
+        dict(table_id="rank"),
+        dict(xpath="//table[@id='rank']"),
+        dict(headers=["名次", "成交量"]),
+        dict(match="永安"),
+    ):
+        temp_df = read_html_table(PAGE, na_values=("",), **kwargs)
+        pd.testing.assert_frame_equal(temp_df, expected, check_dtype=False)
+    # 默认把 "-" 视为缺失值, 整列转换为数值
+    temp_df = read_html_table(PAGE, headers=["名次", "成交量"])
+    assert temp_df["成交量"].dtype == "float64"
+    assert temp_df["成交量"].isna().tolist() == [False, True, False]
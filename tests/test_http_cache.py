@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: HTTP 响应缓存测试
+"""
+
+from unittest import mock
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from akshare.utils import context, http_cache
+from akshare.utils.http_cache import MemoryCache, SQLiteCache, TieredCache
+
+URL = "https://cache-test.example.com/list.js"
+
+
+@pytest.fixture
+def fake_server(tmp_path):
+    """
+    模拟服务器: 返回带 ETag 的内容, 请求带有相同的 If-None-Match 时返回 304
+    """
+    calls = []
+
+    def _send(self, request, **kwargs):
+        calls.append(dict(request.headers))
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        if request.headers.get("If-None-Match") == '"v1"':
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response.headers["ETag"] = '"v1"'
+            response.headers["Content-Type"] = "text/plain; charset=utf-8"
+            response._content = "var r = [1, 2];".encode("utf-8")
+        return response
+
+    old_backend = http_cache.default_http_cache.backend
+    http_cache.set_http_cache_backend(
+        TieredCache(MemoryCache(), SQLiteCache(str(tmp_path / "cache.sqlite")))
+    )
+    http_cache.reset_cache_stats()
+    with mock.patch.object(HTTPAdapter, "send", _send):
+        yield calls
+    http_cache.set_cache_policy(URL, None)
+    http_cache.set_http_cache_backend(old_backend)
+    http_cache.reset_cache_stats()
+    context.reset_sessions()
+
+
+def test_policy_hit_and_revalidation(fake_server):
+    http_cache.set_cache_policy(URL, 60)
+    session = context.get_session(URL)
+    assert session.get(URL).text == "var r = [1, 2];"
+    assert session.get(URL).text == "var r = [1, 2];"
+    assert len(fake_server) == 1
+    # 过期后带 ETag 重新验证, 服务器返回 304 时使用缓存的内容
+    http_cache.set_cache_policy(URL, 0.0)
+    response = session.get(URL)
+    assert response.status_code == 200 and response.text == "var r = [1, 2];"
+    assert fake_server[-1]["If-None-Match"] == '"v1"'
+    stats = http_cache.get_cache_stats()
+    assert (stats["hits"], stats["revalidated"], stats["misses"]) == (1, 1, 1)
+
+
+def test_disk_cache_survives_memory_clear(fake_server):
+    other_url = URL + "?page=2"
+    session = context.get_session(URL)
+    with http_cache.http_cache(ttl=60):
+        session.get(other_url)
+    # 没有设置策略时不使用缓存
+    session.get(other_url)
+    assert len(fake_server) == 2
+    http_cache.default_http_cache.backend.backends[0].clear()
+    with http_cache.http_cache(ttl=60):
+        assert session.get(other_url).text == "var r = [1, 2];"
+    assert len(fake_server) == 2
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 技术指标测试, 批量计算与 pandas 参考实现比较, 增量计算与批量计算逐根 K 线比较
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from akshare.cal import indicator
+
+# 增量计算用前 FIT_ROWS 根 K 线初始化, 之后逐根更新
+FIT_ROWS = 40
+
+
+@pytest.fixture
+def panel() -> dict:
+    """
+    (时间, 股票) 面板: 第 2 只股票第 10 根 K 线才上市, 第 3 只股票在初始化区间和更新区间内各停牌一段
+    """
+    rng = np.random.default_rng(0)
+    rows, cols = 120, 4
+    close = 10 + rng.standard_normal((rows, cols)).cumsum(axis=0) * 0.3
+    high = close + rng.uniform(0, 0.5, (rows, cols))
+    low = close - rng.uniform(0, 0.5, (rows, cols))
+    # 连续 9 根一字板, 窗口内最高价等于最低价
+    close[52:61, 0] = high[52:61, 0] = low[52:61, 0] = close[51, 0]
+    for arr in (close, high, low):
+        arr[:10, 1] = np.nan
+        arr[30:35, 2] = np.nan
+        arr[70:73, 2] = np.nan
+        arr[90, 2] = np.nan
+    index = pd.date_range("2024-01-01", periods=rows, freq="B")
+    columns = ["000001", "000002", "600000", "600519"]
+    return {
+        name: pd.DataFrame(arr, index=index, columns=columns)
+        for name, arr in (("close", close), ("high", high), ("low", low))
+    }
+
+
+def _ewm(frame: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    return frame.ewm(adjust=False, ignore_na=True, **kwargs).mean()
+
+
+def _seeded_ewm(frame: pd.DataFrame, alpha: float, seed: float) -> pd.DataFrame:
+    """
+    以 seed 为初始值的 SMA(X, N, 1), 第一个有效值之前为缺失值
+    """
+    seed_row = pd.DataFrame(
+        seed, index=[frame.index[0] - pd.Timedelta(days=1)], columns=frame.columns
+    )
+    result = _ewm(pd.concat([seed_row, frame]), alpha=alpha).iloc[1:]
+    return result.where(frame.notna().cummax())
+
+
+def _assert_frame(result, expected: pd.DataFrame):
+    pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+
+def test_ma_boll_match_pandas_rolling(panel):
+    close = panel["close"]
+    _assert_frame(indicator.ma(close, 5), close.rolling(5).mean())
+    _assert_frame(indicator.rolling_max(close, 20), close.rolling(20).max())
+    _assert_frame(indicator.rolling_min(close, 20), close.rolling(20).min())
+    mid, upper, lower = indicator.boll(close, 20, 2)
+    std = close.rolling(20).std()
+    _assert_frame(mid, close.rolling(20).mean())
+    _assert_frame(upper, close.rolling(20).mean() + 2 * std)
+    _assert_frame(lower, close.rolling(20).mean() - 2 * std)
+
+
+def test_ema_macd_match_pandas_ewm(panel):
+    close = panel["close"]
+    _assert_frame(indicator.ema(close, 12), _ewm(close, span=12))
+    dif, dea, hist = indicator.macd(close)
+    expected_dif = _ewm(close, span=12) - _ewm(close, span=26)
+    expected_dea = _ewm(expected_dif, span=9)
+    _assert_frame(dif, expected_dif)
+    _assert_frame(dea, expected_dea)
+    _assert_frame(hist, 2 * (expected_dif - expected_dea))
+    # 没有缺失值的股票与 ewm(adjust=False) 一致
+    pd.testing.assert_series_equal(
+        indicator.ema(close["000001"], 12),
+        close["000001"].ewm(span=12, adjust=False).mean(),
+        check_freq=False,
+    )
+
+
+def test_rsi_matches_pandas(panel):
+    close = panel["close"]
+    diff = close.diff()
+    up = _ewm(diff.clip(lower=0), alpha=1 / 14)
+    total = _ewm(diff.abs(), alpha=1 / 14)
+    _assert_frame(indicator.rsi(close, 14), up / total * 100)
+
+
+def test_atr_matches_pandas(panel):
+    high, low, close = panel["high"], panel["low"], panel["close"]
+    prev_close = close.shift(1)
+    tr = np.fmax(
+        high - low, np.fmax((high - prev_close).abs(), (low - prev_close).abs())
+    )
+    _assert_frame(indicator.atr(high, low, close, 14), tr.rolling(14).mean())
+
+
+def test_kdj_matches_pandas(panel):
+    high, low, close = panel["high"], panel["low"], panel["close"]
+    hhv, llv = high.rolling(9).max(), low.rolling(9).min()
+    rsv = (close - llv) / (hhv - llv) * 100
+    rsv = rsv.mask((hhv == llv) & close.notna(), 50.0)
+    expected_k = _seeded_ewm(rsv, 1 / 3, 50.0)
+    expected_d = _seeded_ewm(expected_k, 1 / 3, 50.0)
+    k, d, j = indicator.kdj(high, low, close)
+    _assert_frame(k, expected_k)
+    _assert_frame(d, expected_d)
+    _assert_frame(j, 3 * expected_k - 2 * expected_d)
+    assert k["000001"].iloc[60] == pytest.approx((2 * k["000001"].iloc[59] + 50.0) / 3)
+
+
+def _assert_incremental(batch, fitted, updates):
+    """
+    fit 的结果与批量计算的前 FIT_ROWS 根一致, 之后每次 update 与批量计算的对应行一致
+    """
+    batch = [np.asarray(item) for item in batch]
+    for item, fit_item in zip(batch, fitted):
+        np.testing.assert_allclose(fit_item, item[:FIT_ROWS], equal_nan=True)
+    for offset, row in enumerate(updates):
+        for item, row_item in zip(batch, row):
+            np.testing.assert_allclose(
+                row_item, item[FIT_ROWS + offset], rtol=1e-10, equal_nan=True
+            )
+
+
+def _rows(*frames):
+    arrays = [frame.to_numpy()[FIT_ROWS:] for frame in frames]
+    return zip(*arrays)
+
+
+def test_ema_macd_state_match_batch(panel):
+    close = panel["close"].to_numpy()
+    state = indicator.EMAState(span=12)
+    fitted = state.fit(close[:FIT_ROWS])
+    updates = [(state.update(row),) for row in close[FIT_ROWS:]]
+    _assert_incremental([indicator.ema(close, 12)], [fitted], updates)
+
+    state = indicator.MACDState()
+    fitted = state.fit(close[:FIT_ROWS])
+    updates = [state.update(row) for row in close[FIT_ROWS:]]
+    _assert_incremental(indicator.macd(close), fitted, updates)
+
+
+def test_rolling_state_matches_batch(panel):
+    close = panel["close"].to_numpy()
+    state = indicator.RollingState(window=20).fit(close[:FIT_ROWS])
+    updates = []
+    for row in close[FIT_ROWS:]:
+        state.update(row)
+        updates.append((state.mean(), state.max(), state.min(), state.std()))
+    mid, upper, _ = indicator.boll(close, 20, 1)
+    batch = [
+        indicator.ma(close, 20),
+        indicator.rolling_max(close, 20),
+        indicator.rolling_min(close, 20),
+        upper - mid,
+    ]
+    _assert_incremental(batch, [item[:FIT_ROWS] for item in batch], updates)
+
+
+def test_rsi_state_matches_batch(panel):
+    close = panel["close"].to_numpy()
+    state = indicator.RSIState(14)
+    fitted = state.fit(close[:FIT_ROWS])
+    updates = [(state.update(row),) for row in close[FIT_ROWS:]]
+    _assert_incremental([indicator.rsi(close, 14)], [fitted], updates)
+
+
+def test_kdj_atr_state_match_batch(panel):
+    high, low, close = (panel[name].to_numpy() for name in ("high", "low", "close"))
+
+    state = indicator.KDJState()
+    fitted = state.fit(high[:FIT_ROWS], low[:FIT_ROWS], close[:FIT_ROWS])
+    updates = [
+        state.update(*row)
+        for row in _rows(*(panel[name] for name in ("high", "low", "close")))
+    ]
+    _assert_incremental(indicator.kdj(high, low, close), fitted, updates)
+
+    state = indicator.ATRState(14)
+    fitted = state.fit(high[:FIT_ROWS], low[:FIT_ROWS], close[:FIT_ROWS])
+    updates = [
+        (state.update(*row),)
+        for row in _rows(*(panel[name] for name in ("high", "low", "close")))
+    ]
+    _assert_incremental([indicator.atr(high, low, close, 14)], [fitted], updates)
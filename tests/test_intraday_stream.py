@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 东方财富-分时数据订阅测试
+"""
+
+import json
+import threading
+from unittest import mock
+
+import requests
+
+from akshare.stock import stock_intraday_em as intraday
+
+TICKS = [f"09:30:{i:02d},10.{i:02d},{100 + i},0,{(1, 2, 4)[i % 3]}" for i in range(8)]
+
+
+class _Response:
+    """
+    模拟 server-sent events 连接: 依次推送事件, 推送完后断开或者保持连接直到 close
+    """
+
+    def __init__(self, events, disconnect):
+        self.events = events
+        self.disconnect = disconnect
+        self.closed = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        self.closed.set()
+
+    def iter_lines(self):
+        for details in self.events:
+            yield ("data: " + json.dumps({"data": {"details": details}})).encode()
+            yield b""
+        if self.disconnect:
+            raise requests.ConnectionError("connection reset")
+        self.closed.wait(5)
+        raise requests.ConnectionError("closed")
+
+
+def test_subscription_resumes_without_duplicates():
+    responses = [
+        # 第一次连接: 最近的逐笔成交, 然后是两次增量推送, 之后断线
+        _Response([TICKS[:3], TICKS[3:4], TICKS[4:6]], disconnect=True),
+        # 重新连接: 推送的最近逐笔成交与已收到的数据重叠
+        _Response([TICKS[2:7], TICKS[7:]], disconnect=False),
+    ]
+    subscription = intraday.StockIntradaySubscription(["000001"], reconnect_delay=0.01)
+    received = []
+    with mock.patch.object(intraday.requests, "get", side_effect=responses):
+        with subscription:
+            for symbol, temp_df in subscription:
+                received.append(temp_df)
+                if temp_df.index[-1] == 7:
+                    break
+    assert [temp_df.index.tolist() for temp_df in received] == [
+        [0, 1, 2],
+        [3],
+        [4, 5],
+        [6],
+        [7],
+    ]
+    temp_df = subscription.frame("000001")
+    assert temp_df["时间"].tolist() == [item.split(",")[0] for item in TICKS]
+    assert temp_df["手数"].tolist() == list(range(100, 108))
+    assert temp_df["买卖盘性质"].tolist()[:3] == ["卖盘", "买盘", "中性盘"]
+
+
+def test_subscription_restarts_after_stop():
+    responses = [
+        _Response([TICKS[:3]], disconnect=False),
+        # 重新启动后的第一次推送与已收到的数据重叠
+        _Response([TICKS[2:5]], disconnect=False),
+    ]
+    subscription = intraday.StockIntradaySubscription(["000001"])
+    received = []
+    with mock.patch.object(intraday.requests, "get", side_effect=responses):
+        for _ in range(2):
+            with subscription:
+                symbol, temp_df = next(iter(subscription))
+                received.append(temp_df.index.tolist())
+    assert received == [[0, 1, 2], [3, 4]]
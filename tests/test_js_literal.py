@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: JS 字面量解析
+"""
+
+import subprocess
+import sys
+
+from akshare.utils import demjson
+from akshare.utils.js_literal import loads
+
+PAYLOADS = [
+    '[{symbol:"sh600000",code:"600000",name:"浦发银行",trade:"7.230",per:5.1,volume:123}]',
+    "{'a': 'it\\'s', b: [1, 2, 3,], c: null, d: true, /* 注释 */ e: -.5, f: 5., g: 0x1F}",
+    '{"k": "a\\x41\\u4e2d", "z": "\\\\x", "q": \'say "hi"\'}',
+    "[1,\n// 注释\n 2.5e-3,]",
+    '{"data":{"sh600000":{"qfqday":[["2024-01-02","7.1","7.2","7.3","7.0","1000.000"]]}}}',
+]
+
+
+def test_loads_matches_demjson():
+    """
+    test loads gives the same result as demjson
+    """
+    for payload in PAYLOADS:
+        assert loads(payload) == demjson.decode(payload), payload
+
+
+def test_loads_unwrap():
+    """
+    test var and JSONP wrappers
+    """
+    assert loads('var kline_dayqfq2024={"code":0,"data":{}};') == {
+        "code": 0,
+        "data": {},
+    }
+    assert loads("jQuery1124_1({rc: 0, data: [1, 2]});") == {"rc": 0, "data": [1, 2]}
+    assert loads(b"[1, 2]") == [1, 2]
+
+
+def test_loads_undefined_is_none():
+    """
+    test JS undefined decodes to None instead of demjson.undefined
+    """
+    payload = "{a: undefined, b: [1, undefined]}"
+    assert demjson.decode(payload)["a"] is demjson.undefined
+    assert loads(payload) == {"a": None, "b": [1, None]}
+
+
+def test_demjson_imported_on_fallback_only():
+    """
+    test demjson is only imported when json cannot parse the payload
+    """
+    code = (
+        "import sys; from akshare.utils.js_literal import loads; "
+        "loads('[1, 2,]'); "
+        "assert 'akshare.utils.demjson' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    test_loads_matches_demjson()
+    test_loads_unwrap()
+    test_demjson_imported_on_fallback_only()
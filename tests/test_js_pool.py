@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: JS 执行环境池测试
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("py_mini_racer")
+
+from akshare.utils.js_pool import JSContextPool  # noqa: E402
+
+SOURCE = "var counter = 0; function next(x) { counter += 1; return x * 2; }"
+
+
+def test_pool_reuses_contexts_across_threads():
+    pool = JSContextPool(max_size=2, max_scripts=4)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda x: pool.call(SOURCE, "next", x), range(200)))
+    assert results == [x * 2 for x in range(200)]
+    slots = pool._entries[SOURCE].slots
+    assert 1 <= len(slots) <= 2
+    # 脚本只在新建环境时执行一次, 所有调用都累计在已有环境中
+    assert sum(slot.ctx.eval("counter") for slot in slots) == 200
+
+
+def test_pool_evicts_least_recently_used_script():
+    pool = JSContextPool(max_size=1, max_scripts=2)
+    for value in range(3):
+        assert pool.eval(f"var a = {value};", "a") == value
+    assert list(pool._entries) == ["var a = 1;", "var a = 2;"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: K 线数据解析测试
+"""
+
+import pandas as pd
+
+from akshare.utils.kline import parse_klines
+
+LINES = [
+    "2024-01-02,9.39,9.21,1158366,-,0.60",
+    "2024-01-03,9.19,9.20,733610,abc,0.38",
+]
+
+
+def test_parse_klines_matches_split_and_to_numeric():
+    columns = ["日期", "开盘", "收盘", "成交量", "振幅", "换手率"]
+    expected = pd.DataFrame([item.split(",") for item in LINES], columns=columns)
+    for column in columns[1:]:
+        expected[column] = pd.to_numeric(expected[column], errors="coerce")
+    pd.testing.assert_frame_equal(parse_klines(LINES, columns=columns), expected)
+
+
+def test_parse_klines_skips_unnamed_fields():
+    temp_df = parse_klines(LINES, columns=["日期", None, "收盘"])
+    assert list(temp_df.columns) == ["日期", "收盘"]
+    assert temp_df["收盘"].tolist() == [9.21, 9.20]
+    assert parse_klines([], columns=["日期", None, "收盘"]).empty
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: akshare 顶层接口的延迟导入
+"""
+
+import pathlib
+import subprocess
+import sys
+
+import akshare
+from akshare._lazy_exports import LAZY_EXPORTS, OPTIONAL_EXPORTS
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def test_lazy_exports_up_to_date():
+    """
+    test akshare/_lazy_exports.py is generated from akshare/__init__.py
+    """
+    sys.path.insert(0, str(ROOT / "scripts"))
+    try:
+        from gen_lazy_exports import parse_exports
+    finally:
+        sys.path.pop(0)
+    groups, optional = parse_exports(
+        (ROOT / "akshare" / "__init__.py").read_text("utf-8")
+    )
+    assert dict(item for _, items in groups for item in items) == LAZY_EXPORTS
+    assert optional == OPTIONAL_EXPORTS
+
+
+def test_lazy_exports_resolve():
+    """
+    test every public name still resolves
+    """
+    for name in LAZY_EXPORTS:
+        if name in OPTIONAL_EXPORTS:
+            continue
+        assert getattr(akshare, name) is not None, name
+
+
+def test_import_is_lazy():
+    """
+    test import akshare does not import data modules
+    """
+    code = (
+        "import sys, akshare; "
+        "assert 'akshare.stock_feature.stock_hist_em' not in sys.modules; "
+        "akshare.stock_zh_a_hist; "
+        "assert 'akshare.stock_feature.stock_hist_em' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_star_import():
+    """
+    test from akshare import * skips optional exports whose dependency is missing
+    """
+    code = (
+        "import importlib.util; "
+        "from akshare._lazy_exports import LAZY_EXPORTS, OPTIONAL_EXPORTS; "
+        "namespace = {}; "
+        "exec('from akshare import *', namespace); "
+        "missing = {name for name in OPTIONAL_EXPORTS "
+        "if importlib.util.find_spec(LAZY_EXPORTS[name]) is None}; "
+        "assert set(LAZY_EXPORTS) - missing <= set(namespace); "
+        "assert not missing & set(namespace)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    test_lazy_exports_up_to_date()
+    test_lazy_exports_resolve()
+    test_import_is_lazy()
+    test_star_import()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 新浪财经-上交所期权链快照测试
+"""
+
+from unittest import mock
+
+import pandas as pd
+
+from akshare.option import option_finance_sina as sina
+
+
+def _quote(code: str) -> str:
+    fields = ["1"] * len(sina.SSE_SPOT_FIELDS)
+    fields[2] = f"0.{code[-2:]}"
+    fields[32] = "2024-12-02 14:59:59"
+    fields[37] = f"50ETF购12月{code}"
+    return f'var hq_str_CON_OP_{code}="{",".join(fields)}";\n'
+
+
+def _greeks(code: str) -> str:
+    fields = [f"50ETF购12月{code}", "", "", "", "10", "0.5", "1.2", "-0.3", "0.1"]
+    fields += ["0.2", "0.6", "0.4", f"510050C2412M0{code[-4:]}", "2.5", "0.3", "0.31"]
+    return f'var hq_str_CON_SO_{code}="{",".join(fields)}";\n'
+
+
+def test_chain_snapshot_batches_requests():
+    codes = [str(10007000 + i) for i in range(150)]
+    requested = []
+
+    def _hq_text(symbols, timeout=15):
+        requested.append(symbols)
+        return "".join(
+            _quote(item[7:]) if item.startswith("CON_OP_") else _greeks(item[7:])
+            for item in symbols
+        )
+
+    def _codes(symbol, trade_date, underlying):
+        part = codes[:100] if symbol == "看涨期权" else codes[100:]
+        return pd.DataFrame({"序号": range(1, len(part) + 1), "期权代码": part})
+
+    with mock.patch.multiple(
+        sina, option_sse_codes_sina=_codes, _sina_hq_text=_hq_text
+    ):
+        temp_df = sina.option_sse_chain_snapshot_sina(expiry="202412")
+    # 300 个代码按 URL 长度分为少量批次, 而不是每个合约一次请求
+    assert 1 < len(requested) < 10
+    assert sum(len(batch) for batch in requested) == 300
+    assert temp_df["期权代码"].tolist() == codes
+    assert temp_df["类型"].value_counts().to_dict() == {"看涨期权": 100, "看跌期权": 50}
+    assert temp_df["最新价"].dtype == "float64"
+    assert temp_df["Delta"].iloc[0] == 0.5
+    assert temp_df["交易代码"].iloc[0] == "510050C2412M07000"
+    assert temp_df["行情时间"].iloc[0] == pd.Timestamp("2024-12-02 14:59:59")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 东方财富-分页获取数据测试, 使用模拟的接口返回数据
+"""
+
+import random
+import threading
+import time
+from unittest import mock
+
+import pandas as pd
+
+from akshare.utils import func
+
+TOTAL = 23
+PER_PAGE = 5
+
+
+class _Response:
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def _make_fetch(f3_of):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def _fetch(url, params=None, timeout=15):
+        page = int(params.get("pn", 1))
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        # 后面的页面先返回, 检查合并结果仍按页码排列
+        time.sleep(random.uniform(0, 0.01) if page == 1 else 0.02 / page)
+        with lock:
+            active[0] -= 1
+        start = (page - 1) * PER_PAGE
+        rows = [
+            {"f12": f"{i:06d}", "f3": f3_of(i)}
+            for i in range(start, min(start + PER_PAGE, TOTAL))
+        ]
+        return _Response({"data": {"total": TOTAL, "diff": rows}})
+
+    return _fetch, peak
+
+
+def test_fetch_paginated_data_keeps_page_order():
+    results = []
+    for max_workers in (1, 4):
+        _fetch, peak = _make_fetch(lambda i: 1.0)
+        with mock.patch.object(func, "request_with_retry", _fetch):
+            results.append(
+                func.fetch_paginated_data(
+                    "https://push2.eastmoney.com/api/qt/clist/get",
+                    {"pn": "1", "pz": str(PER_PAGE)},
+                    max_workers=max_workers,
+                    rate=1000,
+                )
+            )
+        assert peak[0] <= max(max_workers, 1)
+    serial_df, concurrent_df = results
+    pd.testing.assert_frame_equal(serial_df, concurrent_df)
+    # f3 相同时保持页码顺序, 序号从 1 开始
+    assert concurrent_df["f12"].tolist() == [f"{i:06d}" for i in range(TOTAL)]
+    assert concurrent_df["index"].tolist() == list(range(1, TOTAL + 1))
+
+
+def test_merge_paginated_rows_sorts_by_f3():
+    page_rows = [
+        [{"f12": "a", "f3": "1.5"}, {"f12": "b", "f3": "-"}],
+        None,
+        [{"f12": "c", "f3": "3"}, {"f12": "d", "f3": "1.5"}],
+    ]
+    temp_df = func.merge_paginated_rows(page_rows)
+    assert temp_df["f12"].tolist() == ["c", "a", "d", "b"]
+    assert temp_df["index"].tolist() == [1, 2, 3, 4]
+    assert pd.isna(temp_df["f3"].iloc[-1])
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 按 host 限速测试
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from akshare.utils import context
+from akshare.utils.rate_limit import HostLimiter, match_host_rule
+
+
+def test_match_host_rule_uses_longest_suffix():
+    rules = ["eastmoney.com", "push2.eastmoney.com", "sina.com.cn"]
+    assert match_host_rule("82.push2.eastmoney.com", rules) == "push2.eastmoney.com"
+    assert match_host_rule("quote.eastmoney.com", rules) == "eastmoney.com"
+    assert match_host_rule("notsina.com.cn", rules) is None
+
+
+def test_session_requests_respect_host_concurrency():
+    host = "limit-test.example.com"
+    context.set_rate_limit(host, rate=1000, max_concurrency=2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def _send(self, request, **kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    try:
+        with mock.patch.object(HTTPAdapter, "send", _send):
+            session = context.get_session(f"https://a.{host}")
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(
+                    executor.map(
+                        lambda _: session.get(f"https://a.{host}/x"), range(16)
+                    )
+                )
+    finally:
+        context.set_rate_limit(host)
+        context.reset_sessions()
+    assert peak[0] == 2
+
+
+def test_async_limiter_shares_concurrency_slots():
+    limiter = HostLimiter(rate=1000, max_concurrency=3)
+    active, peak = [0], [0]
+
+    async def _task():
+        async with limiter.limit_async():
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+
+    async def _main():
+        await asyncio.gather(*[_task() for _ in range(12)])
+
+    asyncio.run(_main())
+    assert peak[0] == 3
+
+
+def test_async_limiter_releases_slots_on_cancel():
+    # 令牌桶只有一个令牌, 后续任务会在等待令牌时被取消
+    limiter = HostLimiter(rate=0.5, capacity=1, max_concurrency=2)
+    limiter.bucket.reserve()
+
+    async def _main():
+        tasks = [asyncio.ensure_future(limiter.acquire_async()) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert limiter._semaphore._value == 2
+        limiter.bucket = None
+        await asyncio.wait_for(limiter.acquire_async(), timeout=1)
+        await asyncio.wait_for(limiter.acquire_async(), timeout=1)
+        limiter.release()
+        limiter.release()
+
+    asyncio.run(_main())
+
+
+def test_async_limiter_wakes_waiters_after_cancel():
+    limiter = HostLimiter(max_concurrency=1)
+    order = []
+
+    async def _worker(name):
+        async with limiter.limit_async():
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def _main():
+        await limiter.acquire_async()
+        cancelled = asyncio.ensure_future(_worker("cancelled"))
+        waiting = asyncio.ensure_future(_worker("waiting"))
+        await asyncio.sleep(0.01)
+        # 先唤醒第一个等待者, 它在取到名额前被取消, 唤醒应转交给下一个
+        limiter.release()
+        cancelled.cancel()
+        await asyncio.wait_for(waiting, timeout=1)
+        await asyncio.gather(cancelled, return_exceptions=True)
+
+    asyncio.run(_main())
+    assert order == ["waiting"]
+    assert limiter._semaphore._value == 1
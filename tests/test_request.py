@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 共享 Session 与带重试的请求测试, 使用模拟的 HTTPAdapter.send
+"""
+
+from unittest import mock
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from akshare.utils import context
+from akshare.utils.request import request_with_retry
+
+PROXIES = {"https": "http://127.0.0.1:8888"}
+
+
+def _response(request, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = request.url
+    response.request = request
+    response._content = b"{}"
+    return response
+
+
+def test_get_session_is_shared_per_host():
+    try:
+        session = context.get_session("https://push2.eastmoney.com/api/qt/clist/get")
+        assert context.get_session("https://PUSH2.eastmoney.com/other") is session
+        assert context.get_session("push2.eastmoney.com") is session
+        assert context.get_session("https://push2his.eastmoney.com/x") is not session
+        context.reset_sessions()
+        assert context.get_session("https://push2.eastmoney.com/x") is not session
+    finally:
+        context.reset_sessions()
+
+
+def test_request_with_retry_uses_proxies_and_retries():
+    calls = []
+
+    def _send(self, request, **kwargs):
+        calls.append((request.url, kwargs.get("proxies")))
+        if len(calls) == 1:
+            raise requests.ConnectionError("connection reset")
+        return _response(request)
+
+    try:
+        with mock.patch.object(HTTPAdapter, "send", _send):
+            with context.ProxyContext(PROXIES):
+                r = request_with_retry(
+                    "https://request-test.example.com/data",
+                    params={"a": 1},
+                    base_delay=0,
+                    random_delay_range=(0, 0),
+                )
+            assert context.get_proxies() is None
+    finally:
+        context.reset_sessions()
+    assert r.status_code == 200
+    assert calls == [("https://request-test.example.com/data?a=1", PROXIES)] * 2
+
+
+def test_request_with_retry_raises_last_exception():
+    def _send(self, request, **kwargs):
+        return _response(request, status_code=503)
+
+    try:
+        with mock.patch.object(HTTPAdapter, "send", _send):
+            context.set_retry_policy("retry-test.example.com", max_retries=2)
+            with pytest.raises(requests.HTTPError) as excinfo:
+                request_with_retry(
+                    "https://retry-test.example.com/x",
+                    base_delay=0,
+                    random_delay_range=(0, 0),
+                )
+    finally:
+        context.config.retry_policies.pop("retry-test.example.com", None)
+        context.reset_sessions()
+    assert excinfo.value.response.status_code == 503
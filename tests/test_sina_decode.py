@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 新浪财经-K 线数据解码, 对比纯 Python 版本与 JS 版本的结果
+"""
+
+import random
+
+import pytest
+
+from akshare.utils.sina_decode import sina_kline_decode_py
+
+py_mini_racer = pytest.importorskip("py_mini_racer")
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+
+def _make_payload(decoder_id: int, length: int, rnd: random.Random) -> str:
+    """
+    构造指定解码分支的随机数据, 前 18 位为解码分支和版本号
+    """
+    head = [decoder_id & 63, (decoder_id >> 6) & 63, 63]
+    body = [rnd.randrange(64) for _ in range(length)]
+    return "".join(ALPHABET[item] for item in head + body)
+
+
+def test_sina_kline_decode_py():
+    """
+    test sina_kline_decode_py against hk_js_decode
+    """
+    from akshare.stock.cons import hk_js_decode
+
+    js_code = py_mini_racer.MiniRacer()
+    js_code.eval(hk_js_decode)
+    rnd = random.Random(0)
+    for decoder_id in [1479, 136, 200, 139, 197, 3466]:
+        for _ in range(10):
+            payload = _make_payload(decoder_id, rnd.choice([20, 200, 2000]), rnd)
+            try:
+                expected = js_code.call("d", payload, timeout=5000)
+            except Exception as e:
+                if "NoneType" not in str(e):
+                    # JS 版本抛出异常时, Python 版本同样应该抛出异常
+                    with pytest.raises(Exception):
+                        sina_kline_decode_py(payload)
+                    continue
+                expected = None
+            assert sina_kline_decode_py(payload) == expected
+
+
+if __name__ == "__main__":
+    test_sina_kline_decode_py()
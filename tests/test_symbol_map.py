@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 代码映射表缓存测试, 使用临时缓存目录
+"""
+
+import json
+import os
+import types
+from unittest import mock
+
+import pytest
+
+from akshare.utils import context, symbol_map
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    old_cache_dir = context.get_cache_dir()
+    old_ttl = context.config.symbol_map_ttl
+    context.set_cache_dir(str(tmp_path))
+    yield tmp_path
+    context.set_cache_dir(old_cache_dir)
+    symbol_map.set_symbol_map_ttl(old_ttl)
+
+
+def _counting_map(name: str):
+    calls = []
+
+    @symbol_map.cached_symbol_map(name)
+    def _code_id_map():
+        calls.append(1)
+        return {"000300": 1, "399001": len(calls)}
+
+    return _code_id_map, calls
+
+
+def test_expired_map_refreshes_in_background(cache_dir):
+    code_id_map, calls = _counting_map("test_expired")
+    assert code_id_map() == {"000300": 1, "399001": 1}
+    assert code_id_map() == {"000300": 1, "399001": 1}
+    assert len(calls) == 1
+    with open(cache_dir / "symbol_map" / "test_expired.json", encoding="utf-8") as f:
+        assert json.load(f)["data"] == {"000300": 1, "399001": 1}
+
+    # 过期后先返回旧数据, 后台刷新完成后返回新数据并写入本地
+    symbol_map.set_symbol_map_ttl(0)
+    with mock.patch("threading.Thread") as thread:
+        assert code_id_map() == {"000300": 1, "399001": 1}
+    # 直接执行后台刷新线程的任务
+    thread.call_args.kwargs["target"]()
+    symbol_map.set_symbol_map_ttl(86400)
+    assert code_id_map() == {"000300": 1, "399001": 2}
+    assert len(calls) == 2
+    with open(cache_dir / "symbol_map" / "test_expired.json", encoding="utf-8") as f:
+        assert json.load(f)["data"] == {"000300": 1, "399001": 2}
+
+    # 新的进程从本地缓存读取, 不重新下载
+    code_id_map, calls = _counting_map("test_expired")
+    assert code_id_map() == {"000300": 1, "399001": 2}
+    assert calls == []
+
+
+@pytest.mark.parametrize("content", ["{not json", "[1, 2]", '{"data": {}}'])
+def test_corrupt_cache_file_is_redownloaded(cache_dir, content):
+    os.makedirs(cache_dir / "symbol_map")
+    path = cache_dir / "symbol_map" / "test_corrupt.json"
+    path.write_text(content, encoding="utf-8")
+    code_id_map, calls = _counting_map("test_corrupt")
+    assert code_id_map() == {"000300": 1, "399001": 1}
+    assert len(calls) == 1
+    assert json.loads(path.read_text(encoding="utf-8"))["data"] == code_id_map()
+
+
+def test_resolve_secid():
+    module = types.SimpleNamespace(index_code_id_map_em=lambda: {"000300": 1})
+    with mock.patch.object(symbol_map.importlib, "import_module", return_value=module):
+        assert symbol_map.resolve_secid("000300", kind="index") == "1.000300"
+        assert symbol_map.resolve_secid("999999", kind="index") is None
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/15 18:00
+Desc: 交易日历测试, 使用本地日历文件, 不访问网络
+"""
+
+import datetime
+
+from akshare.futures import cons as futures_cons
+from akshare.option import cons as option_cons
+from akshare.utils.trade_calendar import TradingCalendar, get_trading_calendar
+
+# 2024 年国庆前后: 09-27 周五, 09-30 周一, 10-01 至 10-07 休市
+DAYS = ["20240926", "20240927", "20240930", "20241008", "20241009"]
+
+
+def _date(text: str) -> datetime.date:
+    return datetime.datetime.strptime(text, "%Y%m%d").date()
+
+
+def test_prev_next_latest_on_trading_day():
+    calendar = TradingCalendar(DAYS)
+    assert calendar.prev("20240930") == _date("20240927")
+    assert calendar.prev("20240930", 2) == _date("20240926")
+    assert calendar.next("20240930") == _date("20241008")
+    assert calendar.next("20240930", 2) == _date("20241009")
+    assert calendar.latest("20240930") == _date("20240930")
+
+
+def test_prev_next_latest_on_non_trading_day():
+    calendar = TradingCalendar(DAYS)
+    assert calendar.prev("20241005") == _date("20240930")
+    assert calendar.prev("20241005", 2) == _date("20240927")
+    assert calendar.next("20241005") == _date("20241008")
+    assert calendar.next("20241005", 2) == _date("20241009")
+    assert calendar.latest("20241005") == _date("20240930")
+    assert calendar.latest(datetime.date(2024, 9, 28)) == _date("20240927")
+
+
+def test_calendar_ends():
+    calendar = TradingCalendar(DAYS)
+    assert calendar.prev("20240926") is None
+    assert calendar.prev("20240927", 2) is None
+    assert calendar.next("20241009") is None
+    assert calendar.next("20241008", 2) is None
+    assert calendar.latest("20240925") is None
+    assert calendar.latest("20241010") == _date("20241009")
+    assert calendar.next("20240925") == _date("20240926")
+    assert calendar.prev("20241010") == _date("20241009")
+    assert calendar.next("20241010") is None
+
+
+def test_shipped_calendar():
+    calendar = get_trading_calendar()
+    assert calendar.prev("20241005") == _date("20240930")
+    assert calendar.latest("20241005") == _date("20240930")
+    assert calendar.next("20241005") == _date("20241008")
+
+
+def test_last_trading_day_at_calendar_start():
+    first_day = get_trading_calendar().to_list()[0]
+    for cons in (futures_cons, option_cons):
+        assert cons.last_trading_day("20241008") == "20240930"
+        assert cons.last_trading_day(_date("20241008")) == _date("20240930")
+        assert cons.last_trading_day(first_day) is False
+        assert cons.last_trading_day(_date(first_day)) is False